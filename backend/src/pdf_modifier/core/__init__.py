@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from .analyzer import PDFAnalyzer
+from .async_api import AsyncPDFAnalyzer, AsyncPDFModifier, PDFExecutor
 from .exceptions import (
+    ExecutorBusyError,
     FileSizeExceededError,
     InvalidPatternError,
+    OperationCancelledError,
     PDFModifierError,
     PDFNotFoundError,
     PDFPasswordError,
@@ -17,17 +20,26 @@ from .models import (
     FontInspectionResult,
     FontMatch,
     ModificationResult,
+    ModificationTimings,
     PageStructure,
+    PageTimings,
     PDFStructure,
     ReplacementSpec,
     TextElement,
 )
 from .modifier import PDFModifier, batch_process
+from .result_cache import ResultCache
+from .span_cache import SpanCache
 
 __all__ = [
     # Classes
+    "AsyncPDFAnalyzer",
+    "AsyncPDFModifier",
     "PDFAnalyzer",
+    "PDFExecutor",
     "PDFModifier",
+    "ResultCache",
+    "SpanCache",
     # Functions
     "batch_process",
     # Models
@@ -35,13 +47,17 @@ __all__ = [
     "FontInspectionResult",
     "FontMatch",
     "ModificationResult",
+    "ModificationTimings",
     "PageStructure",
+    "PageTimings",
     "PDFStructure",
     "ReplacementSpec",
     "TextElement",
     # Exceptions
+    "ExecutorBusyError",
     "FileSizeExceededError",
     "InvalidPatternError",
+    "OperationCancelledError",
     "PDFModifierError",
     "PDFNotFoundError",
     "PDFPasswordError",
@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 import fitz
 
 from ..logger import setup_logging
-from .exceptions import FileSizeExceededError, PDFNotFoundError, PDFPasswordError, PDFReadError
+from .cancel import CancelEvent, check_cancelled
+from .exceptions import (
+    FileSizeExceededError,
+    OperationCancelledError,
+    PDFNotFoundError,
+    PDFPasswordError,
+    PDFReadError,
+)
 from .models import (
     EmbeddedFontInfo,
     FontInspectionResult,
@@ -16,12 +27,15 @@ from .models import (
     HyperlinkInventory,
     PageStructure,
     PDFStructure,
-    TextElement,
 )
+from .pdf_source import IN_MEMORY_NAME, PDFSource, map_file, resolve_source
+from .span_cache import SpanCache, extract_page_record, source_digest
 
 logger = setup_logging(__name__)
 
 DEFAULT_MAX_FILE_SIZE_BYTES: int = 100 * 1024 * 1024  # 100 MB
+# Memory-mapped files are paged in on demand, so far larger inputs are safe
+DEFAULT_MAX_MAPPED_FILE_SIZE_BYTES: int = 4 * 1024 * 1024 * 1024  # 4 GB
 
 
 class PDFAnalyzer:
@@ -33,6 +47,9 @@ class PDFAnalyzer:
     - Plain text extraction
     - Font property inspection
 
+    Page loops check ``cancel_event`` before each page and raise
+    OperationCancelledError once it is set.
+
     Example:
         >>> analyzer = PDFAnalyzer("document.pdf")
         >>> structure = analyzer.get_structure()
@@ -40,41 +57,73 @@ class PDFAnalyzer:
 
         >>> result = analyzer.inspect_fonts(["Invoice", "Total"])
         >>> print(result.total_matches)
+
+        # Reuse extracted spans across calls and processes:
+        >>> analyzer = PDFAnalyzer("document.pdf", span_cache=SpanCache())
+
+        # Analyze a PDF held in memory (bytes, memoryview or binary file object):
+        >>> analyzer = PDFAnalyzer(upload_bytes)
+
+        # Memory-map a multi-GB archive instead of enforcing max_file_size:
+        >>> analyzer = PDFAnalyzer("archive.pdf", memory_map=True)
     """
 
     def __init__(
         self,
-        file_path: str | Path,
+        file_path: PDFSource,
         password: str | None = None,
         max_file_size: int = DEFAULT_MAX_FILE_SIZE_BYTES,
+        span_cache: SpanCache | None = None,
+        memory_map: bool = False,
+        max_mapped_file_size: int = DEFAULT_MAX_MAPPED_FILE_SIZE_BYTES,
+        cancel_event: CancelEvent | None = None,
     ) -> None:
-        self.file_path = Path(file_path)
+        self._source = resolve_source(file_path)
+        self.file_path = self._source if isinstance(self._source, Path) else None
+        self._name = str(self.file_path) if self.file_path else IN_MEMORY_NAME
+        if memory_map and self.file_path is None:
+            raise ValueError("memory_map requires a file path input")
         self.password = password
         self.max_file_size = max_file_size
+        self.span_cache = span_cache
+        self.memory_map = memory_map
+        self.max_mapped_file_size = max_mapped_file_size
+        self.cancel_event = cancel_event
+        self._source_digest: str | None = None
 
     def _open_doc(self) -> fitz.Document:
         """Safely open the document with password authentication if required."""
-        if not self.file_path.exists():
-            raise PDFNotFoundError(
-                f"PDF file not found: {self.file_path}",
-                {"path": str(self.file_path)},
-            )
+        source = self._source
+        if isinstance(source, Path):
+            if not source.exists():
+                raise PDFNotFoundError(
+                    f"PDF file not found: {source}",
+                    {"path": self._name},
+                )
+            file_size = source.stat().st_size
+        else:
+            file_size = memoryview(source).nbytes
 
-        file_size = self.file_path.stat().st_size
-        if file_size > self.max_file_size:
+        limit = self.max_mapped_file_size if self.memory_map else self.max_file_size
+        if file_size > limit:
             size_mb = file_size / (1024 * 1024)
-            limit_mb = self.max_file_size / (1024 * 1024)
+            limit_mb = limit / (1024 * 1024)
             raise FileSizeExceededError(
                 f"PDF file is {size_mb:.1f} MB, exceeds limit of {limit_mb:.0f} MB",
                 {
-                    "path": str(self.file_path),
+                    "path": self._name,
                     "size_bytes": file_size,
-                    "limit_bytes": self.max_file_size,
+                    "limit_bytes": limit,
                 },
             )
 
         try:
-            doc = fitz.open(self.file_path)
+            if isinstance(source, Path) and self.memory_map:
+                doc = fitz.open(stream=map_file(source), filetype="pdf")
+            elif isinstance(source, Path):
+                doc = fitz.open(source)
+            else:
+                doc = fitz.open(stream=source, filetype="pdf")
             if doc.needs_pass:
                 if not self.password:
                     raise PDFPasswordError("PDF is password protected. Please provide a password.")
@@ -86,62 +135,186 @@ class PDFAnalyzer:
         except Exception as e:
             raise PDFReadError(f"Failed to open PDF: {e}") from e
 
-    def get_structure(self) -> PDFStructure:
+    def _digest(self) -> str:
+        """SHA-256 of the input, hashed once per analyzer.
+
+        File digests are also remembered by ``source_digest`` while the file
+        is unchanged, so they stay correct if the file is edited between calls.
+        """
+        if isinstance(self._source, Path):
+            return source_digest(self._source)
+        if self._source_digest is None:
+            self._source_digest = source_digest(self._source)
+        return self._source_digest
+
+    def _cached_page_records(self, doc: fitz.Document) -> list[dict[str, Any]] | None:
+        """Return page records from the span cache, or None on a miss."""
+        if self.span_cache is None or doc.needs_pass:
+            return None
+        records = self.span_cache.get(self.span_cache.key_for(self._source, self._digest()))
+        if records is None or len(records) != len(doc):
+            return None
+        return records
+
+    def _page_records(self, doc: fitz.Document) -> list[dict[str, Any]]:
+        """Return page records for every page, extracting and caching on a miss."""
+        records = self._cached_page_records(doc)
+        if records is not None:
+            return records
+
+        records = [self._extract_page_record(page) for page in doc]
+        if self.span_cache is not None and not doc.needs_pass:
+            self.span_cache.put(self.span_cache.key_for(self._source, self._digest()), records)
+        return records
+
+    def _extract_page_record(self, page: fitz.Page) -> dict[str, Any]:
+        """Extract one page record, stopping first if the operation was cancelled."""
+        check_cancelled(self.cancel_event)
+        return extract_page_record(page)
+
+    @staticmethod
+    def _resolve_window(total_pages: int, start_page: int, page_limit: int | None) -> range:
+        """Validate a page window and return its 0-indexed page range.
+
+        Raises:
+            ValueError: If the window is invalid or starts past the last page.
+        """
+        if start_page < 1:
+            raise ValueError("Page numbers must be 1-indexed")
+        if page_limit is not None and page_limit < 1:
+            raise ValueError("page_limit must be >= 1")
+        if start_page > max(total_pages, 1):
+            raise ValueError(f"Page {start_page} exceeds document total of {total_pages} pages")
+        end = total_pages if page_limit is None else min(total_pages, start_page - 1 + page_limit)
+        return range(start_page - 1, end)
+
+    @staticmethod
+    def _build_page_structure(page_num: int, record: dict[str, Any]) -> PageStructure:
+        """Convert a page record into a PageStructure model."""
+        return PageStructure(
+            page=page_num,
+            width=record["width"],
+            height=record["height"],
+            elements=record["spans"].to_elements(),
+        )
+
+    def page_count(self) -> int:
+        """
+        Return the number of pages in the document.
+
+        Raises:
+            PDFReadError: If the PDF cannot be read.
+            PDFPasswordError: If password is required but not provided or incorrect.
+        """
+        with self._open_doc() as doc:
+            return len(doc)
+
+    def get_structure(self, start_page: int = 1, page_limit: int | None = None) -> PDFStructure:
         """
         Extract complete PDF structure as typed model.
 
         Returns page dimensions, text elements with positions,
         fonts, sizes, and colors.
 
+        Pass ``page_limit`` to fetch a window of pages instead of the whole
+        document; ``next_page`` in the result is the cursor for the next
+        window (None once the last page is included).
+
+        Args:
+            start_page: First page to include (1-indexed).
+            page_limit: Maximum number of pages to include. None includes
+                        every page from ``start_page`` to the end.
+
         Returns:
-            PDFStructure containing all pages and elements.
+            PDFStructure containing the requested pages and elements.
 
         Raises:
             PDFReadError: If the PDF cannot be read.
             PDFPasswordError: If password is required but not provided or incorrect.
+            ValueError: If the page window is invalid.
         """
         try:
             with self._open_doc() as doc:
-                pages = []
-                for page_num, page in enumerate(doc, start=1):
-                    elements = []
-                    blocks = page.get_text("dict")["blocks"]
-
-                    for block in blocks:
-                        if "lines" not in block:
-                            continue
-                        for line in block["lines"]:
-                            for span in line["spans"]:
-                                elements.append(
-                                    TextElement(
-                                        text=span["text"],
-                                        bbox=tuple(span["bbox"]),
-                                        origin=tuple(span["origin"]),
-                                        font=span["font"],
-                                        size=span["size"],
-                                        color=span["color"],
-                                    )
-                                )
-
-                    pages.append(
-                        PageStructure(
-                            page=page_num,
-                            width=page.rect.width,
-                            height=page.rect.height,
-                            elements=elements,
-                        )
-                    )
-
+                total_pages = len(doc)
+                window = self._resolve_window(total_pages, start_page, page_limit)
+
+                if len(window) == total_pages:
+                    records = self._page_records(doc)
+                else:
+                    cached = self._cached_page_records(doc)
+                    records = [
+                        cached[i] if cached is not None else self._extract_page_record(doc[i])
+                        for i in window
+                    ]
+
+                pages = [
+                    self._build_page_structure(page_index + 1, record)
+                    for page_index, record in zip(window, records, strict=True)
+                ]
                 return PDFStructure(
-                    file_path=str(self.file_path),
-                    total_pages=len(pages),
+                    file_path=self._name,
+                    total_pages=total_pages,
                     pages=pages,
+                    next_page=window.stop + 1 if window.stop < total_pages else None,
                 )
 
-        except (PDFPasswordError, PDFNotFoundError, FileSizeExceededError):
+        except (
+            PDFPasswordError,
+            PDFNotFoundError,
+            FileSizeExceededError,
+            OperationCancelledError,
+            ValueError,
+        ):
+            raise
+        except Exception as e:
+            raise PDFReadError(f"Failed to analyze PDF: {e}", {"path": self._name}) from e
+
+    def iter_pages(
+        self, start_page: int = 1, page_limit: int | None = None
+    ) -> Iterator[PageStructure]:
+        """
+        Yield page structures one page at a time.
+
+        Only the current page's elements are held in memory, so this is the
+        preferred way to stream structure for very large documents. The
+        document stays open until the generator is exhausted or closed.
+
+        Args:
+            start_page: First page to yield (1-indexed).
+            page_limit: Maximum number of pages to yield. None yields every
+                        page from ``start_page`` to the end.
+
+        Yields:
+            PageStructure for each page in the window, in order.
+
+        Raises:
+            PDFReadError: If the PDF cannot be read.
+            PDFPasswordError: If password is required but not provided or incorrect.
+            ValueError: If the page window is invalid.
+        """
+        try:
+            with self._open_doc() as doc:
+                window = self._resolve_window(len(doc), start_page, page_limit)
+                cached = self._cached_page_records(doc)
+                for page_index in window:
+                    check_cancelled(self.cancel_event)
+                    record = (
+                        cached[page_index]
+                        if cached is not None
+                        else extract_page_record(doc[page_index])
+                    )
+                    yield self._build_page_structure(page_index + 1, record)
+
+        except (
+            PDFPasswordError,
+            PDFNotFoundError,
+            FileSizeExceededError,
+            OperationCancelledError,
+            ValueError,
+        ):
             raise
         except Exception as e:
-            raise PDFReadError(f"Failed to analyze PDF: {e}", {"path": str(self.file_path)}) from e
+            raise PDFReadError(f"Failed to analyze PDF: {e}", {"path": self._name}) from e
 
     def extract_text(self) -> str:
         """
@@ -156,16 +329,26 @@ class PDFAnalyzer:
         """
         try:
             with self._open_doc() as doc:
-                output = [f"Analyzed {self.file_path} with {len(doc)} pages.\n"]
+                output = [f"Analyzed {self._name} with {len(doc)} pages.\n"]
+                records = self._cached_page_records(doc)
                 for page_num, page in enumerate(doc, start=1):
+                    check_cancelled(self.cancel_event)
                     output.append(f"--- Page {page_num} ---")
-                    output.append(page.get_text("text"))
+                    if records is not None:
+                        output.append(records[page_num - 1]["text"])
+                    else:
+                        output.append(page.get_text("text"))
                     output.append("-" * 20)
                 return "\n".join(output)
-        except (PDFPasswordError, PDFNotFoundError, FileSizeExceededError):
+        except (
+            PDFPasswordError,
+            PDFNotFoundError,
+            FileSizeExceededError,
+            OperationCancelledError,
+        ):
             raise
         except Exception as e:
-            raise PDFReadError(f"Failed to extract text: {e}", {"path": str(self.file_path)}) from e
+            raise PDFReadError(f"Failed to extract text: {e}", {"path": self._name}) from e
 
     def inspect_fonts(self, terms: list[str]) -> FontInspectionResult:
         """
@@ -187,41 +370,40 @@ class PDFAnalyzer:
 
         try:
             with self._open_doc() as doc:
-                for page_num, page in enumerate(doc, start=1):
-                    blocks = page.get_text("dict")["blocks"]
-
-                    for block in blocks:
-                        if "lines" not in block:
-                            continue
-                        for line in block["lines"]:
-                            for span in line["spans"]:
-                                text = span["text"]
-                                for term in terms:
-                                    if term in text:
-                                        matches.append(
-                                            FontMatch(
-                                                page=page_num,
-                                                term=term,
-                                                context=text[:100],
-                                                font=span["font"],
-                                                size=span["size"],
-                                                origin=tuple(span["origin"]),
-                                            )
-                                        )
+                for page_num, record in enumerate(self._page_records(doc), start=1):
+                    check_cancelled(self.cancel_event)
+                    spans = record["spans"]
+                    for i in range(len(spans)):
+                        text = spans.text(i)
+                        for term in terms:
+                            if term in text:
+                                matches.append(
+                                    FontMatch(
+                                        page=page_num,
+                                        term=term,
+                                        context=text[:100],
+                                        font=spans.font(i),
+                                        size=spans.size(i),
+                                        origin=spans.origin(i),
+                                    )
+                                )
 
             return FontInspectionResult(
-                file_path=str(self.file_path),
+                file_path=self._name,
                 terms_searched=terms,
                 matches=matches,
                 total_matches=len(matches),
             )
 
-        except (PDFPasswordError, PDFNotFoundError, FileSizeExceededError):
+        except (
+            PDFPasswordError,
+            PDFNotFoundError,
+            FileSizeExceededError,
+            OperationCancelledError,
+        ):
             raise
         except Exception as e:
-            raise PDFReadError(
-                f"Failed to inspect fonts: {e}", {"path": str(self.file_path)}
-            ) from e
+            raise PDFReadError(f"Failed to inspect fonts: {e}", {"path": self._name}) from e
 
     def get_hyperlinks(self) -> HyperlinkInventory:
         """
@@ -239,6 +421,7 @@ class PDFAnalyzer:
         try:
             with self._open_doc() as doc:
                 for page_num, page in enumerate(doc, start=1):
+                    check_cancelled(self.cancel_event)
                     for link in page.get_links():
                         if "uri" in link:
                             # Try to find text under the link's bbox
@@ -253,17 +436,20 @@ class PDFAnalyzer:
                             )
 
             return HyperlinkInventory(
-                file_path=str(self.file_path),
+                file_path=self._name,
                 total_links=len(links),
                 links=links,
             )
 
-        except (PDFPasswordError, PDFNotFoundError, FileSizeExceededError):
+        except (
+            PDFPasswordError,
+            PDFNotFoundError,
+            FileSizeExceededError,
+            OperationCancelledError,
+        ):
             raise
         except Exception as e:
-            raise PDFReadError(
-                f"Failed to extract hyperlinks: {e}", {"path": str(self.file_path)}
-            ) from e
+            raise PDFReadError(f"Failed to extract hyperlinks: {e}", {"path": self._name}) from e
 
     def extract_embedded_fonts(self) -> list[EmbeddedFontInfo]:
         """
@@ -287,6 +473,7 @@ class PDFAnalyzer:
         try:
             with self._open_doc() as doc:
                 for page_num, page in enumerate(doc, start=1):
+                    check_cancelled(self.cancel_event)
                     fonts = page.get_fonts(full=True)
                     # fonts: list of (xref, name, type, encoding, embed, file, ...)
                     for xref, _, font_type, _, _, _, *_ in fonts:
@@ -311,12 +498,17 @@ class PDFAnalyzer:
                                     )
                                 )
 
-        except (PDFPasswordError, PDFNotFoundError, FileSizeExceededError):
+        except (
+            PDFPasswordError,
+            PDFNotFoundError,
+            FileSizeExceededError,
+            OperationCancelledError,
+        ):
             raise
         except Exception as e:
             raise PDFReadError(
                 f"Failed to extract embedded fonts: {e}",
-                {"path": str(self.file_path)},
+                {"path": self._name},
             ) from e
 
         return results
@@ -0,0 +1,485 @@
+"""Async facade over PDFAnalyzer and PDFModifier backed by a bounded executor."""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from ..logger import setup_logging
+from .analyzer import PDFAnalyzer
+from .exceptions import ExecutorBusyError
+from .modifier import (
+    DEFAULT_MAX_FILE_SIZE_BYTES,
+    DEFAULT_MAX_MAPPED_FILE_SIZE_BYTES,
+    DEFAULT_SAVE_PROFILE,
+    PDFModifier,
+)
+from .pdf_source import resolve_source
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+    from multiprocessing.managers import SyncManager
+    from pathlib import Path
+
+    from .cancel import CancelEvent
+    from .models import (
+        EmbeddedFontInfo,
+        FontInspectionResult,
+        HyperlinkInventory,
+        ModificationResult,
+        PageStructure,
+        PDFStructure,
+        ReplacementSpec,
+    )
+    from .pdf_source import PDFBytes, PDFSource
+    from .result_cache import ResultCache
+    from .span_cache import SpanCache
+
+logger = setup_logging(__name__)
+
+T = TypeVar("T")
+
+EXECUTOR_KINDS = ("thread", "process")
+DEFAULT_EXECUTOR_KIND = "thread"
+DEFAULT_EXECUTOR_WORKERS: int = min(4, os.cpu_count() or 1)
+DEFAULT_EXECUTOR_QUEUE: int = 16
+# Pages fetched per executor call by AsyncPDFAnalyzer.iter_pages
+DEFAULT_PAGE_CHUNK: int = 16
+
+
+class PDFExecutor:
+    """Bounded worker pool that runs blocking PDF work off the event loop.
+
+    Jobs run on a dedicated thread or process pool instead of the event
+    loop's default thread pool, so heavy documents cannot starve other
+    ``to_thread`` users. At most ``max_workers`` jobs run at once and at
+    most ``max_queue`` more wait for a worker; further submissions fail
+    fast with ExecutorBusyError instead of piling up.
+
+    Cancelling the awaiting task (e.g. because the client disconnected)
+    drops a job that has not started yet and sets the cancel event of a
+    running one, which stops it at the next page boundary.
+
+    Example:
+        >>> executor = PDFExecutor(max_workers=2, max_queue=8)
+        >>> analyzer = AsyncPDFAnalyzer("document.pdf", executor=executor)
+        >>> structure = await analyzer.get_structure()
+        >>> executor.shutdown()
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_EXECUTOR_WORKERS,
+        kind: str = DEFAULT_EXECUTOR_KIND,
+        max_queue: int = DEFAULT_EXECUTOR_QUEUE,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if max_queue < 0:
+            raise ValueError("max_queue must be >= 0")
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown executor kind '{kind}'. Choose from: thread, process")
+        self.max_workers = max_workers
+        self.kind = kind
+        self.max_queue = max_queue
+        self._executor: Executor | None = None
+        self._manager: SyncManager | None = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Jobs currently running or waiting for a worker."""
+        return self._in_flight
+
+    def _get_executor(self) -> Executor:
+        """Create the underlying pool on first use."""
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="pdf-worker"
+                )
+        return self._executor
+
+    def _new_cancel_event(self) -> threading.Event:
+        """Return an event the job can poll; a manager proxy for process pools."""
+        if self.kind != "process":
+            return threading.Event()
+        if self._manager is None:
+            self._manager = multiprocessing.Manager()
+        return self._manager.Event()
+
+    def job_workers(self, workers: int) -> int:
+        """Worker processes a job on this pool may start for itself.
+
+        Jobs on a process pool already run in a pool process; a nested
+        process pool there would oversubscribe the CPUs the pool was sized
+        for, so such jobs run serially.
+        """
+        if self.kind == "process" and workers > 1:
+            logger.debug("Running with workers=1 instead of %d inside a process pool", workers)
+            return 1
+        return workers
+
+    def _release(self, _future: Future[Any]) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    async def run(
+        self,
+        fn: Callable[..., T],
+        /,
+        *args: Any,
+        cancellable: bool = False,
+        **kwargs: Any,
+    ) -> T:
+        """Run ``fn(*args, **kwargs)`` on the pool and await its result.
+
+        With ``cancellable=True`` a fresh cancel event is passed to ``fn``
+        as the ``cancel_event`` keyword argument. For process pools ``fn``
+        and its arguments must be picklable.
+
+        Raises:
+            ExecutorBusyError: If ``max_workers + max_queue`` jobs are in flight.
+        """
+        with self._lock:
+            limit = self.max_workers + self.max_queue
+            if self._in_flight >= limit:
+                raise ExecutorBusyError(
+                    "PDF worker pool is busy, try again later",
+                    {"in_flight": self._in_flight, "limit": limit},
+                )
+            self._in_flight += 1
+
+        event: threading.Event | None = None
+        try:
+            if cancellable:
+                event = kwargs["cancel_event"] = self._new_cancel_event()
+            future = self._get_executor().submit(fn, *args, **kwargs)
+        except BaseException:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        future.add_done_callback(self._release)
+
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # A queued job is dropped by wrap_future; a running one stops at
+            # its next page check
+            if event is not None:
+                event.set()
+            logger.info("Cancelled %s", getattr(fn, "__name__", fn))
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the pool; queued jobs are cancelled."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+
+_default_executor: PDFExecutor | None = None
+
+
+def default_executor() -> PDFExecutor:
+    """Return the shared executor configured through environment variables.
+
+    ``PDF_MOD_EXECUTOR_KIND`` selects "thread" (default) or "process",
+    ``PDF_MOD_EXECUTOR_WORKERS`` the worker count and
+    ``PDF_MOD_EXECUTOR_QUEUE`` how many jobs may wait for a worker.
+    """
+    global _default_executor
+    if _default_executor is None:
+        kind = os.environ.get("PDF_MOD_EXECUTOR_KIND", DEFAULT_EXECUTOR_KIND)
+        if kind not in EXECUTOR_KINDS:
+            kind = DEFAULT_EXECUTOR_KIND
+        _default_executor = PDFExecutor(
+            max_workers=_env_int("PDF_MOD_EXECUTOR_WORKERS", DEFAULT_EXECUTOR_WORKERS, 1),
+            kind=kind,
+            max_queue=_env_int("PDF_MOD_EXECUTOR_QUEUE", DEFAULT_EXECUTOR_QUEUE, 0),
+        )
+    return _default_executor
+
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    """Read an integer environment variable, falling back on invalid values."""
+    try:
+        value = int(os.environ.get(name, str(default)))
+    except ValueError:
+        return default
+    return value if value >= minimum else default
+
+
+def _portable_source(source: Path | PDFBytes, kind: str) -> Any:
+    """Make a resolved source picklable for process pools."""
+    if kind == "process" and isinstance(source, memoryview):
+        return source.tobytes()
+    return source
+
+
+class _WorkerSource:
+    """A PDF source prepared for the workers of one executor.
+
+    Paths and buffers are resolved right away. File-like objects are read
+    on first use in a thread, so the event loop never blocks on them, and
+    only once, so later calls reuse the bytes.
+    """
+
+    def __init__(self, source: PDFSource, kind: str) -> None:
+        self._kind = kind
+        self._pending: PDFSource | None = None
+        self.resolved: Any = None
+        if isinstance(source, str | os.PathLike | bytes | bytearray | memoryview):
+            self.resolved = _portable_source(resolve_source(source), kind)
+        else:
+            self._pending = source
+
+    async def get(self) -> Any:
+        """Return the resolved source, reading a file-like source if needed."""
+        if self._pending is not None:
+            source = await asyncio.to_thread(resolve_source, self._pending)
+            self.resolved = _portable_source(source, self._kind)
+            self._pending = None
+        return self.resolved
+
+
+def _placeholder(source: _WorkerSource) -> Any:
+    """The resolved source, or empty bytes for a file-like source not yet read."""
+    return source.resolved if source.resolved is not None else b""
+
+
+def _analyzer_call(
+    source: Any,
+    options: dict[str, Any],
+    method: str,
+    args: tuple[Any, ...],
+    cancel_event: CancelEvent | None = None,
+) -> Any:
+    """Run one PDFAnalyzer method in a worker."""
+    analyzer = PDFAnalyzer(source, cancel_event=cancel_event, **options)
+    return getattr(analyzer, method)(*args)
+
+
+def _modifier_call(
+    source: Any,
+    output_path: str | Path | None,
+    options: dict[str, Any],
+    method: str,
+    kwargs: dict[str, Any],
+    cancel_event: CancelEvent | None = None,
+) -> Any:
+    """Run PDFModifier.process or process_to_bytes in a worker."""
+    modifier = PDFModifier(source, output_path, cancel_event=cancel_event, **options)
+    return getattr(modifier, method)(**kwargs)
+
+
+class AsyncPDFAnalyzer:
+    """Awaitable counterpart of PDFAnalyzer.
+
+    Every call opens the document in a worker of ``executor`` (the shared
+    ``default_executor()`` if omitted) and can be cancelled between pages.
+
+    Example:
+        >>> analyzer = AsyncPDFAnalyzer("document.pdf")
+        >>> structure = await analyzer.get_structure()
+        >>> async for page in analyzer.iter_pages():
+        ...     print(page.page, len(page.elements))
+    """
+
+    def __init__(
+        self,
+        file_path: PDFSource,
+        password: str | None = None,
+        max_file_size: int = DEFAULT_MAX_FILE_SIZE_BYTES,
+        span_cache: SpanCache | None = None,
+        memory_map: bool = False,
+        max_mapped_file_size: int = DEFAULT_MAX_MAPPED_FILE_SIZE_BYTES,
+        executor: PDFExecutor | None = None,
+    ) -> None:
+        self.executor = executor or default_executor()
+        self._source = _WorkerSource(file_path, self.executor.kind)
+        self._options: dict[str, Any] = {
+            "password": password,
+            "max_file_size": max_file_size,
+            "span_cache": span_cache,
+            "memory_map": memory_map,
+            "max_mapped_file_size": max_mapped_file_size,
+        }
+        # Fail on invalid arguments here rather than inside a worker; an
+        # unread file-like source stands in as bytes, which it becomes
+        PDFAnalyzer(_placeholder(self._source), **self._options)
+
+    async def _call(self, method: str, *args: Any) -> Any:
+        return await self.executor.run(
+            _analyzer_call,
+            await self._source.get(),
+            self._options,
+            method,
+            args,
+            cancellable=True,
+        )
+
+    async def page_count(self) -> int:
+        """Return the number of pages in the document."""
+        count: int = await self._call("page_count")
+        return count
+
+    async def get_structure(
+        self, start_page: int = 1, page_limit: int | None = None
+    ) -> PDFStructure:
+        """Extract the structure of a page window; see ``PDFAnalyzer.get_structure``."""
+        structure: PDFStructure = await self._call("get_structure", start_page, page_limit)
+        return structure
+
+    async def iter_pages(
+        self,
+        start_page: int = 1,
+        page_limit: int | None = None,
+        chunk_size: int = DEFAULT_PAGE_CHUNK,
+    ) -> AsyncIterator[PageStructure]:
+        """Yield page structures, fetching ``chunk_size`` pages per worker call.
+
+        Only one chunk is held in memory at a time, and the worker is
+        released between chunks.
+
+        Raises:
+            ValueError: If the page window or chunk size is invalid.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        if page_limit is not None and page_limit < 1:
+            raise ValueError("page_limit must be >= 1")
+
+        next_page: int | None = start_page
+        remaining = page_limit
+        while next_page is not None and (remaining is None or remaining > 0):
+            window = chunk_size if remaining is None else min(chunk_size, remaining)
+            structure = await self.get_structure(next_page, window)
+            for page in structure.pages:
+                yield page
+            if remaining is not None:
+                remaining -= len(structure.pages)
+            next_page = structure.next_page
+
+    async def extract_text(self) -> str:
+        """Extract plain text from all pages."""
+        text: str = await self._call("extract_text")
+        return text
+
+    async def inspect_fonts(self, terms: list[str]) -> FontInspectionResult:
+        """Search for terms and report their font properties."""
+        result: FontInspectionResult = await self._call("inspect_fonts", terms)
+        return result
+
+    async def get_hyperlinks(self) -> HyperlinkInventory:
+        """Extract all hyperlinks from the document."""
+        result: HyperlinkInventory = await self._call("get_hyperlinks")
+        return result
+
+    async def extract_embedded_fonts(self) -> list[EmbeddedFontInfo]:
+        """Extract metadata and buffers of all embedded fonts."""
+        fonts: list[EmbeddedFontInfo] = await self._call("extract_embedded_fonts")
+        return fonts
+
+
+class AsyncPDFModifier:
+    """Awaitable counterpart of PDFModifier.
+
+    Runs ``process``/``process_to_bytes`` in a worker of ``executor`` (the
+    shared ``default_executor()`` if omitted). Cancelling the awaiting task
+    stops the job at the next page; nothing is written in that case.
+
+    Example:
+        >>> modifier = AsyncPDFModifier("input.pdf", "output.pdf")
+        >>> result = await modifier.process(ReplacementSpec(replacements={"old": "new"}))
+    """
+
+    def __init__(
+        self,
+        input_path: PDFSource,
+        output_path: str | Path | None = None,
+        password: str | None = None,
+        max_file_size: int = DEFAULT_MAX_FILE_SIZE_BYTES,
+        custom_fonts: dict[str, str] | None = None,
+        span_cache: SpanCache | None = None,
+        incremental: bool = False,
+        memory_map: bool = False,
+        max_mapped_file_size: int = DEFAULT_MAX_MAPPED_FILE_SIZE_BYTES,
+        result_cache: ResultCache | None = None,
+        collect_timings: bool = False,
+        executor: PDFExecutor | None = None,
+    ) -> None:
+        self.executor = executor or default_executor()
+        self._source = _WorkerSource(input_path, self.executor.kind)
+        self._output_path = output_path
+        self._options: dict[str, Any] = {
+            "password": password,
+            "max_file_size": max_file_size,
+            "custom_fonts": custom_fonts,
+            "span_cache": span_cache,
+            "incremental": incremental,
+            "memory_map": memory_map,
+            "max_mapped_file_size": max_mapped_file_size,
+            "result_cache": result_cache,
+            "collect_timings": collect_timings,
+        }
+        # Fail on invalid arguments here rather than inside a worker. Custom
+        # font files are only checked there: that needs the file system
+        PDFModifier(
+            _placeholder(self._source), output_path, **{**self._options, "custom_fonts": None}
+        )
+
+    async def _call(self, method: str, **kwargs: Any) -> Any:
+        return await self.executor.run(
+            _modifier_call,
+            await self._source.get(),
+            self._output_path,
+            self._options,
+            method,
+            kwargs,
+            cancellable=True,
+        )
+
+    async def process(
+        self,
+        spec: ReplacementSpec,
+        pages: tuple[int, int] | None = None,
+        workers: int = 1,
+        save_profile: str = DEFAULT_SAVE_PROFILE,
+    ) -> ModificationResult:
+        """Execute all replacements and save; see ``PDFModifier.process``."""
+        result: ModificationResult = await self._call(
+            "process",
+            spec=spec,
+            pages=pages,
+            workers=self.executor.job_workers(workers),
+            save_profile=save_profile,
+        )
+        return result
+
+    async def process_to_bytes(
+        self,
+        spec: ReplacementSpec,
+        pages: tuple[int, int] | None = None,
+        workers: int = 1,
+        save_profile: str = DEFAULT_SAVE_PROFILE,
+    ) -> tuple[ModificationResult, bytes]:
+        """Execute all replacements in memory; see ``PDFModifier.process_to_bytes``."""
+        result: tuple[ModificationResult, bytes] = await self._call(
+            "process_to_bytes",
+            spec=spec,
+            pages=pages,
+            workers=self.executor.job_workers(workers),
+            save_profile=save_profile,
+        )
+        return result
@@ -0,0 +1,22 @@
+"""Cooperative cancellation for long-running PDF operations."""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+from .exceptions import OperationCancelledError
+
+
+class CancelEvent(Protocol):
+    """Anything with ``is_set()``: ``threading.Event`` or a multiprocessing Event proxy."""
+
+    def is_set(self) -> bool: ...
+
+
+def check_cancelled(event: CancelEvent | None) -> None:
+    """Raise OperationCancelledError if ``event`` has been set.
+
+    Called between pages, so a cancelled operation stops within one page.
+    """
+    if event is not None and event.is_set():
+        raise OperationCancelledError("Operation cancelled")
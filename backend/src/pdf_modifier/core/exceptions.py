@@ -59,3 +59,15 @@ class InvalidPatternError(PDFModifierError):
     """Regex pattern is invalid."""
 
     code = "INVALID_PATTERN"
+
+
+class OperationCancelledError(PDFModifierError):
+    """Operation was cancelled (e.g. the client disconnected) before it finished."""
+
+    code = "CANCELLED"
+
+
+class ExecutorBusyError(PDFModifierError):
+    """The worker pool's queue is full; retry later."""
+
+    code = "BUSY"
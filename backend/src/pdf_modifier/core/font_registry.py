@@ -0,0 +1,121 @@
+"""Per-document registry of loaded and embedded fonts."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import fitz
+
+from ..logger import setup_logging
+
+logger = setup_logging(__name__)
+
+
+class FontRegistry:
+    """Loads each font once per document and embeds custom fonts once.
+
+    ``page.insert_text(..., fontfile=...)`` and ``fitz.Font(fontfile=...)``
+    both re-read and re-parse the font file on every call. The registry
+    keeps one ``fitz.Font`` per font for width measurement, embeds each
+    custom font on the first page that needs it, and on later pages only
+    adds a reference to the existing font object to the page resources.
+
+    A registry is bound to one open document and must be discarded when
+    that document is closed.
+
+    Example:
+        >>> registry = FontRegistry(doc)
+        >>> name = registry.insert_font(page, "/fonts/NotoSansCJK.otf")
+        >>> page.insert_text((72, 72), "你好", fontname=name)
+        >>> registry.font("helv").text_length("Hello", fontsize=12)
+        27.336
+    """
+
+    def __init__(self, doc: fitz.Document) -> None:
+        self._doc = doc
+        self._fonts: dict[str, fitz.Font] = {}
+        self._xrefs: dict[str, tuple[str, int]] = {}
+        self._linked: set[tuple[int, int]] = set()
+
+    @staticmethod
+    def resource_name(fontfile: str) -> str:
+        """Resource name used for a custom font file.
+
+        Must not be a Base 14 name, or PyMuPDF would ignore the file.
+        """
+        return f"__custom_{Path(fontfile).stem}__"
+
+    def font(self, fontname: str, fontfile: str | None = None) -> fitz.Font:
+        """Return the cached ``fitz.Font`` for a Base 14 name or custom font file.
+
+        Args:
+            fontname: Base 14 code (e.g. "helv"); ignored when ``fontfile`` is set.
+            fontfile: Optional path to a TTF/OTF file.
+        """
+        key = fontfile or fontname
+        font = self._fonts.get(key)
+        if font is None:
+            if fontfile:
+                font = fitz.Font(fontbuffer=Path(fontfile).read_bytes())
+            else:
+                font = fitz.Font(fontname=fontname)
+            self._fonts[key] = font
+        return font
+
+    @property
+    def has_custom_fonts(self) -> bool:
+        """Whether any custom font has been embedded."""
+        return bool(self._xrefs)
+
+    def insert_font(self, page: fitz.Page, fontfile: str) -> str:
+        """Make a custom font available on ``page``.
+
+        Args:
+            page: Page that will use the font.
+            fontfile: Path to the TTF/OTF file.
+
+        Returns:
+            Resource name to pass as ``fontname`` to ``insert_text``.
+        """
+        entry = self._xrefs.get(fontfile)
+        if entry is None:
+            fontname = self.resource_name(fontfile)
+            xref = page.insert_font(
+                fontname=fontname, fontbuffer=self.font(fontname, fontfile).buffer
+            )
+            self._xrefs[fontfile] = (fontname, xref)
+            self._linked.add((page.xref, xref))
+            logger.debug("Embedded custom font %s as xref %d", fontfile, xref)
+            return fontname
+
+        fontname, xref = entry
+        if (page.xref, xref) not in self._linked:
+            if not self._link_font(page, fontname, xref):
+                # No own /Resources (inherited or missing): let PyMuPDF add it
+                page.insert_font(fontname=fontname, fontbuffer=self.font(fontname, fontfile).buffer)
+            self._linked.add((page.xref, xref))
+        return fontname
+
+    def _link_font(self, page: fitz.Page, fontname: str, xref: int) -> bool:
+        """Reference an already embedded font from the page's /Resources/Font.
+
+        Returns False if the page has no resource dictionary of its own.
+        """
+        doc = self._doc
+        owner, key = page.xref, "Resources"
+        kind, value = doc.xref_get_key(owner, key)
+        if kind == "xref":
+            owner, key = int(value.split()[0]), ""
+        elif kind != "dict":
+            return False
+
+        ref = f"{xref} 0 R"
+        font_key = f"{key}/Font" if key else "Font"
+        kind, value = doc.xref_get_key(owner, font_key)
+        if kind == "xref":
+            doc.xref_set_key(int(value.split()[0]), fontname, ref)
+        elif kind == "dict":
+            doc.xref_set_key(owner, f"{font_key}/{fontname}", ref)
+        else:
+            doc.xref_set_key(owner, font_key, f"<</{fontname} {ref}>>")
+        return True
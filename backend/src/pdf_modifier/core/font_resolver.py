@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from pathlib import Path
 
 from .models import FontProperties
 
+# (bold, italic, serif, mono) as read from PyMuPDF font flags
+_FlagKey = tuple[bool, bool, bool, bool]
+
+_NO_FLAGS: _FlagKey = (False, False, False, False)
+
 
 class FontResolver:
     """Resolves font properties from PDF spans with enhanced detection.
@@ -14,12 +21,18 @@ class FontResolver:
     font file resolution. Preserves existing ``_get_font_properties`` behavior
     as the fallback path.
 
+    Results are memoized per (font name, flags, custom font set), since a
+    document typically uses a handful of fonts across thousands of spans.
+    Custom font files are validated once per distinct custom font map, not
+    on every lookup; fonts passed to the constructor are validated there.
+
     Example:
         >>> resolver = FontResolver()
         >>> props = resolver.resolve("Arial-BoldMT")
         >>> props.fontname
         'HeBo'
-        >>> props = resolver.resolve("myfont", custom_fonts={"myfont": "/path/to/font.ttf"})
+        >>> resolver = FontResolver(custom_fonts={"myfont": "/path/to/font.ttf"})
+        >>> props = resolver.resolve("myfont")
         >>> props.fontfile
         '/path/to/font.ttf'
     """
@@ -53,6 +66,21 @@ class FontResolver:
         ("zapfdingbats", "ZaDb", False, False, False, False),
     ]
 
+    # All patterns in one regex. Each alternative is a lookahead anchored at
+    # the start, so alternatives are tried in table order and the first
+    # pattern found anywhere in the name wins, exactly like the table scan.
+    _BASE14_REGEX = re.compile(
+        "|".join(f"(?=.*?({re.escape(pattern)}))" for pattern, *_ in _BASE14_PATTERNS),
+        re.DOTALL,
+    )
+
+    _CACHE_SIZE = 1024
+
+    def __init__(self, custom_fonts: dict[str, str] | None = None) -> None:
+        self._custom_fonts = self._valid_custom_fonts(custom_fonts)
+        self._validated: dict[frozenset[tuple[str, str]], frozenset[tuple[str, str]]] = {}
+        self._resolve_cached = lru_cache(maxsize=self._CACHE_SIZE)(self._resolve)
+
     def resolve(
         self,
         font_name: str,
@@ -73,59 +101,72 @@ class FontResolver:
                         ``bold``, ``italic``, ``mono``, ``serif`` (0 or 1).
             custom_fonts: Optional map of alias -> file path for custom fonts.
                           Aliases can match either the raw font name or a
-                          resolved Base 14 code (e.g. "helv").
+                          resolved Base 14 code (e.g. "helv"). Defaults to
+                          the fonts given to the constructor.
 
         Returns:
             FontProperties with resolved fontname, fontfile, and style flags.
+            Memoized results are shared between calls; treat them as read-only.
         """
+        if font_flags:
+            flags: _FlagKey = (
+                font_flags.get("bold", 0) == 1,
+                font_flags.get("italic", 0) == 1,
+                font_flags.get("serif", 0) == 1,
+                font_flags.get("mono", 0) == 1,
+            )
+        else:
+            flags = _NO_FLAGS
+
+        if custom_fonts is None:
+            valid = self._custom_fonts
+        else:
+            key = frozenset(custom_fonts.items())
+            cached = self._validated.get(key)
+            if cached is None:
+                cached = self._validated[key] = self._valid_custom_fonts(custom_fonts)
+            valid = cached
+        return self._resolve_cached(font_name, flags, valid)
+
+    def _resolve(
+        self,
+        font_name: str,
+        flags: _FlagKey,
+        custom_fonts: frozenset[tuple[str, str]],
+    ) -> FontProperties:
+        """Uncached resolution; ``custom_fonts`` holds only valid font files."""
+        fonts = dict(custom_fonts)
+        flag_bold, flag_italic, flag_serif, flag_mono = flags
+
         # Step 1: Check custom fonts by raw font name
-        if custom_fonts and font_name in custom_fonts:
-            font_path = custom_fonts[font_name]
-            if self._is_valid_font_file(font_path):
-                return FontProperties(
-                    fontname=font_name,  # Use font_name as-is (may be Base 14 name)
-                    fontfile=font_path,
-                    is_bold=font_flags.get("bold", 0) == 1 if font_flags else False,
-                    is_italic=font_flags.get("italic", 0) == 1 if font_flags else False,
-                    is_serif=font_flags.get("serif", 0) == 1 if font_flags else False,
-                    is_monospaced=font_flags.get("mono", 0) == 1 if font_flags else False,
-                    embed=True,
-                )
+        if font_name in fonts:
+            return FontProperties(
+                fontname=font_name,  # Use font_name as-is (may be Base 14 name)
+                fontfile=fonts[font_name],
+                is_bold=flag_bold,
+                is_italic=flag_italic,
+                is_serif=flag_serif,
+                is_monospaced=flag_mono,
+                embed=True,
+            )
 
         # Step 2: Base 14 font name matching
-        resolved_fontname: str | None = None
-        is_bold, is_italic, is_serif, is_monospaced = False, False, False, False
-
-        for pattern, fontname, fb, fi, fs, fm in self._BASE14_PATTERNS:
-            if pattern in font_name.lower():
-                resolved_fontname = fontname
-                is_bold, is_italic, is_serif, is_monospaced = fb, fi, fs, fm
-                break
+        match = self._BASE14_REGEX.match(font_name.lower())
+        if match is not None and match.lastindex is not None:
+            _, resolved_fontname, is_bold, is_italic, is_serif, is_monospaced = (
+                self._BASE14_PATTERNS[match.lastindex - 1]
+            )
 
-        if resolved_fontname is not None:
             # Step 3: Apply font flag overrides
-            if font_flags:
-                is_bold = is_bold or font_flags.get("bold", 0) == 1
-                is_italic = is_italic or font_flags.get("italic", 0) == 1
-                is_serif = is_serif or font_flags.get("serif", 0) == 1
-                is_monospaced = is_monospaced or font_flags.get("mono", 0) == 1
+            is_bold = is_bold or flag_bold
+            is_italic = is_italic or flag_italic
+            is_serif = is_serif or flag_serif
+            is_monospaced = is_monospaced or flag_mono
 
             # Step 4: Check if custom font overrides this Base 14 code
-            if custom_fonts and resolved_fontname in custom_fonts:
-                font_path = custom_fonts[resolved_fontname]
-                if self._is_valid_font_file(font_path):
-                    return FontProperties(
-                        fontname=resolved_fontname,
-                        fontfile=font_path,
-                        is_bold=is_bold,
-                        is_italic=is_italic,
-                        is_serif=is_serif,
-                        is_monospaced=is_monospaced,
-                        embed=True,
-                    )
-
             return FontProperties(
                 fontname=resolved_fontname,
+                fontfile=fonts.get(resolved_fontname),
                 is_bold=is_bold,
                 is_italic=is_italic,
                 is_serif=is_serif,
@@ -136,13 +177,22 @@ class FontResolver:
         # Step 5: Fallback to Helvetica
         return FontProperties(
             fontname="helv",
-            is_bold=font_flags.get("bold", 0) == 1 if font_flags else False,
-            is_italic=font_flags.get("italic", 0) == 1 if font_flags else False,
-            is_serif=font_flags.get("serif", 0) == 1 if font_flags else False,
-            is_monospaced=font_flags.get("mono", 0) == 1 if font_flags else False,
+            is_bold=flag_bold,
+            is_italic=flag_italic,
+            is_serif=flag_serif,
+            is_monospaced=flag_mono,
             embed=True,
         )
 
+    @classmethod
+    def _valid_custom_fonts(cls, custom_fonts: dict[str, str] | None) -> frozenset[tuple[str, str]]:
+        """Return the custom font entries whose files are usable."""
+        if not custom_fonts:
+            return frozenset()
+        return frozenset(
+            (alias, path) for alias, path in custom_fonts.items() if cls._is_valid_font_file(path)
+        )
+
     @staticmethod
     def _is_valid_font_file(path: str) -> bool:
         """Check if a path points to a valid TTF or OTF font file."""
@@ -0,0 +1,75 @@
+"""Single-pass target detection for replacement specs."""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .models import ReplacementSpec
+
+
+# Regex constructs whose result depends on text around the match. A pattern
+# using any of them may match a lone span yet not the same span inside the
+# page text (or vice versa), so page-level prefiltering is unsafe for it.
+_CONTEXT_TOKENS = ("^", "$", "\\b", "\\B", "\\A", "\\Z", "\\z", "(?=", "(?!", "(?<=", "(?<!")
+
+
+class TargetMatcher:
+    """Tells whether any replacement target can match a piece of text.
+
+    All targets of a spec are compiled once into a single non-capturing
+    alternation, so a span or merged line is scanned once no matter how
+    many targets the spec holds. The per-target loop in ``PDFModifier``
+    then only runs on text that is known to contain a hit, which keeps its
+    first-target-wins semantics unchanged.
+
+    Regex patterns that define capture groups are kept out of the
+    alternation (their backreferences would be renumbered) and are checked
+    individually instead.
+
+    ``context_free`` reports whether a match inside a span also implies a
+    match inside any text containing that span — always true for literals,
+    and true for regex specs without anchors, word boundaries or lookarounds.
+
+    Example:
+        >>> spec = ReplacementSpec(replacements={"Draft": "Final", "2024": "2025"})
+        >>> matcher = TargetMatcher(spec)
+        >>> matcher.may_match("Draft copy")
+        True
+        >>> matcher.may_match("Nothing here")
+        False
+    """
+
+    def __init__(self, spec: ReplacementSpec) -> None:
+        self.spec = spec
+        self.context_free = True
+        self._separate: list[re.Pattern[str]] = []
+
+        if spec.use_regex and spec.compiled_patterns:
+            self.context_free = not any(
+                token in pattern for pattern in spec.replacements for token in _CONTEXT_TOKENS
+            )
+            combinable: list[str] = []
+            for pattern in spec.compiled_patterns.values():
+                if pattern.groups:
+                    self._separate.append(pattern)
+                else:
+                    combinable.append(f"(?:{pattern.pattern})")
+        else:
+            combinable = [re.escape(target) for target in spec.replacements]
+
+        self._combined: re.Pattern[str] | None = None
+        if combinable:
+            try:
+                self._combined = re.compile("|".join(combinable))
+            except re.error:
+                # e.g. inline global flags that are only valid at pattern start
+                assert spec.compiled_patterns is not None
+                self._separate = list(spec.compiled_patterns.values())
+
+    def may_match(self, text: str) -> bool:
+        """Return True if at least one target matches somewhere in ``text``."""
+        if self._combined is not None and self._combined.search(text):
+            return True
+        return any(pattern.search(text) for pattern in self._separate)
@@ -67,6 +67,9 @@ class PDFStructure(BaseModel):
     file_path: str
     total_pages: int
     pages: list[PageStructure]
+    next_page: int | None = Field(
+        default=None, description="First page of the next window, if any pages remain"
+    )
 
 
 class FontMatch(BaseModel):
@@ -108,6 +111,31 @@ class HyperlinkInventory(BaseModel):
     links: list[Hyperlink]
 
 
+class PageTimings(BaseModel):
+    """Time spent on one page of a modification run."""
+
+    page: int = Field(description="1-indexed page number")
+    seconds: float = Field(description="Total time of the page's stages")
+    stages: dict[str, float] = Field(default_factory=dict, description="Seconds per stage")
+    counters: dict[str, int] = Field(default_factory=dict)
+
+
+class ModificationTimings(BaseModel):
+    """Per-stage timings and counters of a modification run."""
+
+    total_seconds: float
+    stages: dict[str, float] = Field(
+        default_factory=dict,
+        description=(
+            "Seconds per stage: open, result_cache, textpage, get_text_dict, match, "
+            "parallel_scan, apply_redactions, insert_text, save"
+        ),
+    )
+    counters: dict[str, int] = Field(default_factory=dict)
+    pages_timed: int = Field(default=0, description="Pages with per-page timings")
+    slowest_pages: list[PageTimings] = Field(default_factory=list)
+
+
 class ModificationResult(BaseModel):
     """Result of PDF modification operation."""
 
@@ -117,6 +145,21 @@ class ModificationResult(BaseModel):
     replacements_made: int
     pages_modified: int
     warnings: list[str] = Field(default_factory=list)
+    save_mode: str = Field(
+        default="full",
+        description='How the output was written: "full" rewrite or "incremental" update',
+    )
+    save_profile: str = Field(default="fast", description="Save optimization profile used")
+    save_seconds: float = Field(
+        default=0.0, description="Time spent writing the output file; 0 on a cache hit"
+    )
+    output_size_bytes: int = Field(default=0, description="Size of the written output file")
+    cache_hit: bool = Field(
+        default=False, description="Output was served from the result cache, not recomputed"
+    )
+    timings: ModificationTimings | None = Field(
+        default=None, description="Per-stage and per-page timings, when requested"
+    )
 
 
 class BatchResult(BaseModel):
@@ -2,28 +2,80 @@
 
 from __future__ import annotations
 
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from .result_cache import ResultCache
+
 import fitz
 
 from ..logger import setup_logging
+from .cancel import CancelEvent, check_cancelled
 from .exceptions import (
     FileSizeExceededError,
     PDFModifierError,
     PDFNotFoundError,
     PDFPasswordError,
     PDFReadError,
+    PDFWriteError,
 )
+from .font_registry import FontRegistry
 from .font_resolver import FontResolver
+from .matcher import TargetMatcher
 from .models import BatchResult, ModificationResult, ReplacementSpec
+from .pdf_source import IN_MEMORY_NAME, PDFSource, map_file, resolve_source
+from .span_cache import TEXT_FLAGS, SpanCache, source_digest
+from .span_table import SpanTable
+from .timings import TimingCollector
 
 logger = setup_logging(__name__)
 
 DEFAULT_MAX_FILE_SIZE_BYTES: int = 100 * 1024 * 1024  # 100 MB
+# Memory-mapped files are paged in on demand, so far larger inputs are safe
+DEFAULT_MAX_MAPPED_FILE_SIZE_BYTES: int = 4 * 1024 * 1024 * 1024  # 4 GB
+
+# Named PyMuPDF save options. "fast" is a plain rewrite with no compression
+# or cleanup; "smallest" also subsets embedded fonts before saving.
+# Exception: once a custom font was embedded, every profile subsets fonts
+# and deflates font streams. A full custom font (e.g. CJK) adds megabytes
+# per output, PyMuPDF can only subset all fonts of a document at once, and
+# subset fonts keep a zero-filled glyph table that is only small deflated.
+SAVE_PROFILES: dict[str, dict[str, int]] = {
+    "fast": {},
+    "balanced": {"garbage": 1, "deflate": 1},
+    "smallest": {
+        "garbage": 3,
+        "deflate": 1,
+        "deflate_images": 1,
+        "deflate_fonts": 1,
+        "use_objstms": 1,
+    },
+}
+DEFAULT_SAVE_PROFILE = "fast"
+_SUBSET_FONTS_PROFILES = frozenset({"smallest"})
+
+# Called as ``(pages_done, pages_total)`` after each page is processed
+PageProgressCallback = Callable[[int, int], None]
+
+
+def _validate_save_profile(save_profile: str, incremental: bool = False) -> None:
+    """Raise ValueError for unknown profiles or ones incompatible with incremental saves."""
+    if save_profile not in SAVE_PROFILES:
+        raise ValueError(
+            f"Unknown save profile '{save_profile}'. Choose from: {', '.join(SAVE_PROFILES)}"
+        )
+    if incremental and save_profile != DEFAULT_SAVE_PROFILE:
+        raise ValueError(f"Save profile '{save_profile}' cannot be used with incremental saves")
 
 
 class PDFModifier:
@@ -35,6 +87,29 @@ class PDFModifier:
     - Regex pattern matching
     - Hyperlink creation (text|URL syntax)
     - Font style preservation (Base 14 fonts)
+    - Incremental saves: the output is a copy of the input with only the
+      changed objects appended. Much faster on large files, but the
+      original content is still present in the file, so do not use it to
+      remove sensitive text.
+    - In-memory documents: the input may be bytes, a memoryview or a binary
+      file object, and ``process_to_bytes`` returns the output without
+      touching the filesystem.
+    - Memory-mapped input (``memory_map=True``) for multi-GB files: pages
+      are read from the mapping on demand, and ``max_mapped_file_size``
+      replaces ``max_file_size`` as the limit.
+    - Cooperative cancellation: once ``cancel_event`` is set, processing
+      stops at the next page with OperationCancelledError and nothing is
+      written.
+    - Progress reporting: ``on_progress`` is called with
+      ``(pages_done, pages_total)`` after every processed page.
+    - Result caching: with a ``result_cache``, repeating a request for the
+      same input bytes and options returns the stored output and result
+      (``cache_hit=True``) instead of running the pipeline again.
+    - Timings: with ``collect_timings=True`` the result's ``timings`` holds
+      seconds per stage (open, textpage, get_text_dict, match,
+      apply_redactions, insert_text, save), counters, and the slowest
+      pages. They are also logged. Off by default; the overhead is a few
+      clock reads per page.
 
     Example:
         >>> spec = ReplacementSpec(replacements={"old": "new"})
@@ -45,28 +120,59 @@ class PDFModifier:
         # Or with context manager:
         >>> with PDFModifier("input.pdf", "output.pdf") as modifier:
         ...     result = modifier.process(spec)
+
+        # Entirely in memory:
+        >>> result, pdf_bytes = PDFModifier(upload_bytes).process_to_bytes(spec)
     """
 
     def __init__(
         self,
-        input_path: str | Path,
-        output_path: str | Path,
+        input_path: PDFSource,
+        output_path: str | Path | None = None,
         password: str | None = None,
         max_file_size: int = DEFAULT_MAX_FILE_SIZE_BYTES,
         custom_fonts: dict[str, str] | None = None,
+        span_cache: SpanCache | None = None,
+        incremental: bool = False,
+        memory_map: bool = False,
+        max_mapped_file_size: int = DEFAULT_MAX_MAPPED_FILE_SIZE_BYTES,
+        cancel_event: CancelEvent | None = None,
+        on_progress: PageProgressCallback | None = None,
+        result_cache: ResultCache | None = None,
+        collect_timings: bool = False,
     ) -> None:
-        self.input_path = Path(input_path).absolute()
-        self.output_path = Path(output_path).absolute()
+        source = resolve_source(input_path)
+        self._source = source.absolute() if isinstance(source, Path) else source
+        self.input_path = self._source if isinstance(self._source, Path) else None
+        self.output_path = Path(output_path).absolute() if output_path is not None else None
         self.password = password
         self.max_file_size = max_file_size
+        self.span_cache = span_cache
+        self.incremental = incremental
+        self.memory_map = memory_map
+        self.max_mapped_file_size = max_mapped_file_size
+        self.cancel_event = cancel_event
+        self.on_progress = on_progress
+        self.result_cache = result_cache
+        self.collect_timings = collect_timings
         self._custom_fonts = self._validate_custom_fonts(custom_fonts or {})
-        self._font_resolver = FontResolver()
+        self._font_resolver = FontResolver(custom_fonts=self._custom_fonts)
 
-        if self.input_path == self.output_path:
+        if self.input_path is not None and self.input_path == self.output_path:
             raise ValueError("Input and output paths cannot be the same. Risk of file corruption.")
+        if memory_map and self.input_path is None:
+            raise ValueError("memory_map requires a file path input")
 
         self._doc: fitz.Document | None = None
         self._warnings: list[str] = []
+        self._matcher: TargetMatcher | None = None
+        self._span_records: list[dict[str, Any]] | None = None
+        self._font_registry: FontRegistry | None = None
+        self._timings: TimingCollector | None = None
+        self._open_seconds = 0.0
+        self._source_digest: str | None = None
+        # Whether a run changed the open document, so it no longer matches the input
+        self._doc_modified = False
 
     @staticmethod
     def _parse_flags(raw_flags: int | dict[str, int] | None) -> dict[str, int] | None:
@@ -100,29 +206,60 @@ class PDFModifier:
                 raise ValueError(f"font file must be .ttf or .otf: {path}")
         return custom_fonts
 
-    def _open_doc(self) -> fitz.Document:
-        """Safely open the document with password authentication if required."""
-        if not self.input_path.exists():
-            raise PDFNotFoundError(
-                f"PDF file not found: {self.input_path}",
-                {"path": str(self.input_path)},
-            )
+    def _check_source(self) -> None:
+        """Raise if the input file is missing or over the size limit."""
+        source = self._source
+        if isinstance(source, Path):
+            if not source.exists():
+                raise PDFNotFoundError(
+                    f"PDF file not found: {source}",
+                    {"path": str(source)},
+                )
+            file_size = source.stat().st_size
+        else:
+            file_size = memoryview(source).nbytes
 
-        file_size = self.input_path.stat().st_size
-        if file_size > self.max_file_size:
+        limit = self.max_mapped_file_size if self.memory_map else self.max_file_size
+        if file_size > limit:
             size_mb = file_size / (1024 * 1024)
-            limit_mb = self.max_file_size / (1024 * 1024)
+            limit_mb = limit / (1024 * 1024)
             raise FileSizeExceededError(
                 f"PDF file is {size_mb:.1f} MB, exceeds limit of {limit_mb:.0f} MB",
                 {
-                    "path": str(self.input_path),
+                    "path": self._input_name,
                     "size_bytes": file_size,
-                    "limit_bytes": self.max_file_size,
+                    "limit_bytes": limit,
                 },
             )
 
+    def _open_doc(self) -> fitz.Document:
+        """Safely open the document with password authentication if required."""
+        self._check_source()
+        source = self._source
+        if self.incremental:
+            # Incremental updates must be appended to the file the document
+            # was opened from, so edit a copy placed at the output path
+            assert self.output_path is not None
+            try:
+                self._unshare_output()
+                if isinstance(source, Path):
+                    shutil.copyfile(source, self.output_path)
+                else:
+                    self.output_path.write_bytes(source)
+            except OSError as e:
+                raise PDFWriteError(
+                    f"Cannot create output file: {e}", {"path": str(self.output_path)}
+                ) from e
+            source = self.output_path
+
         try:
-            doc = fitz.open(self.input_path)
+            # The incremental copy must stay file-backed for the appending save
+            if isinstance(source, Path) and self.memory_map and not self.incremental:
+                doc = fitz.open(stream=map_file(source), filetype="pdf")
+            elif isinstance(source, Path):
+                doc = fitz.open(source)
+            else:
+                doc = fitz.open(stream=source, filetype="pdf")
             if doc.needs_pass:
                 if not self.password:
                     raise PDFPasswordError("PDF is password protected. Please provide a password.")
@@ -130,12 +267,64 @@ class PDFModifier:
                     raise PDFPasswordError("Incorrect password provided for the PDF.")
             return doc
         except PDFPasswordError:
+            self._discard_incremental_copy()
             raise
         except Exception as e:
-            raise PDFReadError(f"Cannot open PDF: {e}", {"path": str(self.input_path)}) from e
+            self._discard_incremental_copy()
+            raise PDFReadError(f"Cannot open PDF: {e}", {"path": self._input_name}) from e
 
-    def __enter__(self) -> PDFModifier:
+    @property
+    def _input_name(self) -> str:
+        """Input path for messages and results; a placeholder for in-memory input."""
+        return str(self.input_path) if self.input_path else IN_MEMORY_NAME
+
+    def _unshare_output(self) -> None:
+        """Unlink an output file that is hard-linked elsewhere before rewriting it.
+
+        Writing into it would also change the other names, e.g. a result
+        cache entry the output was served from.
+        """
+        assert self.output_path is not None
+        try:
+            if self.output_path.stat().st_nlink > 1:
+                self.output_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _discard_incremental_copy(self) -> None:
+        """Remove the output copy made for an incremental save that never happened."""
+        if self.incremental and self.output_path is not None:
+            self.output_path.unlink(missing_ok=True)
+
+    def _load_span_records(self) -> list[dict[str, Any]] | None:
+        """Load previously extracted page records from the span cache, if any.
+
+        The modifier only reads the cache: populating it would force a full
+        dict extraction of pages the prefilter would otherwise skip.
+        """
+        doc = self._doc
+        if self.span_cache is None or doc is None or doc.needs_pass:
+            return None
+        records = self.span_cache.get(self.span_cache.key_for(self._source, self._digest()))
+        if records is None or len(records) != len(doc):
+            return None
+        return records
+
+    def _digest(self) -> str:
+        """SHA-256 of the input, computed once per opened document or run."""
+        if self._source_digest is None:
+            self._source_digest = source_digest(self._source)
+        return self._source_digest
+
+    def _open(self) -> None:
+        """Open the document and load its cached span records, timing both."""
+        start = time.perf_counter()
         self._doc = self._open_doc()
+        self._span_records = self._load_span_records()
+        self._open_seconds = time.perf_counter() - start
+
+    def __enter__(self) -> PDFModifier:
+        self._open()
         return self
 
     def __exit__(self, *args: Any) -> None:
@@ -146,6 +335,21 @@ class PDFModifier:
         if self._doc:
             self._doc.close()
             self._doc = None
+        self._span_records = None
+        self._font_registry = None
+        self._source_digest = None
+        self._doc_modified = False
+
+    def _stage(self, name: str, page: int | None = None) -> AbstractContextManager[None]:
+        """Time a block as stage ``name`` when collecting timings."""
+        if self._timings is None:
+            return nullcontext()
+        return self._timings.stage(name, page)
+
+    def _count(self, name: str, n: int = 1, page: int | None = None) -> None:
+        """Increase a timings counter when collecting timings."""
+        if self._timings is not None:
+            self._timings.count(name, n, page)
 
     def _apply_replacements_to_page(
         self,
@@ -153,24 +357,78 @@ class PDFModifier:
         items: list[dict[str, Any]],
     ) -> int:
         """Apply replacements to a single page. Returns count of replacements."""
-        for item in items:
-            if "bboxes" in item:
-                for bbox in item["bboxes"]:
+        areas = 0
+        with self._stage("apply_redactions", page.number):
+            for item in items:
+                for bbox in item.get("bboxes", [item["bbox"]]):
                     page.add_redact_annot(bbox, fill=(1, 1, 1))
-            else:
-                page.add_redact_annot(item["bbox"], fill=(1, 1, 1))
-
-        page.apply_redactions()
+                    areas += 1
+            page.apply_redactions()
+        self._count("redaction_areas", areas, page.number)
 
-        for item in items:
-            self._insert_replacement(page, item)
+        with self._stage("insert_text", page.number):
+            for item in items:
+                self._insert_replacement(page, item)
+        self._count("replacements", len(items), page.number)
 
         return len(items)
 
+    def _collect_replacements_parallel(
+        self,
+        spec: ReplacementSpec,
+        page_indices: range,
+        workers: int,
+    ) -> dict[int, list[dict[str, Any]]]:
+        """Collect replacement items for a page range across worker processes.
+
+        The range is split into contiguous chunks; each worker opens its own
+        copy of the input document and runs ``_collect_replacements`` on its
+        chunk. Only the (picklable) replacement items travel back, so the
+        redact-and-insert step still runs on this instance's document and
+        links, fonts and page order are untouched by the merge.
+        """
+        chunk_count = min(workers, len(page_indices))
+        chunk_size, remainder = divmod(len(page_indices), chunk_count)
+        chunks: list[range] = []
+        start = page_indices.start
+        for i in range(chunk_count):
+            stop = start + chunk_size + (1 if i < remainder else 0)
+            chunks.append(range(start, stop))
+            start = stop
+
+        # memoryviews cannot be pickled; workers get their own copy of the bytes
+        source = self._source
+        if isinstance(source, memoryview):
+            source = source.tobytes()
+
+        collected: dict[int, list[dict[str, Any]]] = {}
+        with ProcessPoolExecutor(max_workers=chunk_count) as executor:
+            futures = [
+                executor.submit(
+                    _collect_page_chunk,
+                    source,
+                    self.password,
+                    self.max_file_size,
+                    self._custom_fonts,
+                    self.span_cache,
+                    spec,
+                    chunk,
+                    self.memory_map,
+                    self.max_mapped_file_size,
+                    self._source_digest,
+                )
+                for chunk in chunks
+            ]
+            for future in futures:
+                collected.update(future.result())
+                check_cancelled(self.cancel_event)
+        return collected
+
     def _process_pages(
         self,
         spec: ReplacementSpec,
         pages: tuple[int, int] | None = None,
+        workers: int = 1,
     ) -> tuple[int, set[int]]:
         """Process pages and return (total_replacements, pages_modified).
 
@@ -178,6 +436,8 @@ class PDFModifier:
             spec: Replacement specification.
             pages: Optional (start, end) 1-indexed inclusive range.
                    None processes all pages.
+            workers: Number of worker processes used to scan pages for
+                     matches. 1 scans serially in this process.
 
         Raises:
             ValueError: If page range is invalid or out of bounds.
@@ -205,25 +465,117 @@ class PDFModifier:
         total = 0
         pages_modified: set[int] = set()
 
-        for page_num in page_indices:
+        collected: dict[int, list[dict[str, Any]]] | None = None
+        # Workers open the input, so they cannot scan a document an earlier
+        # run in a with block has already edited
+        if workers > 1 and len(page_indices) > 1 and not self._doc_modified:
+            # Workers scan pages in their own processes; only the total is timed
+            with self._stage("parallel_scan"):
+                collected = self._collect_replacements_parallel(spec, page_indices, workers)
+
+        for done, page_num in enumerate(page_indices, start=1):
+            check_cancelled(self.cancel_event)
             page = doc[page_num]
-            items = self._collect_replacements(page, spec)
-            if not items:
-                continue
-            pages_modified.add(page_num)
-            total += self._apply_replacements_to_page(page, items)
+            if collected is not None:
+                items = collected.get(page_num, [])
+            else:
+                items = self._collect_replacements(page, spec)
+            self._count("pages_scanned")
+            if items:
+                pages_modified.add(page_num)
+                total += self._apply_replacements_to_page(page, items)
+            if self.on_progress is not None:
+                self.on_progress(done, len(page_indices))
 
         return total, pages_modified
 
-    def _save_and_log(self) -> None:
-        """Save the modified document and log the result."""
-        self._doc.save(str(self.output_path))  # type: ignore[union-attr]
-        logger.info("Saved %s", self.output_path)
+    def _save_and_log(self, save_profile: str = DEFAULT_SAVE_PROFILE) -> tuple[str, float]:
+        """Save the modified document and log the result.
+
+        Args:
+            save_profile: Name of the ``SAVE_PROFILES`` entry used for full saves.
+
+        Returns:
+            Tuple of (save mode actually used, seconds spent saving).
+        """
+        doc = self._doc
+        assert doc is not None
+        assert self.output_path is not None
+        start = time.perf_counter()
+        mode = "full"
+        options = self._prepare_save(doc, save_profile)
+
+        if not self.incremental:
+            self._unshare_output()
+            doc.save(str(self.output_path), **options)
+        elif not doc.is_repaired:
+            # can_save_incrementally() is always False once redactions are
+            # applied, since the removed text stays in the original bytes.
+            # Callers opting into incremental mode accept exactly that.
+            doc.save(
+                str(self.output_path),
+                incremental=True,
+                encryption=fitz.PDF_ENCRYPT_KEEP,
+                **options,
+            )
+            mode = "incremental"
+        else:
+            # A damaged file MuPDF rebuilt on open has no valid xref to append to
+            msg = "Incremental save not possible for this file; wrote a full copy instead"
+            logger.warning(msg)
+            self._warnings.append(msg)
+            fd, tmp_name = tempfile.mkstemp(dir=self.output_path.parent, suffix=".pdf")
+            os.close(fd)
+            doc.save(tmp_name, **options)
+            os.replace(tmp_name, self.output_path)
+        elapsed = time.perf_counter() - start
+        logger.info("Saved %s (%s/%s, %.3fs)", self.output_path, mode, save_profile, elapsed)
+        return mode, elapsed
+
+    def _save_to_bytes(self, save_profile: str = DEFAULT_SAVE_PROFILE) -> tuple[bytes, float]:
+        """Serialize the modified document to bytes.
+
+        Returns:
+            Tuple of (PDF bytes, seconds spent serializing).
+        """
+        doc = self._doc
+        assert doc is not None
+        start = time.perf_counter()
+        data = doc.tobytes(**self._prepare_save(doc, save_profile))
+        elapsed = time.perf_counter() - start
+        logger.info("Saved %d bytes in memory (%s, %.3fs)", len(data), save_profile, elapsed)
+        return data, elapsed
+
+    def _prepare_save(self, doc: fitz.Document, save_profile: str) -> dict[str, int]:
+        """Subset fonts if needed and return the PyMuPDF save options.
+
+        See ``SAVE_PROFILES`` for why custom fonts override the profile.
+        """
+        options = dict(SAVE_PROFILES[save_profile])
+        custom_fonts = self._font_registry is not None and self._font_registry.has_custom_fonts
+        if custom_fonts or save_profile in _SUBSET_FONTS_PROFILES:
+            self._subset_fonts(doc)
+        if custom_fonts:
+            # Subsets keep the full glyph table zero-filled; they are only
+            # small once compressed
+            options["deflate_fonts"] = 1
+        return options
+
+    def _subset_fonts(self, doc: fitz.Document) -> None:
+        """Shrink embedded fonts to the glyphs actually used; best-effort."""
+        try:
+            doc.subset_fonts()
+        except Exception as e:
+            msg = f"Font subsetting failed, saving full fonts: {e}"
+            logger.warning(msg)
+            self._warnings.append(msg)
 
     def process(
         self,
         spec: ReplacementSpec,
         pages: tuple[int, int] | None = None,
+        workers: int = 1,
+        save_profile: str = DEFAULT_SAVE_PROFILE,
     ) -> ModificationResult:
         """
         Execute all replacements and return structured result.
@@ -234,22 +586,119 @@ class PDFModifier:
             spec: ReplacementSpec containing replacements and options.
             pages: Optional (start, end) 1-indexed inclusive page range.
                    None processes all pages.
+            workers: Number of worker processes used to scan pages for
+                     matches. Useful for very large single documents.
+            save_profile: Output optimization profile, one of ``SAVE_PROFILES``:
+                          "fast" (no compression), "balanced" (drop unused
+                          objects, compress streams) or "smallest" (also
+                          merge duplicates, object streams, font subsetting).
 
         Returns:
             ModificationResult with success status and statistics.
 
         Raises:
             PDFReadError: If the PDF cannot be opened.
-            ValueError: If page range is invalid.
+            OperationCancelledError: If ``cancel_event`` was set; checked between pages.
+            PDFWriteError: If the output copy for an incremental save cannot be created.
+            ValueError: If page range is invalid, workers is less than 1, no
+                        output path was given, or the save profile is unknown
+                        or combined with an incremental save.
+        """
+        if self.output_path is None:
+            raise ValueError("No output path given; use process_to_bytes() for in-memory output")
+        result, _ = self._run(spec, pages, workers, save_profile, to_bytes=False)
+        return result
+
+    def process_to_bytes(
+        self,
+        spec: ReplacementSpec,
+        pages: tuple[int, int] | None = None,
+        workers: int = 1,
+        save_profile: str = DEFAULT_SAVE_PROFILE,
+    ) -> tuple[ModificationResult, bytes]:
         """
-        doc_opened_here = False
-        if not self._doc:
-            self._doc = self._open_doc()
-            doc_opened_here = True
+        Execute all replacements and return the modified PDF as bytes.
+
+        Same as ``process`` but nothing is written to ``output_path``; the
+        result's ``output_path`` is ``"<memory>"``.
 
+        Args:
+            spec: ReplacementSpec containing replacements and options.
+            pages: Optional (start, end) 1-indexed inclusive page range.
+            workers: Number of worker processes used to scan pages for matches.
+            save_profile: Output optimization profile, one of ``SAVE_PROFILES``.
+
+        Returns:
+            Tuple of (ModificationResult, modified PDF bytes).
+
+        Raises:
+            PDFReadError: If the PDF cannot be opened.
+            OperationCancelledError: If ``cancel_event`` was set; checked between pages.
+            ValueError: If page range is invalid, workers is less than 1, the
+                        save profile is unknown, or the modifier was created
+                        with ``incremental=True`` (which needs an output file).
+        """
+        if self.incremental:
+            raise ValueError("Incremental saves need an output file; use process()")
+        result, data = self._run(spec, pages, workers, save_profile, to_bytes=True)
+        assert data is not None
+        return result, data
+
+    def _run(
+        self,
+        spec: ReplacementSpec,
+        pages: tuple[int, int] | None,
+        workers: int,
+        save_profile: str,
+        to_bytes: bool,
+    ) -> tuple[ModificationResult, bytes | None]:
+        """Open, modify and save the document; shared by process() and process_to_bytes()."""
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        _validate_save_profile(save_profile, self.incremental)
+
+        self._timings = TimingCollector() if self.collect_timings else None
+        doc_opened_here = self._doc is None
+        if doc_opened_here:
+            # The input may have changed since an earlier run of this modifier
+            self._source_digest = None
+
+        # Looked up before opening, so a hit skips the open and the copy
+        # made for incremental saves. An earlier run in a with block may
+        # have edited the open document: its output is not the output for
+        # the input, so it is neither served from nor stored in the cache.
+        cache_key = None
+        if not self._doc_modified:
+            cache_key = self._result_cache_key(spec, pages, save_profile)
+        if cache_key is not None:
+            with self._stage("result_cache"):
+                cached = self._load_cached_result(cache_key, to_bytes)
+            if cached is not None:
+                self._record_open()
+                return self._with_timings(cached[0]), cached[1]
+
+        if doc_opened_here:
+            self._open()
+        self._record_open()
+        if cache_key is not None and self._doc is not None and self._doc.is_encrypted:
+            cache_key = None
+
+        saved = False
+        data: bytes | None = None
+        # Assume the worst if processing fails halfway through the pages
+        modified = True
         try:
-            total, pages_modified = self._process_pages(spec, pages)
-            self._save_and_log()
+            total, pages_modified = self._process_pages(spec, pages, workers)
+            modified = bool(pages_modified)
+            check_cancelled(self.cancel_event)
+            if to_bytes:
+                data, save_seconds = self._save_to_bytes(save_profile)
+                save_mode = "full"
+            else:
+                save_mode, save_seconds = self._save_and_log(save_profile)
+            if self._timings is not None:
+                self._timings.add("save", save_seconds)
+            saved = True
         except ValueError:
             raise
         except PDFModifierError:
@@ -257,16 +706,116 @@ class PDFModifier:
         except Exception as e:
             raise PDFReadError(f"Failed to process PDF pages: {e}") from e
         finally:
+            if modified:
+                self._doc_modified = True
+                # Cached span records describe the input, not the edited pages
+                self._span_records = None
             if doc_opened_here:
                 self.close()
+                if not saved:
+                    self._discard_incremental_copy()
 
-        return ModificationResult(
+        if data is not None:
+            output_name, output_size = IN_MEMORY_NAME, len(data)
+        else:
+            assert self.output_path is not None
+            output_name, output_size = str(self.output_path), self.output_path.stat().st_size
+
+        result = ModificationResult(
             success=True,
-            input_path=str(self.input_path),
-            output_path=str(self.output_path),
+            input_path=self._input_name,
+            output_path=output_name,
             replacements_made=total,
             pages_modified=len(pages_modified),
             warnings=self._warnings,
+            save_mode=save_mode,
+            save_profile=save_profile,
+            save_seconds=save_seconds,
+            output_size_bytes=output_size,
+        )
+        if cache_key is not None and self.result_cache is not None:
+            output = data if data is not None else self.output_path
+            assert output is not None
+            self.result_cache.put(cache_key, result, output)
+        return self._with_timings(result), data
+
+    def _record_open(self) -> None:
+        """Add the time spent opening the document to this run's timings."""
+        if self._timings is not None:
+            # Opened by __enter__ for the first run in a with block
+            self._timings.add("open", self._open_seconds)
+        self._open_seconds = 0.0
+
+    def _with_timings(self, result: ModificationResult) -> ModificationResult:
+        """Attach and log the collected timings; ``result`` as is when not collecting."""
+        if self._timings is None:
+            return result
+        timings = self._timings.result()
+        self._timings = None
+        logger.info(
+            "Timings for %s: %.3fs over %d pages",
+            self._input_name,
+            timings.total_seconds,
+            timings.pages_timed,
+            extra={"data": {"input_path": self._input_name, **timings.model_dump()}},
+        )
+        return result.model_copy(update={"timings": timings})
+
+    def _result_cache_key(
+        self, spec: ReplacementSpec, pages: tuple[int, int] | None, save_profile: str
+    ) -> str | None:
+        """Cache key of this request, or None if it must not be cached.
+
+        Password-protected documents are never cached, so a hit cannot
+        hand out content without the password: _run() drops the key of an
+        encrypted document once it is open, so no entry is ever stored for
+        one. Missing or oversized inputs fail here as they would on open.
+        """
+        if self.result_cache is None or self.password is not None:
+            return None
+        self._check_source()
+        return self.result_cache.key_for(
+            self._source,
+            spec,
+            pages,
+            save_profile,
+            self.incremental,
+            self._custom_fonts,
+            digest=self._digest(),
+        )
+
+    def _load_cached_result(
+        self, key: str, to_bytes: bool
+    ) -> tuple[ModificationResult, bytes | None] | None:
+        """Return the cached result (and bytes) for ``key``, placing the output file."""
+        assert self.result_cache is not None
+        data: bytes | None = None
+        if to_bytes:
+            hit = self.result_cache.get_bytes(key)
+            if hit is None:
+                return None
+            result, data = hit
+            output_name = IN_MEMORY_NAME
+        else:
+            assert self.output_path is not None
+            cached = self.result_cache.get(key, self.output_path)
+            if cached is None:
+                return None
+            result, output_name = cached, str(self.output_path)
+        logger.info("Served %s from the result cache", output_name)
+        return (
+            result.model_copy(
+                update={
+                    "input_path": self._input_name,
+                    "output_path": output_name,
+                    "cache_hit": True,
+                    # Nothing was saved by this run; the stored run's figures
+                    # would misreport it
+                    "save_seconds": 0.0,
+                    "timings": None,
+                }
+            ),
+            data,
         )
 
     def _get_font_properties(self, font_name: str) -> tuple[str, str]:
@@ -331,6 +880,24 @@ class PDFModifier:
 
         return new_text, url
 
+    def _get_matcher(self, spec: ReplacementSpec) -> TargetMatcher:
+        """Return the compiled TargetMatcher for ``spec``, building it once."""
+        if self._matcher is None or self._matcher.spec is not spec:
+            self._matcher = TargetMatcher(spec)
+        return self._matcher
+
+    def _page_may_match(self, spec: ReplacementSpec, page_text: Callable[[], str]) -> bool:
+        """Cheap page-level check on plain text before full dict extraction.
+
+        Every span and every merged line is a substring of the page text, so
+        a context-free spec that finds nothing there cannot match any span.
+        ``page_text`` is only called when the check applies.
+        """
+        matcher = self._get_matcher(spec)
+        if not matcher.context_free:
+            return True
+        return matcher.may_match(page_text())
+
     def _match_single_span(
         self,
         span: dict[str, Any],
@@ -340,6 +907,10 @@ class PDFModifier:
         text = span["text"].strip()
         original = span["text"]
 
+        # Single scan over all targets; most spans stop here
+        if not self._get_matcher(spec).may_match(text):
+            return None
+
         for target, replacement_raw in spec.replacements.items():
             match_found = False
             if spec.use_regex and spec.compiled_patterns:
@@ -354,11 +925,7 @@ class PDFModifier:
                 # Convert int flags to dict if needed
                 raw_flags = span.get("flags")
                 font_flags = self._parse_flags(raw_flags)
-                font_props = self._font_resolver.resolve(
-                    span["font"],
-                    font_flags=font_flags,
-                    custom_fonts=self._custom_fonts,
-                )
+                font_props = self._font_resolver.resolve(span["font"], font_flags=font_flags)
                 return {
                     "bbox": span["bbox"],
                     "origin": span["origin"],
@@ -381,47 +948,55 @@ class PDFModifier:
         Two-pass approach:
         1. Single-span matching (fast path for most cases).
         2. Cross-span matching per line.
+
+        The page's plain text is checked first; pages where no target can
+        match return early, before the costly ``get_text("dict")`` build.
         """
         items: list[dict[str, Any]] = []
-        matched_span_ids: set[int] = set()
-        blocks = page.get_text("dict")["blocks"]
-
-        # Pass 1: single-span matching
-        for block in blocks:
-            if "lines" not in block:
-                continue
-            for line in block["lines"]:
-                for span in line["spans"]:
-                    item = self._match_single_span(span, spec)
+        matched: set[int] = set()
+        page_num = page.number
+
+        record = self._span_records[page_num] if self._span_records is not None else None
+        if record is not None:
+            self._count("pages_from_span_cache", page=page_num)
+            with self._stage("textpage", page_num):
+                may_match = self._page_may_match(spec, lambda: record["text"])
+            if not may_match:
+                self._count("pages_skipped", page=page_num)
+                return items
+            spans: SpanTable = record["spans"]
+        else:
+            with self._stage("textpage", page_num):
+                textpage = page.get_textpage(flags=TEXT_FLAGS)
+                may_match = self._page_may_match(spec, textpage.extractText)
+            if not may_match:
+                self._count("pages_skipped", page=page_num)
+                return items
+            with self._stage("get_text_dict", page_num):
+                spans = SpanTable.from_blocks(page.get_text("dict", textpage=textpage)["blocks"])
+        self._count("spans_scanned", len(spans), page_num)
+
+        with self._stage("match", page_num):
+            # Pass 1: single-span matching. Span dicts are only built for hits.
+            matcher = self._get_matcher(spec)
+            for line in spans.lines():
+                for i in line:
+                    if not matcher.may_match(spans.text(i).strip()):
+                        continue
+                    item = self._match_single_span(spans.span(i), spec)
                     if item:
                         items.append(item)
-                        matched_span_ids.add(id(span))
+                        matched.add(i)
                         break
 
-        # Pass 2: cross-span matching
-        for block in blocks:
-            if "lines" not in block:
-                continue
-            for line in block["lines"]:
-                if len(line["spans"]) < 2:
+            # Pass 2: cross-span matching
+            for line in spans.lines():
+                if len(line) < 2:
                     continue
-                items.extend(self._match_across_spans(line["spans"], spec, matched_span_ids))
+                items.extend(self._match_across_spans(spans, line, spec, matched))
 
         return items
 
-    def _build_merged_text(
-        self,
-        spans: list[dict[str, Any]],
-    ) -> tuple[str, list[tuple[int, int]]]:
-        """Build concatenated text and offset map from spans."""
-        merged = ""
-        span_ranges: list[tuple[int, int]] = []
-        for span in spans:
-            start = len(merged)
-            merged += span["text"]
-            span_ranges.append((start, len(merged)))
-        return merged, span_ranges
-
     def _find_matches_in_merged(
         self,
         merged: str,
@@ -467,11 +1042,7 @@ class PDFModifier:
         new_text, url = self._resolve_replacement(replacement_raw, matched_text, target, spec)
         raw_flags = first_span.get("flags")
         font_flags = self._parse_flags(raw_flags)
-        font_props = self._font_resolver.resolve(
-            first_span["font"],
-            font_flags=font_flags,
-            custom_fonts=self._custom_fonts,
-        )
+        font_props = self._font_resolver.resolve(first_span["font"], font_flags=font_flags)
 
         return {
             "bbox": (x0, y0, x1, y1),
@@ -487,17 +1058,26 @@ class PDFModifier:
 
     def _match_across_spans(
         self,
-        spans: list[dict[str, Any]],
+        table: SpanTable,
+        line: range,
         spec: ReplacementSpec,
-        matched_span_ids: set[int],
+        matched: set[int],
     ) -> list[dict[str, Any]]:
-        """Match replacement targets across concatenated span texts."""
+        """Match replacement targets across the concatenated spans of a line.
+
+        ``matched`` holds table indices of spans already replaced and is
+        updated with the spans consumed here.
+        """
         items: list[dict[str, Any]] = []
 
-        merged, span_ranges = self._build_merged_text(spans)
-        if not merged.strip():
+        merged = table.joined_text(line)
+        if not merged.strip() or not self._get_matcher(spec).may_match(merged):
             return items
 
+        base = table.text_offset(line.start)
+        span_ranges = [(table.text_offset(i) - base, table.text_offset(i + 1) - base) for i in line]
+        spans = [table.span(i) for i in line]
+
         for target, replacement_raw in spec.replacements.items():
             matches = self._find_matches_in_merged(merged, target, spec)
 
@@ -510,7 +1090,7 @@ class PDFModifier:
 
                 if len(involved) < 2:
                     continue
-                if any(id(spans[i]) in matched_span_ids for i in involved):
+                if any(line[i] in matched for i in involved):
                     continue
 
                 item = self._build_cross_span_item(
@@ -526,7 +1106,7 @@ class PDFModifier:
                 items.append(item)
 
                 for i in involved:
-                    matched_span_ids.add(id(spans[i]))
+                    matched.add(line[i])
 
         return items
 
@@ -538,11 +1118,7 @@ class PDFModifier:
     ) -> None:
         """Insert a hyperlink for the replacement text."""
         try:
-            fontname = item["fontname"]
-            fontfile = item.get("fontfile")
-            if fontfile:
-                fontname = f"__custom_{Path(fontfile).stem}__"
-            font = fitz.Font(fontname=fontname, fontfile=fontfile)
+            font = self._get_font_registry(page.parent).font(item["fontname"], item.get("fontfile"))
             text_width = font.text_length(item["text"], fontsize=item["size"])
             x0 = item["origin"][0]
             y_baseline = item["origin"][1]
@@ -558,17 +1134,22 @@ class PDFModifier:
             logger.warning(msg)
             self._warnings.append(msg)
 
+    def _get_font_registry(self, doc: fitz.Document) -> FontRegistry:
+        """Return the font registry of the open document, creating it on first use."""
+        if self._font_registry is None:
+            self._font_registry = FontRegistry(doc)
+        return self._font_registry
+
     def _insert_replacement(self, page: fitz.Page, item: dict[str, Any]) -> None:
         """Insert replacement text with original styling."""
         color = self._convert_color(item["color"])
         fontname = item["fontname"]
         fontfile = item.get("fontfile")
 
-        # PyMuPDF ignores fontfile when fontname is a Base 14 font.
-        # When a custom fontfile is provided, use a non-Base14 fontname
-        # so PyMuPDF treats it as a custom embedded font.
+        # Custom fonts are embedded once per document and then referenced
+        # by resource name; they are subset to the inserted glyphs on save.
         if fontfile:
-            fontname = f"__custom_{Path(fontfile).stem}__"
+            fontname = self._get_font_registry(page.parent).insert_font(page, fontfile)
 
         page.insert_text(
             item["origin"],
@@ -576,7 +1157,6 @@ class PDFModifier:
             fontname=fontname,
             fontsize=item["size"],
             color=color,
-            fontfile=fontfile,
         )
 
         link_url = item["url"]
@@ -586,6 +1166,79 @@ class PDFModifier:
             self._insert_link(page, item, link_url)
 
 
+BatchProgressCallback = Callable[[int, int, str], None]
+
+
+def _collect_page_chunk(
+    source: Path | bytes | bytearray,
+    password: str | None,
+    max_file_size: int,
+    custom_fonts: dict[str, str],
+    span_cache: SpanCache | None,
+    spec: ReplacementSpec,
+    page_indices: range,
+    memory_map: bool = False,
+    max_mapped_file_size: int = DEFAULT_MAX_MAPPED_FILE_SIZE_BYTES,
+    digest: str | None = None,
+) -> dict[int, list[dict[str, Any]]]:
+    """Collect replacement items for a chunk of pages in a worker process.
+
+    Opens a private document so workers never share PyMuPDF state; no
+    output is ever written. ``digest`` is the parent's input digest, if
+    known, so the span cache lookup does not hash the input again.
+    """
+    modifier = PDFModifier(
+        source,
+        password=password,
+        max_file_size=max_file_size,
+        custom_fonts=custom_fonts,
+        span_cache=span_cache,
+        memory_map=memory_map,
+        max_mapped_file_size=max_mapped_file_size,
+    )
+    modifier._source_digest = digest
+    collected: dict[int, list[dict[str, Any]]] = {}
+    with modifier:
+        doc = modifier._doc
+        assert doc is not None
+        for page_num in page_indices:
+            items = modifier._collect_replacements(doc[page_num], spec)
+            if items:
+                collected[page_num] = items
+    return collected
+
+
+def _process_batch_file(
+    file_path: Path,
+    output_path: Path,
+    spec: ReplacementSpec,
+    password: str | None,
+    max_file_size: int,
+    custom_fonts: dict[str, str] | None,
+    save_profile: str = DEFAULT_SAVE_PROFILE,
+) -> ModificationResult | dict[str, str]:
+    """Process one batch entry, returning its result or an error record.
+
+    Module-level so it can be pickled and run inside a worker process.
+    """
+    if file_path.absolute() == output_path.absolute():
+        return {"file": str(file_path), "error": "Input and output paths are the same"}
+
+    try:
+        modifier = PDFModifier(
+            str(file_path),
+            str(output_path),
+            password=password,
+            max_file_size=max_file_size,
+            custom_fonts=custom_fonts,
+        )
+        return modifier.process(spec, save_profile=save_profile)
+    except Exception as e:
+        logger.warning("Batch: failed to process %s: %s", file_path, e)
+        error_code = getattr(e, "code", "UNKNOWN")
+        return {"file": str(file_path), "error": f"[{error_code}] {e}"}
+
+
 def batch_process(
     file_paths: Sequence[str | Path],
     output_dir: str | Path,
@@ -593,6 +1246,9 @@ def batch_process(
     password: str | None = None,
     max_file_size: int = DEFAULT_MAX_FILE_SIZE_BYTES,
     custom_fonts: dict[str, str] | None = None,
+    workers: int = 1,
+    on_progress: BatchProgressCallback | None = None,
+    save_profile: str = DEFAULT_SAVE_PROFILE,
 ) -> BatchResult:
     """
     Apply the same replacements to multiple PDF files.
@@ -601,47 +1257,75 @@ def batch_process(
     affect the rest of the batch. Output files are written to
     ``output_dir`` using the same filename as the input.
 
+    With ``workers > 1`` files are distributed over a process pool. Results
+    and errors are still reported in input order, regardless of the order
+    in which workers finish.
+
     Args:
         file_paths: List of input PDF file paths.
         output_dir: Directory where modified PDFs will be saved.
         spec: ReplacementSpec containing replacements and options.
         password: Optional password for encrypted PDFs.
         custom_fonts: Optional map of alias -> font file path.
+        workers: Number of worker processes. 1 processes files serially
+                 in the calling process.
+        on_progress: Optional callback invoked as ``(done, total, file)``
+                     each time a file finishes.
+        save_profile: Output optimization profile applied to every file.
 
     Returns:
         BatchResult with per-file results and aggregate statistics.
+
+    Raises:
+        ValueError: If workers is less than 1 or the save profile is unknown.
     """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    _validate_save_profile(save_profile)
+
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    paths = [Path(p) for p in file_paths]
+    total = len(paths)
+    outcomes: list[ModificationResult | dict[str, str] | None] = [None] * total
+    args = [
+        (p, output_dir / p.name, spec, password, max_file_size, custom_fonts, save_profile)
+        for p in paths
+    ]
+
+    if workers == 1 or total <= 1:
+        for index, file_args in enumerate(args):
+            outcomes[index] = _process_batch_file(*file_args)
+            if on_progress:
+                on_progress(index + 1, total, str(paths[index]))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, total)) as executor:
+            futures = {
+                executor.submit(_process_batch_file, *file_args): index
+                for index, file_args in enumerate(args)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                index = futures[future]
+                try:
+                    outcomes[index] = future.result()
+                except Exception as e:
+                    # Worker crashed (e.g. BrokenProcessPool) — isolate to this file
+                    logger.warning("Batch: worker failed on %s: %s", paths[index], e)
+                    outcomes[index] = {"file": str(paths[index]), "error": f"[UNKNOWN] {e}"}
+                if on_progress:
+                    on_progress(done, total, str(paths[index]))
+
     results: list[ModificationResult] = []
     errors: list[dict[str, str]] = []
-
-    for file_path in file_paths:
-        file_path = Path(file_path)
-        output_path = output_dir / file_path.name
-
-        if file_path.absolute() == output_path.absolute():
-            errors.append({"file": str(file_path), "error": "Input and output paths are the same"})
-            continue
-
-        try:
-            modifier = PDFModifier(
-                str(file_path),
-                str(output_path),
-                password=password,
-                max_file_size=max_file_size,
-                custom_fonts=custom_fonts,
-            )
-            result = modifier.process(spec)
-            results.append(result)
-        except Exception as e:
-            logger.warning("Batch: failed to process %s: %s", file_path, e)
-            error_code = getattr(e, "code", "UNKNOWN")
-            errors.append({"file": str(file_path), "error": f"[{error_code}] {e}"})
+    for outcome in outcomes:
+        if isinstance(outcome, ModificationResult):
+            results.append(outcome)
+        elif outcome is not None:
+            errors.append(outcome)
 
     return BatchResult(
-        total_files=len(file_paths),
+        total_files=total,
         successful=len(results),
         failed=len(errors),
         results=results,
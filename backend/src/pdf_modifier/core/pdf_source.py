@@ -0,0 +1,57 @@
+"""PDF inputs given as filesystem paths or in-memory bytes."""
+
+from __future__ import annotations
+
+import mmap
+import os
+from pathlib import Path
+from typing import BinaryIO
+
+PDFBytes = bytes | bytearray | memoryview
+PDFSource = str | os.PathLike[str] | bytes | bytearray | memoryview | BinaryIO
+
+# Stand-in for ``input_path``/``output_path`` in results of in-memory documents
+IN_MEMORY_NAME = "<memory>"
+
+
+def resolve_source(source: PDFSource) -> Path | PDFBytes:
+    """Normalize a PDF source to a path or a bytes-like buffer.
+
+    File-like objects are read to the end once; bytes, bytearrays and
+    memoryviews are passed through without copying.
+
+    Args:
+        source: Path, bytes-like object, or binary file-like object.
+
+    Returns:
+        Path for filesystem sources, the buffer otherwise.
+
+    Raises:
+        TypeError: If ``source`` is none of the supported types.
+    """
+    if isinstance(source, bytes | bytearray | memoryview):
+        return source
+    if isinstance(source, str | os.PathLike):
+        return Path(source)
+    if hasattr(source, "read"):
+        data = source.read()
+        if not isinstance(data, bytes | bytearray):
+            raise TypeError("File-like PDF sources must be opened in binary mode")
+        return data
+    raise TypeError(f"Unsupported PDF source type: {type(source).__name__}")
+
+
+def map_file(path: Path) -> memoryview:
+    """Memory-map ``path`` read-only and return a zero-copy view of it.
+
+    PyMuPDF reads the view in place, so only the pages of the file that
+    are actually touched become resident. The mapping is released once the
+    view and the document opened from it are garbage collected.
+
+    Raises:
+        OSError: If the file cannot be opened or mapped.
+        ValueError: If the file is empty.
+    """
+    with path.open("rb") as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapping)
@@ -0,0 +1,259 @@
+"""Persistent on-disk cache of modification results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import fitz
+
+from ..logger import setup_logging
+from .models import ModificationResult
+from .span_cache import source_digest
+
+if TYPE_CHECKING:
+    from .models import ReplacementSpec
+    from .pdf_source import PDFBytes
+
+logger = setup_logging(__name__)
+
+DEFAULT_RESULT_CACHE_DIR = Path.home() / ".pdf-modifier" / "cache" / "results"
+DEFAULT_RESULT_CACHE_MAX_BYTES: int = 1024 * 1024 * 1024  # 1 GB
+DEFAULT_RESULT_CACHE_TTL_SECONDS: float = 24 * 3600.0
+
+# Bump when the modification pipeline changes its output for the same request
+_FORMAT_VERSION = 1
+
+
+class ResultCache:
+    """Size-bounded LRU cache of modified PDFs and their ModificationResult.
+
+    Entries are keyed by the SHA-256 of the input PDF plus a canonical hash
+    of everything else that determines the output: the replacements (in
+    order), regex mode, page range, save profile, incremental mode, the
+    contents of custom font files and the PyMuPDF version. A hit returns
+    the stored output, copied to the requested output path, without
+    opening the pipeline.
+
+    Entries older than ``ttl_seconds`` are ignored and removed; writes
+    evict least recently used entries until the directory fits in
+    ``max_bytes``. Requests with a password are never cached.
+
+    With ``link_outputs``, hits are hard-linked to the output path when the
+    filesystem allows it instead of copied. Only use it when the outputs
+    belong to the application (like the web server's session files): a
+    linked output must not be modified in place. PDFModifier replaces a
+    shared output file instead of writing into it, other writers may not.
+
+    Example:
+        >>> cache = ResultCache(Path("/tmp/results"))
+        >>> modifier = PDFModifier("in.pdf", "out.pdf", result_cache=cache)
+        >>> modifier.process(spec)  # runs the pipeline and stores the output
+        >>> modifier.process(spec).cache_hit
+        True
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path = DEFAULT_RESULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_RESULT_CACHE_MAX_BYTES,
+        ttl_seconds: float = DEFAULT_RESULT_CACHE_TTL_SECONDS,
+        link_outputs: bool = False,
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be > 0")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be > 0")
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.link_outputs = link_outputs
+
+    @staticmethod
+    def key_for(
+        source: str | Path | PDFBytes,
+        spec: ReplacementSpec,
+        pages: tuple[int, int] | None = None,
+        save_profile: str = "fast",
+        incremental: bool = False,
+        custom_fonts: dict[str, str] | None = None,
+        digest: str | None = None,
+    ) -> str:
+        """Compute the cache key of a modification request.
+
+        ``digest`` is the source's ``source_digest()`` if the caller already
+        has it, to avoid hashing the input again.
+        """
+        fonts = {}
+        for alias, path in sorted((custom_fonts or {}).items()):
+            fonts[alias] = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        request = {
+            # Replacements are applied in order, so keep it
+            "replacements": list(spec.replacements.items()),
+            "use_regex": spec.use_regex,
+            "pages": list(pages) if pages is not None else None,
+            "save_profile": save_profile,
+            "incremental": incremental,
+            "fonts": fonts,
+        }
+        canonical = json.dumps(request, sort_keys=True, separators=(",", ":"))
+        request_digest = hashlib.sha256(canonical.encode()).hexdigest()
+        digest = digest or source_digest(source)
+        return f"{digest}-{request_digest[:32]}-{fitz.VersionBind}-v{_FORMAT_VERSION}"
+
+    def _pdf_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pdf"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _load(self, key: str) -> ModificationResult | None:
+        """Read an entry's result, dropping it if expired or incomplete."""
+        meta_path = self._meta_path(key)
+        try:
+            meta = json.loads(meta_path.read_bytes())
+            result = ModificationResult.model_validate(meta["result"])
+            created_at = float(meta["created_at"])
+            size = self._pdf_path(key).stat().st_size
+        except (OSError, ValueError, KeyError):
+            return None
+        if time.time() - created_at > self.ttl_seconds or size != result.output_size_bytes:
+            # Expired, or the stored output was changed behind the cache's back
+            self._remove(key)
+            return None
+        return result
+
+    def get(self, key: str, output_path: Path) -> ModificationResult | None:
+        """Place the cached output for ``key`` at ``output_path``.
+
+        Returns:
+            The stored result, or None on a miss (``output_path`` untouched).
+        """
+        result = self._load(key)
+        if result is None:
+            return None
+        temp_path = output_path.with_name(f".{output_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            self._place(key, temp_path)
+            os.replace(temp_path, output_path)
+            os.utime(self._meta_path(key))
+        except OSError as e:
+            temp_path.unlink(missing_ok=True)
+            logger.warning("Result cache hit for %s could not be used: %s", key, e)
+            return None
+        logger.debug("Result cache hit: %s", key)
+        return result
+
+    def _place(self, key: str, path: Path) -> None:
+        """Create ``path`` with the cached output, as a hard link if enabled."""
+        if self.link_outputs:
+            try:
+                os.link(self._pdf_path(key), path)
+                return
+            except OSError:
+                # Different filesystem, or no hard link support
+                pass
+        shutil.copyfile(self._pdf_path(key), path)
+
+    def get_bytes(self, key: str) -> tuple[ModificationResult, bytes] | None:
+        """Return the cached result and output bytes for ``key``, or None."""
+        result = self._load(key)
+        if result is None:
+            return None
+        try:
+            data = self._pdf_path(key).read_bytes()
+            os.utime(self._meta_path(key))
+        except OSError:
+            return None
+        logger.debug("Result cache hit: %s", key)
+        return result, data
+
+    def put(self, key: str, result: ModificationResult, output: Path | bytes) -> None:
+        """Store a result with its output file or bytes, then evict if over budget."""
+        try:
+            size = len(output) if isinstance(output, bytes) else output.stat().st_size
+            if size > self.max_bytes:
+                return
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_pdf = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            os.close(fd)
+            if isinstance(output, bytes):
+                Path(tmp_pdf).write_bytes(output)
+            else:
+                # A private copy: the caller may overwrite its output later
+                shutil.copyfile(output, tmp_pdf)
+            fd, tmp_meta = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"created_at": time.time(), "result": result.model_dump()}, f)
+            # The result is written last: an entry is only visible once complete
+            os.replace(tmp_pdf, self._pdf_path(key))
+            os.replace(tmp_meta, self._meta_path(key))
+            self._evict()
+        except OSError as e:
+            # Caching is best-effort; never fail the actual operation
+            logger.warning("Result cache write failed for %s: %s", key, e)
+
+    def _remove(self, key: str) -> None:
+        self._meta_path(key).unlink(missing_ok=True)
+        self._pdf_path(key).unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """Delete expired entries, then least recently used ones until the cache fits."""
+        entries = []
+        now = time.time()
+        for meta_path in self.cache_dir.glob("*.json"):
+            key = meta_path.stem
+            try:
+                used = meta_path.stat().st_mtime
+                size = meta_path.stat().st_size + self._pdf_path(key).stat().st_size
+            except OSError:
+                continue
+            entries.append((used, size, key))
+
+        total = sum(size for _, size, _ in entries)
+        for used, size, key in sorted(entries):
+            # Last use bounds creation time, so this only drops expired entries
+            if total <= self.max_bytes and now - used <= self.ttl_seconds:
+                continue
+            self._remove(key)
+            total -= size
+            logger.info("Result cache evicted %s", key)
+
+
+def default_result_cache(link_outputs: bool = False) -> ResultCache | None:
+    """Build the result cache configured through environment variables.
+
+    ``PDF_MOD_RESULT_CACHE_DIR`` overrides the cache directory,
+    ``PDF_MOD_RESULT_CACHE_MAX_BYTES`` the size budget (0 disables caching)
+    and ``PDF_MOD_RESULT_CACHE_TTL_SECONDS`` how long entries stay valid.
+    ``link_outputs`` is passed on to ResultCache.
+    """
+    try:
+        max_bytes = int(
+            os.environ.get("PDF_MOD_RESULT_CACHE_MAX_BYTES", str(DEFAULT_RESULT_CACHE_MAX_BYTES))
+        )
+    except ValueError:
+        max_bytes = DEFAULT_RESULT_CACHE_MAX_BYTES
+    if max_bytes <= 0:
+        return None
+    try:
+        ttl_seconds = float(
+            os.environ.get(
+                "PDF_MOD_RESULT_CACHE_TTL_SECONDS", str(DEFAULT_RESULT_CACHE_TTL_SECONDS)
+            )
+        )
+    except ValueError:
+        ttl_seconds = DEFAULT_RESULT_CACHE_TTL_SECONDS
+    if ttl_seconds <= 0:
+        return None
+    cache_dir = os.environ.get("PDF_MOD_RESULT_CACHE_DIR") or DEFAULT_RESULT_CACHE_DIR
+    return ResultCache(
+        cache_dir, max_bytes=max_bytes, ttl_seconds=ttl_seconds, link_outputs=link_outputs
+    )
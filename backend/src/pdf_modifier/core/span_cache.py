@@ -0,0 +1,203 @@
+"""Persistent on-disk cache of extracted text spans."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import fitz
+
+from ..logger import setup_logging
+from .span_table import SpanTable
+
+if TYPE_CHECKING:
+    from .pdf_source import PDFBytes
+
+logger = setup_logging(__name__)
+
+DEFAULT_SPAN_CACHE_DIR = Path.home() / ".pdf-modifier" / "cache" / "spans"
+DEFAULT_SPAN_CACHE_MAX_BYTES: int = 256 * 1024 * 1024  # 256 MB
+
+# Bump when the cached page layout changes so stale entries are ignored
+_FORMAT_VERSION = 2
+
+# Same flags get_text("dict") uses, minus image extraction (image blocks are
+# never used, and their pixel data dominates the dict size)
+TEXT_FLAGS: int = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+
+# Digests of recently hashed files, keyed by path and stat; see source_digest()
+_FILE_DIGESTS: OrderedDict[tuple[str, int, int, int, int], str] = OrderedDict()
+_FILE_DIGESTS_MAX = 256
+_file_digests_lock = threading.Lock()
+
+
+def extract_page_record(page: fitz.Page, textpage: fitz.TextPage | None = None) -> dict[str, Any]:
+    """Extract the cacheable text content of a page.
+
+    The spans of ``get_text("dict")`` are packed into a columnar
+    SpanTable; the per-span dicts are dropped as soon as it is built.
+
+    Args:
+        page: Page to extract.
+        textpage: Optional pre-built TextPage (built with ``TEXT_FLAGS``).
+
+    Returns:
+        Page record dict with ``width``, ``height``, ``text`` and ``spans``.
+    """
+    if textpage is None:
+        textpage = page.get_textpage(flags=TEXT_FLAGS)
+    return {
+        "width": page.rect.width,
+        "height": page.rect.height,
+        "text": textpage.extractText(),
+        "spans": SpanTable.from_blocks(page.get_text("dict", textpage=textpage)["blocks"]),
+    }
+
+
+def source_digest(source: str | Path | PDFBytes) -> str:
+    """SHA-256 hex digest of a PDF file or in-memory PDF bytes.
+
+    File digests are remembered per process by path, device, inode, size
+    and modification time, so repeated calls for an unchanged file (e.g.
+    one analyzer per page window) do not read it again.
+    """
+    if isinstance(source, bytes | bytearray | memoryview):
+        return hashlib.sha256(source).hexdigest()
+
+    st = os.stat(source)
+    stamp = (os.path.abspath(source), st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+    with _file_digests_lock:
+        known = _FILE_DIGESTS.get(stamp)
+        if known is not None:
+            _FILE_DIGESTS.move_to_end(stamp)
+            return known
+    digest = hashlib.sha256()
+    with open(source, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    hexdigest = digest.hexdigest()
+    with _file_digests_lock:
+        _FILE_DIGESTS[stamp] = hexdigest
+        while len(_FILE_DIGESTS) > _FILE_DIGESTS_MAX:
+            _FILE_DIGESTS.popitem(last=False)
+    return hexdigest
+
+
+class SpanCache:
+    """Size-bounded LRU cache of page records, stored on disk.
+
+    Entries are keyed by the SHA-256 of the PDF bytes plus the PyMuPDF
+    version, so an edited file or an upgraded extractor never hits a stale
+    entry. Reads refresh an entry's mtime; writes evict least recently used
+    entries until the directory fits in ``max_bytes``.
+
+    Password-protected documents are never cached, so decrypted text is
+    not written to disk.
+
+    Example:
+        >>> cache = SpanCache(Path("/tmp/spans"))
+        >>> analyzer = PDFAnalyzer("document.pdf", span_cache=cache)
+        >>> analyzer.get_structure()  # extracts and stores
+        >>> analyzer.inspect_fonts(["Total"])  # served from cache
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path = DEFAULT_SPAN_CACHE_DIR,
+        max_bytes: int = DEFAULT_SPAN_CACHE_MAX_BYTES,
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be > 0")
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key_for(source: str | Path | PDFBytes, digest: str | None = None) -> str:
+        """Compute the cache key for a PDF file or in-memory PDF bytes.
+
+        ``digest`` is the source's ``source_digest()`` if already computed.
+        """
+        return f"{digest or source_digest(source)}-{fitz.VersionBind}-v{_FORMAT_VERSION}"
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> list[dict[str, Any]] | None:
+        """Return cached page records for ``key``, or None on a miss."""
+        path = self._entry_path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        try:
+            pages: list[dict[str, Any]] = json.loads(data)
+            for page in pages:
+                page["spans"] = SpanTable.from_dict(page["spans"])
+        except (KeyError, TypeError, ValueError, OverflowError) as e:
+            # Truncated or foreign entry: drop it so the next put replaces it
+            logger.warning("Discarding corrupt span cache entry %s: %s", key, e)
+            path.unlink(missing_ok=True)
+            return None
+        logger.debug("Span cache hit: %s", key)
+        return pages
+
+    def put(self, key: str, pages: list[dict[str, Any]]) -> None:
+        """Store page records for ``key`` and evict old entries if over budget."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            columnar = [{**page, "spans": page["spans"].to_dict()} for page in pages]
+            payload = json.dumps(columnar, separators=(",", ":")).encode()
+            if len(payload) > self.max_bytes:
+                return
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_name, self._entry_path(key))
+            self._evict()
+        except OSError as e:
+            # Caching is best-effort; never fail the actual operation
+            logger.warning("Span cache write failed for %s: %s", key, e)
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache fits."""
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.info("Span cache evicted %s", path.name)
+
+
+def default_span_cache() -> SpanCache | None:
+    """Build the span cache configured through environment variables.
+
+    ``PDF_MOD_SPAN_CACHE_DIR`` overrides the cache directory and
+    ``PDF_MOD_SPAN_CACHE_MAX_BYTES`` the size budget; a budget of 0
+    disables caching.
+    """
+    try:
+        max_bytes = int(
+            os.environ.get("PDF_MOD_SPAN_CACHE_MAX_BYTES", str(DEFAULT_SPAN_CACHE_MAX_BYTES))
+        )
+    except ValueError:
+        max_bytes = DEFAULT_SPAN_CACHE_MAX_BYTES
+    if max_bytes <= 0:
+        return None
+    cache_dir = os.environ.get("PDF_MOD_SPAN_CACHE_DIR") or DEFAULT_SPAN_CACHE_DIR
+    return SpanCache(cache_dir, max_bytes=max_bytes)
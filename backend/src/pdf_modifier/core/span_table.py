@@ -0,0 +1,201 @@
+"""Columnar, array-backed storage for the text spans of a page."""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Any
+
+from .models import TextElement
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class SpanTable:
+    """Text spans of one page stored as parallel arrays.
+
+    Holding hundreds of thousands of spans as PyMuPDF dicts or Pydantic
+    models costs one or more Python objects per span. A SpanTable keeps
+    geometry and style in flat ``array`` columns, interns font names, and
+    stores all span texts in a single string addressed by offsets. Line
+    structure is kept as span offsets, so a line's merged text is a slice.
+
+    Pydantic models and PyMuPDF-style span dicts are produced on demand
+    with ``to_elements()`` and ``span()``.
+
+    Example:
+        >>> table = SpanTable.from_blocks(page.get_text("dict")["blocks"])
+        >>> len(table), table.line_count
+        (42, 12)
+        >>> table.text(0), table.font(0)
+        ('Invoice', 'Helvetica-Bold')
+    """
+
+    __slots__ = (
+        "_bboxes",
+        "_colors",
+        "_flags",
+        "_font_ids",
+        "_fonts",
+        "_line_offsets",
+        "_origins",
+        "_sizes",
+        "_text",
+        "_text_offsets",
+    )
+
+    def __init__(self) -> None:
+        self._text = ""
+        self._text_offsets = array("L", [0])
+        self._bboxes = array("d")
+        self._origins = array("d")
+        self._sizes = array("d")
+        self._colors = array("q")
+        self._flags = array("q")
+        self._font_ids = array("L")
+        self._fonts: list[str] = []
+        self._line_offsets = array("L", [0])
+
+    @classmethod
+    def from_blocks(cls, blocks: list[dict[str, Any]]) -> SpanTable:
+        """Build a table from ``page.get_text("dict")["blocks"]``.
+
+        Non-text (image) blocks are skipped.
+        """
+        table = cls()
+        font_index: dict[str, int] = {}
+        texts: list[str] = []
+        length = 0
+        for block in blocks:
+            if "lines" not in block:
+                continue
+            for line in block["lines"]:
+                for span in line["spans"]:
+                    texts.append(span["text"])
+                    length += len(span["text"])
+                    table._text_offsets.append(length)
+                    table._bboxes.extend(span["bbox"])
+                    table._origins.extend(span["origin"])
+                    table._sizes.append(span["size"])
+                    table._colors.append(span["color"])
+                    table._flags.append(span.get("flags", 0))
+                    font_id = font_index.get(span["font"])
+                    if font_id is None:
+                        font_id = font_index[span["font"]] = len(table._fonts)
+                        table._fonts.append(span["font"])
+                    table._font_ids.append(font_id)
+                table._line_offsets.append(len(table._sizes))
+        table._text = "".join(texts)
+        return table
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SpanTable:
+        """Rebuild a table from ``to_dict()`` output."""
+        table = cls()
+        table._text = data["text"]
+        table._text_offsets = array("L", data["text_offsets"])
+        table._bboxes = array("d", data["bboxes"])
+        table._origins = array("d", data["origins"])
+        table._sizes = array("d", data["sizes"])
+        table._colors = array("q", data["colors"])
+        table._flags = array("q", data["flags"])
+        table._font_ids = array("L", data["font_ids"])
+        table._fonts = list(data["fonts"])
+        table._line_offsets = array("L", data["line_offsets"])
+        return table
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable columnar representation."""
+        return {
+            "text": self._text,
+            "text_offsets": self._text_offsets.tolist(),
+            "bboxes": self._bboxes.tolist(),
+            "origins": self._origins.tolist(),
+            "sizes": self._sizes.tolist(),
+            "colors": self._colors.tolist(),
+            "flags": self._flags.tolist(),
+            "font_ids": self._font_ids.tolist(),
+            "fonts": self._fonts,
+            "line_offsets": self._line_offsets.tolist(),
+        }
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    @property
+    def line_count(self) -> int:
+        """Number of text lines on the page."""
+        return len(self._line_offsets) - 1
+
+    def lines(self) -> Iterator[range]:
+        """Yield the span index range of each line, in reading order."""
+        offsets = self._line_offsets
+        for i in range(len(offsets) - 1):
+            yield range(offsets[i], offsets[i + 1])
+
+    def text(self, i: int) -> str:
+        """Text of span ``i``."""
+        return self._text[self._text_offsets[i] : self._text_offsets[i + 1]]
+
+    def text_offset(self, i: int) -> int:
+        """Offset of span ``i`` within the page's concatenated span text."""
+        return self._text_offsets[i]
+
+    def joined_text(self, spans: range) -> str:
+        """Concatenated text of a contiguous span range (e.g. a line)."""
+        return self._text[self._text_offsets[spans.start] : self._text_offsets[spans.stop]]
+
+    def bbox(self, i: int) -> tuple[float, float, float, float]:
+        """Bounding box (x0, y0, x1, y1) of span ``i``."""
+        b = self._bboxes
+        return (b[4 * i], b[4 * i + 1], b[4 * i + 2], b[4 * i + 3])
+
+    def origin(self, i: int) -> tuple[float, float]:
+        """Text origin point (x, y) of span ``i``."""
+        return (self._origins[2 * i], self._origins[2 * i + 1])
+
+    def font(self, i: int) -> str:
+        """Font name of span ``i``."""
+        return self._fonts[self._font_ids[i]]
+
+    def size(self, i: int) -> float:
+        """Font size of span ``i``."""
+        return self._sizes[i]
+
+    def color(self, i: int) -> int:
+        """sRGB color integer of span ``i``."""
+        return self._colors[i]
+
+    def flags(self, i: int) -> int:
+        """PyMuPDF font flags bitmask of span ``i``."""
+        return self._flags[i]
+
+    def span(self, i: int) -> dict[str, Any]:
+        """Span ``i`` as a PyMuPDF-style span dict."""
+        return {
+            "text": self.text(i),
+            "bbox": self.bbox(i),
+            "origin": self.origin(i),
+            "font": self.font(i),
+            "size": self.size(i),
+            "color": self.color(i),
+            "flags": self.flags(i),
+        }
+
+    def to_elements(self) -> list[TextElement]:
+        """Materialize every span as a TextElement.
+
+        Values come straight from PyMuPDF with the declared types, so
+        models are constructed without re-validation.
+        """
+        return [
+            TextElement.model_construct(
+                text=self.text(i),
+                bbox=self.bbox(i),
+                origin=self.origin(i),
+                font=self.font(i),
+                size=self.size(i),
+                color=self.color(i),
+            )
+            for i in range(len(self))
+        ]
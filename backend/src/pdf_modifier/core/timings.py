@@ -0,0 +1,80 @@
+"""Per-stage and per-page timing of modification runs."""
+
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from .models import ModificationTimings, PageTimings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Number of pages listed in ModificationTimings.slowest_pages
+SLOWEST_PAGES = 5
+
+
+class TimingCollector:
+    """Accumulates stage timings and counters of one PDFModifier run.
+
+    Stage times and counters recorded with a ``page`` (0-indexed) are also
+    kept per page, so the slowest pages can be reported.
+
+    Example:
+        >>> timings = TimingCollector()
+        >>> with timings.stage("match", page=0):
+        ...     items = collect(page)
+        >>> timings.count("replacements", len(items), page=0)
+        >>> timings.result().stages["match"]
+        0.0042
+    """
+
+    def __init__(self) -> None:
+        self._start = time.perf_counter()
+        self.stages: dict[str, float] = defaultdict(float)
+        self.counters: dict[str, int] = defaultdict(int)
+        self._page_stages: dict[int, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self._page_counters: dict[int, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    @contextmanager
+    def stage(self, name: str, page: int | None = None) -> Iterator[None]:
+        """Time the enclosed block as ``name``, also for ``page`` if given."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start, page)
+
+    def add(self, name: str, seconds: float, page: int | None = None) -> None:
+        """Record time measured elsewhere for stage ``name``."""
+        self.stages[name] += seconds
+        if page is not None:
+            self._page_stages[page][name] += seconds
+
+    def count(self, name: str, n: int = 1, page: int | None = None) -> None:
+        """Increase counter ``name`` by ``n``, also for ``page`` if given."""
+        self.counters[name] += n
+        if page is not None:
+            self._page_counters[page][name] += n
+
+    def result(self, slowest: int = SLOWEST_PAGES) -> ModificationTimings:
+        """Summarize the run so far, with the ``slowest`` slowest pages."""
+        pages = [
+            PageTimings(
+                page=page + 1,
+                seconds=sum(stages.values()),
+                stages=dict(stages),
+                counters=dict(self._page_counters.get(page, {})),
+            )
+            for page, stages in self._page_stages.items()
+        ]
+        pages.sort(key=lambda p: (-p.seconds, p.page))
+        return ModificationTimings(
+            total_seconds=time.perf_counter() - self._start,
+            stages=dict(self.stages),
+            counters=dict(self.counters),
+            pages_timed=len(pages),
+            slowest_pages=pages[:slowest],
+        )
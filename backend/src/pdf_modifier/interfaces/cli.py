@@ -15,8 +15,16 @@ from rich.table import Table
 
 from ..core.analyzer import PDFAnalyzer
 from ..core.exceptions import PDFModifierError
-from ..core.models import ReplacementSpec
-from ..core.modifier import DEFAULT_MAX_FILE_SIZE_BYTES, PDFModifier, batch_process
+from ..core.models import ModificationTimings, ReplacementSpec
+from ..core.modifier import (
+    DEFAULT_MAX_FILE_SIZE_BYTES,
+    DEFAULT_MAX_MAPPED_FILE_SIZE_BYTES,
+    DEFAULT_SAVE_PROFILE,
+    SAVE_PROFILES,
+    PDFModifier,
+    batch_process,
+)
+from ..core.span_cache import default_span_cache
 from ..logger import setup_logging
 
 
@@ -30,6 +38,41 @@ def _get_max_file_size() -> int:
         return DEFAULT_MAX_FILE_SIZE_BYTES
 
 
+def _get_max_mapped_file_size() -> int:
+    """Get the memory-mapped input size limit from env var, defaulting to 4 GB."""
+    import os
+
+    try:
+        return int(
+            os.environ.get("PDF_MOD_MAX_MAPPED_FILE_SIZE", str(DEFAULT_MAX_MAPPED_FILE_SIZE_BYTES))
+        )
+    except ValueError:
+        return DEFAULT_MAX_MAPPED_FILE_SIZE_BYTES
+
+
+def _print_timings(timings: ModificationTimings) -> None:
+    """Print stage timings, counters and the slowest pages of a modification."""
+    table = Table(title=f"Timings ({timings.total_seconds:.3f}s total)")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Seconds", justify="right")
+    for stage, seconds in sorted(timings.stages.items(), key=lambda kv: -kv[1]):
+        table.add_row(stage, f"{seconds:.4f}")
+    console.print(table)
+    if timings.counters:
+        counters = ", ".join(f"{name}={n}" for name, n in sorted(timings.counters.items()))
+        console.print(f"  Counters: {counters}")
+
+    if timings.slowest_pages:
+        pages = Table(title="Slowest pages")
+        pages.add_column("Page", style="cyan")
+        pages.add_column("Seconds", justify="right")
+        pages.add_column("Slowest stage")
+        for page in timings.slowest_pages:
+            stage = max(page.stages, key=lambda name: page.stages[name])
+            pages.add_row(str(page.page), f"{page.seconds:.4f}", stage)
+        console.print(pages)
+
+
 def _parse_custom_fonts(ctx: Any, fonts: list[str] | None) -> dict[str, str] | None:
     """Parse --custom-fonts KEY=PATH options into a dict."""
     if not fonts:
@@ -99,6 +142,55 @@ def modify(
             help="Maximum input PDF size in bytes (default: 100 MB, env: PDF_MOD_MAX_FILE_SIZE)",
         ),
     ] = None,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            "-w",
+            min=1,
+            help="Number of worker processes used to scan pages. Useful for very large PDFs.",
+        ),
+    ] = 1,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental",
+            help=(
+                "Append changes to a copy of the input instead of rewriting the whole file. "
+                "Faster for large PDFs; original content stays recoverable, so do not use "
+                "it to redact sensitive text."
+            ),
+        ),
+    ] = False,
+    save_profile: Annotated[
+        str,
+        typer.Option(
+            "--save-profile",
+            help=(
+                f"Output optimization: {', '.join(SAVE_PROFILES)}. 'fast' skips compression, "
+                "'smallest' also deduplicates objects and subsets fonts."
+            ),
+        ),
+    ] = DEFAULT_SAVE_PROFILE,
+    mmap: Annotated[
+        bool,
+        typer.Option(
+            "--mmap",
+            help=(
+                "Memory-map the input so only touched pages are loaded. For very large "
+                "files; --max-size then overrides the mapped limit "
+                "(default: 4 GB, env: PDF_MOD_MAX_MAPPED_FILE_SIZE)."
+            ),
+        ),
+    ] = False,
+    timings: Annotated[
+        bool,
+        typer.Option(
+            "--timings",
+            help="Show time per stage (open, text extraction, matching, redaction, save) "
+            "and the slowest pages.",
+        ),
+    ] = False,
 ) -> None:
     """
     Modify a PDF by finding and replacing text while preserving font style.
@@ -108,6 +200,11 @@ def modify(
         pdf-mod modify input.pdf output.pdf -r "$99.99=$149.99" --regex
         pdf-mod modify input.pdf output.pdf -r "Click Here=Visit Site|https://example.com"
         pdf-mod modify input.pdf output.pdf -r "Hello=Hi" --pages 1-3
+        pdf-mod modify catalogue.pdf output.pdf -r "2024=2025" --workers 8
+        pdf-mod modify brochure.pdf output.pdf -r "$99=$89" --pages 2 --incremental
+        pdf-mod modify input.pdf output.pdf -r "Draft=Final" --save-profile smallest
+        pdf-mod modify archive.pdf output.pdf -r "ACME=Acme" --mmap
+        pdf-mod modify slow.pdf output.pdf -r "Draft=Final" --timings
     """
     replacements = {}
     for item in replace:
@@ -144,21 +241,33 @@ def modify(
     try:
         spec = ReplacementSpec(replacements=replacements, use_regex=regex)
         cf = _parse_custom_fonts(None, custom_fonts) if custom_fonts else None
-        max_file_size = max_size or _get_max_file_size()
         modifier = PDFModifier(
             str(input_pdf.absolute()),
             str(output_pdf.absolute()),
             password=password,
-            max_file_size=max_file_size,
+            max_file_size=max_size or _get_max_file_size(),
             custom_fonts=cf,
+            span_cache=default_span_cache(),
+            incremental=incremental,
+            memory_map=mmap,
+            max_mapped_file_size=max_size or _get_max_mapped_file_size(),
+            collect_timings=timings,
         )
 
         with console.status("[bold green]Modifying PDF...", spinner="dots"):
-            result = modifier.process(spec, pages=page_range)
+            result = modifier.process(
+                spec, pages=page_range, workers=workers, save_profile=save_profile
+            )
 
         console.print(f"[green]Success:[/] Saved to {result.output_path}")
         console.print(f"  Replacements: {result.replacements_made}")
         console.print(f"  Pages modified: {result.pages_modified}")
+        console.print(
+            f"  Save: {result.save_mode} ({result.save_profile}) in {result.save_seconds:.3f}s,"
+            f" {result.output_size_bytes} bytes"
+        )
+        if result.timings is not None:
+            _print_timings(result.timings)
 
         if result.warnings:
             for warn in result.warnings:
@@ -218,6 +327,25 @@ def batch(
             help="Maximum input PDF size in bytes (default: 100 MB, env: PDF_MOD_MAX_FILE_SIZE)",
         ),
     ] = None,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            "-w",
+            min=1,
+            help="Number of worker processes. Files are processed in parallel when > 1.",
+        ),
+    ] = 1,
+    save_profile: Annotated[
+        str,
+        typer.Option(
+            "--save-profile",
+            help=(
+                f"Output optimization: {', '.join(SAVE_PROFILES)}. 'fast' skips compression, "
+                "'smallest' also deduplicates objects and subsets fonts."
+            ),
+        ),
+    ] = DEFAULT_SAVE_PROFILE,
 ) -> None:
     """
     Apply the same replacements to multiple PDF files.
@@ -228,6 +356,8 @@ def batch(
     Examples:
         pdf-mod batch a.pdf b.pdf -o out/ -r "Draft=Final"
         pdf-mod batch *.pdf -o out/ -r "2024=2025" -r "old=new"
+        pdf-mod batch *.pdf -o out/ -r "Draft=Final" --workers 8
+        pdf-mod batch *.pdf -o out/ -r "Draft=Final" --save-profile balanced
     """
     replacements: dict[str, str] = {}
     for item in replace:
@@ -246,7 +376,11 @@ def batch(
         cf = _parse_custom_fonts(None, custom_fonts) if custom_fonts else None
         max_file_size = max_size or _get_max_file_size()
 
-        with console.status("[bold green]Processing batch...", spinner="dots"):
+        with console.status("[bold green]Processing batch...", spinner="dots") as status:
+
+            def _on_progress(done: int, total: int, file: str) -> None:
+                status.update(f"[bold green]Processing batch... ({done}/{total})")
+
             result = batch_process(
                 input_pdfs,
                 output_dir,
@@ -254,21 +388,26 @@ def batch(
                 password=password,
                 max_file_size=max_file_size,
                 custom_fonts=cf,
+                workers=workers,
+                on_progress=_on_progress,
+                save_profile=save_profile,
             )
 
         table = Table(title="Batch Results")
         table.add_column("File", style="cyan")
         table.add_column("Status", style="green")
         table.add_column("Replacements")
+        table.add_column("Size")
 
         for res in result.results:
             table.add_row(
                 res.input_path,
                 "OK",
                 str(res.replacements_made),
+                str(res.output_size_bytes),
             )
         for err in result.errors:
-            table.add_row(err["file"], f"[red]{err['error']}[/]", "-")
+            table.add_row(err["file"], f"[red]{err['error']}[/]", "-", "-")
 
         console.print(table)
         console.print(
@@ -281,6 +420,10 @@ def batch(
         logger.error("Batch error: %s", e.message)
         console.print(f"[red]Error:[/] {e.message}")
         raise typer.Exit(code=1) from None
+    except ValueError as e:
+        logger.error("Validation error: %s", e)
+        console.print(f"[red]Error:[/] {e}")
+        raise typer.Exit(code=1) from None
     except Exception:
         logger.exception("Unexpected error in CLI batch")
         console.print("[red]Error:[/] An unexpected error occurred. Check logs.")
@@ -294,6 +437,13 @@ def analyze(
         bool,
         typer.Option("--json", "-j", help="Output as JSON structure"),
     ] = False,
+    ndjson_output: Annotated[
+        bool,
+        typer.Option(
+            "--ndjson",
+            help="Stream the structure as newline-delimited JSON, one page per line",
+        ),
+    ] = False,
     password: Annotated[
         str | None,
         typer.Option("--password", "-p", help="Password if PDF is encrypted"),
@@ -305,19 +455,40 @@ def analyze(
             help="Maximum input PDF size in bytes (default: 100 MB, env: PDF_MOD_MAX_FILE_SIZE)",
         ),
     ] = None,
+    mmap: Annotated[
+        bool,
+        typer.Option(
+            "--mmap",
+            help=(
+                "Memory-map the input so only touched pages are loaded. For very large "
+                "files; --max-size then overrides the mapped limit "
+                "(default: 4 GB, env: PDF_MOD_MAX_MAPPED_FILE_SIZE)."
+            ),
+        ),
+    ] = False,
 ) -> None:
     """
     Extract text or structure from a PDF.
 
     Use --json for machine-readable output with positions and fonts.
+    Use --ndjson for very large documents: pages are written as they are
+    analyzed, so memory use does not grow with page count. Combine it with
+    --mmap for multi-GB files.
     """
-    max_file_size = max_size or _get_max_file_size()
     try:
         analyzer = PDFAnalyzer(
-            str(input_pdf.absolute()), password=password, max_file_size=max_file_size
+            str(input_pdf.absolute()),
+            password=password,
+            max_file_size=max_size or _get_max_file_size(),
+            span_cache=default_span_cache(),
+            memory_map=mmap,
+            max_mapped_file_size=max_size or _get_max_mapped_file_size(),
         )
 
-        if json_output:
+        if ndjson_output:
+            for page in analyzer.iter_pages():
+                typer.echo(page.model_dump_json())
+        elif json_output:
             result = analyzer.get_structure()
             console.print_json(result.model_dump_json(indent=2))
         else:
@@ -357,7 +528,10 @@ def inspect(
     max_file_size = max_size or _get_max_file_size()
     try:
         analyzer = PDFAnalyzer(
-            str(input_pdf.absolute()), password=password, max_file_size=max_file_size
+            str(input_pdf.absolute()),
+            password=password,
+            max_file_size=max_file_size,
+            span_cache=default_span_cache(),
         )
         result = analyzer.inspect_fonts(terms)
 
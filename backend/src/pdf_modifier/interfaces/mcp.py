@@ -3,21 +3,31 @@ MCP (Model Context Protocol) server for PDF Modifier.
 
 Provides LLM-friendly tools for PDF analysis and modification.
 Uses FastMCP with stdio transport for Claude Desktop integration.
+
+Tools are async and run the PDF work on the bounded ``default_executor()``
+pool (configured with ``PDF_MOD_EXECUTOR_*`` environment variables), so
+large documents never block the server's event loop.
 """
 
 from __future__ import annotations
 
 import json
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from functools import wraps
 from typing import Any
 
 from fastmcp import FastMCP
 
-from ..core.analyzer import PDFAnalyzer
+from ..core.async_api import AsyncPDFAnalyzer, AsyncPDFModifier, default_executor
 from ..core.exceptions import PDFModifierError
 from ..core.models import ReplacementSpec
-from ..core.modifier import DEFAULT_MAX_FILE_SIZE_BYTES, PDFModifier, batch_process
+from ..core.modifier import (
+    DEFAULT_MAX_FILE_SIZE_BYTES,
+    DEFAULT_SAVE_PROFILE,
+    batch_process,
+)
+from ..core.result_cache import default_result_cache
+from ..core.span_cache import default_span_cache
 from ..logger import setup_logging
 
 logger = setup_logging(__name__)
@@ -27,13 +37,13 @@ mcp = FastMCP(
 )
 
 
-def handle_mcp_errors(func: Callable[..., str]) -> Callable[..., str]:
+def handle_mcp_errors(func: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
     """Decorator to handle exceptions in MCP tools and return JSON error responses."""
 
     @wraps(func)
-    def wrapper(*args: Any, **kwargs: Any) -> str:
+    async def wrapper(*args: Any, **kwargs: Any) -> str:
         try:
-            return func(*args, **kwargs)
+            return await func(*args, **kwargs)
         except PDFModifierError as e:
             return json.dumps(e.to_dict(), indent=2)
         except Exception as e:
@@ -52,10 +62,12 @@ def handle_mcp_errors(func: Callable[..., str]) -> Callable[..., str]:
 
 @mcp.tool()
 @handle_mcp_errors
-def read_pdf_structure(
+async def read_pdf_structure(
     input_path: str,
     password: str | None = None,
     max_file_size: int = DEFAULT_MAX_FILE_SIZE_BYTES,
+    start_page: int = 1,
+    page_limit: int | None = None,
 ) -> str:
     """
     Extract the complete structural content of a PDF document.
@@ -73,27 +85,43 @@ def read_pdf_structure(
     making any modifications. The output helps identify exact text
     to target for replacements.
 
+    PAGINATION:
+    - For large documents, set page_limit to fetch a window of pages
+    - The response's next_page is the start_page for the following call
+    - next_page is null once the last page has been returned
+
     Args:
         input_path: Absolute path to the PDF file to analyze.
                    Must be a valid, accessible PDF file.
         password: Optional password if the PDF is encrypted.
         max_file_size: Maximum allowed input file size in bytes (default: 100 MB).
+        start_page: First page to return, 1-indexed (default: 1).
+        page_limit: Maximum number of pages to return. Omit for all pages.
 
     Returns:
-        JSON string containing the complete page structure.
+        JSON string containing the page structure, total_pages and next_page.
         On error, returns JSON with success=false and error details.
 
-    Example:
+    Examples:
         read_pdf_structure("/home/user/documents/invoice.pdf")
+
+        # Walk a 1,000-page document 50 pages at a time
+        read_pdf_structure("/path/catalogue.pdf", page_limit=50)
+        read_pdf_structure("/path/catalogue.pdf", start_page=51, page_limit=50)
     """
-    analyzer = PDFAnalyzer(input_path, password=password, max_file_size=max_file_size)
-    result = analyzer.get_structure()
+    analyzer = AsyncPDFAnalyzer(
+        input_path,
+        password=password,
+        max_file_size=max_file_size,
+        span_cache=default_span_cache(),
+    )
+    result = await analyzer.get_structure(start_page=start_page, page_limit=page_limit)
     return result.model_dump_json(indent=2)
 
 
 @mcp.tool()
 @handle_mcp_errors
-def inspect_pdf_fonts(
+async def inspect_pdf_fonts(
     input_path: str,
     terms: list[str],
     password: str | None = None,
@@ -128,14 +156,19 @@ def inspect_pdf_fonts(
     Example:
         inspect_pdf_fonts("/path/to/doc.pdf", ["Invoice", "$99.99", "Total"])
     """
-    analyzer = PDFAnalyzer(input_path, password=password, max_file_size=max_file_size)
-    result = analyzer.inspect_fonts(terms)
+    analyzer = AsyncPDFAnalyzer(
+        input_path,
+        password=password,
+        max_file_size=max_file_size,
+        span_cache=default_span_cache(),
+    )
+    result = await analyzer.inspect_fonts(terms)
     return result.model_dump_json(indent=2)
 
 
 @mcp.tool()
 @handle_mcp_errors
-def modify_pdf_content(
+async def modify_pdf_content(
     input_path: str,
     output_path: str,
     replacements: dict[str, str],
@@ -143,6 +176,10 @@ def modify_pdf_content(
     password: str | None = None,
     pages: str | None = None,
     max_file_size: int = DEFAULT_MAX_FILE_SIZE_BYTES,
+    workers: int = 1,
+    incremental: bool = False,
+    save_profile: str = DEFAULT_SAVE_PROFILE,
+    timings: bool = False,
 ) -> str:
     """
     Find and replace text in a PDF while preserving font styles.
@@ -172,6 +209,30 @@ def modify_pdf_content(
     - Use pages="5" to process only page 5
     - Omit to process all pages
 
+    INCREMENTAL SAVE:
+    - Set incremental=true to append only the changed objects to a copy of
+      the input instead of rewriting the whole file (much faster on large PDFs)
+    - The original content remains recoverable from the output; never use it
+      to remove sensitive text
+
+    RESULT CACHE:
+    - Repeating a request with the same input bytes, replacements, page
+      range and options reuses the earlier output instead of recomputing it
+    - Requests with a password are never cached
+
+    SAVE PROFILES:
+    - "fast" (default): plain rewrite, no compression, lowest latency
+    - "balanced": drops unused objects and compresses streams
+    - "smallest": also merges duplicate objects, uses object streams and
+      subsets embedded fonts; slowest save, smallest file
+    - Only "fast" can be combined with incremental=true
+
+    TIMINGS:
+    - Set timings=true to find out where a slow call spends its time
+    - The result then has seconds per stage (open, textpage, get_text_dict,
+      match, apply_redactions, insert_text, save), counters such as
+      pages_scanned and spans_scanned, and the slowest pages
+
     Args:
         input_path: Absolute path to the source PDF file.
         output_path: Absolute path where the modified PDF will be saved.
@@ -184,6 +245,15 @@ def modify_pdf_content(
         password: Optional password if the source PDF is encrypted.
         pages: Optional page range, e.g. "1-3" or "5". Defaults to all pages.
         max_file_size: Maximum allowed input file size in bytes (default: 100 MB).
+        workers: Number of worker processes used to scan pages (default: 1).
+                Use > 1 for documents with thousands of pages. Treated as 1
+                when PDF_MOD_EXECUTOR_KIND is "process".
+        incremental: If true, write an incremental update instead of a full
+                    rewrite (default: false).
+        save_profile: Output optimization profile: "fast", "balanced" or
+                     "smallest" (default: "fast").
+        timings: If true, include per-stage and per-page timings in the
+                result (default: false).
 
     Returns:
         JSON string with modification results including:
@@ -191,6 +261,13 @@ def modify_pdf_content(
         - replacements_made: count of text spans modified
         - pages_modified: count of pages with changes
         - warnings: any non-fatal issues encountered
+        - save_mode: "full" or "incremental"
+        - save_profile: the save profile used
+        - save_seconds: time spent writing the output file (0 on a cache hit)
+        - output_size_bytes: size of the written file
+        - cache_hit: true if an identical earlier request's output was reused
+        - timings: stage timings, counters and slowest pages (null unless
+          timings=true)
 
     Examples:
         # Simple text replacement
@@ -233,19 +310,25 @@ def modify_pdf_content(
         elif len(parts) == 2:
             page_range = (int(parts[0]), int(parts[1]))
 
-    modifier = PDFModifier(
+    modifier = AsyncPDFModifier(
         input_path,
         output_path,
         password=password,
         max_file_size=max_file_size,
+        span_cache=default_span_cache(),
+        incremental=incremental,
+        result_cache=default_result_cache(),
+        collect_timings=timings,
+    )
+    result = await modifier.process(
+        spec, pages=page_range, workers=workers, save_profile=save_profile
     )
-    result = modifier.process(spec, pages=page_range)
     return result.model_dump_json(indent=2)
 
 
 @mcp.tool()
 @handle_mcp_errors
-def list_pdf_hyperlinks(
+async def list_pdf_hyperlinks(
     input_path: str,
     password: str | None = None,
     max_file_size: int = DEFAULT_MAX_FILE_SIZE_BYTES,
@@ -268,14 +351,14 @@ def list_pdf_hyperlinks(
     Example:
         list_pdf_hyperlinks("/path/to/report.pdf")
     """
-    analyzer = PDFAnalyzer(input_path, password=password, max_file_size=max_file_size)
-    result = analyzer.get_hyperlinks()
+    analyzer = AsyncPDFAnalyzer(input_path, password=password, max_file_size=max_file_size)
+    result = await analyzer.get_hyperlinks()
     return result.model_dump_json(indent=2)
 
 
 @mcp.tool()
 @handle_mcp_errors
-def extract_embedded_fonts(
+async def extract_embedded_fonts(
     input_path: str,
     password: str | None = None,
     max_file_size: int = DEFAULT_MAX_FILE_SIZE_BYTES,
@@ -304,8 +387,8 @@ def extract_embedded_fonts(
     Example:
         extract_embedded_fonts("/path/to/document.pdf")
     """
-    analyzer = PDFAnalyzer(input_path, password=password, max_file_size=max_file_size)
-    fonts = analyzer.extract_embedded_fonts()
+    analyzer = AsyncPDFAnalyzer(input_path, password=password, max_file_size=max_file_size)
+    fonts = await analyzer.extract_embedded_fonts()
 
     return json.dumps(
         {
@@ -329,13 +412,15 @@ def extract_embedded_fonts(
 
 @mcp.tool()
 @handle_mcp_errors
-def batch_modify_pdf_content(
+async def batch_modify_pdf_content(
     input_paths: list[str],
     output_dir: str,
     replacements: dict[str, str],
     use_regex: bool = False,
     password: str | None = None,
     max_file_size: int = DEFAULT_MAX_FILE_SIZE_BYTES,
+    workers: int = 1,
+    save_profile: str = DEFAULT_SAVE_PROFILE,
 ) -> str:
     """
     Apply the same text replacements to multiple PDF files at once.
@@ -351,6 +436,11 @@ def batch_modify_pdf_content(
         use_regex: If true, treat keys as regex patterns.
         password: Optional password if PDFs are encrypted.
         max_file_size: Maximum allowed input file size in bytes (default: 100 MB).
+        workers: Number of worker processes (default: 1). Use > 1 to process
+                files in parallel; results keep the order of input_paths.
+                Treated as 1 when PDF_MOD_EXECUTOR_KIND is "process".
+        save_profile: Output optimization profile for every file: "fast",
+                     "balanced" or "smallest" (default: "fast").
 
     Returns:
         JSON string with batch results including per-file status.
@@ -363,12 +453,16 @@ def batch_modify_pdf_content(
         )
     """
     spec = ReplacementSpec(replacements=replacements, use_regex=use_regex)
-    result = batch_process(
+    executor = default_executor()
+    result = await executor.run(
+        batch_process,
         input_paths,
         output_dir,
         spec,
         password=password,
         max_file_size=max_file_size,
+        workers=executor.job_workers(workers),
+        save_profile=save_profile,
     )
     return result.model_dump_json(indent=2)
 
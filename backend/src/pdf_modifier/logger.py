@@ -15,6 +15,10 @@ class JsonFormatter(logging.Formatter):
             "name": record.name,
             "message": record.getMessage(),
         }
+        # Structured payload passed as ``logger.info(..., extra={"data": {...}})``
+        data = getattr(record, "data", None)
+        if data is not None:
+            log_data["data"] = data
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
         return json.dumps(log_data)
@@ -11,7 +11,8 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from ..logger import setup_logging
 from .config import WebSettings
-from .routes import ai_router, health_router, pdf_router
+from .deps import get_job_runner, get_reaper, shutdown_executor, shutdown_job_runner
+from .routes import ai_router, health_router, jobs_router, pdf_router
 
 logger = setup_logging(__name__)
 
@@ -28,8 +29,15 @@ def _get_version() -> str:
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan — startup and shutdown hooks."""
     logger.info("Web API starting up")
+    # Start job workers right away so jobs left over from a restart resume
+    get_job_runner()
+    reaper = get_reaper()
+    reaper.start()
     yield
     logger.info("Web API shutting down")
+    await reaper.stop()
+    shutdown_job_runner()
+    shutdown_executor()
 
 
 def create_app(settings: WebSettings | None = None) -> FastAPI:
@@ -63,6 +71,7 @@ def create_app(settings: WebSettings | None = None) -> FastAPI:
     # Register routers
     app.include_router(health_router)
     app.include_router(pdf_router)
+    app.include_router(jobs_router)
     app.include_router(ai_router)
 
     return app
@@ -0,0 +1,142 @@
+"""Content-addressed store of uploaded PDFs shared between sessions."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from typing import TYPE_CHECKING
+
+from ..logger import setup_logging
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = setup_logging(__name__)
+
+BLOB_SUFFIX = ".pdf"
+STRUCTURE_SUFFIX = ".structure.json"
+
+
+class BlobStore:
+    """PDFs stored once per SHA-256 digest, referenced by hard links.
+
+    A session's copy of an upload is a hard link to the blob, so every
+    session uploading the same bytes shares one file on disk and the
+    existing per-session paths keep working unchanged. The filesystem's
+    link count is the reference count: a blob whose only remaining link
+    is its own entry here is unreferenced and removed by
+    ``collect_garbage``. Analysis results are cached next to the blob and
+    removed with it.
+
+    Blobs are never modified in place; a modified PDF is always written to
+    a new file.
+
+    Example:
+        >>> blobs = BlobStore(Path("storage/.blobs"))
+        >>> shared = blobs.adopt(upload_path, digest)  # upload_path now links the blob
+        >>> blobs.ref_count(digest)
+        1
+    """
+
+    def __init__(self, root: Path) -> None:
+        # Created with the first blob
+        self.root = root
+
+    def path_for(self, digest: str) -> Path:
+        """Location of the blob with ``digest``."""
+        return self.root / digest[:2] / f"{digest}{BLOB_SUFFIX}"
+
+    def _structure_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}{STRUCTURE_SUFFIX}"
+
+    def adopt(self, path: Path, digest: str) -> bool:
+        """Make ``path``, a freshly written file with ``digest``, reference its blob.
+
+        If the blob already exists, ``path`` is replaced by a link to it and
+        its own copy is freed; otherwise ``path`` becomes the blob. When the
+        filesystem does not support hard links, ``path`` is left as a
+        private copy.
+
+        Returns:
+            True if the content was already stored (a duplicate upload).
+        """
+        blob = self.path_for(digest)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        for _ in range(2):
+            try:
+                # Linking is atomic: the blob never exists without a reference
+                os.link(path, blob)
+                return False
+            except FileExistsError:
+                pass
+            except OSError as e:
+                logger.warning("Cannot link %s into blob store: %s", path, e)
+                return False
+
+            link_name = path.with_name(f".{path.name}.link")
+            try:
+                os.link(blob, link_name)
+            except FileNotFoundError:
+                # Collected between the two links; store ours instead
+                continue
+            except OSError as e:
+                logger.warning("Cannot link blob %s: %s", digest, e)
+                return False
+            link_name.replace(path)
+            logger.info("Deduplicated upload %s against blob %s", path, digest)
+            return True
+        return False
+
+    def ref_count(self, digest: str) -> int:
+        """Number of session files linking to the blob (0 if it does not exist)."""
+        try:
+            return self.path_for(digest).stat().st_nlink - 1
+        except FileNotFoundError:
+            return 0
+
+    def get_structure(self, digest: str) -> bytes | None:
+        """Cached structure analysis (serialized JSON) of a blob, or None."""
+        try:
+            return self._structure_path(digest).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put_structure(self, digest: str, structure: bytes) -> None:
+        """Cache the structure analysis of a blob while the blob exists."""
+        target = self._structure_path(digest)
+        if not self.path_for(digest).exists():
+            return
+        try:
+            fd, temp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(structure)
+            os.replace(temp_name, target)
+        except OSError as e:
+            # Caching is best-effort; the session still has its own copy
+            logger.warning("Structure cache write failed for blob %s: %s", digest, e)
+
+    def collect_garbage(self) -> int:
+        """Delete blobs no session links to, with their cached analysis.
+
+        Returns:
+            Bytes freed.
+        """
+        freed = 0
+        for blob in self.root.glob(f"*/*{BLOB_SUFFIX}"):
+            try:
+                stat = blob.stat()
+                if stat.st_nlink > 1:
+                    continue
+                blob.unlink()
+            except FileNotFoundError:
+                continue
+            freed += stat.st_size
+            structure = self._structure_path(blob.name.removesuffix(BLOB_SUFFIX))
+            try:
+                freed += structure.stat().st_size
+                structure.unlink()
+            except FileNotFoundError:
+                pass
+        if freed:
+            logger.info("Collected %d bytes of unreferenced blobs", freed)
+        return freed
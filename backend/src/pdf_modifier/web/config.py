@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from ..core.async_api import DEFAULT_EXECUTOR_QUEUE, DEFAULT_EXECUTOR_WORKERS
+from .reaper import DEFAULT_REAPER_BATCH_SIZE, DEFAULT_REAPER_INTERVAL_SECONDS
+from .storage import DEFAULT_UPLOAD_CHUNK_SIZE
+
 
 class WebSettings(BaseSettings):
     """Web layer configuration."""
@@ -27,11 +32,85 @@ class WebSettings(BaseSettings):
         gt=0,
         description="Maximum upload file size in bytes (default: 100 MB)",
     )
+    session_backend: Literal["memory", "sqlite"] = Field(
+        default="memory",
+        description=(
+            "Where sessions are kept: process-local memory, or a SQLite database "
+            "shared by all workers (needed with more than one uvicorn worker)"
+        ),
+    )
+    session_db_path: Path | None = Field(
+        default=None,
+        description="SQLite session database (default: <storage_dir>/sessions.sqlite3)",
+    )
+    upload_chunk_size: int = Field(
+        default=DEFAULT_UPLOAD_CHUNK_SIZE,
+        gt=0,
+        description="Bytes read and written per step when streaming uploads to disk",
+    )
     session_ttl_seconds: int = Field(
         default=3600,
         gt=0,
         description="Session TTL in seconds (default: 1 hour)",
     )
+    reaper_interval_seconds: float = Field(
+        default=DEFAULT_REAPER_INTERVAL_SECONDS,
+        gt=0,
+        description="Seconds between runs of the expired-session reaper",
+    )
+    reaper_batch_size: int = Field(
+        default=DEFAULT_REAPER_BATCH_SIZE,
+        gt=0,
+        description="Expired sessions removed per store call by the reaper",
+    )
+    storage_quota_bytes: int | None = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Total size of stored session files; above it the reaper evicts the "
+            "oldest sessions (default: no quota)"
+        ),
+    )
+    executor_kind: Literal["thread", "process"] = Field(
+        default="thread",
+        description="Worker pool used for PDF analysis and modification",
+    )
+    executor_workers: int = Field(
+        default=DEFAULT_EXECUTOR_WORKERS,
+        gt=0,
+        description="Number of PDF worker threads or processes",
+    )
+    executor_max_queue: int = Field(
+        default=DEFAULT_EXECUTOR_QUEUE,
+        ge=0,
+        description="PDF jobs allowed to wait for a worker before requests get 503",
+    )
+    job_workers: int = Field(
+        default=2,
+        gt=0,
+        description="Background workers processing modification jobs",
+    )
+    job_max_queued: int = Field(
+        default=100,
+        ge=0,
+        description="Jobs allowed to wait for a worker before submissions get 503",
+    )
+    job_lease_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds without heartbeat after which another process requeues a job",
+    )
+    job_db_path: Path | None = Field(
+        default=None,
+        description="SQLite job queue database (default: <storage_dir>/jobs.sqlite3)",
+    )
+    accel_redirect_prefix: str | None = Field(
+        default=None,
+        description=(
+            "nginx internal location mapped to storage_dir; when set, downloads "
+            "are handed to nginx via X-Accel-Redirect"
+        ),
+    )
     log_level: str = Field(default="INFO", description="Logging level")
     cors_origins: list[str] = Field(
         default_factory=lambda: ["http://localhost:5173"],
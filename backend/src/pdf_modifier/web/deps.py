@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
+from ..core.async_api import PDFExecutor
+from ..core.result_cache import ResultCache, default_result_cache
 from .config import WebSettings
+from .jobs import JobRunner, JobStore
+from .reaper import SessionReaper
 from .session import SessionManager
+from .session_store import InMemorySessionStore, SessionStore, SQLiteSessionStore
 from .storage import PDFStorage
 
 _settings: WebSettings | None = None
 _session_mgr: SessionManager | None = None
 _storage: PDFStorage | None = None
+_executor: PDFExecutor | None = None
+_job_runner: JobRunner | None = None
+_reaper: SessionReaper | None = None
+_result_cache: ResultCache | None = None
+_result_cache_loaded = False
 
 
 def get_settings() -> WebSettings:
@@ -24,7 +34,13 @@ def get_session_manager() -> SessionManager:
     global _session_mgr
     if _session_mgr is None:
         settings = get_settings()
-        _session_mgr = SessionManager(ttl_seconds=settings.session_ttl_seconds)
+        store: SessionStore
+        if settings.session_backend == "sqlite":
+            db_path = settings.session_db_path or settings.storage_dir / "sessions.sqlite3"
+            store = SQLiteSessionStore(db_path)
+        else:
+            store = InMemorySessionStore()
+        _session_mgr = SessionManager(ttl_seconds=settings.session_ttl_seconds, store=store)
     return _session_mgr
 
 
@@ -37,9 +53,89 @@ def get_storage() -> PDFStorage:
     return _storage
 
 
+def get_executor() -> PDFExecutor:
+    """Get the bounded PDF worker pool (singleton)."""
+    global _executor
+    if _executor is None:
+        settings = get_settings()
+        _executor = PDFExecutor(
+            max_workers=settings.executor_workers,
+            kind=settings.executor_kind,
+            max_queue=settings.executor_max_queue,
+        )
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """Stop the PDF worker pool if it was started."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+
+def get_result_cache() -> ResultCache | None:
+    """Get the modification result cache configured by environment (None if disabled)."""
+    global _result_cache, _result_cache_loaded
+    if not _result_cache_loaded:
+        # Outputs are session files owned by the server, so hits can be linked
+        _result_cache = default_result_cache(link_outputs=True)
+        _result_cache_loaded = True
+    return _result_cache
+
+
+def get_job_runner() -> JobRunner:
+    """Get the background job runner (singleton), starting its workers."""
+    global _job_runner
+    if _job_runner is None:
+        settings = get_settings()
+        db_path = settings.job_db_path or settings.storage_dir / "jobs.sqlite3"
+        _job_runner = JobRunner(
+            JobStore(db_path, lease_seconds=settings.job_lease_seconds),
+            workers=settings.job_workers,
+            max_queued=settings.job_max_queued,
+            session_mgr=get_session_manager(),
+            result_cache=get_result_cache(),
+        )
+        _job_runner.start()
+    return _job_runner
+
+
+def shutdown_job_runner() -> None:
+    """Stop the job workers; interrupted jobs are requeued for the next start."""
+    global _job_runner
+    if _job_runner is not None:
+        _job_runner.stop()
+        _job_runner.store.close()
+        _job_runner = None
+
+
+def get_reaper() -> SessionReaper:
+    """Get the expired-session reaper (singleton); the app lifespan starts it."""
+    global _reaper
+    if _reaper is None:
+        settings = get_settings()
+        _reaper = SessionReaper(
+            get_session_manager(),
+            get_storage(),
+            interval_seconds=settings.reaper_interval_seconds,
+            batch_size=settings.reaper_batch_size,
+            quota_bytes=settings.storage_quota_bytes,
+            orphan_grace_seconds=settings.session_ttl_seconds,
+        )
+    return _reaper
+
+
 def reset_deps() -> None:
     """Reset dependency singletons (for testing)."""
-    global _settings, _session_mgr, _storage
+    global _settings, _session_mgr, _storage, _reaper, _result_cache, _result_cache_loaded
+    shutdown_job_runner()
+    shutdown_executor()
+    if _session_mgr is not None and isinstance(_session_mgr.store, SQLiteSessionStore):
+        _session_mgr.store.close()
     _settings = None
     _session_mgr = None
     _storage = None
+    _reaper = None
+    _result_cache = None
+    _result_cache_loaded = False
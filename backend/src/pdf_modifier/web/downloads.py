@@ -0,0 +1,93 @@
+"""Cacheable file downloads with conditional GET and nginx offloading."""
+
+from __future__ import annotations
+
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from typing import TYPE_CHECKING
+from urllib.parse import quote
+
+from fastapi import Request, Response
+from fastapi.responses import FileResponse
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Clients may keep a copy but must revalidate it; the ETag makes that a 304
+CACHE_CONTROL = "private, no-cache"
+
+
+def file_etag(stat: os.stat_result) -> str:
+    """Strong validator derived from the file's size and modification time.
+
+    Stored files are only ever replaced, never edited in place, so size
+    and nanosecond mtime identify a version without reading the file.
+    """
+    return f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+
+
+def _not_modified(request: Request, etag: str, stat: os.stat_result) -> bool:
+    """Evaluate If-None-Match, or If-Modified-Since when no ETag was sent."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(stat.st_mtime) <= since
+    return False
+
+
+def file_response(
+    request: Request,
+    path: Path,
+    filename: str,
+    storage_dir: Path,
+    accel_redirect_prefix: str | None = None,
+) -> Response:
+    """Serve a stored PDF with validators, conditional GET and Range support.
+
+    A matching If-None-Match/If-Modified-Since returns an empty 304. With
+    ``accel_redirect_prefix`` set, the body is left to nginx through
+    ``X-Accel-Redirect`` (nginx then handles Range requests itself);
+    otherwise Starlette's FileResponse streams the file, answering Range
+    requests with 206 and using the server's zero-copy ``pathsend``
+    extension when available.
+
+    Args:
+        request: Incoming request, for the conditional and Range headers.
+        path: File to serve; must be inside ``storage_dir``.
+        filename: Download filename for Content-Disposition.
+        storage_dir: Storage root that ``accel_redirect_prefix`` maps to.
+        accel_redirect_prefix: nginx internal location serving ``storage_dir``.
+
+    Returns:
+        304, X-Accel-Redirect or file response.
+    """
+    stat = path.stat()
+    etag = file_etag(stat)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        "Cache-Control": CACHE_CONTROL,
+    }
+    if _not_modified(request, etag, stat):
+        return Response(status_code=304, headers=headers)
+
+    if accel_redirect_prefix:
+        relative = path.resolve().relative_to(storage_dir.resolve()).as_posix()
+        headers["X-Accel-Redirect"] = accel_redirect_prefix.rstrip("/") + "/" + quote(relative)
+        headers["Content-Disposition"] = f"attachment; filename*=utf-8''{quote(filename)}"
+        return Response(media_type="application/pdf", headers=headers)
+
+    return FileResponse(
+        path,
+        media_type="application/pdf",
+        filename=filename,
+        headers=headers,
+        stat_result=stat,
+    )
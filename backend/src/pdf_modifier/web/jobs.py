@@ -0,0 +1,548 @@
+"""Persistent job queue and background workers for long-running modifications."""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ..core.exceptions import ExecutorBusyError, OperationCancelledError, PDFModifierError
+from ..core.models import ReplacementSpec
+from ..core.modifier import DEFAULT_SAVE_PROFILE, PDFModifier
+from ..logger import setup_logging
+
+if TYPE_CHECKING:
+    from ..core.result_cache import ResultCache
+    from .session import SessionManager
+
+logger = setup_logging(__name__)
+
+# How often idle workers look for new jobs submitted by other processes
+DEFAULT_POLL_SECONDS = 1.0
+# Minimum interval between progress writes for one job
+PROGRESS_WRITE_SECONDS = 0.25
+# A running job whose owner sent no heartbeat for this long is requeued
+DEFAULT_LEASE_SECONDS = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    input_path TEXT NOT NULL,
+    output_path TEXT NOT NULL,
+    params TEXT NOT NULL,
+    pages_done INTEGER NOT NULL DEFAULT 0,
+    pages_total INTEGER NOT NULL DEFAULT 0,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    owner TEXT,
+    heartbeat_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at);
+"""
+# Columns added after the first release, for databases created before them
+_ADDED_COLUMNS = {"owner": "TEXT", "heartbeat_at": "REAL"}
+
+
+@dataclass
+class JobRecord:
+    """A queued, running or finished modification job."""
+
+    job_id: str
+    session_id: str
+    status: str
+    input_path: Path
+    output_path: Path
+    params: dict[str, Any]
+    pages_done: int
+    pages_total: int
+    cancel_requested: bool
+    result: dict[str, Any] | None
+    error: str | None
+    created_at: float
+    updated_at: float
+    owner: str | None = None
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> JobRecord:
+        """Build a record from a ``jobs`` table row."""
+        return cls(
+            job_id=row["job_id"],
+            session_id=row["session_id"],
+            status=row["status"],
+            input_path=Path(row["input_path"]),
+            output_path=Path(row["output_path"]),
+            params=json.loads(row["params"]),
+            pages_done=row["pages_done"],
+            pages_total=row["pages_total"],
+            cancel_requested=bool(row["cancel_requested"]),
+            result=json.loads(row["result"]) if row["result"] else None,
+            error=row["error"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            owner=row["owner"],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Public view of the job; filesystem paths are not exposed."""
+        return {
+            "job_id": self.job_id,
+            "session_id": self.session_id,
+            "status": self.status,
+            "pages_done": self.pages_done,
+            "pages_total": self.pages_total,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+class JobStore:
+    """SQLite-backed job queue that survives restarts.
+
+    The database runs in WAL mode so status polls never block the workers
+    writing progress. Jobs are claimed inside ``BEGIN IMMEDIATE``
+    transactions, so several server processes can share one database
+    without running a job twice.
+
+    Each store has an ``owner`` ID, unique per process, that is recorded
+    on the jobs it claims. A claim is a lease: the owner renews it with
+    ``heartbeat()``, and only running jobs whose lease is older than
+    ``lease_seconds`` (their process died) are requeued by
+    ``requeue_expired()``.
+
+    Example:
+        >>> store = JobStore(Path("storage/jobs.sqlite3"))
+        >>> job = store.submit("abc123", input_pdf, output_dir, {"replacements": {"a": "b"}})
+        >>> store.get(job.job_id).status
+        'queued'
+    """
+
+    def __init__(self, db_path: Path, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> None:
+        if lease_seconds <= 0:
+            raise ValueError("lease_seconds must be > 0")
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(_SCHEMA)
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        for name, sql_type in _ADDED_COLUMNS.items():
+            if name not in columns:
+                self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {sql_type}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def submit(
+        self,
+        session_id: str,
+        input_path: Path,
+        output_dir: Path,
+        params: dict[str, Any],
+    ) -> JobRecord:
+        """Queue a new job.
+
+        Args:
+            session_id: Session the input PDF belongs to.
+            input_path: PDF to modify.
+            output_dir: Directory the modified PDF is written to, as
+                        ``<job_id>.pdf``.
+            params: JSON-serializable replacement options.
+
+        Returns:
+            The queued job.
+        """
+        job_id = uuid.uuid4().hex
+        output_path = output_dir / f"{job_id}.pdf"
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, session_id, status, input_path, output_path,"
+                " params, created_at, updated_at) VALUES (?, ?, 'queued', ?, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    session_id,
+                    str(input_path),
+                    str(output_path),
+                    json.dumps(params),
+                    now,
+                    now,
+                ),
+            )
+        logger.info("Job queued: %s (session %s)", job_id, session_id)
+        job = self.get(job_id)
+        assert job is not None
+        return job
+
+    def get(self, job_id: str) -> JobRecord | None:
+        """Get a job by ID. Returns None if not found."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return JobRecord.from_row(row) if row else None
+
+    def count(self, *statuses: str) -> int:
+        """Count jobs in any of ``statuses``."""
+        placeholders = ", ".join("?" * len(statuses))
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT COUNT(*) FROM jobs WHERE status IN ({placeholders})", statuses
+            ).fetchone()
+        return int(row[0])
+
+    def claim(self) -> JobRecord | None:
+        """Atomically mark the oldest queued job as running by this owner and return it."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT * FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+                ).fetchone()
+                if row is not None:
+                    now = time.time()
+                    self._conn.execute(
+                        "UPDATE jobs SET status = 'running', owner = ?, heartbeat_at = ?,"
+                        " updated_at = ? WHERE job_id = ?",
+                        (self.owner, now, now, row["job_id"]),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        job = JobRecord.from_row(row)
+        job.status = "running"
+        job.owner = self.owner
+        return job
+
+    # Updates of a running job only apply while this store still holds its
+    # lease: once it expired and the job was requeued, the job is someone
+    # else's and a late write from this owner must not touch it.
+
+    def update_progress(self, job_id: str, pages_done: int, pages_total: int) -> bool:
+        """Record how many pages of a running job are done; also renews its lease.
+
+        Returns:
+            False if this owner no longer holds the job.
+        """
+        now = time.time()
+        return self._execute(
+            "UPDATE jobs SET pages_done = ?, pages_total = ?, updated_at = ?, heartbeat_at = ?"
+            " WHERE job_id = ? AND owner = ? AND status = 'running'",
+            (pages_done, pages_total, now, now, job_id, self.owner),
+        )
+
+    def finish(self, job_id: str, result: dict[str, Any]) -> bool:
+        """Mark a job this owner is running as succeeded with its result.
+
+        Returns:
+            False if this owner no longer holds the job (nothing is written).
+        """
+        return self._execute(
+            "UPDATE jobs SET status = 'succeeded', result = ?, updated_at = ?"
+            " WHERE job_id = ? AND owner = ? AND status = 'running'",
+            (json.dumps(result), time.time(), job_id, self.owner),
+        )
+
+    def fail(self, job_id: str, error: str, status: str = "failed") -> bool:
+        """Mark a job this owner is running as failed (or cancelled) with an error.
+
+        Returns:
+            False if this owner no longer holds the job (nothing is written).
+        """
+        return self._execute(
+            "UPDATE jobs SET status = ?, error = ?, updated_at = ?"
+            " WHERE job_id = ? AND owner = ? AND status = 'running'",
+            (status, error, time.time(), job_id, self.owner),
+        )
+
+    def request_cancel(self, job_id: str) -> JobRecord | None:
+        """Cancel a job.
+
+        Queued jobs are cancelled immediately; running jobs are flagged and
+        stop at their next page. Finished jobs are left as they are.
+
+        Returns:
+            The updated job, or None if not found.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = 'cancelled', error = 'Cancelled before start',"
+                " updated_at = ? WHERE job_id = ? AND status = 'queued'",
+                (now, job_id),
+            )
+            self._conn.execute(
+                "UPDATE jobs SET cancel_requested = 1, updated_at = ?"
+                " WHERE job_id = ? AND status = 'running'",
+                (now, job_id),
+            )
+        return self.get(job_id)
+
+    def is_cancel_requested(self, job_id: str) -> bool:
+        """Whether cancellation was requested for a running job."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT cancel_requested FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return bool(row and row[0])
+
+    def heartbeat(self) -> int:
+        """Renew the lease of every job this owner is running.
+
+        Returns:
+            Number of renewed jobs.
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET heartbeat_at = ? WHERE owner = ? AND status = 'running'",
+                (time.time(), self.owner),
+            )
+        return cursor.rowcount
+
+    def requeue_expired(self) -> int:
+        """Put running jobs whose lease expired back in the queue.
+
+        Jobs of live processes, which keep sending heartbeats, are left
+        alone; only those of processes that died or hung are requeued.
+
+        Returns:
+            Number of requeued jobs.
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = 'queued', owner = NULL, pages_done = 0, updated_at = ?"
+                " WHERE status = 'running' AND COALESCE(heartbeat_at, 0) < ?",
+                (now, now - self.lease_seconds),
+            )
+        if cursor.rowcount:
+            logger.info("Requeued %d interrupted jobs", cursor.rowcount)
+        return cursor.rowcount
+
+    def requeue(self, job_id: str) -> None:
+        """Put a job this owner is running back in the queue, e.g. on shutdown."""
+        self._execute(
+            "UPDATE jobs SET status = 'queued', owner = NULL, pages_done = 0, updated_at = ?"
+            " WHERE job_id = ? AND status = 'running' AND owner = ?",
+            (time.time(), job_id, self.owner),
+        )
+
+    def _execute(self, sql: str, args: tuple[Any, ...]) -> bool:
+        """Run one statement; whether it changed any row."""
+        with self._lock:
+            return self._conn.execute(sql, args).rowcount > 0
+
+
+class _JobCancelEvent:
+    """CancelEvent backed by the job's ``cancel_requested`` flag."""
+
+    def __init__(self, store: JobStore, job_id: str, local: threading.Event) -> None:
+        self._store = store
+        self._job_id = job_id
+        self._local = local
+
+    def is_set(self) -> bool:
+        if not self._local.is_set() and self._store.is_cancel_requested(self._job_id):
+            self._local.set()
+        return self._local.is_set()
+
+
+class JobRunner:
+    """Pool of worker threads that processes jobs from a JobStore.
+
+    ``workers`` jobs run at once. Submissions are refused with
+    ExecutorBusyError once ``max_queued`` jobs are waiting. A heartbeat
+    thread renews the leases of the running jobs and requeues jobs whose
+    process stopped renewing theirs, so runners in several processes can
+    share one store. With a
+    ``result_cache``, a job repeating an earlier request completes from it.
+
+    Example:
+        >>> runner = JobRunner(JobStore(db_path), workers=2, max_queued=100)
+        >>> runner.start()
+        >>> job = runner.submit("abc123", input_pdf, output_dir, params)
+        >>> runner.stop()
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        workers: int = 2,
+        max_queued: int = 100,
+        session_mgr: SessionManager | None = None,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+        result_cache: ResultCache | None = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.store = store
+        self.workers = workers
+        self.max_queued = max_queued
+        self.session_mgr = session_mgr
+        self.poll_seconds = poll_seconds
+        self.result_cache = result_cache
+        self._threads: list[threading.Thread] = []
+        self._stop = threading.Event()
+        self._wake = threading.Condition()
+        self._running: dict[str, threading.Event] = {}
+
+    def start(self) -> None:
+        """Requeue jobs with expired leases and start the worker and heartbeat threads."""
+        if self._threads:
+            return
+        self.store.requeue_expired()
+        self._stop.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"pdf-job-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        heartbeat = threading.Thread(target=self._heartbeat, name="pdf-job-lease", daemon=True)
+        heartbeat.start()
+        self._threads.append(heartbeat)
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Signal running jobs to stop and wait for the workers to exit.
+
+        Interrupted jobs go back to the queue and are picked up again on
+        the next start.
+        """
+        self._stop.set()
+        for event in list(self._running.values()):
+            event.set()
+        with self._wake:
+            self._wake.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+
+    def submit(
+        self,
+        session_id: str,
+        input_path: Path,
+        output_dir: Path,
+        params: dict[str, Any],
+    ) -> JobRecord:
+        """Queue a job and wake an idle worker; see ``JobStore.submit``.
+
+        Raises:
+            ExecutorBusyError: If ``max_queued`` jobs are already waiting.
+        """
+        queued = self.store.count("queued")
+        if queued >= self.max_queued:
+            raise ExecutorBusyError(
+                "Job queue is full, try again later",
+                {"queued": queued, "limit": self.max_queued},
+            )
+        job = self.store.submit(session_id, input_path, output_dir, params)
+        with self._wake:
+            self._wake.notify()
+        return job
+
+    def cancel(self, job_id: str) -> JobRecord | None:
+        """Cancel a queued or running job; see ``JobStore.request_cancel``."""
+        job = self.store.request_cancel(job_id)
+        event = self._running.get(job_id)
+        if event is not None:
+            event.set()
+        return job
+
+    def _heartbeat(self) -> None:
+        # Renew well before expiry, so one late beat does not lose a lease
+        while not self._stop.wait(self.store.lease_seconds / 3):
+            try:
+                self.store.heartbeat()
+                if self.store.requeue_expired():
+                    with self._wake:
+                        self._wake.notify_all()
+            except sqlite3.Error as e:
+                logger.warning("Job lease heartbeat failed: %s", e)
+
+    def _work(self) -> None:
+        while not self._stop.is_set():
+            job = self.store.claim()
+            if job is None:
+                with self._wake:
+                    self._wake.wait(self.poll_seconds)
+                continue
+            self.run_job(job)
+
+    def run_job(self, job: JobRecord) -> None:
+        """Process one claimed job and record its outcome."""
+        local = self._running[job.job_id] = threading.Event()
+        last_write = 0.0
+
+        def on_progress(done: int, total: int) -> None:
+            nonlocal last_write
+            now = time.monotonic()
+            if done == total or now - last_write >= PROGRESS_WRITE_SECONDS:
+                self.store.update_progress(job.job_id, done, total)
+                last_write = now
+
+        params = job.params
+        pages = params.get("pages")
+        try:
+            job.output_path.parent.mkdir(parents=True, exist_ok=True)
+            modifier = PDFModifier(
+                job.input_path,
+                job.output_path,
+                incremental=bool(params.get("incremental", False)),
+                cancel_event=_JobCancelEvent(self.store, job.job_id, local),
+                on_progress=on_progress,
+                result_cache=self.result_cache,
+            )
+            result = modifier.process(
+                ReplacementSpec(
+                    replacements=params.get("replacements", {}),
+                    use_regex=params.get("use_regex", False),
+                ),
+                (pages[0], pages[1]) if pages else None,
+                save_profile=params.get("save_profile", DEFAULT_SAVE_PROFILE),
+            )
+        except OperationCancelledError as e:
+            if self._stop.is_set() and not self.store.is_cancel_requested(job.job_id):
+                self.store.requeue(job.job_id)
+                logger.info("Job interrupted by shutdown, requeued: %s", job.job_id)
+            else:
+                self.store.fail(job.job_id, e.message, status="cancelled")
+                logger.info("Job cancelled: %s", job.job_id)
+        except PDFModifierError as e:
+            self.store.fail(job.job_id, e.message)
+            logger.warning("Job failed: %s: %s", job.job_id, e.message)
+        except ValueError as e:
+            self.store.fail(job.job_id, str(e))
+            logger.warning("Job failed: %s: %s", job.job_id, e)
+        except Exception:
+            self.store.fail(job.job_id, "Modification failed")
+            logger.exception("Error during job %s", job.job_id)
+        else:
+            if not self.store.finish(job.job_id, result.model_dump()):
+                # The lease expired and the job went to another worker
+                logger.warning("Job %s finished after losing its lease; ignored", job.job_id)
+                return
+            if self.session_mgr is not None:
+                self.session_mgr.set_modified_path(job.session_id, job.output_path)
+            logger.info("Job succeeded: %s", job.job_id)
+        finally:
+            del self._running[job.job_id]
@@ -0,0 +1,166 @@
+"""Periodic cleanup of expired sessions and their stored files."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+from ..logger import setup_logging
+
+if TYPE_CHECKING:
+    from .session import SessionManager
+    from .storage import PDFStorage
+
+logger = setup_logging(__name__)
+
+DEFAULT_REAPER_INTERVAL_SECONDS = 60.0
+DEFAULT_REAPER_BATCH_SIZE = 100
+
+
+@dataclass
+class ReaperMetrics:
+    """Cumulative reaper counters plus figures from the latest run."""
+
+    runs: int = 0
+    errors: int = 0
+    sessions_expired: int = 0
+    sessions_evicted: int = 0
+    orphans_removed: int = 0
+    bytes_reclaimed: int = 0
+    storage_bytes: int = 0
+    last_run_at: float | None = None
+    last_run_seconds: float = 0.0
+    last_bytes_reclaimed: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Metrics as a JSON-serializable dict."""
+        return asdict(self)
+
+
+class SessionReaper:
+    """Expires sessions, deletes their directories and enforces a storage quota.
+
+    Each run, in a worker thread so neither database calls nor directory
+    deletion block the event loop:
+
+    1. Removes expired sessions ``batch_size`` at a time and deletes
+       their directories.
+    2. Deletes session directories no session refers to any more (e.g.
+       left behind by a restart with in-memory sessions) once they are
+       older than ``orphan_grace_seconds``.
+    3. If the storage directory still exceeds ``quota_bytes``, evicts the
+       oldest sessions until it fits.
+    4. Deletes stored blobs that no session links to any more.
+
+    Bytes are counted as freed only when no other session shares them.
+
+    Example:
+        >>> reaper = SessionReaper(session_mgr, storage, quota_bytes=10 * 1024**3)
+        >>> reaper.start()  # inside a running event loop
+        >>> await reaper.stop()
+    """
+
+    def __init__(
+        self,
+        session_mgr: SessionManager,
+        storage: PDFStorage,
+        interval_seconds: float = DEFAULT_REAPER_INTERVAL_SECONDS,
+        batch_size: int = DEFAULT_REAPER_BATCH_SIZE,
+        quota_bytes: int | None = None,
+        orphan_grace_seconds: float = 3600.0,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self.session_mgr = session_mgr
+        self.storage = storage
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.quota_bytes = quota_bytes
+        self.orphan_grace_seconds = orphan_grace_seconds
+        self.metrics = ReaperMetrics()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start reaping periodically on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop the periodic task, waiting for a run in progress to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                self.metrics.errors += 1
+                logger.exception("Session reaper run failed")
+            await asyncio.sleep(self.interval_seconds)
+
+    async def run_once(self) -> ReaperMetrics:
+        """Run one reaping pass in a worker thread and return the metrics."""
+        await asyncio.to_thread(self.reap)
+        return self.metrics
+
+    def reap(self) -> None:
+        """Run one reaping pass synchronously."""
+        start = time.perf_counter()
+        reclaimed = 0
+
+        while True:
+            expired = self.session_mgr.expire(self.batch_size)
+            reclaimed += self._delete_dirs(expired)
+            self.metrics.sessions_expired += len(expired)
+            if len(expired) < self.batch_size:
+                break
+
+        now = time.time()
+        for session_id in self.storage.session_ids():
+            if self.session_mgr.get(session_id) is not None:
+                continue
+            mtime = self.storage.session_mtime(session_id)
+            if mtime is not None and now - mtime >= self.orphan_grace_seconds:
+                reclaimed += self._delete_dirs([session_id])
+                self.metrics.orphans_removed += 1
+
+        # Blobs whose last session went away above
+        self.storage.collect_garbage()
+        total = self.storage.total_bytes()
+        if self.quota_bytes is not None and total > self.quota_bytes:
+            while total > self.quota_bytes:
+                evicted = self.session_mgr.evict_oldest()
+                if not evicted:
+                    break
+                freed = self._delete_dirs(evicted)
+                total -= freed
+                reclaimed += freed
+                self.metrics.sessions_evicted += len(evicted)
+                logger.info("Evicted session %s to stay under storage quota", evicted[0])
+            self.storage.collect_garbage()
+
+        self.metrics.runs += 1
+        self.metrics.bytes_reclaimed += reclaimed
+        self.metrics.last_bytes_reclaimed = reclaimed
+        self.metrics.storage_bytes = total
+        self.metrics.last_run_at = now
+        self.metrics.last_run_seconds = time.perf_counter() - start
+        if reclaimed:
+            logger.info(
+                "Reaper reclaimed %d bytes in %.3fs", reclaimed, self.metrics.last_run_seconds
+            )
+
+    def _delete_dirs(self, session_ids: list[str]) -> int:
+        """Delete session directories; returns the bytes they held exclusively."""
+        freed = 0
+        for session_id in session_ids:
+            freed += self.storage.session_bytes(session_id)
+            self.storage.delete_session(session_id)
+        return freed
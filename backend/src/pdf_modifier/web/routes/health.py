@@ -1,6 +1,11 @@
 """Health check endpoint."""
 
-from fastapi import APIRouter
+from typing import Any
+
+from fastapi import APIRouter, Depends
+
+from ..deps import get_reaper
+from ..reaper import SessionReaper
 
 router = APIRouter()
 
@@ -9,3 +14,11 @@ router = APIRouter()
 async def health_check() -> dict[str, str]:
     """Health check endpoint."""
     return {"status": "ok"}
+
+
+@router.get("/health/reaper")
+async def reaper_metrics(
+    reaper: SessionReaper = Depends(get_reaper),
+) -> dict[str, Any]:
+    """Sessions and bytes reclaimed by the session reaper, and run timings."""
+    return reaper.metrics.to_dict()
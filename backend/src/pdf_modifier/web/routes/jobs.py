@@ -0,0 +1,134 @@
+"""Background modification job endpoints.
+
+Large documents can take longer to modify than a proxy allows a request
+to run. These endpoints queue the modification instead: submitting returns
+a job id right away, and clients poll the job for progress and download
+the result once it has succeeded.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+
+from ...core.exceptions import ExecutorBusyError, PDFModifierError
+from ...core.models import ReplacementSpec
+from ..config import WebSettings
+from ..deps import get_job_runner, get_session_manager, get_settings, get_storage
+from ..downloads import file_response
+from ..jobs import JobRecord, JobRunner
+from ..session import SessionManager
+from ..storage import PDFStorage
+from .pdf import parse_replace_options
+
+router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+
+
+def _get_job(runner: JobRunner, job_id: str) -> JobRecord:
+    job = runner.store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.post("", status_code=202)
+def submit_job(
+    body: dict[str, Any],
+    storage: PDFStorage = Depends(get_storage),
+    session_mgr: SessionManager = Depends(get_session_manager),
+    runner: JobRunner = Depends(get_job_runner),
+) -> dict[str, Any]:
+    """Queue text replacements on a session's PDF.
+
+    Args:
+        body: Request body with 'session_id', 'replacements' and the other
+              options of ``POST /api/pdf/{session_id}/replace``.
+        storage: PDF storage dependency.
+        session_mgr: Session manager dependency.
+        runner: Job runner dependency.
+
+    Returns:
+        The queued job; poll ``GET /api/jobs/{job_id}`` for its status.
+
+    Raises:
+        HTTPException 404: If session not found.
+        HTTPException 400: If the options are invalid.
+        HTTPException 503: If the job queue is full.
+    """
+    session_id = str(body.get("session_id", ""))
+    if session_mgr.get(session_id) is None:
+        raise HTTPException(status_code=404, detail="Session not found or expired")
+
+    try:
+        pdf_path = storage.get_pdf(session_id)
+        options = parse_replace_options(body)
+        # Reject invalid replacements now rather than as a failed job
+        ReplacementSpec(replacements=options["replacements"], use_regex=options["use_regex"])
+    except PDFModifierError as e:
+        raise HTTPException(status_code=400, detail=e.message)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # Below the session directory's top level, so get_pdf never returns it
+    output_dir = pdf_path.parent / "jobs"
+    try:
+        job = runner.submit(session_id, pdf_path, output_dir, options)
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=e.message, headers={"Retry-After": "5"})
+    return job.to_dict()
+
+
+@router.get("/{job_id}")
+def get_job(job_id: str, runner: JobRunner = Depends(get_job_runner)) -> dict[str, Any]:
+    """Get a job's status, page progress and, once finished, its result or error.
+
+    Raises:
+        HTTPException 404: If job not found.
+    """
+    return _get_job(runner, job_id).to_dict()
+
+
+@router.get("/{job_id}/download")
+def download_job_result(
+    job_id: str,
+    request: Request,
+    runner: JobRunner = Depends(get_job_runner),
+    settings: WebSettings = Depends(get_settings),
+) -> Response:
+    """Download the modified PDF of a succeeded job.
+
+    Supports Range requests and conditional GET like the session download.
+
+    Raises:
+        HTTPException 404: If job not found or its output was deleted.
+        HTTPException 409: If the job has not succeeded.
+    """
+    job = _get_job(runner, job_id)
+    if job.status != "succeeded":
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}")
+    if not job.output_path.exists():
+        raise HTTPException(status_code=404, detail="Job output no longer available")
+    return file_response(
+        request,
+        job.output_path,
+        f"modified_{job.input_path.name}",
+        settings.storage_dir,
+        settings.accel_redirect_prefix,
+    )
+
+
+@router.delete("/{job_id}")
+def cancel_job(job_id: str, runner: JobRunner = Depends(get_job_runner)) -> dict[str, Any]:
+    """Cancel a queued or running job.
+
+    A running job stops at its next page; its status becomes "cancelled"
+    shortly after. Finished jobs are returned unchanged.
+
+    Raises:
+        HTTPException 404: If job not found.
+    """
+    job = runner.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
@@ -2,130 +2,341 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator, Awaitable
 from pathlib import Path
 from typing import Any
 
-import anyio
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Request, UploadFile
+from fastapi.responses import Response, StreamingResponse
 
-from ...core.analyzer import PDFAnalyzer
-from ...core.exceptions import PDFModifierError
-from ...core.models import ReplacementSpec
-from ...core.modifier import PDFModifier
+from ...core.async_api import AsyncPDFAnalyzer, AsyncPDFModifier, PDFExecutor
+from ...core.exceptions import ExecutorBusyError, FileSizeExceededError, PDFModifierError
+from ...core.models import ModificationResult, PDFStructure, ReplacementSpec
+from ...core.modifier import DEFAULT_SAVE_PROFILE
+from ...core.result_cache import ResultCache
 from ...logger import setup_logging
-from ..deps import get_session_manager, get_storage
+from ..config import WebSettings
+from ..deps import (
+    get_executor,
+    get_result_cache,
+    get_session_manager,
+    get_settings,
+    get_storage,
+)
+from ..downloads import file_etag, file_response
 from ..session import SessionManager
-from ..storage import PDFStorage
+from ..storage import PDFStorage, StorageError, StoredUpload
 
 logger = setup_logging(__name__)
 
 router = APIRouter(prefix="/api/pdf", tags=["pdf"])
 
+# How often a running PDF job checks whether its client is still connected
+DISCONNECT_POLL_SECONDS = 0.5
+# Pages analyzed per worker call when streaming structure
+DEFAULT_STREAM_CHUNK = 16
+
+
+async def _cancel_on_disconnect(request: Request, work: Awaitable[Any]) -> Any:
+    """Await ``work``, cancelling it if the client disconnects first.
+
+    Cancellation reaches the PDF worker, which stops at the next page.
+
+    Raises:
+        HTTPException 499: If the client disconnected (never delivered).
+    """
+    task = asyncio.ensure_future(work)
+    while True:
+        done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_SECONDS)
+        if done:
+            return task.result()
+        if await request.is_disconnected():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            logger.info("Client disconnected; cancelled %s", request.url.path)
+            raise HTTPException(status_code=499, detail="Client disconnected")
+
+
+def _busy() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="Server is busy processing other PDFs, try again later",
+        headers={"Retry-After": "5"},
+    )
+
+
+def parse_replace_options(body: dict[str, Any]) -> dict[str, Any]:
+    """Normalize the options of a replace request body.
+
+    ``pages`` is given as "N" or "START-END" and returned as a
+    ``[start, end]`` list (or None), so the options stay JSON-serializable.
+
+    Raises:
+        HTTPException 400: If the page range is malformed.
+    """
+    pages = body.get("pages")
+    page_range: list[int] | None = None
+    if pages:
+        parts = pages.split("-")
+        if len(parts) == 1:
+            try:
+                page_range = [int(parts[0]), int(parts[0])]
+            except ValueError:
+                raise HTTPException(status_code=400, detail=f"Invalid page format: {parts[0]}")
+        elif len(parts) == 2:
+            try:
+                page_range = [int(parts[0]), int(parts[1])]
+            except ValueError:
+                raise HTTPException(
+                    status_code=400, detail=f"Invalid page format in range: {parts}"
+                )
+    return {
+        "replacements": body.get("replacements", {}),
+        "use_regex": body.get("use_regex", False),
+        "pages": page_range,
+        "incremental": bool(body.get("incremental", False)),
+        "save_profile": body.get("save_profile", DEFAULT_SAVE_PROFILE),
+    }
+
+
+async def _precompute_structure(
+    session_id: str,
+    upload: StoredUpload,
+    session_mgr: SessionManager,
+    storage: PDFStorage,
+    executor: PDFExecutor,
+) -> None:
+    """Analyze a freshly uploaded PDF so ``/structure`` is served from cache.
+
+    The result is also cached for the upload's blob, so later uploads of
+    the same bytes skip the analysis. The blob copy has no ``file_path``:
+    it names this session's directory, and session IDs must not leak to
+    other sessions uploading the same bytes.
+    """
+    try:
+        version = file_etag(upload.path.stat())
+        structure = await AsyncPDFAnalyzer(upload.path, executor=executor).get_structure()
+    except (PDFModifierError, OSError, ValueError) as e:
+        # The structure endpoint reports the error if the client asks for it
+        logger.info("Structure not precomputed for %s: %s", session_id, e)
+        return
+    content = structure.model_dump_json().encode()
+    session_mgr.update_structure(session_id, content, version)
+    shared = structure.model_copy(update={"file_path": ""}).model_dump_json().encode()
+    await asyncio.to_thread(storage.blobs.put_structure, upload.digest, shared)
+
+
+def _structure_for_session(shared: bytes, upload: StoredUpload) -> bytes | None:
+    """Rebuild a session's structure JSON from the path-free blob copy."""
+    try:
+        structure = PDFStructure.model_validate_json(shared)
+    except ValueError:
+        return None
+    return structure.model_copy(update={"file_path": str(upload.path)}).model_dump_json().encode()
+
 
 @router.post("/upload")
 async def upload_pdf(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     storage: PDFStorage = Depends(get_storage),
     session_mgr: SessionManager = Depends(get_session_manager),
+    settings: WebSettings = Depends(get_settings),
+    executor: PDFExecutor = Depends(get_executor),
 ) -> dict[str, str]:
-    """Upload a PDF file and create a session."""
-    from ..config import WebSettings
-
-    max_size = WebSettings().max_file_size
-
-    # Stream with size limit to avoid loading entire file into memory
-    content_chunks: list[bytes] = []
-    total_size = 0
-    while True:
-        chunk = await file.read(8192)
-        if not chunk:
-            break
-        total_size += len(chunk)
-        if total_size > max_size:
-            break
-        content_chunks.append(chunk)
-
-    if total_size > max_size:
-        size_mb = total_size / (1024 * 1024)
-        limit_mb = max_size / (1024 * 1024)
-        raise HTTPException(
-            status_code=413,
-            detail=f"File size {size_mb:.1f} MB exceeds limit of {limit_mb:.0f} MB",
-        )
-
-    content = b"".join(content_chunks)
+    """Upload a PDF file and create a session.
 
-    # Validate PDF magic bytes
-    if not content[:4] == b"%PDF":
-        raise HTTPException(status_code=400, detail="Uploaded file is not a valid PDF")
+    The upload is streamed to disk in ``upload_chunk_size`` chunks, so
+    memory use does not grow with the file size. The document's structure
+    is analyzed in the background after the response is sent, unless the
+    same bytes were uploaded before: then the stored file and its cached
+    analysis are shared and the session is ready immediately.
 
+    Raises:
+        HTTPException 400: If the file is not a PDF.
+        HTTPException 413: If the file exceeds ``max_file_size``.
+    """
     session_id = session_mgr.create(Path("temp"))
-
-    # Save directly to session directory
-    session_dir = storage._base_dir / session_id
-    session_dir.mkdir(parents=True, exist_ok=True)
-    safe_name = storage._sanitize_filename(file.filename or "upload.pdf")
-    output_path = session_dir / safe_name
-    output_path.write_bytes(content)
-
+    try:
+        upload = await storage.save_upload(
+            session_id,
+            file,
+            file.filename or "upload.pdf",
+            max_size=settings.max_file_size,
+            chunk_size=settings.upload_chunk_size,
+        )
+    except (StorageError, FileSizeExceededError) as e:
+        session_mgr.delete(session_id)
+        storage.delete_session(session_id)
+        status = 413 if isinstance(e, FileSizeExceededError) else 400
+        raise HTTPException(status_code=status, detail=e.message)
+
+    shared = storage.blobs.get_structure(upload.digest) if upload.deduplicated else None
+    cached = _structure_for_session(shared, upload) if shared is not None else None
+    if cached is not None:
+        session_mgr.update_structure(session_id, cached, file_etag(upload.path.stat()))
+    else:
+        background_tasks.add_task(
+            _precompute_structure, session_id, upload, session_mgr, storage, executor
+        )
     return {"session_id": session_id}
 
 
 @router.get("/{session_id}/structure")
 async def get_structure(
     session_id: str,
+    request: Request,
+    start_page: int = 1,
+    page_limit: int | None = None,
     storage: PDFStorage = Depends(get_storage),
     session_mgr: SessionManager = Depends(get_session_manager),
-) -> dict[str, Any]:
+    executor: PDFExecutor = Depends(get_executor),
+) -> Response:
     """Get the structural analysis of a PDF.
 
+    The whole-document structure is cached in the session as serialized
+    JSON (precomputed after upload) and served as is while the PDF is
+    unchanged. Page windows are always analyzed on demand.
+
     Args:
         session_id: Session identifier.
+        request: Incoming request, watched for client disconnects.
+        start_page: First page to include (1-indexed).
+        page_limit: Maximum number of pages to include; omit for all pages.
         storage: PDF storage dependency.
         session_mgr: Session manager dependency.
+        executor: PDF worker pool dependency.
 
     Returns:
-        PDF structure as JSON.
+        PDF structure as JSON. ``next_page`` is the cursor for the next window.
 
     Raises:
         HTTPException 404: If session not found.
+        HTTPException 400: If the PDF cannot be analyzed or the window is invalid.
+        HTTPException 503: If the PDF worker pool is saturated.
     """
     session = session_mgr.get(session_id)
     if session is None:
         raise HTTPException(status_code=404, detail="Session not found or expired")
 
     pdf_path = storage.get_pdf(session_id)
+    whole_document = start_page == 1 and page_limit is None
+    version = file_etag(pdf_path.stat())
+    if whole_document:
+        cached = session_mgr.get_structure(session_id, version)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
 
     try:
-        analyzer = PDFAnalyzer(str(pdf_path))
-        result = await anyio.to_thread.run_sync(analyzer.get_structure)
-        session_mgr.update_structure(session_id, result.model_dump())
-        return result.model_dump()
+        analyzer = AsyncPDFAnalyzer(pdf_path, executor=executor)
+        result: PDFStructure = await _cancel_on_disconnect(
+            request, analyzer.get_structure(start_page, page_limit)
+        )
+    except ExecutorBusyError:
+        raise _busy() from None
+    except PDFModifierError as e:
+        raise HTTPException(status_code=400, detail=e.message)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    content = result.model_dump_json().encode()
+    if whole_document:
+        session_mgr.update_structure(session_id, content, version)
+    return Response(content=content, media_type="application/json")
+
+
+@router.get("/{session_id}/structure/stream")
+async def stream_structure(
+    session_id: str,
+    start_page: int = 1,
+    page_limit: int | None = None,
+    storage: PDFStorage = Depends(get_storage),
+    session_mgr: SessionManager = Depends(get_session_manager),
+    executor: PDFExecutor = Depends(get_executor),
+) -> StreamingResponse:
+    """Stream the structural analysis of a PDF as NDJSON, one page per line.
+
+    Pages are analyzed in small chunks and sent as they are ready, so
+    memory use stays bounded regardless of document size. The document's
+    page count is returned in the ``X-Total-Pages`` header. A client that
+    disconnects mid-stream cancels the remaining work.
+
+    Raises:
+        HTTPException 404: If session not found.
+        HTTPException 400: If the PDF cannot be analyzed or the window is invalid.
+        HTTPException 503: If the PDF worker pool is saturated.
+    """
+    session = session_mgr.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found or expired")
+
+    pdf_path = storage.get_pdf(session_id)
+    analyzer = AsyncPDFAnalyzer(pdf_path, executor=executor)
+    if page_limit is not None and page_limit < 1:
+        raise HTTPException(status_code=400, detail="page_limit must be >= 1")
+
+    try:
+        # Fetch the first chunk eagerly so open/validation errors become a 400
+        first = await analyzer.get_structure(
+            start_page, min(page_limit or DEFAULT_STREAM_CHUNK, DEFAULT_STREAM_CHUNK)
+        )
+    except ExecutorBusyError:
+        raise _busy() from None
     except PDFModifierError as e:
         raise HTTPException(status_code=400, detail=e.message)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    remaining = None if page_limit is None else page_limit - len(first.pages)
+
+    async def ndjson() -> AsyncIterator[str]:
+        for page in first.pages:
+            yield page.model_dump_json() + "\n"
+        if first.next_page is None or remaining == 0:
+            return
+        async for page in analyzer.iter_pages(
+            first.next_page, remaining, chunk_size=DEFAULT_STREAM_CHUNK
+        ):
+            yield page.model_dump_json() + "\n"
+
+    return StreamingResponse(
+        ndjson(),
+        media_type="application/x-ndjson",
+        headers={"X-Total-Pages": str(first.total_pages)},
+    )
 
 
 @router.post("/{session_id}/replace")
 async def replace_text(
     session_id: str,
     body: dict[str, Any],
+    request: Request,
     storage: PDFStorage = Depends(get_storage),
     session_mgr: SessionManager = Depends(get_session_manager),
+    executor: PDFExecutor = Depends(get_executor),
+    result_cache: ResultCache | None = Depends(get_result_cache),
 ) -> dict[str, Any]:
     """Apply text replacements to a PDF.
 
+    Repeating an earlier request on the same PDF bytes reuses its output
+    from the result cache (``cache_hit`` in the response).
+
     Args:
         session_id: Session identifier.
         body: Request body with 'replacements' dict and optional fields.
+        request: Incoming request, watched for client disconnects.
         storage: PDF storage dependency.
         session_mgr: Session manager dependency.
+        executor: PDF worker pool dependency.
+        result_cache: Result cache dependency; None when disabled.
 
     Returns:
         Modification result.
 
     Raises:
         HTTPException 404: If session not found.
+        HTTPException 503: If the PDF worker pool is saturated.
     """
     session = session_mgr.get(session_id)
     if session is None:
@@ -135,35 +346,32 @@ async def replace_text(
     output_path = pdf_path.parent / f"modified_{pdf_path.name}"
 
     try:
-        replacements = body.get("replacements", {})
-        use_regex = body.get("use_regex", False)
-        pages = body.get("pages")
-        spec = ReplacementSpec(replacements=replacements, use_regex=use_regex)
-        modifier = PDFModifier(str(pdf_path), str(output_path))
-
-        page_range: tuple[int, int] | None = None
-        if pages:
-            parts = pages.split("-")
-            if len(parts) == 1:
-                try:
-                    page_range = (int(parts[0]), int(parts[0]))
-                except ValueError:
-                    raise HTTPException(status_code=400, detail=f"Invalid page format: {parts[0]}")
-            elif len(parts) == 2:
-                try:
-                    page_range = (int(parts[0]), int(parts[1]))
-                except ValueError:
-                    raise HTTPException(
-                        status_code=400, detail=f"Invalid page format in range: {parts}"
-                    )
-
-        result = await anyio.to_thread.run_sync(modifier.process, spec, page_range)
+        options = parse_replace_options(body)
+        spec = ReplacementSpec(replacements=options["replacements"], use_regex=options["use_regex"])
+        modifier = AsyncPDFModifier(
+            pdf_path,
+            output_path,
+            incremental=options["incremental"],
+            result_cache=result_cache,
+            executor=executor,
+        )
+        pages = options["pages"]
+        page_range = (pages[0], pages[1]) if pages else None
+
+        result: ModificationResult = await _cancel_on_disconnect(
+            request,
+            modifier.process(spec, page_range, save_profile=options["save_profile"]),
+        )
         session_mgr.set_modified_path(session_id, output_path)
         return result.model_dump()
+    except ExecutorBusyError:
+        raise _busy() from None
     except PDFModifierError as e:
         raise HTTPException(status_code=400, detail=e.message)
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception:
         logger.exception("Error during PDF modification")
         raise HTTPException(status_code=500, detail="Modification failed")
@@ -172,12 +380,15 @@ async def replace_text(
 @router.get("/{session_id}/download")
 async def download_pdf(
     session_id: str,
+    request: Request,
     storage: PDFStorage = Depends(get_storage),
     session_mgr: SessionManager = Depends(get_session_manager),
-) -> FileResponse:
+    settings: WebSettings = Depends(get_settings),
+) -> Response:
     """Download the (modified or original) PDF.
 
-    Returns the modified PDF if it exists, otherwise the original.
+    Returns the modified PDF if it exists, otherwise the original. Supports
+    Range requests and conditional GET via ETag/Last-Modified.
 
     Raises:
         HTTPException 404: If session not found.
@@ -186,20 +397,17 @@ async def download_pdf(
     if session is None:
         raise HTTPException(status_code=404, detail="Session not found or expired")
 
-    # Return modified if exists
+    # Return modified if exists, otherwise the original
     if session.modified_path and session.modified_path.exists():
-        return FileResponse(
-            str(session.modified_path),
-            media_type="application/pdf",
-            filename=session.modified_path.name,
-        )
-
-    # Return original
-    pdf_path = storage.get_pdf(session_id)
-    return FileResponse(
-        str(pdf_path),
-        media_type="application/pdf",
-        filename=pdf_path.name,
+        pdf_path = session.modified_path
+    else:
+        pdf_path = storage.get_pdf(session_id)
+    return file_response(
+        request,
+        pdf_path,
+        pdf_path.name,
+        settings.storage_dir,
+        settings.accel_redirect_prefix,
     )
 
 
@@ -1,34 +1,26 @@
-"""In-memory session manager with TTL-based expiration."""
+"""Session manager with TTL-based expiration over a pluggable store."""
 
 from __future__ import annotations
 
-import threading
+import time
 import uuid
-from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
 
 from ..logger import setup_logging
+from .session_store import InMemorySessionStore, SessionData, SessionStore
 
 logger = setup_logging(__name__)
 
-
-@dataclass
-class SessionData:
-    """Data associated with a web session."""
-
-    session_id: str
-    original_path: Path
-    modified_path: Path | None = None
-    structure: dict[str, Any] | None = None
-    created_at: float = field(default_factory=lambda: __import__("time").time())
+__all__ = ["SessionData", "SessionManager"]
 
 
 class SessionManager:
-    """Manages in-memory sessions with TTL expiration.
+    """Manages sessions with TTL expiration.
 
     Each session tracks an uploaded PDF, its structure analysis,
     and any modifications. Expired sessions are cleaned up on access.
+    Sessions live in ``store``: process-local memory by default, or a
+    SQLiteSessionStore shared by several server processes.
 
     Example:
         >>> mgr = SessionManager(ttl_seconds=3600)
@@ -37,10 +29,15 @@ class SessionManager:
         >>> mgr.delete(sid)
     """
 
-    def __init__(self, ttl_seconds: int = 3600) -> None:
+    def __init__(self, ttl_seconds: int = 3600, store: SessionStore | None = None) -> None:
         self._ttl_seconds = ttl_seconds
-        self._sessions: dict[str, SessionData] = {}
-        self._lock = threading.Lock()
+        self.store: SessionStore = store if store is not None else InMemorySessionStore()
+
+    def _expiry_cutoff(self) -> float | None:
+        """Sessions created at or before this time are expired; None if TTL is off."""
+        if self._ttl_seconds <= 0:
+            return None
+        return time.time() - self._ttl_seconds
 
     def create(self, original_path: Path, modified_path: Path | None = None) -> str:
         """Create a new session.
@@ -53,77 +50,83 @@ class SessionManager:
             Session ID string.
         """
         session_id = uuid.uuid4().hex[:12]
-        with self._lock:
-            self._sessions[session_id] = SessionData(
+        self.store.add(
+            SessionData(
                 session_id=session_id,
                 original_path=original_path,
                 modified_path=modified_path,
             )
+        )
         logger.info("Session created: %s", session_id)
         return session_id
 
     def get(self, session_id: str) -> SessionData | None:
         """Get a session by ID. Returns None if expired or not found."""
-        with self._lock:
-            session = self._sessions.get(session_id)
-            if session is None:
-                return None
-            # Check TTL
-            elapsed = __import__("time").time() - session.created_at
-            if elapsed >= self._ttl_seconds and self._ttl_seconds > 0:
-                del self._sessions[session_id]
-                logger.info("Session expired: %s", session_id)
-                return None
-            return session
-
-    def update_structure(self, session_id: str, structure: dict[str, Any]) -> bool:
-        """Store structure analysis for a session."""
-        with self._lock:
-            session = self._sessions.get(session_id)
-            if session is None:
-                return False
-            session.structure = structure
-            return True
+        session = self.store.get(session_id)
+        if session is None:
+            return None
+        cutoff = self._expiry_cutoff()
+        if cutoff is not None and session.created_at <= cutoff:
+            self.store.delete(session_id)
+            logger.info("Session expired: %s", session_id)
+            return None
+        return session
+
+    def update_structure(self, session_id: str, structure: bytes, version: str) -> bool:
+        """Store the serialized structure analysis for a session.
+
+        Args:
+            session_id: Session identifier.
+            structure: Structure as JSON bytes, ready to be sent.
+            version: Version of the PDF it was computed from.
+        """
+        return self.store.update(session_id, structure=structure, structure_version=version)
+
+    def get_structure(self, session_id: str, version: str) -> bytes | None:
+        """Return the cached structure if it was computed from ``version`` of the PDF."""
+        # get() applies the expiry check; the structure itself is only loaded here
+        if self.get(session_id) is None:
+            return None
+        return self.store.get_structure(session_id, version)
 
     def set_modified_path(self, session_id: str, path: Path) -> bool:
         """Set the modified PDF path for a session."""
-        with self._lock:
-            session = self._sessions.get(session_id)
-            if session is None:
-                return False
-            session.modified_path = path
-            return True
+        return self.store.update(session_id, modified_path=path)
 
     def delete(self, session_id: str) -> bool:
         """Delete a session. Returns True if it existed."""
-        with self._lock:
-            if session_id in self._sessions:
-                del self._sessions[session_id]
-                logger.info("Session deleted: %s", session_id)
-                return True
-            return False
+        if self.store.delete(session_id):
+            logger.info("Session deleted: %s", session_id)
+            return True
+        return False
 
     def cleanup_expired(self) -> int:
         """Remove all expired sessions. Returns count of removed sessions."""
-        now = __import__("time").time()
-        expired: list[str] = []
-        with self._lock:
-            for sid, session in self._sessions.items():
-                if now - session.created_at >= self._ttl_seconds and self._ttl_seconds > 0:
-                    expired.append(sid)
-            for sid in expired:
-                del self._sessions[sid]
+        expired = self.expire(limit=None)
         if expired:
             logger.info("Cleaned up %d expired sessions", len(expired))
         return len(expired)
 
+    def expire(self, limit: int | None = 100) -> list[str]:
+        """Remove up to ``limit`` expired sessions, oldest first.
+
+        Returns:
+            IDs of the removed sessions, whose files are now unreferenced.
+        """
+        cutoff = self._expiry_cutoff()
+        if cutoff is None:
+            return []
+        return self.store.delete_created_before(cutoff, limit)
+
+    def evict_oldest(self, limit: int = 1) -> list[str]:
+        """Remove the ``limit`` oldest sessions whether or not they expired.
+
+        Returns:
+            IDs of the removed sessions.
+        """
+        return self.store.delete_created_before(float("inf"), limit)
+
     def list_active(self) -> list[str]:
         """List all active session IDs."""
-        with self._lock:
-            now = __import__("time").time()
-            # TTL <= 0 means no expiry (consistent with get() and cleanup_expired())
-            if self._ttl_seconds <= 0:
-                return list(self._sessions.keys())
-            return [
-                sid for sid, s in self._sessions.items() if now - s.created_at <= self._ttl_seconds
-            ]
+        # TTL <= 0 means no expiry (consistent with get() and cleanup_expired())
+        return self.store.list_created_since(self._expiry_cutoff())
@@ -0,0 +1,270 @@
+"""Session storage backends: process-local memory or a shared SQLite database."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field, fields, replace
+from pathlib import Path
+from typing import Any, Protocol
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    original_path TEXT NOT NULL,
+    modified_path TEXT,
+    structure BLOB,
+    structure_version TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_created_at ON sessions (created_at);
+"""
+
+
+@dataclass
+class SessionData:
+    """Data associated with a web session."""
+
+    session_id: str
+    original_path: Path
+    modified_path: Path | None = None
+    # Full-document structure as serialized JSON, and the version (ETag) of
+    # the PDF it was computed from. Stores only load it in get_structure(),
+    # so sessions returned by get() have None here.
+    structure: bytes | None = None
+    structure_version: str | None = None
+    created_at: float = field(default_factory=time.time)
+
+
+_UPDATABLE = frozenset(f.name for f in fields(SessionData)) - {"session_id", "created_at"}
+
+
+class SessionStore(Protocol):
+    """Where SessionManager keeps sessions.
+
+    Expiry is the manager's job; stores only need to find sessions by
+    creation time without scanning all of them.
+    """
+
+    def add(self, session: SessionData) -> None:
+        """Store a new session."""
+        ...
+
+    def get(self, session_id: str) -> SessionData | None:
+        """Get a session's metadata by ID, or None; ``structure`` is not loaded."""
+        ...
+
+    def get_structure(self, session_id: str, version: str) -> bytes | None:
+        """The session's structure if it was computed from ``version``, else None."""
+        ...
+
+    def update(self, session_id: str, **changes: Any) -> bool:
+        """Set fields of a session. Returns False if it does not exist."""
+        ...
+
+    def delete(self, session_id: str) -> bool:
+        """Delete a session. Returns True if it existed."""
+        ...
+
+    def delete_created_before(self, cutoff: float, limit: int | None = None) -> list[str]:
+        """Delete up to ``limit`` sessions created at or before ``cutoff``, oldest first.
+
+        Returns:
+            IDs of the deleted sessions.
+        """
+        ...
+
+    def list_created_since(self, cutoff: float | None = None) -> list[str]:
+        """IDs of sessions created at or after ``cutoff`` (all if None)."""
+        ...
+
+
+def _check_changes(changes: dict[str, Any]) -> None:
+    unknown = set(changes) - _UPDATABLE
+    if unknown:
+        raise ValueError(f"Cannot update session fields: {', '.join(sorted(unknown))}")
+
+
+class InMemorySessionStore:
+    """Process-local session store.
+
+    Sessions are kept in creation order, so expiry only walks the expired
+    prefix instead of every session. Suitable for a single server process.
+    """
+
+    def __init__(self) -> None:
+        self._sessions: dict[str, SessionData] = {}
+        self._lock = threading.Lock()
+
+    def add(self, session: SessionData) -> None:
+        with self._lock:
+            self._sessions[session.session_id] = session
+
+    def get(self, session_id: str) -> SessionData | None:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            return replace(session, structure=None) if session is not None else None
+
+    def get_structure(self, session_id: str, version: str) -> bytes | None:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None or session.structure_version != version:
+                return None
+            return session.structure
+
+    def update(self, session_id: str, **changes: Any) -> bool:
+        _check_changes(changes)
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return False
+            for name, value in changes.items():
+                setattr(session, name, value)
+            return True
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def delete_created_before(self, cutoff: float, limit: int | None = None) -> list[str]:
+        expired: list[str] = []
+        with self._lock:
+            for session_id, session in self._sessions.items():
+                if session.created_at > cutoff or (limit is not None and len(expired) >= limit):
+                    break
+                expired.append(session_id)
+            for session_id in expired:
+                del self._sessions[session_id]
+        return expired
+
+    def list_created_since(self, cutoff: float | None = None) -> list[str]:
+        with self._lock:
+            return [
+                session_id
+                for session_id, session in self._sessions.items()
+                if cutoff is None or session.created_at >= cutoff
+            ]
+
+
+class SQLiteSessionStore:
+    """Session store in a SQLite database shared by all server processes.
+
+    Runs in WAL mode, so readers in one worker never block writers in
+    another. Every process opening the same file sees the same sessions,
+    which allows several uvicorn workers or containers sharing a volume.
+    Expiry uses the index on ``created_at``.
+
+    Example:
+        >>> store = SQLiteSessionStore(Path("storage/sessions.sqlite3"))
+        >>> mgr = SessionManager(ttl_seconds=3600, store=store)
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _from_row(row: sqlite3.Row) -> SessionData:
+        return SessionData(
+            session_id=row["session_id"],
+            original_path=Path(row["original_path"]),
+            modified_path=Path(row["modified_path"]) if row["modified_path"] else None,
+            structure_version=row["structure_version"],
+            created_at=row["created_at"],
+        )
+
+    @staticmethod
+    def _to_column(value: Any) -> Any:
+        return str(value) if isinstance(value, Path) else value
+
+    def add(self, session: SessionData) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO sessions (session_id, original_path, modified_path, structure,"
+                " structure_version, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    session.session_id,
+                    str(session.original_path),
+                    self._to_column(session.modified_path),
+                    session.structure,
+                    session.structure_version,
+                    session.created_at,
+                ),
+            )
+
+    def get(self, session_id: str) -> SessionData | None:
+        with self._lock:
+            row = self._conn.execute(
+                # Every request looks its session up; leave the structure BLOB on disk
+                "SELECT session_id, original_path, modified_path, structure_version, created_at"
+                " FROM sessions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+        return self._from_row(row) if row else None
+
+    def get_structure(self, session_id: str, version: str) -> bytes | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT structure FROM sessions WHERE session_id = ? AND structure_version = ?",
+                (session_id, version),
+            ).fetchone()
+        return row["structure"] if row else None
+
+    def update(self, session_id: str, **changes: Any) -> bool:
+        _check_changes(changes)
+        if not changes:
+            return self.get(session_id) is not None
+        # Column names come from _UPDATABLE, never from user input
+        assignments = ", ".join(f"{name} = ?" for name in changes)
+        values = [self._to_column(value) for value in changes.values()]
+        with self._lock:
+            cursor = self._conn.execute(
+                f"UPDATE sessions SET {assignments} WHERE session_id = ?",
+                (*values, session_id),
+            )
+        return cursor.rowcount > 0
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+        return cursor.rowcount > 0
+
+    def delete_created_before(self, cutoff: float, limit: int | None = None) -> list[str]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    "SELECT session_id FROM sessions WHERE created_at <= ?"
+                    " ORDER BY created_at LIMIT ?",
+                    (cutoff, -1 if limit is None else limit),
+                ).fetchall()
+                expired = [row[0] for row in rows]
+                self._conn.executemany(
+                    "DELETE FROM sessions WHERE session_id = ?", [(sid,) for sid in expired]
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return expired
+
+    def list_created_since(self, cutoff: float | None = None) -> list[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT session_id FROM sessions WHERE created_at >= ? ORDER BY created_at",
+                (float("-inf") if cutoff is None else cutoff,),
+            ).fetchall()
+        return [row[0] for row in rows]
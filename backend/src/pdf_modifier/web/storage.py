@@ -2,14 +2,39 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Protocol
 
-from ..core.exceptions import PDFModifierError
+from ..core.exceptions import FileSizeExceededError, PDFModifierError
 from ..logger import setup_logging
+from .blobs import BlobStore
 
 logger = setup_logging(__name__)
 
 PDF_MAGIC = b"%PDF"
+DEFAULT_UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
+# Hidden, so it is never mistaken for a session directory
+BLOBS_DIR_NAME = ".blobs"
+
+
+class AsyncReadable(Protocol):
+    """Async byte source such as FastAPI's ``UploadFile``."""
+
+    async def read(self, size: int = -1) -> bytes: ...
+
+
+@dataclass(frozen=True)
+class StoredUpload:
+    """An upload saved into a session."""
+
+    path: Path
+    digest: str
+    # The same bytes were already stored, so the upload took no extra space
+    deduplicated: bool
 
 
 class StorageError(PDFModifierError):
@@ -42,7 +67,9 @@ class PDFStorage:
     """Filesystem-based PDF storage with validation.
 
     Stores uploaded PDFs in a session-scoped directory.
-    Validates PDF magic bytes on upload.
+    Validates PDF magic bytes on upload. Uploads are deduplicated by
+    SHA-256: a session's file is a hard link into the shared ``blobs``
+    store, so identical uploads occupy disk space once.
 
     Example:
         >>> storage = PDFStorage(Path("storage"))
@@ -53,6 +80,7 @@ class PDFStorage:
     def __init__(self, base_dir: Path) -> None:
         self._base_dir = base_dir
         self._base_dir.mkdir(parents=True, exist_ok=True)
+        self.blobs = BlobStore(base_dir / BLOBS_DIR_NAME)
 
     def save_pdf(
         self,
@@ -87,9 +115,77 @@ class PDFStorage:
         output_path = session_dir / safe_name
 
         output_path.write_bytes(content)
+        self.blobs.adopt(output_path, hashlib.sha256(content).hexdigest())
         logger.info("Saved PDF: %s (%d bytes)", output_path, len(content))
         return output_path
 
+    async def save_upload(
+        self,
+        session_id: str,
+        source: AsyncReadable,
+        filename: str,
+        max_size: int,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+    ) -> StoredUpload:
+        """Stream an upload into the session directory.
+
+        Chunks are written straight to a hidden temp file in the session
+        directory, which is renamed to the final name once the upload is
+        complete. Memory use is one chunk per upload regardless of file
+        size, and a partial upload is never visible under its final name.
+        The SHA-256 is computed while streaming; if the same bytes are
+        already stored, the session gets a link to them and the new copy
+        is freed.
+
+        Args:
+            session_id: Session identifier.
+            source: Async byte source, read ``chunk_size`` bytes at a time.
+            filename: Original filename (sanitized).
+            max_size: Maximum upload size in bytes.
+            chunk_size: Bytes read and written per step.
+
+        Returns:
+            Saved file with its digest.
+
+        Raises:
+            StorageError: If content is not a valid PDF.
+            FileSizeExceededError: If the upload exceeds ``max_size``.
+        """
+        session_dir = self._base_dir / _validate_session_id(session_id)
+        session_dir.mkdir(parents=True, exist_ok=True)
+        output_path = session_dir / self._sanitize_filename(filename)
+
+        fd, temp_name = tempfile.mkstemp(dir=session_dir, prefix=".upload-", suffix=".part")
+        temp_path = Path(temp_name)
+        header = b""
+        total = 0
+        digest = hashlib.sha256()
+        try:
+            with os.fdopen(fd, "wb") as out:
+                while chunk := await source.read(chunk_size):
+                    total += len(chunk)
+                    if total > max_size:
+                        raise FileSizeExceededError(
+                            f"File size exceeds limit of {max_size / (1024 * 1024):.0f} MB",
+                            {"filename": filename, "limit_bytes": max_size},
+                        )
+                    if len(header) < len(PDF_MAGIC):
+                        header += chunk[: len(PDF_MAGIC) - len(header)]
+                        if len(header) == len(PDF_MAGIC) and not self._validate_pdf_header(header):
+                            break
+                    out.write(chunk)
+                    digest.update(chunk)
+            if not self._validate_pdf_header(header):
+                raise StorageError("Uploaded file is not a valid PDF", {"filename": filename})
+            deduplicated = self.blobs.adopt(temp_path, digest.hexdigest())
+            temp_path.replace(output_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        logger.info("Saved PDF: %s (%d bytes)", output_path, total)
+        return StoredUpload(output_path, digest.hexdigest(), deduplicated)
+
     def get_pdf(self, session_id: str, filename: str | None = None) -> Path:
         """Get the path to a stored PDF.
 
@@ -122,6 +218,59 @@ class PDFStorage:
 
         raise StorageError(f"No PDF found in session: {session_id}")
 
+    def session_ids(self) -> list[str]:
+        """IDs of all session directories on disk, including orphaned ones."""
+        return [
+            entry.name
+            for entry in self._base_dir.iterdir()
+            if entry.is_dir() and not entry.name.startswith(".")
+        ]
+
+    def session_bytes(self, session_id: str) -> int:
+        """Bytes deleting a session would free (0 if missing).
+
+        Files linked from other sessions too are not counted; a blob only
+        this session links to is, as it is collected once unreferenced.
+        """
+        total = 0
+        for path in (self._base_dir / Path(session_id).name).rglob("*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Removed while scanning (e.g. a temp upload was renamed)
+                continue
+            if path.is_file() and stat.st_nlink <= 2:
+                total += stat.st_size
+        return total
+
+    def total_bytes(self) -> int:
+        """Disk space used by all sessions and blobs, counting shared files once."""
+        seen: set[tuple[int, int]] = set()
+        total = 0
+        for path in self._base_dir.rglob("*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if not path.is_file() or path.parent == self._base_dir:
+                # Top-level files are databases, not stored PDFs
+                continue
+            if (stat.st_dev, stat.st_ino) not in seen:
+                seen.add((stat.st_dev, stat.st_ino))
+                total += stat.st_size
+        return total
+
+    def collect_garbage(self) -> int:
+        """Delete stored blobs no session refers to. Returns bytes freed."""
+        return self.blobs.collect_garbage()
+
+    def session_mtime(self, session_id: str) -> float | None:
+        """Last modification time of a session directory, or None if missing."""
+        try:
+            return (self._base_dir / Path(session_id).name).stat().st_mtime
+        except FileNotFoundError:
+            return None
+
     def delete_session(self, session_id: str) -> None:
         """Delete all files for a session."""
         session_id_safe = Path(session_id).name
@@ -0,0 +1,79 @@
+"""Compare two benchmark results files and flag regressions.
+
+Usage:
+    python -m tests.benchmarks.compare BASELINE.json CURRENT.json [--threshold 0.15]
+
+Benchmarks are matched by their full test id and compared on median time.
+Exits with status 1 when any benchmark got slower by more than the
+threshold (a fraction: 0.15 means 15%).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+
+def _medians(path: Path) -> dict[str, float]:
+    report: dict[str, Any] = json.loads(path.read_text())
+    return {b["fullname"]: float(b["stats"]["median"]) for b in report["benchmarks"]}
+
+
+def compare(
+    baseline: dict[str, float], current: dict[str, float], threshold: float
+) -> tuple[list[str], list[str]]:
+    """Build report lines and the names of regressed benchmarks.
+
+    Args:
+        baseline: Median seconds by benchmark name, from the older run.
+        current: Median seconds by benchmark name, from the newer run.
+        threshold: Allowed slowdown as a fraction of the baseline median.
+
+    Returns:
+        ``(lines, regressions)``.
+    """
+    lines = []
+    regressions = []
+    for name in sorted(baseline.keys() | current.keys()):
+        if name not in current:
+            lines.append(f"  removed    {name}")
+            continue
+        if name not in baseline:
+            lines.append(f"  new        {name}  {current[name] * 1000:.1f} ms")
+            continue
+        old, new = baseline[name], current[name]
+        change = (new - old) / old if old else 0.0
+        status = "ok"
+        if change > threshold:
+            status = "REGRESSED"
+            regressions.append(name)
+        elif change < -threshold:
+            status = "improved"
+        lines.append(
+            f"  {status:<10} {name}  {old * 1000:.1f} ms -> {new * 1000:.1f} ms ({change:+.1%})"
+        )
+    return lines, regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path, help="Results file of the reference run")
+    parser.add_argument("current", type=Path, help="Results file of the run to check")
+    parser.add_argument(
+        "--threshold", type=float, default=0.15, help="Allowed slowdown (default: 0.15)"
+    )
+    args = parser.parse_args(argv)
+
+    lines, regressions = compare(_medians(args.baseline), _medians(args.current), args.threshold)
+    print("\n".join(lines))
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) slower than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""Benchmark fixtures and the machine-readable results file.
+
+Benchmarks are skipped unless pytest runs with ``--run-benchmarks``:
+
+    pytest tests/benchmarks --run-benchmarks --bench-json .benchmarks/1.8.0.json
+
+The ``bench`` fixture follows the pytest-benchmark calling convention
+(``bench(fn, *args, **kwargs)``, ``bench.group``, ``bench.extra_info``) and
+the results file uses pytest-benchmark's JSON layout, so the suite can
+switch to that plugin without rewriting cases. Compare two results files
+with ``python -m tests.benchmarks.compare``.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import platform
+import statistics
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import fitz
+import pytest
+
+from pdf_modifier import __version__
+
+from .corpus import CORPUS, generate_pdf
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+T = TypeVar("T")
+
+_RESULTS = pytest.StashKey[list[dict[str, Any]]]()
+
+
+class Benchmark:
+    """Times a callable over a warmup run and ``rounds`` measured runs."""
+
+    def __init__(self, name: str, fullname: str, rounds: int) -> None:
+        self.name = name
+        self.fullname = fullname
+        self.rounds = rounds
+        self.group: str | None = None
+        self.extra_info: dict[str, Any] = {}
+        self.timings: list[float] = []
+
+    def __call__(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``fn(*args, **kwargs)`` and record its timings; returns the last result."""
+        if self.timings:
+            raise RuntimeError("bench() can only be used once per test")
+        result = fn(*args, **kwargs)  # warmup: imports, page caches, font loading
+        for _ in range(self.rounds):
+            start = time.perf_counter()
+            result = fn(*args, **kwargs)
+            self.timings.append(time.perf_counter() - start)
+        return result
+
+    def stats(self) -> dict[str, float]:
+        """Summary statistics in seconds, named as pytest-benchmark names them."""
+        mean = statistics.fmean(self.timings)
+        return {
+            "min": min(self.timings),
+            "max": max(self.timings),
+            "mean": mean,
+            "median": statistics.median(self.timings),
+            "stddev": statistics.stdev(self.timings) if len(self.timings) > 1 else 0.0,
+            "rounds": len(self.timings),
+            "total": sum(self.timings),
+            "ops": 1 / mean if mean else 0.0,
+        }
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.stash[_RESULTS] = []
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--run-benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run with --run-benchmarks")
+    for item in items:
+        if "bench" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def bench(request: pytest.FixtureRequest) -> Iterator[Benchmark]:
+    """Benchmark the callable passed to it; results go to ``--bench-json``."""
+    config = request.config
+    benchmark = Benchmark(
+        request.node.name, request.node.nodeid, max(1, config.getoption("--bench-rounds"))
+    )
+    yield benchmark
+    if not benchmark.timings:
+        return
+    callspec = getattr(request.node, "callspec", None)
+    config.stash[_RESULTS].append(
+        {
+            "group": benchmark.group,
+            "name": benchmark.name,
+            "fullname": benchmark.fullname,
+            "params": dict(callspec.params) if callspec else None,
+            "stats": benchmark.stats(),
+            "extra_info": benchmark.extra_info,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def corpus(tmp_path_factory: pytest.TempPathFactory) -> Callable[[str], Path]:
+    """Return a function mapping a corpus preset name to its generated PDF.
+
+    Documents are generated on first use and shared by the whole session.
+    """
+    root = tmp_path_factory.mktemp("corpus")
+    generated: dict[str, Path] = {}
+
+    def get(name: str) -> Path:
+        if name not in generated:
+            generated[name] = generate_pdf(root / f"{name}.pdf", CORPUS[name])
+        return generated[name]
+
+    return get
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    results = config.stash.get(_RESULTS, [])
+    if not results:
+        return
+    path = Path(config.getoption("--bench-json"))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "machine_info": {
+            "node": platform.node(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "release": platform.release(),
+            "python_version": platform.python_version(),
+            "python_implementation": platform.python_implementation(),
+            "cpu_count": os.cpu_count(),
+        },
+        "datetime": datetime.datetime.now(datetime.UTC).isoformat(),
+        "version": __version__,
+        "pymupdf_version": fitz.VersionBind,
+        "corpus": {name: spec.describe() for name, spec in CORPUS.items()},
+        "benchmarks": sorted(results, key=lambda r: (r["group"] or "", r["fullname"])),
+    }
+    path.write_text(json.dumps(report, indent=2) + "\n")
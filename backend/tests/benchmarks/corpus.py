@@ -0,0 +1,189 @@
+"""Deterministic generator of synthetic PDFs for benchmarks."""
+
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+import fitz
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842  # A4 in points
+MARGIN = 36
+FONT_SIZE = 8
+LINE_HEIGHT = 10
+COLUMN_GAP = 12
+# Base 14 fonts, so documents need no embedded font files
+FONTS = ("helv", "tiro", "cour", "hebo", "tibo", "cobo")
+
+# Words the benchmark replacements look for are mixed into filler text
+TARGET_WORDS = ("Invoice", "Total", "$99.99", "Order #1024", "Draft", "ACME Corp")
+_FILLER_TEXT = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+    "incididunt ut labore et dolore magna aliqua enim ad minim veniam quis nostrud "
+    "exercitation ullamco laboris nisi aliquip ex ea commodo consequat"
+)
+FILLER_WORDS = tuple(_FILLER_TEXT.split())
+TARGET_RATE = 0.15
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """Shape of a synthetic document.
+
+    Attributes:
+        name: Preset name, also part of the random seed.
+        pages: Number of pages.
+        spans_per_page: Text spans written on each page.
+        fonts: Fonts cycled through by spans (Base 14 codes).
+        multi_span_ratio: Fraction of lines built from several spans in
+            different fonts, like bold labels followed by regular text.
+        link_density: Fraction of lines covered by a URI link.
+        seed: Changes the text while keeping the shape.
+    """
+
+    name: str
+    pages: int = 10
+    spans_per_page: int = 40
+    fonts: tuple[str, ...] = ("helv",)
+    multi_span_ratio: float = 0.0
+    link_density: float = 0.0
+    seed: int = 0
+
+    def describe(self) -> dict[str, Any]:
+        """Parameters for benchmark reports."""
+        info = asdict(self)
+        info["fonts"] = list(self.fonts)
+        return info
+
+
+CORPUS: dict[str, CorpusSpec] = {
+    spec.name: spec
+    for spec in (
+        CorpusSpec("baseline", pages=10, spans_per_page=40),
+        CorpusSpec("text_heavy", pages=50, spans_per_page=200),
+        CorpusSpec("multi_font", pages=20, spans_per_page=80, fonts=FONTS),
+        CorpusSpec(
+            "multi_span", pages=20, spans_per_page=80, fonts=FONTS[:3], multi_span_ratio=0.5
+        ),
+        CorpusSpec("link_dense", pages=20, spans_per_page=60, link_density=0.3),
+        CorpusSpec("large", pages=300, spans_per_page=60, fonts=FONTS[:2]),
+    )
+}
+
+
+def _words(rng: random.Random, count: int) -> str:
+    words = []
+    for _ in range(count):
+        if rng.random() < TARGET_RATE:
+            words.append(rng.choice(TARGET_WORDS))
+        else:
+            words.append(rng.choice(FILLER_WORDS))
+    return " ".join(words)
+
+
+def _line_positions(spans_per_page: int) -> list[tuple[float, float, float]]:
+    """(x, baseline y, column width) of every line slot on a page, column by column.
+
+    Uses as many columns (at least 2) as needed to give every span a line.
+    """
+    lines_per_column = (PAGE_HEIGHT - 2 * MARGIN - FONT_SIZE) // LINE_HEIGHT + 1
+    columns = max(2, math.ceil(spans_per_page / lines_per_column))
+    width = (PAGE_WIDTH - 2 * MARGIN - (columns - 1) * COLUMN_GAP) / columns
+    slots = []
+    for column in range(columns):
+        x = MARGIN + column * (width + COLUMN_GAP)
+        y = MARGIN + FONT_SIZE
+        while y <= PAGE_HEIGHT - MARGIN:
+            slots.append((x, y, width))
+            y += LINE_HEIGHT
+    return slots
+
+
+class _Font:
+    """A fitz.Font with memoized glyph widths; text_length is slow per call."""
+
+    def __init__(self, name: str) -> None:
+        self.font = fitz.Font(name)
+        self._widths: dict[str, float] = {}
+
+    def text_length(self, text: str) -> float:
+        total = 0.0
+        for char in text:
+            width = self._widths.get(char)
+            if width is None:
+                width = self._widths[char] = self.font.text_length(char, FONT_SIZE)
+            total += width
+        return total
+
+
+def _write_line(
+    writer: fitz.TextWriter,
+    rng: random.Random,
+    x: float,
+    y: float,
+    width: float,
+    fonts: list[_Font],
+) -> fitz.Rect:
+    """Write one line made of ``len(fonts)`` spans; returns its bounding box."""
+    start = x
+    for font in fonts:
+        words = _words(rng, rng.randint(2, 4)).split(" ")
+        # Stop at the column edge rather than overflowing into the next one
+        while words and font.text_length(" ".join(words) + " ") > start + width - x:
+            words.pop()
+        if not words:
+            break
+        text = " ".join(words) + " "
+        writer.append((x, y), text, font=font.font, fontsize=FONT_SIZE)
+        x += font.text_length(text)
+    return fitz.Rect(start, y - FONT_SIZE, x, y + 2)
+
+
+def generate_pdf(path: Path, spec: CorpusSpec) -> Path:
+    """Write the document described by ``spec`` to ``path``.
+
+    The same spec always produces the same bytes, so timings are comparable
+    between runs and machines.
+
+    Args:
+        path: Output file.
+        spec: Document shape.
+
+    Returns:
+        ``path``.
+    """
+    rng = random.Random(f"{spec.name}:{spec.seed}")
+    slots = _line_positions(spec.spans_per_page)
+    fonts = [_Font(name) for name in spec.fonts]
+    doc = fitz.open()
+    font_index = 0
+    for page_number in range(spec.pages):
+        page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        # One writer per page keeps a single content stream for all spans
+        writer = fitz.TextWriter(page.rect)
+        links = []
+        spans = 0
+        for slot, (x, y, width) in enumerate(slots):
+            if spans >= spec.spans_per_page:
+                break
+            span_count = 1
+            if len(spec.fonts) > 1 and rng.random() < spec.multi_span_ratio:
+                span_count = min(rng.randint(2, 3), spec.spans_per_page - spans)
+            line_fonts = [fonts[(font_index + i) % len(fonts)] for i in range(span_count)]
+            font_index += 1
+            rect = _write_line(writer, rng, x, y, width, line_fonts)
+            spans += span_count
+            if rng.random() < spec.link_density:
+                links.append((rect, f"https://example.com/p{page_number + 1}/l{slot}"))
+        writer.write_text(page)
+        for rect, uri in links:
+            page.insert_link({"kind": fitz.LINK_URI, "from": rect, "uri": uri})
+    doc.set_metadata({"title": f"Benchmark corpus: {spec.name}", "producer": "pdf-modifier"})
+    doc.save(str(path), no_new_id=True)
+    doc.close()
+    return path
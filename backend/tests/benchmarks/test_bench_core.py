@@ -0,0 +1,136 @@
+"""Benchmarks of the core entry points over the synthetic corpus."""
+
+from __future__ import annotations
+
+import shutil
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pdf_modifier.core.analyzer import PDFAnalyzer
+from pdf_modifier.core.models import ReplacementSpec
+from pdf_modifier.core.modifier import PDFModifier, batch_process
+
+from .corpus import CORPUS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from .conftest import Benchmark
+
+ALL = sorted(CORPUS)
+# Presets small enough to repeat per file in a batch
+BATCH = ["baseline", "multi_font", "multi_span", "link_dense"]
+
+EXACT = ReplacementSpec(replacements={"Invoice": "Receipt", "ACME Corp": "Globex Inc"})
+REGEX = ReplacementSpec(replacements={r"\$\d+\.\d{2}": "$0.00"}, use_regex=True)
+LINKS = ReplacementSpec(replacements={"Order #1024": "Order #2048|https://example.org/o/2048"})
+
+
+def _describe(bench: Benchmark, preset: str) -> None:
+    bench.extra_info.update(CORPUS[preset].describe())
+
+
+class TestAnalyzerBenchmarks:
+    """Read-only analysis."""
+
+    @pytest.mark.parametrize("preset", ALL)
+    def test_get_structure(
+        self, bench: Benchmark, corpus: Callable[[str], Path], preset: str
+    ) -> None:
+        bench.group = "analyzer.get_structure"
+        _describe(bench, preset)
+        structure = bench(PDFAnalyzer(corpus(preset)).get_structure)
+        assert structure.total_pages == CORPUS[preset].pages
+
+    @pytest.mark.parametrize("preset", ["baseline", "link_dense"])
+    def test_get_hyperlinks(
+        self, bench: Benchmark, corpus: Callable[[str], Path], preset: str
+    ) -> None:
+        bench.group = "analyzer.get_hyperlinks"
+        _describe(bench, preset)
+        bench(PDFAnalyzer(corpus(preset)).get_hyperlinks)
+
+    @pytest.mark.parametrize("preset", ["baseline", "text_heavy"])
+    def test_extract_text(
+        self, bench: Benchmark, corpus: Callable[[str], Path], preset: str
+    ) -> None:
+        bench.group = "analyzer.extract_text"
+        _describe(bench, preset)
+        assert "Invoice" in bench(PDFAnalyzer(corpus(preset)).extract_text)
+
+
+class TestModifierBenchmarks:
+    """Replacement pipeline, to a file and to bytes."""
+
+    @pytest.mark.parametrize("preset", ALL)
+    def test_process_exact(
+        self, bench: Benchmark, corpus: Callable[[str], Path], tmp_path: Path, preset: str
+    ) -> None:
+        bench.group = "modifier.process.exact"
+        _describe(bench, preset)
+        modifier = PDFModifier(corpus(preset), tmp_path / "out.pdf")
+        result = bench(modifier.process, EXACT)
+        assert result.success
+        assert result.replacements_made > 0
+        bench.extra_info["replacements_made"] = result.replacements_made
+
+    @pytest.mark.parametrize("preset", ["baseline", "multi_span", "text_heavy"])
+    def test_process_regex(
+        self, bench: Benchmark, corpus: Callable[[str], Path], tmp_path: Path, preset: str
+    ) -> None:
+        bench.group = "modifier.process.regex"
+        _describe(bench, preset)
+        modifier = PDFModifier(corpus(preset), tmp_path / "out.pdf")
+        result = bench(modifier.process, REGEX)
+        assert result.replacements_made > 0
+        bench.extra_info["replacements_made"] = result.replacements_made
+
+    @pytest.mark.parametrize("preset", ["baseline", "link_dense"])
+    def test_process_links(
+        self, bench: Benchmark, corpus: Callable[[str], Path], tmp_path: Path, preset: str
+    ) -> None:
+        bench.group = "modifier.process.links"
+        _describe(bench, preset)
+        modifier = PDFModifier(corpus(preset), tmp_path / "out.pdf")
+        result = bench(modifier.process, LINKS)
+        assert result.replacements_made > 0
+        bench.extra_info["replacements_made"] = result.replacements_made
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_process_workers(
+        self, bench: Benchmark, corpus: Callable[[str], Path], tmp_path: Path, workers: int
+    ) -> None:
+        bench.group = "modifier.process.workers"
+        _describe(bench, "large")
+        bench.extra_info["workers"] = workers
+        modifier = PDFModifier(corpus("large"), tmp_path / "out.pdf")
+        assert bench(modifier.process, EXACT, workers=workers).success
+
+    @pytest.mark.parametrize("preset", ["baseline", "multi_font"])
+    def test_process_to_bytes(
+        self, bench: Benchmark, corpus: Callable[[str], Path], preset: str
+    ) -> None:
+        bench.group = "modifier.process_to_bytes"
+        _describe(bench, preset)
+        data = corpus(preset).read_bytes()
+        result, _ = bench(lambda: PDFModifier(data).process_to_bytes(EXACT))
+        assert result.success
+
+
+class TestBatchBenchmarks:
+    """Several documents through batch_process."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_batch_process(
+        self, bench: Benchmark, corpus: Callable[[str], Path], tmp_path: Path, workers: int
+    ) -> None:
+        bench.group = "batch_process"
+        bench.extra_info.update({"workers": workers, "files": BATCH})
+        inputs = tmp_path / "in"
+        inputs.mkdir()
+        # Distinct file names, since outputs are named after inputs
+        files = [shutil.copy(corpus(preset), inputs / f"{preset}.pdf") for preset in BATCH]
+        result = bench(batch_process, files, tmp_path / "out", EXACT, workers=workers)
+        assert result.successful == len(BATCH)
@@ -0,0 +1,40 @@
+"""Tests for the benchmark results comparison."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from .compare import compare, main
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _report(path: Path, medians: dict[str, float]) -> Path:
+    benchmarks = [{"fullname": name, "stats": {"median": m}} for name, m in medians.items()]
+    path.write_text(json.dumps({"benchmarks": benchmarks}))
+    return path
+
+
+class TestCompare:
+    """Median comparison between two runs."""
+
+    def test_flags_regressions_over_threshold(self) -> None:
+        lines, regressions = compare(
+            {"a": 1.0, "b": 1.0, "c": 1.0, "gone": 1.0},
+            {"a": 1.1, "b": 1.5, "c": 0.5, "added": 1.0},
+            threshold=0.15,
+        )
+        assert regressions == ["b"]
+        assert any(line.split()[0] == "improved" and "c" in line for line in lines)
+        assert any(line.split()[0] == "removed" for line in lines)
+        assert any(line.split()[0] == "new" for line in lines)
+
+    def test_exit_status(self, tmp_path: Path) -> None:
+        base = _report(tmp_path / "base.json", {"a": 1.0})
+        same = _report(tmp_path / "same.json", {"a": 1.05})
+        slow = _report(tmp_path / "slow.json", {"a": 2.0})
+        assert main([str(base), str(same)]) == 0
+        assert main([str(base), str(slow)]) == 1
+        assert main([str(base), str(slow), "--threshold", "1.5"]) == 0
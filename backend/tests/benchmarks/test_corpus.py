@@ -0,0 +1,59 @@
+"""Tests for the synthetic benchmark corpus generator."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import fitz
+
+from .corpus import CORPUS, FONTS, CorpusSpec, _line_positions, generate_pdf
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SMALL = CorpusSpec(
+    "small", pages=3, spans_per_page=30, fonts=FONTS[:3], multi_span_ratio=0.5, link_density=0.5
+)
+
+
+def _spans(page: fitz.Page) -> list[dict[str, object]]:
+    blocks = page.get_text("dict")["blocks"]
+    return [span for b in blocks for line in b.get("lines", []) for span in line["spans"]]
+
+
+class TestGeneratePdf:
+    """Shape and determinism of generated documents."""
+
+    def test_deterministic(self, tmp_path: Path) -> None:
+        first = generate_pdf(tmp_path / "a.pdf", SMALL)
+        second = generate_pdf(tmp_path / "b.pdf", SMALL)
+        assert first.read_bytes() == second.read_bytes()
+
+    def test_seed_changes_content(self, tmp_path: Path) -> None:
+        first = generate_pdf(tmp_path / "a.pdf", SMALL)
+        other = CorpusSpec(**{**SMALL.describe(), "fonts": SMALL.fonts, "seed": 1})
+        second = generate_pdf(tmp_path / "b.pdf", other)
+        assert first.read_bytes() != second.read_bytes()
+
+    def test_shape(self, tmp_path: Path) -> None:
+        with fitz.open(generate_pdf(tmp_path / "doc.pdf", SMALL)) as doc:
+            assert len(doc) == SMALL.pages
+            spans = _spans(doc[0])
+            assert len(spans) == SMALL.spans_per_page
+            assert len({span["font"] for span in spans}) == 3
+            assert any(
+                len(line["spans"]) > 1
+                for b in doc[0].get_text("dict")["blocks"]
+                for line in b.get("lines", [])
+            )
+            assert sum(len(page.get_links()) for page in doc) > 0
+
+    def test_single_font_without_links(self, tmp_path: Path) -> None:
+        spec = CorpusSpec("plain", pages=1, spans_per_page=10)
+        with fitz.open(generate_pdf(tmp_path / "doc.pdf", spec)) as doc:
+            assert len(_spans(doc[0])) == 10
+            assert not doc[0].get_links()
+
+    def test_every_preset_span_gets_a_line(self) -> None:
+        for spec in CORPUS.values():
+            assert len(_line_positions(spec.spans_per_page)) >= spec.spans_per_page
@@ -14,12 +14,35 @@ SAMPLE_PDF = TEST_DATA_DIR / "sample.pdf"
 EXAMPLES_OUTPUT_DIR = TEST_DIR / "examples_output"
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Options of the benchmark suite in tests/benchmarks (skipped by default)."""
+    group = parser.getgroup("benchmarks")
+    group.addoption(
+        "--run-benchmarks", action="store_true", default=False, help="Run benchmark tests"
+    )
+    group.addoption(
+        "--bench-json",
+        default=".benchmarks/latest.json",
+        help="Where to write benchmark results (default: .benchmarks/latest.json)",
+    )
+    group.addoption(
+        "--bench-rounds", type=int, default=3, help="Timed rounds per benchmark (default: 3)"
+    )
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_examples_dir() -> None:
     """Ensure examples output directory exists."""
     EXAMPLES_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 
+@pytest.fixture(autouse=True)
+def isolated_span_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the interfaces' default caches out of the user's home directory."""
+    monkeypatch.setenv("PDF_MOD_SPAN_CACHE_DIR", str(tmp_path / "span-cache"))
+    monkeypatch.setenv("PDF_MOD_RESULT_CACHE_DIR", str(tmp_path / "result-cache"))
+
+
 @pytest.fixture
 def output_pdf(tmp_path: Path) -> Path:
     """Default output path using pytest tmp_path."""
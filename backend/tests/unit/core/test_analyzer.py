@@ -8,7 +8,12 @@ import fitz
 import pytest
 
 from pdf_modifier.core import PDFAnalyzer
-from pdf_modifier.core.exceptions import PDFNotFoundError, PDFPasswordError
+from pdf_modifier.core.exceptions import (
+    FileSizeExceededError,
+    PDFNotFoundError,
+    PDFPasswordError,
+    PDFReadError,
+)
 from pdf_modifier.core.models import FontInspectionResult, HyperlinkInventory, PDFStructure
 
 from ...conftest import SAMPLE_PDF, create_encrypted_pdf
@@ -68,6 +73,70 @@ class TestGetStructure:
             analyzer.get_structure()
 
 
+def _create_multi_page_pdf(tmp_path: Path, page_count: int) -> Path:
+    """Helper: create a PDF with one line of text per page."""
+    doc = fitz.open()
+    for i in range(page_count):
+        page = doc.new_page()
+        page.insert_text((100, 100), f"Page {i + 1}")
+    path = tmp_path / "multi.pdf"
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+class TestStructurePagination:
+    """Tests for windowed get_structure and iter_pages."""
+
+    def test_full_structure_has_no_next_page(self) -> None:
+        structure = PDFAnalyzer(SAMPLE_PDF).get_structure()
+        assert structure.next_page is None
+        assert len(structure.pages) == structure.total_pages
+
+    def test_window_returns_cursor(self, tmp_path: Path) -> None:
+        pdf = _create_multi_page_pdf(tmp_path, 5)
+        structure = PDFAnalyzer(pdf).get_structure(start_page=2, page_limit=2)
+        assert structure.total_pages == 5
+        assert [p.page for p in structure.pages] == [2, 3]
+        assert structure.next_page == 4
+
+    def test_last_window_clamps_and_ends(self, tmp_path: Path) -> None:
+        pdf = _create_multi_page_pdf(tmp_path, 5)
+        structure = PDFAnalyzer(pdf).get_structure(start_page=4, page_limit=10)
+        assert [p.page for p in structure.pages] == [4, 5]
+        assert structure.next_page is None
+
+    def test_window_past_end_raises(self, tmp_path: Path) -> None:
+        pdf = _create_multi_page_pdf(tmp_path, 2)
+        with pytest.raises(ValueError, match="exceeds"):
+            PDFAnalyzer(pdf).get_structure(start_page=3)
+
+    def test_invalid_page_limit_raises(self, tmp_path: Path) -> None:
+        pdf = _create_multi_page_pdf(tmp_path, 2)
+        with pytest.raises(ValueError, match="page_limit"):
+            PDFAnalyzer(pdf).get_structure(page_limit=0)
+
+    def test_iter_pages_matches_get_structure(self) -> None:
+        analyzer = PDFAnalyzer(SAMPLE_PDF)
+        assert list(analyzer.iter_pages()) == analyzer.get_structure().pages
+
+    def test_iter_pages_window(self, tmp_path: Path) -> None:
+        pdf = _create_multi_page_pdf(tmp_path, 5)
+        pages = list(PDFAnalyzer(pdf).iter_pages(start_page=3, page_limit=2))
+        assert [p.page for p in pages] == [3, 4]
+        assert pages[0].elements[0].text == "Page 3"
+
+    def test_iter_pages_is_lazy(self, tmp_path: Path) -> None:
+        pdf = _create_multi_page_pdf(tmp_path, 3)
+        pages = PDFAnalyzer(pdf).iter_pages()
+        assert next(pages).page == 1
+        pages.close()
+
+    def test_page_count(self, tmp_path: Path) -> None:
+        pdf = _create_multi_page_pdf(tmp_path, 4)
+        assert PDFAnalyzer(pdf).page_count() == 4
+
+
 class TestExtractText:
     """Tests for extract_text method."""
 
@@ -194,3 +263,42 @@ class TestEncryptedPDFAnalysis:
         analyzer = PDFAnalyzer(pdf_path)
         with pytest.raises(PDFPasswordError):
             analyzer.inspect_fonts(["Secret"])
+
+
+class TestInMemoryInput:
+    """Tests for analyzing PDFs passed as bytes or file objects."""
+
+    def test_bytes_input(self) -> None:
+        analyzer = PDFAnalyzer(SAMPLE_PDF.read_bytes())
+        structure = analyzer.get_structure()
+        assert analyzer.file_path is None
+        assert structure.file_path == "<memory>"
+        assert structure.total_pages == PDFAnalyzer(SAMPLE_PDF).get_structure().total_pages
+
+    def test_memoryview_and_file_object_input(self) -> None:
+        data = SAMPLE_PDF.read_bytes()
+        expected = PDFAnalyzer(SAMPLE_PDF).extract_text().split("\n", 1)[1]
+        with SAMPLE_PDF.open("rb") as f:
+            for source in (memoryview(data), f):
+                assert PDFAnalyzer(source).extract_text().split("\n", 1)[1] == expected
+
+    def test_bytes_over_size_limit_raises(self) -> None:
+        analyzer = PDFAnalyzer(SAMPLE_PDF.read_bytes(), max_file_size=10)
+        with pytest.raises(FileSizeExceededError):
+            analyzer.page_count()
+
+    def test_encrypted_bytes_need_password(self, tmp_path: Path) -> None:
+        data = create_encrypted_pdf(tmp_path / "encrypted.pdf", user_pw="pw").read_bytes()
+        with pytest.raises(PDFPasswordError):
+            PDFAnalyzer(data).page_count()
+        assert PDFAnalyzer(data, password="pw").page_count() == 1
+
+    def test_invalid_bytes_raise_read_error(self) -> None:
+        with pytest.raises(PDFReadError):
+            PDFAnalyzer(b"not a pdf").page_count()
+
+    def test_text_mode_file_rejected(self, tmp_path: Path) -> None:
+        path = tmp_path / "notes.txt"
+        path.write_text("hello")
+        with path.open() as f, pytest.raises(TypeError, match="binary mode"):
+            PDFAnalyzer(f)  # type: ignore[arg-type]
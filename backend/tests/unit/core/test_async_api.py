@@ -0,0 +1,274 @@
+"""Tests for the async PDF facade, the bounded executor and cancellation."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import fitz
+import pytest
+
+from pdf_modifier.core.analyzer import PDFAnalyzer
+from pdf_modifier.core.async_api import AsyncPDFAnalyzer, AsyncPDFModifier, PDFExecutor
+from pdf_modifier.core.exceptions import (
+    ExecutorBusyError,
+    OperationCancelledError,
+    PDFNotFoundError,
+)
+from pdf_modifier.core.models import ReplacementSpec
+from pdf_modifier.core.modifier import PDFModifier
+from tests.conftest import create_pdf
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+def _multi_page_pdf(path: Path, pages: int) -> Path:
+    doc = fitz.open()
+    for i in range(pages):
+        doc.new_page().insert_text((72, 72), f"Hello page {i + 1}")
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def _wait_for_cancel(cancel_event: threading.Event, started: threading.Event) -> bool:
+    """Block until cancelled; reports whether the event was set."""
+    started.set()
+    return cancel_event.wait(timeout=5)
+
+
+def _block(release: threading.Event) -> None:
+    release.wait(timeout=5)
+
+
+class _RecordingReader(io.BytesIO):
+    """Binary file object that records the threads it was read on."""
+
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.threads: list[threading.Thread] = []
+
+    def read(self, size: int | None = -1) -> bytes:
+        self.threads.append(threading.current_thread())
+        return super().read(size)
+
+
+@pytest.fixture
+def executor() -> Iterator[PDFExecutor]:
+    pool = PDFExecutor(max_workers=2, max_queue=2)
+    yield pool
+    pool.shutdown()
+
+
+class TestPDFExecutor:
+    """Bounded executor behavior."""
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"max_workers": 0}, "max_workers"),
+            ({"max_queue": -1}, "max_queue"),
+            ({"kind": "fiber"}, "Unknown executor kind"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs: dict[str, object], match: str) -> None:
+        with pytest.raises(ValueError, match=match):
+            PDFExecutor(**kwargs)  # type: ignore[arg-type]
+
+    def test_job_workers(self) -> None:
+        assert PDFExecutor(kind="thread").job_workers(4) == 4
+        # A process pool worker must not start a pool of its own
+        assert PDFExecutor(kind="process").job_workers(4) == 1
+        assert PDFExecutor(kind="process").job_workers(0) == 0
+
+    async def test_run_returns_result(self, executor: PDFExecutor) -> None:
+        assert await executor.run(sum, [1, 2, 3]) == 6
+        assert executor.in_flight == 0
+
+    async def test_busy_when_queue_full(self) -> None:
+        pool = PDFExecutor(max_workers=1, max_queue=1)
+        release = threading.Event()
+        try:
+            jobs = [asyncio.ensure_future(pool.run(_block, release)) for _ in range(2)]
+            await asyncio.sleep(0)
+            assert pool.in_flight == 2
+            with pytest.raises(ExecutorBusyError) as exc_info:
+                await pool.run(_block, release)
+            assert exc_info.value.code == "BUSY"
+            assert exc_info.value.details["limit"] == 2
+            release.set()
+            await asyncio.gather(*jobs)
+            assert pool.in_flight == 0
+        finally:
+            release.set()
+            pool.shutdown()
+
+    async def test_cancel_sets_event_of_running_job(self, executor: PDFExecutor) -> None:
+        started = threading.Event()
+        task = asyncio.ensure_future(
+            executor.run(_wait_for_cancel, started=started, cancellable=True)
+        )
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        deadline = time.monotonic() + 5
+        while executor.in_flight and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        assert executor.in_flight == 0
+
+    async def test_errors_propagate(self, executor: PDFExecutor) -> None:
+        analyzer = AsyncPDFAnalyzer("/nonexistent.pdf", executor=executor)
+        with pytest.raises(PDFNotFoundError):
+            await analyzer.page_count()
+        assert executor.in_flight == 0
+
+
+class TestAsyncPDFAnalyzer:
+    """Awaitable analyzer methods."""
+
+    async def test_matches_sync_analyzer(self, tmp_path: Path, executor: PDFExecutor) -> None:
+        pdf = create_pdf(tmp_path / "input.pdf", text="Hello World")
+        analyzer = AsyncPDFAnalyzer(pdf, executor=executor)
+        sync = PDFAnalyzer(pdf)
+
+        assert await analyzer.page_count() == 1
+        assert (await analyzer.get_structure()).model_dump() == sync.get_structure().model_dump()
+        assert await analyzer.extract_text() == sync.extract_text()
+        assert (await analyzer.inspect_fonts(["Hello"])).total_matches == 1
+
+    async def test_in_memory_source(self, tmp_path: Path, executor: PDFExecutor) -> None:
+        pdf = create_pdf(tmp_path / "input.pdf", text="Hello World")
+        analyzer = AsyncPDFAnalyzer(pdf.read_bytes(), executor=executor)
+        assert "Hello World" in await analyzer.extract_text()
+
+    async def test_iter_pages_in_chunks(self, tmp_path: Path, executor: PDFExecutor) -> None:
+        pdf = _multi_page_pdf(tmp_path / "input.pdf", 5)
+        analyzer = AsyncPDFAnalyzer(pdf, executor=executor)
+
+        pages = [page.page async for page in analyzer.iter_pages(chunk_size=2)]
+        assert pages == [1, 2, 3, 4, 5]
+
+        window = [page.page async for page in analyzer.iter_pages(2, 3, chunk_size=2)]
+        assert window == [2, 3, 4]
+
+    async def test_iter_pages_invalid_chunk_size(
+        self, tmp_path: Path, executor: PDFExecutor
+    ) -> None:
+        pdf = create_pdf(tmp_path / "input.pdf")
+        with pytest.raises(ValueError, match="chunk_size"):
+            async for _ in AsyncPDFAnalyzer(pdf, executor=executor).iter_pages(chunk_size=0):
+                pass
+
+    def test_invalid_arguments_fail_eagerly(self, executor: PDFExecutor) -> None:
+        with pytest.raises(ValueError, match="memory_map"):
+            AsyncPDFAnalyzer(b"%PDF-1.4", memory_map=True, executor=executor)
+
+
+class TestAsyncPDFModifier:
+    """Awaitable modifier methods."""
+
+    async def test_process(self, tmp_path: Path, executor: PDFExecutor) -> None:
+        pdf = create_pdf(tmp_path / "input.pdf", text="Hello World")
+        output = tmp_path / "out.pdf"
+        modifier = AsyncPDFModifier(pdf, output, executor=executor)
+
+        result = await modifier.process(ReplacementSpec(replacements={"Hello": "Goodbye"}))
+
+        assert result.replacements_made == 1
+        with fitz.open(output) as doc:
+            assert "Goodbye World" in doc[0].get_text()
+
+    async def test_process_to_bytes(self, tmp_path: Path, executor: PDFExecutor) -> None:
+        pdf = create_pdf(tmp_path / "input.pdf", text="Hello World")
+        modifier = AsyncPDFModifier(pdf.read_bytes(), executor=executor)
+
+        result, data = await modifier.process_to_bytes(
+            ReplacementSpec(replacements={"Hello": "Goodbye"})
+        )
+
+        assert result.replacements_made == 1
+        with fitz.open(stream=data, filetype="pdf") as doc:
+            assert "Goodbye World" in doc[0].get_text()
+
+    async def test_file_like_source_read_off_the_loop(
+        self, tmp_path: Path, executor: PDFExecutor
+    ) -> None:
+        pdf = create_pdf(tmp_path / "input.pdf", text="Hello World")
+        reader = _RecordingReader(pdf.read_bytes())
+        modifier = AsyncPDFModifier(reader, executor=executor)
+        assert reader.threads == []
+
+        spec = ReplacementSpec(replacements={"Hello": "Goodbye"})
+        first, _ = await modifier.process_to_bytes(spec)
+        second, _ = await modifier.process_to_bytes(spec)
+
+        assert first.replacements_made == second.replacements_made == 1
+        assert len(reader.threads) == 1
+        assert reader.threads[0] is not threading.current_thread()
+
+    async def test_custom_fonts_checked_in_worker(
+        self, tmp_path: Path, executor: PDFExecutor
+    ) -> None:
+        pdf = create_pdf(tmp_path / "input.pdf", text="Hello World")
+        modifier = AsyncPDFModifier(
+            pdf, custom_fonts={"helv": str(tmp_path / "missing.ttf")}, executor=executor
+        )
+        with pytest.raises(ValueError, match="font file does not exist"):
+            await modifier.process_to_bytes(ReplacementSpec(replacements={"Hello": "Hi"}))
+
+    def test_invalid_arguments_fail_eagerly(self, executor: PDFExecutor) -> None:
+        with pytest.raises(ValueError, match="memory_map"):
+            AsyncPDFModifier(io.BytesIO(b"%PDF-1.4"), memory_map=True, executor=executor)
+
+    async def test_process_pool(self, tmp_path: Path) -> None:
+        pdf = create_pdf(tmp_path / "input.pdf", text="Hello World")
+        pool = PDFExecutor(max_workers=1, kind="process")
+        try:
+            modifier = AsyncPDFModifier(memoryview(pdf.read_bytes()), executor=pool)
+            result, data = await modifier.process_to_bytes(
+                ReplacementSpec(replacements={"Hello": "Goodbye"}), workers=2
+            )
+        finally:
+            pool.shutdown()
+        assert result.replacements_made == 1
+        assert data.startswith(b"%PDF")
+
+
+class TestCancelEvent:
+    """Synchronous cancellation between pages."""
+
+    def test_analyzer_stops_when_cancelled(self, tmp_path: Path) -> None:
+        pdf = _multi_page_pdf(tmp_path / "input.pdf", 3)
+        event = threading.Event()
+        event.set()
+        analyzer = PDFAnalyzer(pdf, cancel_event=event)
+        with pytest.raises(OperationCancelledError) as exc_info:
+            analyzer.get_structure()
+        assert exc_info.value.code == "CANCELLED"
+        with pytest.raises(OperationCancelledError):
+            analyzer.extract_text()
+
+    def test_modifier_writes_nothing_when_cancelled(self, tmp_path: Path) -> None:
+        pdf = _multi_page_pdf(tmp_path / "input.pdf", 3)
+        output = tmp_path / "out.pdf"
+        event = threading.Event()
+        event.set()
+        with pytest.raises(OperationCancelledError):
+            PDFModifier(pdf, output, cancel_event=event).process(
+                ReplacementSpec(replacements={"Hello": "Bye"})
+            )
+        assert not output.exists()
+
+    def test_unset_event_has_no_effect(self, tmp_path: Path) -> None:
+        pdf = _multi_page_pdf(tmp_path / "input.pdf", 3)
+        result = PDFModifier(pdf, tmp_path / "out.pdf", cancel_event=threading.Event()).process(
+            ReplacementSpec(replacements={"Hello": "Bye"})
+        )
+        assert result.replacements_made == 3
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import pytest
+
 from pdf_modifier.core.models import ReplacementSpec
 from pdf_modifier.core.modifier import batch_process
 
@@ -117,3 +119,87 @@ class TestBatchProcessMultipleFiles:
         assert result.successful == 0
         assert result.failed == 1
         assert "same" in result.errors[0]["error"].lower()
+
+    def test_batch_applies_save_profile(self, tmp_path: Path) -> None:
+        """The save profile is used for every file in the batch."""
+        pdfs = [create_pdf(tmp_path / f"doc{i}.pdf", text="Hello") for i in range(2)]
+        spec = ReplacementSpec(replacements={"Hello": "Goodbye"})
+
+        result = batch_process(pdfs, tmp_path / "out", spec, save_profile="smallest")
+
+        assert result.successful == 2
+        assert all(r.save_profile == "smallest" for r in result.results)
+
+    def test_batch_unknown_save_profile_raises(self, tmp_path: Path) -> None:
+        """An unknown profile fails fast instead of failing every file."""
+        pdf = create_pdf(tmp_path / "doc.pdf", text="Hello")
+        spec = ReplacementSpec(replacements={"Hello": "Goodbye"})
+        with pytest.raises(ValueError, match="Unknown save profile"):
+            batch_process([pdf], tmp_path / "out", spec, save_profile="tiny")
+
+
+class TestBatchProcessParallel:
+    """Tests for process-pool batch execution (workers > 1)."""
+
+    def test_parallel_processes_all_files(self, tmp_path: Path) -> None:
+        """Parallel mode produces the same outputs as serial mode."""
+        pdfs = [create_pdf(tmp_path / f"file{i}.pdf", text="Hello World") for i in range(4)]
+        output_dir = tmp_path / "output"
+
+        spec = ReplacementSpec(replacements={"Hello": "Goodbye"})
+        result = batch_process([str(p) for p in pdfs], str(output_dir), spec, workers=2)
+
+        assert result.total_files == 4
+        assert result.successful == 4
+        assert result.failed == 0
+        for pdf in pdfs:
+            assert (output_dir / pdf.name).exists()
+
+    def test_parallel_preserves_input_order(self, tmp_path: Path) -> None:
+        """Results are reported in input order regardless of completion order."""
+        pdfs = [create_pdf(tmp_path / f"file{i}.pdf", text="Hello World") for i in range(5)]
+        output_dir = tmp_path / "output"
+
+        spec = ReplacementSpec(replacements={"Hello": "Goodbye"})
+        result = batch_process([str(p) for p in pdfs], str(output_dir), spec, workers=3)
+
+        assert [r.input_path for r in result.results] == [str(p.absolute()) for p in pdfs]
+
+    def test_parallel_isolates_failures(self, tmp_path: Path) -> None:
+        """A missing file fails on its own without affecting other workers."""
+        pdf_good = create_pdf(tmp_path / "good.pdf", text="Hello World")
+        pdf_missing = tmp_path / "missing.pdf"
+        output_dir = tmp_path / "output"
+
+        spec = ReplacementSpec(replacements={"Hello": "Goodbye"})
+        result = batch_process([str(pdf_missing), str(pdf_good)], str(output_dir), spec, workers=2)
+
+        assert result.successful == 1
+        assert result.failed == 1
+        assert result.errors[0]["file"] == str(pdf_missing)
+        assert "FILE_NOT_FOUND" in result.errors[0]["error"]
+
+    def test_progress_callback_reports_each_file(self, tmp_path: Path) -> None:
+        """on_progress is called once per file with a monotonically increasing count."""
+        pdfs = [create_pdf(tmp_path / f"file{i}.pdf", text="Hello") for i in range(3)]
+        output_dir = tmp_path / "output"
+        calls: list[tuple[int, int, str]] = []
+
+        spec = ReplacementSpec(replacements={"Hello": "Goodbye"})
+        batch_process(
+            [str(p) for p in pdfs],
+            str(output_dir),
+            spec,
+            workers=2,
+            on_progress=lambda done, total, file: calls.append((done, total, file)),
+        )
+
+        assert [c[0] for c in calls] == [1, 2, 3]
+        assert all(c[1] == 3 for c in calls)
+        assert sorted(c[2] for c in calls) == sorted(str(p) for p in pdfs)
+
+    def test_invalid_workers_raises(self, tmp_path: Path) -> None:
+        """workers must be at least 1."""
+        spec = ReplacementSpec(replacements={"a": "b"})
+        with pytest.raises(ValueError, match="workers"):
+            batch_process([], str(tmp_path / "output"), spec, workers=0)
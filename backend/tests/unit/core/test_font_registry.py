@@ -0,0 +1,215 @@
+"""Tests for FontRegistry and custom font subsetting."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import fitz
+import pytest
+
+from pdf_modifier.core.font_registry import FontRegistry
+from pdf_modifier.core.models import ReplacementSpec
+from pdf_modifier.core.modifier import SAVE_PROFILES, PDFModifier
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+
+
+@pytest.fixture
+def cjk_font(tmp_path: Path) -> Path:
+    """MuPDF's bundled CJK fallback font (~3.5 MB) written out as a TTF file."""
+    path = tmp_path / "droid.ttf"
+    path.write_bytes(fitz.Font("cjk").buffer)
+    return path
+
+
+def _font_xrefs(doc: fitz.Document, name: str) -> set[int]:
+    """Helper: xrefs of fonts referenced as ``name`` on any page."""
+    return {f[0] for page in doc for f in page.get_fonts() if f[4] == name}
+
+
+class TestFontRegistry:
+    """Embedding and reusing custom fonts within one document."""
+
+    def test_font_embedded_once_across_pages(self, cjk_font: Path) -> None:
+        doc = fitz.open()
+        registry = FontRegistry(doc)
+        for _ in range(3):
+            page = doc.new_page()
+            page.insert_text((72, 72), "base")
+            name = registry.insert_font(page, str(cjk_font))
+            page.insert_text((72, 100), "你好", fontname=name)
+
+        assert registry.has_custom_fonts
+        assert len(_font_xrefs(doc, name)) == 1
+        assert all("你好" in page.get_text() for page in doc)
+        doc.close()
+
+    def test_page_without_resources(self, cjk_font: Path) -> None:
+        """Pages with no resource dictionary still get the font."""
+        doc = fitz.open()
+        registry = FontRegistry(doc)
+        doc.new_page()
+        doc.new_page()
+        second = doc[1]
+        doc.xref_set_key(second.xref, "Resources", "null")
+        registry.insert_font(doc[0], str(cjk_font))
+
+        name = registry.insert_font(second, str(cjk_font))
+        second.insert_text((72, 100), "你好", fontname=name)
+
+        assert "你好" in second.get_text()
+        doc.close()
+
+    def test_font_objects_are_cached(self, cjk_font: Path) -> None:
+        doc = fitz.open()
+        registry = FontRegistry(doc)
+        assert registry.font("helv") is registry.font("helv")
+        custom = registry.font("ignored", str(cjk_font))
+        assert custom is registry.font("other", str(cjk_font))
+        assert custom.name == fitz.Font("cjk").name
+        doc.close()
+
+    def test_embedding_reuses_measurement_font(
+        self, cjk_font: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """The font file is read from disk once, however many pages use it."""
+        doc = fitz.open()
+        registry = FontRegistry(doc)
+        for _ in range(3):
+            doc.new_page()
+        reads: list[Path] = []
+        original = Path.read_bytes
+
+        def spy(self: Path) -> bytes:
+            reads.append(self)
+            return original(self)
+
+        monkeypatch.setattr(Path, "read_bytes", spy)
+        for page in doc:
+            registry.insert_font(page, str(cjk_font))
+        registry.font("x", str(cjk_font)).text_length("你好", fontsize=12)
+
+        assert reads == [cjk_font]
+        doc.close()
+
+    def test_resource_name_is_not_base14(self) -> None:
+        assert FontRegistry.resource_name("/fonts/helv.ttf") == "__custom_helv__"
+
+    def test_empty_registry(self) -> None:
+        doc = fitz.open()
+        assert not FontRegistry(doc).has_custom_fonts
+        doc.close()
+
+
+class TestCustomFontSubsetting:
+    """PDFModifier output scales with the glyphs inserted, not the font size."""
+
+    def test_output_contains_subset_font(self, tmp_path: Path, cjk_font: Path) -> None:
+        pdf_path = tmp_path / "in.pdf"
+        doc = fitz.open()
+        for i in range(3):
+            doc.new_page().insert_text((72, 72), f"Hello page {i}", fontname="helv")
+        doc.save(str(pdf_path))
+        doc.close()
+        output = tmp_path / "out.pdf"
+        spec = ReplacementSpec(replacements={"Hello": "Hi"})
+
+        result = PDFModifier(pdf_path, output, custom_fonts={"helv": str(cjk_font)}).process(spec)
+
+        assert result.replacements_made == 3
+        assert result.output_size_bytes < cjk_font.stat().st_size // 20
+        with fitz.open(output) as out:
+            assert len(_font_xrefs(out, "__custom_droid__")) == 1
+            assert all(f"Hi page {i}" in out[i].get_text() for i in range(3))
+            font = next(f for f in out[0].get_fonts() if f[4] == "__custom_droid__")
+            assert "+" in font[3]  # subset fonts carry a tag prefix, e.g. ABCDEF+Name
+
+    @pytest.mark.parametrize("save_profile", list(SAVE_PROFILES))
+    def test_custom_fonts_subset_under_every_profile(
+        self, tmp_path: Path, cjk_font: Path, save_profile: str
+    ) -> None:
+        pdf_path = tmp_path / "in.pdf"
+        doc = fitz.open()
+        doc.new_page().insert_text((72, 72), "Hello", fontname="helv")
+        doc.save(str(pdf_path))
+        doc.close()
+        output = tmp_path / "out.pdf"
+        spec = ReplacementSpec(replacements={"Hello": "Hi"})
+
+        PDFModifier(pdf_path, output, custom_fonts={"helv": str(cjk_font)}).process(
+            spec, save_profile=save_profile
+        )
+
+        assert output.stat().st_size < cjk_font.stat().st_size // 20
+
+    def test_fast_profile_keeps_fonts_without_custom_fonts(
+        self, tmp_path: Path, cjk_font: Path
+    ) -> None:
+        pdf_path = tmp_path / "in.pdf"
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_font(fontname="droid", fontfile=str(cjk_font))
+        page.insert_text((72, 72), "Hello", fontname="droid")
+        page.insert_text((72, 144), "Other", fontname="helv")
+        doc.save(str(pdf_path))
+        doc.close()
+        output = tmp_path / "out.pdf"
+        spec = ReplacementSpec(replacements={"Other": "Else"})
+
+        PDFModifier(pdf_path, output).process(spec, save_profile="fast")
+
+        with fitz.open(output) as out:
+            font = next(f for f in out[0].get_fonts() if f[4] == "droid")
+            assert "+" not in font[3]
+
+    def test_incremental_save_subsets_too(self, tmp_path: Path, cjk_font: Path) -> None:
+        pdf_path = tmp_path / "in.pdf"
+        doc = fitz.open()
+        doc.new_page().insert_text((72, 72), "Hello", fontname="helv")
+        doc.save(str(pdf_path))
+        doc.close()
+        output = tmp_path / "out.pdf"
+        spec = ReplacementSpec(replacements={"Hello": "Hi"})
+
+        result = PDFModifier(
+            pdf_path, output, custom_fonts={"helv": str(cjk_font)}, incremental=True
+        ).process(spec)
+
+        assert result.save_mode == "incremental"
+        assert output.stat().st_size < cjk_font.stat().st_size // 20
+
+
+class TestModifierFontCache:
+    """PDFModifier keeps one registry per open document."""
+
+    def test_links_measure_with_one_font_object(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        pdf_path = tmp_path / "in.pdf"
+        doc = fitz.open()
+        page = doc.new_page()
+        for i in range(5):
+            page.insert_text((72, 72 + 20 * i), f"Link {i}", fontname="helv")
+        doc.save(str(pdf_path))
+        doc.close()
+        output = tmp_path / "out.pdf"
+        spec = ReplacementSpec(replacements={"Link": "Site|https://example.com"})
+
+        created: list[object] = []
+
+        class CountingFont(fitz.Font):  # type: ignore[misc]
+            def __init__(self, *args: object, **kwargs: object) -> None:
+                created.append(kwargs)
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(fitz, "Font", CountingFont)
+        with PDFModifier(pdf_path, output) as modifier:
+            modifier.process(spec)
+            assert modifier._font_registry is not None
+        assert modifier._font_registry is None
+
+        assert len(created) == 1
+        with fitz.open(output) as out:
+            assert len(out[0].get_links()) == 5
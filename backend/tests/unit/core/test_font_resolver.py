@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from _pytest.monkeypatch import MonkeyPatch
+
 import pytest
 
 from pdf_modifier.core.font_resolver import FontResolver
@@ -253,3 +255,76 @@ class TestFontResolverFallback:
     def test_zapfdingbats(self, resolver: FontResolver) -> None:
         props = resolver.resolve("ZapfDingbats")
         assert props.fontname == "ZaDb"
+
+
+class TestFontResolverPatternTable:
+    """The precompiled pattern regex keeps the table's first-match order."""
+
+    @pytest.mark.parametrize(
+        "font_name",
+        [
+            "Courier-BoldOblique",
+            "ArialNarrow-Courier",
+            "Helvetica-Times",
+            "SerifArial-Bold",
+            "MyFont-Bold",
+            "",
+            "line\nbreak-times",
+        ],
+    )
+    def test_matches_linear_scan(self, font_name: str) -> None:
+        expected = next(
+            (entry[1] for entry in FontResolver._BASE14_PATTERNS if entry[0] in font_name.lower()),
+            "helv",
+        )
+        assert FontResolver().resolve(font_name).fontname == expected
+
+
+class TestFontResolverMemoization:
+    """Repeated lookups are served from the cache."""
+
+    def test_same_inputs_return_cached_result(self) -> None:
+        resolver = FontResolver()
+        first = resolver.resolve("Arial-BoldMT", font_flags={"italic": 1})
+        assert resolver.resolve("Arial-BoldMT", font_flags={"italic": 1}) is first
+        assert resolver.resolve("Arial-BoldMT") is not first
+
+    def test_flags_are_part_of_the_key(self) -> None:
+        resolver = FontResolver()
+        assert not resolver.resolve("ArialMT").is_bold
+        assert resolver.resolve("ArialMT", font_flags={"bold": 1}).is_bold
+
+    def test_constructor_custom_fonts_validated_once(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        font_file = tmp_path / "myfont.ttf"
+        font_file.write_bytes(b"fake ttf")
+        resolver = FontResolver(custom_fonts={"myfont": str(font_file), "bad": "missing.ttf"})
+
+        def fail(path: str) -> bool:
+            raise AssertionError("font file re-validated")
+
+        monkeypatch.setattr(FontResolver, "_is_valid_font_file", staticmethod(fail))
+        for _ in range(3):
+            assert resolver.resolve("myfont").fontfile == str(font_file)
+        assert resolver.resolve("bad").fontfile is None
+
+    def test_per_call_custom_fonts_validated_once(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        font_file = tmp_path / "myfont.ttf"
+        font_file.write_bytes(b"fake ttf")
+        custom_fonts = {"myfont": str(font_file)}
+        resolver = FontResolver()
+        checks: list[str] = []
+        original = FontResolver._is_valid_font_file
+
+        def spy(path: str) -> bool:
+            checks.append(path)
+            return original(path)
+
+        monkeypatch.setattr(FontResolver, "_is_valid_font_file", staticmethod(spy))
+        for name in ("myfont", "helv", "ArialMT", "myfont"):
+            resolver.resolve(name, custom_fonts=custom_fonts)
+
+        assert checks == [str(font_file)]
@@ -0,0 +1,177 @@
+"""Tests for TargetMatcher single-pass target detection."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import fitz
+
+from pdf_modifier.core import PDFModifier
+from pdf_modifier.core.matcher import TargetMatcher
+from pdf_modifier.core.models import ReplacementSpec
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.monkeypatch import MonkeyPatch
+
+
+class TestLiteralTargets:
+    """Literal (non-regex) specs."""
+
+    def test_detects_any_target(self) -> None:
+        spec = ReplacementSpec(replacements={"Draft": "Final", "2024": "2025"})
+        matcher = TargetMatcher(spec)
+        assert matcher.may_match("Report 2024")
+        assert matcher.may_match("Draft")
+
+    def test_rejects_text_without_targets(self) -> None:
+        spec = ReplacementSpec(replacements={"Draft": "Final", "2024": "2025"})
+        assert not TargetMatcher(spec).may_match("Final report 2023")
+
+    def test_regex_metacharacters_are_literal(self) -> None:
+        spec = ReplacementSpec(replacements={"$99.99": "$149.99", "a+b": "c"})
+        matcher = TargetMatcher(spec)
+        assert matcher.may_match("Price: $99.99")
+        assert not matcher.may_match("Price: $99x99")
+        assert not matcher.may_match("aab")
+
+    def test_many_targets(self) -> None:
+        spec = ReplacementSpec(replacements={f"token{i:03d}": "x" for i in range(100)})
+        matcher = TargetMatcher(spec)
+        assert matcher.may_match("prefix token099 suffix")
+        assert not matcher.may_match("prefix token100 suffix")
+
+
+class TestRegexTargets:
+    """Regex specs."""
+
+    def test_detects_pattern(self) -> None:
+        spec = ReplacementSpec(
+            replacements={r"\d{4}-\d{2}-\d{2}": "DATE", r"Order #\d+": "X"},
+            use_regex=True,
+        )
+        matcher = TargetMatcher(spec)
+        assert matcher.may_match("Due 2024-01-15")
+        assert matcher.may_match("Order #42")
+        assert not matcher.may_match("Order #")
+
+    def test_patterns_with_backreferences_stay_correct(self) -> None:
+        """Capture groups are checked separately so backrefs are not renumbered."""
+        spec = ReplacementSpec(
+            replacements={r"(\w)\1": "double", r"(a)(b)\2": "abb"},
+            use_regex=True,
+        )
+        matcher = TargetMatcher(spec)
+        assert matcher.may_match("hello")
+        assert matcher.may_match("xabb")
+        assert not matcher.may_match("abc")
+
+    def test_inline_global_flags(self) -> None:
+        """Patterns with leading inline flags still work when combined fails."""
+        spec = ReplacementSpec(
+            replacements={"(?i)draft": "Final", "2024": "2025"},
+            use_regex=True,
+        )
+        matcher = TargetMatcher(spec)
+        assert matcher.may_match("DRAFT")
+        assert matcher.may_match("2024")
+        assert not matcher.may_match("final")
+
+
+class TestContextFree:
+    """Whether page-level prefiltering is safe for a spec."""
+
+    def test_literal_spec_is_context_free(self) -> None:
+        spec = ReplacementSpec(replacements={"^total$": "x"})
+        assert TargetMatcher(spec).context_free
+
+    def test_plain_regex_is_context_free(self) -> None:
+        spec = ReplacementSpec(replacements={r"\d{4}-\d{2}": "x"}, use_regex=True)
+        assert TargetMatcher(spec).context_free
+
+    def test_anchored_regex_is_not_context_free(self) -> None:
+        for pattern in (r"^Total", r"Total$", r"\bTotal", r"(?<=\$)\d+"):
+            spec = ReplacementSpec(replacements={pattern: "x"}, use_regex=True)
+            assert not TargetMatcher(spec).context_free, pattern
+
+
+class TestModifierIntegration:
+    """PDFModifier uses the matcher without changing match results."""
+
+    def test_first_target_in_spec_order_wins(self, tmp_path: Path) -> None:
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_text((100, 100), "Hello World")
+        spec = ReplacementSpec(replacements={"World": "Earth", "Hello": "Hi"})
+
+        modifier = PDFModifier(tmp_path / "in.pdf", tmp_path / "out.pdf")
+        items = modifier._collect_replacements(page, spec)
+        doc.close()
+
+        assert len(items) == 1
+        assert items[0]["text"] == "Hello Earth"
+
+    def test_matcher_is_reused_for_same_spec(self, tmp_path: Path) -> None:
+        spec = ReplacementSpec(replacements={"a": "b"})
+        modifier = PDFModifier(tmp_path / "in.pdf", tmp_path / "out.pdf")
+        assert modifier._get_matcher(spec) is modifier._get_matcher(spec)
+        other = ReplacementSpec(replacements={"a": "b"})
+        assert modifier._get_matcher(other) is not modifier._get_matcher(spec)
+
+
+class TestPagePrefilter:
+    """Pages without candidate text skip get_text("dict")."""
+
+    def test_non_matching_page_skips_dict_extraction(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_text((100, 100), "Nothing to replace")
+        spec = ReplacementSpec(replacements={"Draft": "Final"})
+        modifier = PDFModifier(tmp_path / "in.pdf", tmp_path / "out.pdf")
+
+        calls: list[str] = []
+        original = fitz.Page.get_text
+
+        def spy(self: fitz.Page, option: str = "text", **kwargs: object) -> object:
+            calls.append(option)
+            return original(self, option, **kwargs)
+
+        monkeypatch.setattr(fitz.Page, "get_text", spy)
+        items = modifier._collect_replacements(page, spec)
+        doc.close()
+
+        assert items == []
+        assert "dict" not in calls
+
+    def test_cross_span_match_survives_prefilter(self, tmp_path: Path) -> None:
+        """A target split across two spans is still found through the page text."""
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_text((100, 100), "Hel", fontname="helv")
+        page.insert_text((100 + fitz.get_text_length("Hel"), 100), "lo", fontname="Cour")
+        spec = ReplacementSpec(replacements={"Hello": "Bye"})
+
+        modifier = PDFModifier(tmp_path / "in.pdf", tmp_path / "out.pdf")
+        items = modifier._collect_replacements(page, spec)
+        doc.close()
+
+        assert len(items) == 1
+        assert items[0]["text"] == "Bye"
+
+    def test_anchored_regex_still_matches_span(self, tmp_path: Path) -> None:
+        """Context-dependent regexes bypass the page prefilter."""
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_text((100, 100), "Header")
+        page.insert_text((100, 200), "Total")
+        spec = ReplacementSpec(replacements={r"^Total$": "Sum"}, use_regex=True)
+
+        modifier = PDFModifier(tmp_path / "in.pdf", tmp_path / "out.pdf")
+        items = modifier._collect_replacements(page, spec)
+        doc.close()
+
+        assert len(items) == 1
+        assert items[0]["text"] == "Sum"
@@ -0,0 +1,99 @@
+"""Tests for memory-mapped input in PDFAnalyzer and PDFModifier."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import fitz
+import pytest
+
+from pdf_modifier.core.analyzer import PDFAnalyzer
+from pdf_modifier.core.exceptions import FileSizeExceededError, PDFReadError
+from pdf_modifier.core.models import ReplacementSpec
+from pdf_modifier.core.modifier import PDFModifier
+from tests.conftest import SAMPLE_PDF, create_pdf
+
+
+def _mapped_regions(path: Path) -> int:
+    """Count this process's memory mappings of ``path`` (Linux only)."""
+    maps = Path("/proc/self/maps")
+    if not maps.exists():
+        pytest.skip("/proc/self/maps not available")
+    return sum(line.endswith(str(path)) for line in maps.read_text().splitlines())
+
+
+class TestAnalyzerMemoryMap:
+    """Memory-mapped input for PDFAnalyzer."""
+
+    def test_same_structure_as_file_open(self) -> None:
+        mapped = PDFAnalyzer(SAMPLE_PDF, memory_map=True).get_structure()
+        regular = PDFAnalyzer(SAMPLE_PDF).get_structure()
+        assert mapped.model_dump() == regular.model_dump()
+
+    def test_mapped_limit_replaces_max_file_size(self, tmp_path: Path) -> None:
+        pdf = create_pdf(tmp_path / "input.pdf")
+        analyzer = PDFAnalyzer(pdf, max_file_size=1, memory_map=True)
+        assert analyzer.page_count() == 1
+
+        analyzer = PDFAnalyzer(pdf, memory_map=True, max_mapped_file_size=1)
+        with pytest.raises(FileSizeExceededError) as exc_info:
+            analyzer.page_count()
+        assert exc_info.value.details["limit_bytes"] == 1
+
+    def test_empty_file_raises_read_error(self, tmp_path: Path) -> None:
+        empty = tmp_path / "empty.pdf"
+        empty.touch()
+        with pytest.raises(PDFReadError):
+            PDFAnalyzer(empty, memory_map=True).page_count()
+
+    def test_requires_file_path(self) -> None:
+        with pytest.raises(ValueError, match="memory_map"):
+            PDFAnalyzer(SAMPLE_PDF.read_bytes(), memory_map=True)
+
+    def test_mapping_released_after_call(self, tmp_path: Path) -> None:
+        pdf = create_pdf(tmp_path / "input.pdf")
+        PDFAnalyzer(pdf, memory_map=True).extract_text()
+        assert _mapped_regions(pdf) == 0
+
+
+class TestModifierMemoryMap:
+    """Memory-mapped input for PDFModifier."""
+
+    def test_process_mapped_input(self, tmp_path: Path) -> None:
+        pdf = create_pdf(tmp_path / "input.pdf", text="Hello World")
+        output = tmp_path / "out.pdf"
+        result = PDFModifier(pdf, output, max_file_size=1, memory_map=True).process(
+            ReplacementSpec(replacements={"Hello": "Goodbye"})
+        )
+        assert result.replacements_made == 1
+        with fitz.open(output) as doc:
+            assert "Goodbye World" in doc[0].get_text()
+        assert _mapped_regions(pdf) == 0
+
+    def test_mapped_limit_enforced(self, tmp_path: Path) -> None:
+        pdf = create_pdf(tmp_path / "input.pdf")
+        modifier = PDFModifier(pdf, tmp_path / "out.pdf", memory_map=True, max_mapped_file_size=1)
+        with pytest.raises(FileSizeExceededError):
+            modifier.process(ReplacementSpec(replacements={"a": "b"}))
+
+    def test_mapped_input_with_workers(self, tmp_path: Path) -> None:
+        doc = fitz.open()
+        for i in range(4):
+            doc.new_page().insert_text((72, 72), f"Hello page {i}")
+        pdf = tmp_path / "input.pdf"
+        doc.save(pdf)
+        doc.close()
+
+        result = PDFModifier(pdf, tmp_path / "out.pdf", memory_map=True).process(
+            ReplacementSpec(replacements={"Hello": "Bye"}), workers=2
+        )
+        assert result.replacements_made == 4
+
+    def test_incremental_with_memory_map(self, tmp_path: Path) -> None:
+        pdf = create_pdf(tmp_path / "input.pdf", text="Hello World")
+        output = tmp_path / "out.pdf"
+        result = PDFModifier(pdf, output, incremental=True, memory_map=True).process(
+            ReplacementSpec(replacements={"Hello": "Goodbye"})
+        )
+        assert result.save_mode == "incremental"
+        assert output.read_bytes().startswith(pdf.read_bytes())
@@ -318,3 +318,234 @@ class TestNoMatchReplacements:
         result = modifier.process(spec)
         assert result.success
         assert result.replacements_made == 0
+
+
+class TestIncrementalSave:
+    """Tests for incremental-update output mode."""
+
+    def test_output_is_original_plus_appended_update(self, tmp_path: Path) -> None:
+        pdf_path = create_pdf(tmp_path / "test.pdf", text="Hello World")
+        output = tmp_path / "out.pdf"
+        spec = ReplacementSpec(replacements={"Hello": "Goodbye"})
+
+        result = PDFModifier(pdf_path, output, incremental=True).process(spec)
+
+        assert result.save_mode == "incremental"
+        assert result.save_seconds >= 0
+        original = pdf_path.read_bytes()
+        assert output.read_bytes().startswith(original)
+        assert output.stat().st_size > len(original)
+        with fitz.open(output) as doc:
+            assert "Goodbye" in doc[0].get_text()
+
+    def test_full_save_is_default(self, tmp_path: Path) -> None:
+        pdf_path = create_pdf(tmp_path / "test.pdf", text="Hello World")
+        result = PDFModifier(pdf_path, tmp_path / "out.pdf").process(
+            ReplacementSpec(replacements={"Hello": "Goodbye"})
+        )
+        assert result.save_mode == "full"
+
+    def test_input_is_left_untouched(self, tmp_path: Path) -> None:
+        pdf_path = create_pdf(tmp_path / "test.pdf", text="Hello World")
+        before = pdf_path.read_bytes()
+        spec = ReplacementSpec(replacements={"Hello": "Goodbye"})
+
+        PDFModifier(pdf_path, tmp_path / "out.pdf", incremental=True).process(spec)
+
+        assert pdf_path.read_bytes() == before
+
+    def test_encrypted_pdf(self, tmp_path: Path) -> None:
+        full_perm = int(
+            fitz.PDF_PERM_ACCESSIBILITY
+            | fitz.PDF_PERM_PRINT
+            | fitz.PDF_PERM_COPY
+            | fitz.PDF_PERM_ANNOTATE
+            | fitz.PDF_PERM_MODIFY
+        )
+        pdf_path = create_encrypted_pdf(
+            tmp_path / "encrypted.pdf",
+            text="Secret data",
+            user_pw="correct",
+            owner_pw="owner",
+            permissions=full_perm,
+        )
+        output = tmp_path / "out.pdf"
+        spec = ReplacementSpec(replacements={"Secret": "Public"})
+
+        result = PDFModifier(pdf_path, output, password="correct", incremental=True).process(spec)
+
+        assert result.save_mode == "incremental"
+        with fitz.open(output) as doc:
+            assert doc.needs_pass
+            assert doc.authenticate("correct")
+            assert "Public" in doc[0].get_text()
+
+    def test_repaired_pdf_falls_back_to_full_save(self, tmp_path: Path) -> None:
+        pdf_path = create_pdf(tmp_path / "test.pdf", text="Hello World")
+        data = pdf_path.read_bytes()
+        # Point startxref at garbage so MuPDF has to rebuild the xref on open
+        broken = data[: data.rfind(b"startxref")] + b"startxref\n999999\n%%EOF\n"
+        pdf_path.write_bytes(broken)
+        output = tmp_path / "out.pdf"
+        spec = ReplacementSpec(replacements={"Hello": "Goodbye"})
+
+        result = PDFModifier(pdf_path, output, incremental=True).process(spec)
+
+        assert result.save_mode == "full"
+        assert any("Incremental save not possible" in w for w in result.warnings)
+        with fitz.open(output) as doc:
+            assert not doc.is_repaired
+            assert "Goodbye" in doc[0].get_text()
+
+    def test_failed_open_removes_output_copy(self, tmp_path: Path) -> None:
+        pdf_path = create_encrypted_pdf(tmp_path / "encrypted.pdf")
+        output = tmp_path / "out.pdf"
+        modifier = PDFModifier(pdf_path, output, incremental=True)
+        with pytest.raises(PDFPasswordError):
+            modifier.process(ReplacementSpec(replacements={"a": "b"}))
+        assert not output.exists()
+
+
+class TestSaveProfiles:
+    """Tests for named save optimization profiles."""
+
+    @staticmethod
+    def _create_text_heavy_pdf(path: Path) -> Path:
+        """Helper: multi-page PDF with uncompressed content streams."""
+        doc = fitz.open()
+        for i in range(5):
+            page = doc.new_page()
+            for line in range(40):
+                page.insert_text((50, 50 + line * 18), f"Draft line {line} of page {i + 1}")
+        doc.save(str(path))
+        doc.close()
+        return path
+
+    def test_result_reports_size_and_time(self, tmp_path: Path) -> None:
+        pdf_path = create_pdf(tmp_path / "test.pdf", text="Hello World")
+        output = tmp_path / "out.pdf"
+        result = PDFModifier(pdf_path, output).process(
+            ReplacementSpec(replacements={"Hello": "Goodbye"}), save_profile="balanced"
+        )
+        assert result.save_profile == "balanced"
+        assert result.output_size_bytes == output.stat().st_size
+        assert result.save_seconds >= 0
+
+    def test_smallest_is_smaller_than_fast(self, tmp_path: Path) -> None:
+        pdf_path = self._create_text_heavy_pdf(tmp_path / "text.pdf")
+        spec = ReplacementSpec(replacements={"Draft": "Final"})
+        sizes = {
+            profile: PDFModifier(pdf_path, tmp_path / f"{profile}.pdf")
+            .process(spec, save_profile=profile)
+            .output_size_bytes
+            for profile in ("fast", "balanced", "smallest")
+        }
+        assert sizes["smallest"] <= sizes["balanced"] < sizes["fast"]
+        with fitz.open(tmp_path / "smallest.pdf") as doc:
+            assert "Final line 0 of page 1" in doc[0].get_text()
+
+    def test_unknown_profile_raises(self, tmp_path: Path) -> None:
+        pdf_path = create_pdf(tmp_path / "test.pdf")
+        modifier = PDFModifier(pdf_path, tmp_path / "out.pdf")
+        with pytest.raises(ValueError, match="Unknown save profile"):
+            modifier.process(ReplacementSpec(replacements={"a": "b"}), save_profile="tiny")
+
+    def test_incremental_rejects_compressing_profile(self, tmp_path: Path) -> None:
+        pdf_path = create_pdf(tmp_path / "test.pdf")
+        output = tmp_path / "out.pdf"
+        modifier = PDFModifier(pdf_path, output, incremental=True)
+        with pytest.raises(ValueError, match="incremental"):
+            modifier.process(ReplacementSpec(replacements={"a": "b"}), save_profile="smallest")
+        assert not output.exists()
+
+
+class TestInMemoryDocuments:
+    """Tests for bytes/file-object input and in-memory output."""
+
+    def test_process_to_bytes_from_bytes(self, tmp_path: Path) -> None:
+        data = create_pdf(tmp_path / "test.pdf", text="Hello World").read_bytes()
+        result, output = PDFModifier(data).process_to_bytes(
+            ReplacementSpec(replacements={"Hello": "Goodbye"})
+        )
+        assert result.replacements_made == 1
+        assert result.input_path == "<memory>"
+        assert result.output_path == "<memory>"
+        assert result.output_size_bytes == len(output)
+        with fitz.open(stream=output, filetype="pdf") as doc:
+            assert "Goodbye World" in doc[0].get_text()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["test.pdf"]
+
+    def test_file_object_input_to_path(self, tmp_path: Path) -> None:
+        pdf_path = create_pdf(tmp_path / "test.pdf", text="Hello World")
+        output = tmp_path / "out.pdf"
+        with pdf_path.open("rb") as f:
+            result = PDFModifier(f, output).process(
+                ReplacementSpec(replacements={"Hello": "Goodbye"})
+            )
+        assert result.output_path == str(output)
+        with fitz.open(output) as doc:
+            assert "Goodbye World" in doc[0].get_text()
+
+    def test_path_input_to_bytes(self, tmp_path: Path) -> None:
+        pdf_path = create_pdf(tmp_path / "test.pdf", text="Hello World")
+        result, output = PDFModifier(pdf_path).process_to_bytes(
+            ReplacementSpec(replacements={"Hello": "Goodbye"}), save_profile="balanced"
+        )
+        assert result.input_path == str(pdf_path)
+        assert output.startswith(b"%PDF")
+
+    def test_memoryview_input_with_workers(self, tmp_path: Path) -> None:
+        doc = fitz.open()
+        for i in range(3):
+            doc.new_page().insert_text((72, 72), f"Hello page {i}")
+        data = memoryview(doc.tobytes())
+        doc.close()
+        result, output = PDFModifier(data).process_to_bytes(
+            ReplacementSpec(replacements={"Hello": "Bye"}), workers=2
+        )
+        assert result.replacements_made == 3
+        with fitz.open(stream=output, filetype="pdf") as out:
+            assert "Bye page 2" in out[2].get_text()
+
+    def test_incremental_from_bytes_writes_output_file(self, tmp_path: Path) -> None:
+        data = create_pdf(tmp_path / "test.pdf", text="Hello World").read_bytes()
+        output = tmp_path / "out.pdf"
+        result = PDFModifier(data, output, incremental=True).process(
+            ReplacementSpec(replacements={"Hello": "Goodbye"})
+        )
+        assert result.save_mode == "incremental"
+        assert output.read_bytes().startswith(data)
+
+    def test_process_without_output_path_raises(self, tmp_path: Path) -> None:
+        modifier = PDFModifier(create_pdf(tmp_path / "test.pdf"))
+        with pytest.raises(ValueError, match="process_to_bytes"):
+            modifier.process(ReplacementSpec(replacements={"a": "b"}))
+
+    def test_incremental_to_bytes_raises(self, tmp_path: Path) -> None:
+        modifier = PDFModifier(create_pdf(tmp_path / "test.pdf"), incremental=True)
+        with pytest.raises(ValueError, match="Incremental"):
+            modifier.process_to_bytes(ReplacementSpec(replacements={"a": "b"}))
+
+    def test_encrypted_bytes_with_password(self, tmp_path: Path) -> None:
+        data = create_encrypted_pdf(tmp_path / "enc.pdf", user_pw="pw").read_bytes()
+        spec = ReplacementSpec(replacements={"Encrypted": "Decrypted"})
+        with pytest.raises(PDFPasswordError):
+            PDFModifier(data).process_to_bytes(spec)
+        result, _ = PDFModifier(data, password="pw").process_to_bytes(spec)
+        assert result.replacements_made == 1
+
+
+class TestProgressCallback:
+    """Tests for per-page progress reporting."""
+
+    def test_reports_every_page(self) -> None:
+        doc = fitz.open()
+        for i in range(3):
+            doc.new_page().insert_text((72, 72), f"Hello page {i}")
+        data = doc.tobytes()
+        doc.close()
+        calls: list[tuple[int, int]] = []
+        PDFModifier(
+            data, on_progress=lambda done, total: calls.append((done, total))
+        ).process_to_bytes(ReplacementSpec(replacements={"Hello": "Bye"}), pages=(2, 3))
+        assert calls == [(1, 2), (2, 2)]
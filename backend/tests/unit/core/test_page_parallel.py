@@ -0,0 +1,110 @@
+"""Tests for page-level parallel scanning in PDFModifier."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import fitz
+import pytest
+
+from pdf_modifier.core import PDFModifier
+from pdf_modifier.core.models import ReplacementSpec
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _create_linked_pdf(tmp_path: Path, page_count: int) -> Path:
+    """Helper: multi-page PDF where each page has text and a link to page 1."""
+    doc = fitz.open()
+    for i in range(page_count):
+        page = doc.new_page()
+        page.insert_text((100, 100), f"Page {i + 1} Draft")
+        page.insert_text((100, 140), "Contents")
+        if i > 0:
+            page.insert_link(
+                {"kind": fitz.LINK_GOTO, "from": fitz.Rect(100, 130, 160, 145), "page": 0}
+            )
+    path = tmp_path / "linked.pdf"
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+class TestParallelPageScanning:
+    """Page scanning across worker processes (workers > 1)."""
+
+    def test_parallel_matches_serial_result(self, tmp_path: Path) -> None:
+        """Parallel mode produces the same counts and text as serial mode."""
+        pdf_path = _create_linked_pdf(tmp_path, page_count=6)
+        spec = ReplacementSpec(replacements={"Draft": "Final"})
+
+        serial = PDFModifier(pdf_path, tmp_path / "serial.pdf").process(spec)
+        parallel = PDFModifier(pdf_path, tmp_path / "parallel.pdf").process(spec, workers=3)
+
+        assert parallel.replacements_made == serial.replacements_made == 6
+        assert parallel.pages_modified == serial.pages_modified == 6
+        with (
+            fitz.open(tmp_path / "serial.pdf") as s_doc,
+            fitz.open(tmp_path / "parallel.pdf") as p_doc,
+        ):
+            assert [p.get_text() for p in s_doc] == [p.get_text() for p in p_doc]
+
+    def test_parallel_preserves_page_order_and_links(self, tmp_path: Path) -> None:
+        """Pages stay in order and internal links survive the merge."""
+        pdf_path = _create_linked_pdf(tmp_path, page_count=5)
+        output = tmp_path / "out.pdf"
+        spec = ReplacementSpec(replacements={"Draft": "Final"})
+
+        PDFModifier(pdf_path, output).process(spec, workers=2)
+
+        with fitz.open(output) as doc:
+            assert len(doc) == 5
+            for i, page in enumerate(doc):
+                assert f"Page {i + 1} Final" in page.get_text()
+                if i > 0:
+                    links = page.get_links()
+                    assert any(link.get("page") == 0 for link in links)
+
+    def test_parallel_respects_page_range(self, tmp_path: Path) -> None:
+        """Only pages inside the requested range are modified."""
+        pdf_path = _create_linked_pdf(tmp_path, page_count=6)
+        output = tmp_path / "out.pdf"
+        spec = ReplacementSpec(replacements={"Draft": "Final"})
+
+        result = PDFModifier(pdf_path, output).process(spec, pages=(2, 5), workers=3)
+
+        assert result.pages_modified == 4
+        with fitz.open(output) as doc:
+            assert "Draft" in doc[0].get_text()
+            assert "Draft" in doc[5].get_text()
+            assert "Final" in doc[3].get_text()
+
+    def test_more_workers_than_pages(self, tmp_path: Path) -> None:
+        """Worker count is capped at the number of pages."""
+        pdf_path = _create_linked_pdf(tmp_path, page_count=2)
+        spec = ReplacementSpec(replacements={"Draft": "Final"})
+
+        result = PDFModifier(pdf_path, tmp_path / "out.pdf").process(spec, workers=8)
+
+        assert result.replacements_made == 2
+
+    def test_later_run_in_with_block_sees_edits(self, tmp_path: Path) -> None:
+        """Workers read the input, so a run on an edited document scans serially."""
+        pdf_path = _create_linked_pdf(tmp_path, page_count=4)
+        out = tmp_path / "out.pdf"
+
+        with PDFModifier(pdf_path, out) as modifier:
+            modifier.process(ReplacementSpec(replacements={"Draft": "Final"}))
+            result = modifier.process(ReplacementSpec(replacements={"Final": "Done"}), workers=2)
+
+        assert result.replacements_made == 4
+        with fitz.open(out) as doc:
+            assert all("Done" in page.get_text() for page in doc)
+
+    def test_invalid_workers_raises(self, tmp_path: Path) -> None:
+        """workers must be at least 1."""
+        pdf_path = _create_linked_pdf(tmp_path, page_count=1)
+        spec = ReplacementSpec(replacements={"Draft": "Final"})
+        with pytest.raises(ValueError, match="workers"):
+            PDFModifier(pdf_path, tmp_path / "out.pdf").process(spec, workers=0)
@@ -0,0 +1,293 @@
+"""Tests for the modification result cache."""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING
+
+import fitz
+import pytest
+
+from pdf_modifier.core import PDFModifier, PDFNotFoundError, ResultCache, SpanCache
+from pdf_modifier.core import modifier as modifier_module
+from pdf_modifier.core.models import ModificationResult, ReplacementSpec
+from pdf_modifier.core.result_cache import default_result_cache
+from pdf_modifier.core.span_cache import source_digest
+
+from ...conftest import create_encrypted_pdf, create_pdf
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.monkeypatch import MonkeyPatch
+
+SPEC = ReplacementSpec(replacements={"Hello": "Goodbye"})
+
+
+def _result(size: int) -> ModificationResult:
+    return ModificationResult(
+        success=True,
+        input_path="in.pdf",
+        output_path="out.pdf",
+        replacements_made=1,
+        pages_modified=1,
+        output_size_bytes=size,
+    )
+
+
+def _fail_pipeline(monkeypatch: MonkeyPatch) -> None:
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("the pipeline should not run on a cache hit")
+
+    monkeypatch.setattr(PDFModifier, "_process_pages", fail)
+
+
+class TestResultCacheKey:
+    """Cache key computation."""
+
+    def test_key_depends_on_content_and_options(self, tmp_path: Path) -> None:
+        a = create_pdf(tmp_path / "a.pdf", text="Hello")
+        b = create_pdf(tmp_path / "b.pdf", text="World")
+        key = ResultCache.key_for(a, SPEC)
+
+        assert ResultCache.key_for(a.read_bytes(), SPEC) == key
+        assert ResultCache.key_for(b, SPEC) != key
+        assert ResultCache.key_for(a, SPEC, pages=(1, 1)) != key
+        assert ResultCache.key_for(a, SPEC, save_profile="smallest") != key
+        assert ResultCache.key_for(a, SPEC, incremental=True) != key
+        regex = ReplacementSpec(replacements={"Hello": "Goodbye"}, use_regex=True)
+        assert ResultCache.key_for(a, regex) != key
+        assert fitz.VersionBind in key
+
+    def test_key_keeps_replacement_order(self, tmp_path: Path) -> None:
+        pdf = create_pdf(tmp_path / "a.pdf")
+        first = ReplacementSpec(replacements={"a": "b", "b": "c"})
+        second = ReplacementSpec(replacements={"b": "c", "a": "b"})
+        assert ResultCache.key_for(pdf, first) != ResultCache.key_for(pdf, second)
+
+    def test_key_hashes_font_contents(self, tmp_path: Path) -> None:
+        pdf = create_pdf(tmp_path / "a.pdf")
+        font = tmp_path / "font.ttf"
+        font.write_bytes(b"one")
+        key = ResultCache.key_for(pdf, SPEC, custom_fonts={"F": str(font)})
+        font.write_bytes(b"two")
+        assert ResultCache.key_for(pdf, SPEC, custom_fonts={"F": str(font)}) != key
+
+
+class TestResultCacheStorage:
+    """Round-trips, expiry and eviction."""
+
+    def test_round_trip_file(self, tmp_path: Path) -> None:
+        cache = ResultCache(tmp_path / "cache")
+        produced = tmp_path / "produced.pdf"
+        produced.write_bytes(b"%PDF-cached")
+        cache.put("k", _result(11), produced)
+        # The cache keeps its own copy
+        produced.write_bytes(b"%PDF-overwritten")
+
+        target = tmp_path / "target.pdf"
+        result = cache.get("k", target)
+        assert result is not None
+        assert result.replacements_made == 1
+        assert target.read_bytes() == b"%PDF-cached"
+
+    def test_outputs_are_copied_by_default(self, tmp_path: Path) -> None:
+        cache = ResultCache(tmp_path / "cache")
+        cache.put("k", _result(11), b"%PDF-cached")
+        target = tmp_path / "target.pdf"
+        assert cache.get("k", target) is not None
+        # A caller writing into its output must not reach the cache entry
+        assert target.stat().st_nlink == 1
+
+    def test_link_outputs(self, tmp_path: Path) -> None:
+        cache = ResultCache(tmp_path / "cache", link_outputs=True)
+        cache.put("k", _result(11), b"%PDF-cached")
+        target = tmp_path / "target.pdf"
+        assert cache.get("k", target) is not None
+        assert target.read_bytes() == b"%PDF-cached"
+        assert target.stat().st_nlink == 2
+
+    def test_round_trip_bytes(self, tmp_path: Path) -> None:
+        cache = ResultCache(tmp_path / "cache")
+        cache.put("k", _result(11), b"%PDF-cached")
+        hit = cache.get_bytes("k")
+        assert hit is not None
+        assert hit[1] == b"%PDF-cached"
+
+    def test_miss_leaves_output_alone(self, tmp_path: Path) -> None:
+        cache = ResultCache(tmp_path / "cache")
+        assert cache.get("missing", tmp_path / "out.pdf") is None
+        assert cache.get_bytes("missing") is None
+        assert not (tmp_path / "out.pdf").exists()
+
+    def test_expired_entries_are_dropped(self, tmp_path: Path) -> None:
+        cache = ResultCache(tmp_path / "cache", ttl_seconds=0.05)
+        cache.put("k", _result(4), b"%PDF")
+        time.sleep(0.1)
+        assert cache.get_bytes("k") is None
+        assert not list((tmp_path / "cache").iterdir())
+
+    def test_tampered_output_is_a_miss(self, tmp_path: Path) -> None:
+        cache = ResultCache(tmp_path / "cache")
+        cache.put("k", _result(11), b"%PDF-cached")
+        (tmp_path / "cache" / "k.pdf").write_bytes(b"%PDF")
+        assert cache.get_bytes("k") is None
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        cache = ResultCache(tmp_path / "cache", max_bytes=3000)
+        payload = b"%PDF" + b"x" * 996
+        cache.put("old", _result(1000), payload)
+        cache.put("used", _result(1000), payload)
+        os.utime(tmp_path / "cache" / "old.json", (time.time() - 60,) * 2)
+        assert cache.get_bytes("used") is not None
+
+        cache.put("new", _result(1000), payload)
+
+        assert cache.get_bytes("old") is None
+        assert cache.get_bytes("used") is not None
+        assert cache.get_bytes("new") is not None
+
+    def test_invalid_limits(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="max_bytes"):
+            ResultCache(tmp_path, max_bytes=0)
+        with pytest.raises(ValueError, match="ttl_seconds"):
+            ResultCache(tmp_path, ttl_seconds=0)
+
+
+class TestDefaultResultCache:
+    """Environment-driven configuration used by the MCP server and web API."""
+
+    def test_uses_env(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("PDF_MOD_RESULT_CACHE_DIR", str(tmp_path / "results"))
+        monkeypatch.setenv("PDF_MOD_RESULT_CACHE_TTL_SECONDS", "60")
+        cache = default_result_cache()
+        assert cache is not None
+        assert cache.cache_dir == tmp_path / "results"
+        assert cache.ttl_seconds == 60
+        assert cache.link_outputs is False
+
+    def test_zero_budget_disables(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("PDF_MOD_RESULT_CACHE_MAX_BYTES", "0")
+        assert default_result_cache() is None
+
+
+class TestModifierWithResultCache:
+    """PDFModifier skips the pipeline for repeated requests."""
+
+    def test_repeat_request_served_from_cache(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        pdf = create_pdf(tmp_path / "in.pdf", text="Hello World")
+        cache = ResultCache(tmp_path / "cache")
+        first = PDFModifier(pdf, tmp_path / "first.pdf", result_cache=cache).process(SPEC)
+        assert first.cache_hit is False
+
+        _fail_pipeline(monkeypatch)
+        second = PDFModifier(pdf, tmp_path / "second.pdf", result_cache=cache).process(SPEC)
+
+        assert second.cache_hit is True
+        assert second.save_seconds == 0.0
+        assert second.output_path == str(tmp_path / "second.pdf")
+        assert second.replacements_made == first.replacements_made
+        assert (tmp_path / "second.pdf").read_bytes() == (tmp_path / "first.pdf").read_bytes()
+
+    def test_repeat_request_in_memory(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        data = create_pdf(tmp_path / "in.pdf", text="Hello World").read_bytes()
+        cache = ResultCache(tmp_path / "cache")
+        _, expected = PDFModifier(data, result_cache=cache).process_to_bytes(SPEC)
+
+        _fail_pipeline(monkeypatch)
+        result, output = PDFModifier(data, result_cache=cache).process_to_bytes(SPEC)
+
+        assert result.cache_hit is True
+        assert result.save_seconds == 0.0
+        assert output == expected
+
+    def test_different_request_is_recomputed(self, tmp_path: Path) -> None:
+        pdf = create_pdf(tmp_path / "in.pdf", text="Hello World")
+        cache = ResultCache(tmp_path / "cache")
+        PDFModifier(pdf, tmp_path / "a.pdf", result_cache=cache).process(SPEC)
+        other = ReplacementSpec(replacements={"World": "There"})
+        result = PDFModifier(pdf, tmp_path / "b.pdf", result_cache=cache).process(other)
+
+        assert result.cache_hit is False
+        with fitz.open(tmp_path / "b.pdf") as doc:
+            assert "Hello There" in doc[0].get_text()
+
+    def test_later_runs_in_a_with_block_are_not_cached(self, tmp_path: Path) -> None:
+        pdf = create_pdf(tmp_path / "in.pdf", text="Draft 0")
+        cache = ResultCache(tmp_path / "cache")
+        zero = ReplacementSpec(replacements={"0": "ZERO"})
+        with PDFModifier(pdf, tmp_path / "out.pdf", result_cache=cache) as modifier:
+            modifier.process(ReplacementSpec(replacements={"Draft": "Final"}))
+            # Runs on the already edited document: its output has both edits
+            modifier.process(zero)
+
+        result = PDFModifier(pdf, tmp_path / "fresh.pdf", result_cache=cache).process(zero)
+
+        assert result.cache_hit is False
+        with fitz.open(tmp_path / "fresh.pdf") as doc:
+            assert "Draft ZERO" in doc[0].get_text()
+
+    def test_rewriting_a_served_output_keeps_the_entry(self, tmp_path: Path) -> None:
+        pdf = create_pdf(tmp_path / "in.pdf", text="Hello World")
+        cache = ResultCache(tmp_path / "cache", link_outputs=True)
+        out = tmp_path / "out.pdf"
+        PDFModifier(pdf, out, result_cache=cache).process(SPEC)
+        PDFModifier(pdf, out, result_cache=cache).process(SPEC)  # hit, possibly a link
+        expected = out.read_bytes()
+
+        other = ReplacementSpec(replacements={"World": "There"})
+        PDFModifier(pdf, out, result_cache=cache).process(other)
+
+        result = PDFModifier(pdf, tmp_path / "again.pdf", result_cache=cache).process(SPEC)
+        assert result.cache_hit is True
+        assert (tmp_path / "again.pdf").read_bytes() == expected
+
+    def test_input_hashed_once(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        pdf = create_pdf(tmp_path / "in.pdf", text="Hello World")
+        calls: list[object] = []
+
+        def counting_digest(source: Path) -> str:
+            calls.append(source)
+            return source_digest(source)
+
+        monkeypatch.setattr(modifier_module, "source_digest", counting_digest)
+        PDFModifier(
+            pdf,
+            tmp_path / "out.pdf",
+            span_cache=SpanCache(tmp_path / "spans"),
+            result_cache=ResultCache(tmp_path / "cache"),
+        ).process(SPEC)
+        assert len(calls) == 1
+
+    def test_incremental_hit_skips_the_working_copy(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        pdf = create_pdf(tmp_path / "in.pdf", text="Hello World")
+        cache = ResultCache(tmp_path / "cache")
+        PDFModifier(pdf, tmp_path / "a.pdf", incremental=True, result_cache=cache).process(SPEC)
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("a cache hit should not open the document")
+
+        monkeypatch.setattr(PDFModifier, "_open_doc", fail)
+        result = PDFModifier(pdf, tmp_path / "b.pdf", incremental=True, result_cache=cache).process(
+            SPEC
+        )
+        assert result.cache_hit is True
+        assert (tmp_path / "b.pdf").read_bytes() == (tmp_path / "a.pdf").read_bytes()
+
+    def test_missing_input_still_fails(self, tmp_path: Path) -> None:
+        cache = ResultCache(tmp_path / "cache")
+        with pytest.raises(PDFNotFoundError):
+            PDFModifier(tmp_path / "missing.pdf", tmp_path / "out.pdf", result_cache=cache).process(
+                SPEC
+            )
+
+    def test_password_requests_are_not_cached(self, tmp_path: Path) -> None:
+        pdf = create_encrypted_pdf(tmp_path / "enc.pdf", text="Hello World")
+        cache = ResultCache(tmp_path / "cache")
+        PDFModifier(pdf, tmp_path / "out.pdf", password="secret", result_cache=cache).process(SPEC)
+        assert not (tmp_path / "cache").exists()
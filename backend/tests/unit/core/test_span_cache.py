@@ -0,0 +1,248 @@
+"""Tests for the persistent span cache."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import fitz
+import pytest
+
+from pdf_modifier.core import PDFAnalyzer, PDFModifier, SpanCache
+from pdf_modifier.core import span_cache as span_cache_module
+from pdf_modifier.core.models import ReplacementSpec
+from pdf_modifier.core.span_cache import default_span_cache, extract_page_record, source_digest
+from pdf_modifier.core.span_table import SpanTable
+
+from ...conftest import SAMPLE_PDF, create_encrypted_pdf, create_pdf
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.monkeypatch import MonkeyPatch
+
+
+def _count_hashing(monkeypatch: MonkeyPatch) -> list[object]:
+    """Start with no remembered digests and record every SHA-256 computed."""
+    monkeypatch.setattr(span_cache_module, "_FILE_DIGESTS", OrderedDict())
+    calls: list[object] = []
+
+    def sha256(*args: bytes) -> hashlib._Hash:
+        calls.append(args)
+        return hashlib.sha256(*args)
+
+    # Only hashing done by the span cache module is counted
+    monkeypatch.setattr(span_cache_module, "hashlib", SimpleNamespace(sha256=sha256))
+    return calls
+
+
+class TestSpanCacheStorage:
+    """Key computation, round-trips and eviction."""
+
+    def test_key_changes_with_content(self, tmp_path: Path) -> None:
+        a = create_pdf(tmp_path / "a.pdf", text="Hello")
+        b = create_pdf(tmp_path / "b.pdf", text="World")
+        assert SpanCache.key_for(a) != SpanCache.key_for(b)
+        assert SpanCache.key_for(a) == SpanCache.key_for(a)
+
+    def test_bytes_key_matches_file_key(self, tmp_path: Path) -> None:
+        pdf = create_pdf(tmp_path / "a.pdf")
+        data = pdf.read_bytes()
+        assert SpanCache.key_for(data) == SpanCache.key_for(pdf)
+        assert SpanCache.key_for(memoryview(data)) == SpanCache.key_for(pdf)
+
+    def test_file_digest_reused_until_the_file_changes(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        hashed = _count_hashing(monkeypatch)
+        pdf = create_pdf(tmp_path / "a.pdf", text="Hello")
+        first = source_digest(pdf)
+        assert source_digest(pdf) == first
+        assert len(hashed) == 1
+
+        create_pdf(pdf, text="Changed")
+        assert source_digest(pdf) != first
+        assert len(hashed) == 2
+
+    def test_key_includes_pymupdf_version(self, tmp_path: Path) -> None:
+        pdf = create_pdf(tmp_path / "a.pdf")
+        assert fitz.VersionBind in SpanCache.key_for(pdf)
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        cache = SpanCache(tmp_path / "cache")
+        with fitz.open(SAMPLE_PDF) as doc:
+            records = [extract_page_record(page) for page in doc]
+        cache.put("k", records)
+
+        loaded = cache.get("k")
+        assert loaded is not None
+        assert len(loaded) == len(records)
+        spans = loaded[0]["spans"]
+        assert isinstance(spans, SpanTable)
+        assert spans.to_dict() == records[0]["spans"].to_dict()
+
+    def test_miss_returns_none(self, tmp_path: Path) -> None:
+        assert SpanCache(tmp_path / "cache").get("missing") is None
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            b'[{"spans": {"text": "abc"',  # truncated write
+            b"garbage",
+            b'[{"text": "no spans"}]',
+            b'{"spans": 1}',
+            b"[1, 2]",
+            b'[{"spans": {"text": "", "text_offsets": [-1], "bboxes": [], "origins": [],'
+            b' "sizes": [], "colors": [], "flags": [], "font_ids": [], "fonts": [],'
+            b' "line_offsets": []}}]',
+        ],
+    )
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path, payload: bytes) -> None:
+        cache = SpanCache(tmp_path / "cache")
+        entry = tmp_path / "cache" / "k.json"
+        entry.parent.mkdir()
+        entry.write_bytes(payload)
+
+        assert cache.get("k") is None
+        assert not entry.exists()
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        cache = SpanCache(tmp_path / "cache", max_bytes=2500)
+        record = [{"width": 1, "height": 1, "text": "x" * 1000, "spans": SpanTable()}]
+        cache.put("old", record)
+        cache.put("used", record)
+        # Make "old" the least recently used, then touch "used"
+        os.utime(tmp_path / "cache" / "old.json", (1, 1))
+        assert cache.get("used") is not None
+
+        cache.put("new", record)
+
+        assert cache.get("old") is None
+        assert cache.get("used") is not None
+        assert cache.get("new") is not None
+
+    def test_invalid_max_bytes(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="max_bytes"):
+            SpanCache(tmp_path, max_bytes=0)
+
+
+class TestDefaultSpanCache:
+    """Environment-driven configuration used by the CLI and MCP server."""
+
+    def test_uses_env_dir(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("PDF_MOD_SPAN_CACHE_DIR", str(tmp_path / "spans"))
+        cache = default_span_cache()
+        assert cache is not None
+        assert cache.cache_dir == tmp_path / "spans"
+
+    def test_zero_budget_disables(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("PDF_MOD_SPAN_CACHE_MAX_BYTES", "0")
+        assert default_span_cache() is None
+
+
+class TestAnalyzerWithCache:
+    """PDFAnalyzer reuses cached spans across calls."""
+
+    def test_structure_populates_and_matches_uncached(self, tmp_path: Path) -> None:
+        cache = SpanCache(tmp_path / "cache")
+        cached = PDFAnalyzer(SAMPLE_PDF, span_cache=cache).get_structure()
+        uncached = PDFAnalyzer(SAMPLE_PDF).get_structure()
+
+        assert cached == uncached
+        assert list((tmp_path / "cache").glob("*.json"))
+
+    def test_inspect_fonts_served_from_cache(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        cache = SpanCache(tmp_path / "cache")
+        PDFAnalyzer(SAMPLE_PDF, span_cache=cache).get_structure()
+        expected = PDFAnalyzer(SAMPLE_PDF).inspect_fonts(["$"])
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("get_text should not be called on a cache hit")
+
+        monkeypatch.setattr(fitz.Page, "get_text", fail)
+        result = PDFAnalyzer(SAMPLE_PDF, span_cache=cache).inspect_fonts(["$"])
+        assert result == expected
+
+    def test_extract_text_uses_cache(self, tmp_path: Path) -> None:
+        cache = SpanCache(tmp_path / "cache")
+        expected = PDFAnalyzer(SAMPLE_PDF).extract_text()
+        PDFAnalyzer(SAMPLE_PDF, span_cache=cache).get_structure()
+        assert PDFAnalyzer(SAMPLE_PDF, span_cache=cache).extract_text() == expected
+
+    def test_input_hashed_once_across_page_windows(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        pdf = create_pdf(tmp_path / "in.pdf", text="Hello World")
+        cache = SpanCache(tmp_path / "cache")
+        hashed = _count_hashing(monkeypatch)
+
+        # A miss looks up and then stores; later windows come from new analyzers
+        PDFAnalyzer(pdf, span_cache=cache).get_structure(1, 1)
+        PDFAnalyzer(pdf, span_cache=cache).get_structure(1, 1)
+        assert len(hashed) == 1
+
+    def test_in_memory_input_hashed_once_per_analyzer(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        data = create_pdf(tmp_path / "in.pdf", text="Hello World").read_bytes()
+        cache = SpanCache(tmp_path / "cache")
+        hashed = _count_hashing(monkeypatch)
+
+        analyzer = PDFAnalyzer(data, span_cache=cache)
+        analyzer.get_structure()
+        analyzer.extract_text()
+        assert len(hashed) == 1
+
+    def test_encrypted_pdf_is_not_cached(self, tmp_path: Path) -> None:
+        pdf = create_encrypted_pdf(tmp_path / "enc.pdf")
+        cache = SpanCache(tmp_path / "cache")
+        PDFAnalyzer(pdf, password="secret", span_cache=cache).get_structure()
+        assert not list((tmp_path / "cache").glob("*.json"))
+
+
+class TestModifierWithCache:
+    """PDFModifier reads cached spans instead of re-extracting."""
+
+    def test_modify_with_cached_spans(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        pdf = create_pdf(tmp_path / "in.pdf", text="Hello World")
+        cache = SpanCache(tmp_path / "cache")
+        PDFAnalyzer(pdf, span_cache=cache).get_structure()
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("get_textpage should not be called on a cache hit")
+
+        monkeypatch.setattr(fitz.Page, "get_textpage", fail)
+        spec = ReplacementSpec(replacements={"Hello": "Goodbye"})
+        result = PDFModifier(pdf, tmp_path / "out.pdf", span_cache=cache).process(spec)
+
+        assert result.replacements_made == 1
+        monkeypatch.undo()
+        with fitz.open(tmp_path / "out.pdf") as doc:
+            assert "Goodbye World" in doc[0].get_text()
+
+    def test_modify_does_not_populate_cache(self, tmp_path: Path) -> None:
+        pdf = create_pdf(tmp_path / "in.pdf", text="Hello World")
+        cache = SpanCache(tmp_path / "cache")
+        spec = ReplacementSpec(replacements={"Hello": "Goodbye"})
+        PDFModifier(pdf, tmp_path / "out.pdf", span_cache=cache).process(spec)
+        assert not list((tmp_path / "cache").glob("*.json"))
+
+    def test_cached_spans_not_reused_after_an_edit(self, tmp_path: Path) -> None:
+        pdf = create_pdf(tmp_path / "in.pdf", text="Draft report")
+        cache = SpanCache(tmp_path / "cache")
+        PDFAnalyzer(pdf, span_cache=cache).get_structure()
+
+        out = tmp_path / "out.pdf"
+        with PDFModifier(pdf, out, span_cache=cache) as modifier:
+            modifier.process(ReplacementSpec(replacements={"Draft": "Final"}))
+            # The cached records still say "Draft"; the page now says "Final"
+            result = modifier.process(ReplacementSpec(replacements={"Final": "Done"}))
+
+        assert result.replacements_made == 1
+        with fitz.open(out) as doc:
+            assert "Done report" in doc[0].get_text()
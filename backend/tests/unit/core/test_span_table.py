@@ -0,0 +1,120 @@
+"""Tests for the columnar SpanTable page representation."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import fitz
+
+from pdf_modifier.core.models import TextElement
+from pdf_modifier.core.span_table import SpanTable
+
+from ...conftest import SAMPLE_PDF
+
+
+def _sample_blocks() -> list[dict[str, Any]]:
+    """Helper: get_text("dict") blocks of the first sample page."""
+    with fitz.open(SAMPLE_PDF) as doc:
+        blocks: list[dict[str, Any]] = doc[0].get_text("dict")["blocks"]
+    return blocks
+
+
+def _dict_spans(blocks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Helper: flatten text blocks into their spans."""
+    return [
+        span
+        for block in blocks
+        if "lines" in block
+        for line in block["lines"]
+        for span in line["spans"]
+    ]
+
+
+def _span(text: str, font: str) -> dict[str, Any]:
+    """Helper: minimal PyMuPDF-style span dict."""
+    return {
+        "text": text,
+        "bbox": (0.0, 0.0, 10.0, 10.0),
+        "origin": (0.0, 8.0),
+        "font": font,
+        "size": 11.0,
+        "color": 0,
+        "flags": 0,
+    }
+
+
+class TestFromBlocks:
+    """Building a table from PyMuPDF dict output."""
+
+    def test_columns_match_dict_spans(self) -> None:
+        blocks = _sample_blocks()
+        table = SpanTable.from_blocks(blocks)
+        spans = _dict_spans(blocks)
+
+        assert len(table) == len(spans)
+        for i, span in enumerate(spans):
+            assert table.text(i) == span["text"]
+            assert table.bbox(i) == tuple(span["bbox"])
+            assert table.origin(i) == tuple(span["origin"])
+            assert table.font(i) == span["font"]
+            assert table.size(i) == span["size"]
+            assert table.color(i) == span["color"]
+            assert table.flags(i) == span["flags"]
+
+    def test_lines_and_joined_text(self) -> None:
+        blocks = [
+            {
+                "lines": [
+                    {"spans": [_span("Hel", "Helv"), _span("lo", "Cour")]},
+                    {"spans": [_span("World", "Helv")]},
+                ]
+            },
+            {"type": 1, "image": b""},
+        ]
+        table = SpanTable.from_blocks(blocks)
+
+        lines = list(table.lines())
+        assert table.line_count == 2
+        assert lines == [range(0, 2), range(2, 3)]
+        assert table.joined_text(lines[0]) == "Hello"
+        assert table.text_offset(1) == 3
+
+    def test_font_names_are_interned(self) -> None:
+        blocks = [{"lines": [{"spans": [_span("a", "Helv"), _span("b", "Helv")]}]}]
+        table = SpanTable.from_blocks(blocks)
+        assert table.to_dict()["fonts"] == ["Helv"]
+        assert table.to_dict()["font_ids"] == [0, 0]
+
+    def test_empty_table(self) -> None:
+        table = SpanTable.from_blocks([])
+        assert len(table) == 0
+        assert list(table.lines()) == []
+        assert table.to_elements() == []
+
+
+class TestConversion:
+    """Round-trips and lazy model conversion."""
+
+    def test_dict_round_trip_through_json(self) -> None:
+        table = SpanTable.from_blocks(_sample_blocks())
+        restored = SpanTable.from_dict(json.loads(json.dumps(table.to_dict())))
+        assert restored.to_dict() == table.to_dict()
+        assert restored.span(0) == table.span(0)
+
+    def test_to_elements_matches_validated_models(self) -> None:
+        blocks = _sample_blocks()
+        table = SpanTable.from_blocks(blocks)
+        expected = [
+            TextElement(
+                text=s["text"],
+                bbox=s["bbox"],
+                origin=s["origin"],
+                font=s["font"],
+                size=s["size"],
+                color=s["color"],
+            )
+            for s in _dict_spans(blocks)
+        ]
+        elements = table.to_elements()
+        assert [e.model_dump() for e in elements] == [e.model_dump() for e in expected]
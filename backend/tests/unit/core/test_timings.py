@@ -0,0 +1,155 @@
+"""Tests for per-stage timing of modification runs."""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import TYPE_CHECKING
+
+import fitz
+import pytest
+
+from pdf_modifier.core.models import ReplacementSpec
+from pdf_modifier.core.modifier import PDFModifier
+from pdf_modifier.core.result_cache import ResultCache
+from pdf_modifier.core.timings import TimingCollector
+from pdf_modifier.logger import JsonFormatter
+
+from ...conftest import SAMPLE_PDF
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SPEC = ReplacementSpec(replacements={"Target": "Result"})
+
+
+def _multi_page_pdf(path: Path, pages: int = 4) -> Path:
+    """Pages alternate between containing the target and not."""
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), "Target text" if i % 2 == 0 else "Other text")
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+class TestTimingCollector:
+    """Aggregation of stages, counters and pages."""
+
+    def test_stages_and_counters(self) -> None:
+        timings = TimingCollector()
+        with timings.stage("match", page=0):
+            pass
+        timings.add("match", 0.5, page=1)
+        timings.add("save", 0.25)
+        timings.count("replacements", 2, page=1)
+        timings.count("pages_scanned")
+
+        result = timings.result()
+        assert result.stages["match"] >= 0.5
+        assert result.stages["save"] == 0.25
+        assert result.counters == {"replacements": 2, "pages_scanned": 1}
+        assert result.pages_timed == 2
+        slowest = result.slowest_pages[0]
+        assert slowest.page == 2
+        assert slowest.seconds == 0.5
+        assert slowest.counters == {"replacements": 2}
+
+    def test_slowest_pages_limited(self) -> None:
+        timings = TimingCollector()
+        for page in range(10):
+            timings.add("match", float(page), page=page)
+        result = timings.result(slowest=3)
+        assert [p.page for p in result.slowest_pages] == [10, 9, 8]
+        assert result.pages_timed == 10
+
+    def test_stage_recorded_on_error(self) -> None:
+        timings = TimingCollector()
+        with pytest.raises(RuntimeError), timings.stage("open"):
+            raise RuntimeError("boom")
+        assert "open" in timings.result().stages
+
+
+class TestModifierTimings:
+    """Timings collected by PDFModifier."""
+
+    def test_disabled_by_default(self, output_pdf: Path) -> None:
+        result = PDFModifier(SAMPLE_PDF, output_pdf).process(SPEC)
+        assert result.timings is None
+
+    def test_stages_pages_and_counters(self, tmp_path: Path, output_pdf: Path) -> None:
+        pdf = _multi_page_pdf(tmp_path / "in.pdf")
+        result = PDFModifier(pdf, output_pdf, collect_timings=True).process(SPEC)
+
+        timings = result.timings
+        assert timings is not None
+        expected = {"open", "textpage", "get_text_dict", "match", "apply_redactions"}
+        assert expected | {"insert_text", "save"} <= timings.stages.keys()
+        assert timings.stages["save"] == result.save_seconds
+        assert timings.total_seconds >= sum(timings.stages.values())
+        assert timings.counters["pages_scanned"] == 4
+        assert timings.counters["pages_skipped"] == 2
+        assert timings.counters["replacements"] == 2
+        assert timings.counters["redaction_areas"] == 2
+        assert timings.pages_timed == 4
+        # Pages with a match also paid for extraction, redaction and insertion
+        assert {p.page for p in timings.slowest_pages[:2]} == {1, 3}
+        first = next(p for p in timings.slowest_pages if p.page == 1)
+        assert "apply_redactions" in first.stages
+        assert first.counters["replacements"] == 1
+
+    def test_to_bytes(self, tmp_path: Path) -> None:
+        pdf = _multi_page_pdf(tmp_path / "in.pdf")
+        result, _ = PDFModifier(pdf, collect_timings=True).process_to_bytes(SPEC)
+        assert result.timings is not None
+        assert "save" in result.timings.stages
+
+    def test_parallel_scan(self, tmp_path: Path, output_pdf: Path) -> None:
+        pdf = _multi_page_pdf(tmp_path / "in.pdf")
+        result = PDFModifier(pdf, output_pdf, collect_timings=True).process(SPEC, workers=2)
+        assert result.timings is not None
+        assert "parallel_scan" in result.timings.stages
+        assert "match" not in result.timings.stages
+        assert result.timings.counters["replacements"] == 2
+
+    def test_open_counted_once_in_context_manager(self, tmp_path: Path) -> None:
+        pdf = _multi_page_pdf(tmp_path / "in.pdf")
+        with PDFModifier(pdf, tmp_path / "out.pdf", collect_timings=True) as modifier:
+            first = modifier.process(SPEC).timings
+            second = modifier.process(ReplacementSpec(replacements={"Other": "Else"})).timings
+        assert first is not None and second is not None
+        assert first.stages["open"] > 0
+        assert second.stages["open"] == 0
+
+    def test_cache_hit_has_fresh_timings(self, tmp_path: Path) -> None:
+        pdf = _multi_page_pdf(tmp_path / "in.pdf")
+        cache = ResultCache(tmp_path / "cache")
+        PDFModifier(pdf, tmp_path / "a.pdf", result_cache=cache, collect_timings=True).process(SPEC)
+        hit = PDFModifier(
+            pdf, tmp_path / "b.pdf", result_cache=cache, collect_timings=True
+        ).process(SPEC)
+
+        assert hit.cache_hit
+        assert hit.timings is not None
+        assert "result_cache" in hit.timings.stages
+        assert "match" not in hit.timings.stages
+        assert "save" not in hit.timings.stages
+        assert hit.save_seconds == 0.0
+        # Timings are per run, never stored in the cache
+        plain = PDFModifier(pdf, tmp_path / "c.pdf", result_cache=cache).process(SPEC)
+        assert plain.cache_hit
+        assert plain.timings is None
+
+    def test_logged_as_json(
+        self, tmp_path: Path, output_pdf: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        pdf = _multi_page_pdf(tmp_path / "in.pdf")
+        with caplog.at_level(logging.INFO, logger="pdf_modifier.core.modifier"):
+            PDFModifier(pdf, output_pdf, collect_timings=True).process(SPEC)
+        record = next(r for r in caplog.records if r.getMessage().startswith("Timings for"))
+
+        logged = json.loads(JsonFormatter().format(record))
+        assert logged["data"]["input_path"] == str(pdf)
+        assert logged["data"]["counters"]["pages_scanned"] == 4
+        assert logged["data"]["slowest_pages"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING
 
 import fitz
@@ -29,6 +30,71 @@ class TestCLIModify:
         assert "Success" in result.stdout
         assert output_pdf.exists()
 
+    def test_incremental_save(self, tmp_path: Path) -> None:
+        output_pdf = tmp_path / "output.pdf"
+        result = runner.invoke(
+            app,
+            ["modify", str(SAMPLE_PDF), str(output_pdf), "-r", "$27.99=$99.99", "--incremental"],
+        )
+        assert result.exit_code == 0
+        assert "Save: incremental" in result.stdout
+        assert output_pdf.read_bytes().startswith(SAMPLE_PDF.read_bytes())
+
+    def test_memory_mapped_input(self, tmp_path: Path) -> None:
+        output_pdf = tmp_path / "output.pdf"
+        result = runner.invoke(
+            app,
+            ["modify", str(SAMPLE_PDF), str(output_pdf), "-r", "$27.99=$99.99", "--mmap"],
+        )
+        assert result.exit_code == 0
+        assert output_pdf.exists()
+
+    def test_save_profile(self, tmp_path: Path) -> None:
+        output_pdf = tmp_path / "output.pdf"
+        result = runner.invoke(
+            app,
+            [
+                "modify",
+                str(SAMPLE_PDF),
+                str(output_pdf),
+                "-r",
+                "$27.99=$99.99",
+                "--save-profile",
+                "smallest",
+            ],
+        )
+        assert result.exit_code == 0
+        assert "(smallest)" in result.stdout
+        assert f"{output_pdf.stat().st_size} bytes" in result.stdout
+
+    def test_timings(self, tmp_path: Path) -> None:
+        output_pdf = tmp_path / "output.pdf"
+        args = ["modify", str(SAMPLE_PDF), str(output_pdf), "-r", "$27.99=$99.99"]
+        assert "Timings" not in runner.invoke(app, args).stdout
+
+        result = runner.invoke(app, [*args, "--timings"])
+        assert result.exit_code == 0
+        assert "Timings" in result.stdout
+        assert "apply_redactions" in result.stdout
+        assert "Slowest pages" in result.stdout
+        assert "pages_scanned=" in result.stdout
+
+    def test_unknown_save_profile(self, tmp_path: Path) -> None:
+        result = runner.invoke(
+            app,
+            [
+                "modify",
+                str(SAMPLE_PDF),
+                str(tmp_path / "output.pdf"),
+                "-r",
+                "a=b",
+                "--save-profile",
+                "tiny",
+            ],
+        )
+        assert result.exit_code == 1
+        assert "Unknown save profile" in result.stdout
+
     def test_regex_replacement(self, tmp_path: Path) -> None:
         output_pdf = tmp_path / "output.pdf"
         result = runner.invoke(
@@ -95,6 +161,26 @@ class TestCLIAnalyze:
         assert result.exit_code == 0
         assert "total_pages" in result.stdout
 
+    def test_ndjson_output(self) -> None:
+        result = runner.invoke(app, ["analyze", str(SAMPLE_PDF), "--ndjson"])
+        assert result.exit_code == 0
+        lines = [line for line in result.stdout.splitlines() if line.startswith("{")]
+        pages = [json.loads(line) for line in lines]
+        assert [p["page"] for p in pages] == list(range(1, len(pages) + 1))
+        assert all("elements" in p for p in pages)
+
+    def test_mmap_uses_mapped_size_limit(self) -> None:
+        result = runner.invoke(app, ["analyze", str(SAMPLE_PDF), "--mmap", "--max-size", "1"])
+        assert result.exit_code == 1
+        assert "exceeds limit" in result.stdout
+
+        result = runner.invoke(
+            app,
+            ["analyze", str(SAMPLE_PDF), "--mmap"],
+            env={"PDF_MOD_MAX_FILE_SIZE": "1"},
+        )
+        assert result.exit_code == 0
+
 
 class TestCLIInspect:
     """Tests for CLI inspect command."""
@@ -193,6 +279,28 @@ class TestCLIBatch:
         )
         assert result.exit_code == 1
 
+    def test_batch_with_workers(self, tmp_path: Path) -> None:
+        pdf1 = create_pdf(tmp_path / "a.pdf", text="Hello World")
+        pdf2 = create_pdf(tmp_path / "b.pdf", text="Hello World")
+        output_dir = tmp_path / "out"
+
+        result = runner.invoke(
+            app,
+            [
+                "batch",
+                str(pdf1),
+                str(pdf2),
+                "-o",
+                str(output_dir),
+                "-r",
+                "Hello=Goodbye",
+                "--workers",
+                "2",
+            ],
+        )
+        assert result.exit_code == 0
+        assert "2 succeeded" in result.stdout
+
     def test_batch_shows_in_help(self) -> None:
         result = runner.invoke(app, ["--help"])
         assert "batch" in result.stdout
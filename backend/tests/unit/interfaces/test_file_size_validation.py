@@ -168,10 +168,10 @@ class TestEnvVarMaxFileSize:
 class TestMCPMaxFileSize:
     """File size validation exposed through MCP tools."""
 
-    def test_modify_pdf_rejects_large_file(self, tmp_path: Path) -> None:
+    async def test_modify_pdf_rejects_large_file(self, tmp_path: Path) -> None:
         pdf = create_pdf(tmp_path / "input.pdf")
         output = tmp_path / "output.pdf"
-        result = modify_pdf_content(
+        result = await modify_pdf_content(
             input_path=str(pdf),
             output_path=str(output),
             replacements={"Hello": "World"},
@@ -183,10 +183,10 @@ class TestMCPMaxFileSize:
         assert data["success"] is False
         assert data["error"] == "FILE_TOO_LARGE"
 
-    def test_modify_pdf_accepts_within_limit(self, tmp_path: Path) -> None:
+    async def test_modify_pdf_accepts_within_limit(self, tmp_path: Path) -> None:
         pdf = create_pdf(tmp_path / "input.pdf", text="Hello World")
         output = tmp_path / "output.pdf"
-        result = modify_pdf_content(
+        result = await modify_pdf_content(
             input_path=str(pdf),
             output_path=str(output),
             replacements={"Hello": "Hola"},
@@ -198,12 +198,12 @@ class TestMCPMaxFileSize:
         assert data["success"] is True
         assert data["replacements_made"] > 0
 
-    def test_batch_modify_rejects_large_file(self, tmp_path: Path) -> None:
+    async def test_batch_modify_rejects_large_file(self, tmp_path: Path) -> None:
         from pdf_modifier.interfaces.mcp import batch_modify_pdf_content
 
         pdf = create_pdf(tmp_path / "input.pdf")
         output_dir = tmp_path / "out"
-        result = batch_modify_pdf_content(
+        result = await batch_modify_pdf_content(
             input_paths=[str(pdf)],
             output_dir=str(output_dir),
             replacements={"Hello": "World"},
@@ -215,11 +215,11 @@ class TestMCPMaxFileSize:
         assert data["failed"] == 1
         assert "FILE_TOO_LARGE" in data["errors"][0]["error"]
 
-    def test_read_pdf_structure_rejects_large_file(self, tmp_path: Path) -> None:
+    async def test_read_pdf_structure_rejects_large_file(self, tmp_path: Path) -> None:
         from pdf_modifier.interfaces.mcp import read_pdf_structure
 
         pdf = create_pdf(tmp_path / "input.pdf")
-        result = read_pdf_structure(
+        result = await read_pdf_structure(
             input_path=str(pdf),
             max_file_size=1,
         )
@@ -229,11 +229,11 @@ class TestMCPMaxFileSize:
         assert data["success"] is False
         assert data["error"] == "FILE_TOO_LARGE"
 
-    def test_inspect_pdf_fonts_rejects_large_file(self, tmp_path: Path) -> None:
+    async def test_inspect_pdf_fonts_rejects_large_file(self, tmp_path: Path) -> None:
         from pdf_modifier.interfaces.mcp import inspect_pdf_fonts
 
         pdf = create_pdf(tmp_path / "input.pdf")
-        result = inspect_pdf_fonts(
+        result = await inspect_pdf_fonts(
             input_path=str(pdf),
             terms=["Hello"],
             max_file_size=1,
@@ -244,11 +244,11 @@ class TestMCPMaxFileSize:
         assert data["success"] is False
         assert data["error"] == "FILE_TOO_LARGE"
 
-    def test_list_pdf_hyperlinks_rejects_large_file(self, tmp_path: Path) -> None:
+    async def test_list_pdf_hyperlinks_rejects_large_file(self, tmp_path: Path) -> None:
         from pdf_modifier.interfaces.mcp import list_pdf_hyperlinks
 
         pdf = create_pdf(tmp_path / "input.pdf")
-        result = list_pdf_hyperlinks(
+        result = await list_pdf_hyperlinks(
             input_path=str(pdf),
             max_file_size=1,
         )
@@ -258,11 +258,11 @@ class TestMCPMaxFileSize:
         assert data["success"] is False
         assert data["error"] == "FILE_TOO_LARGE"
 
-    def test_extract_embedded_fonts_rejects_large_file(self, tmp_path: Path) -> None:
+    async def test_extract_embedded_fonts_rejects_large_file(self, tmp_path: Path) -> None:
         from pdf_modifier.interfaces.mcp import extract_embedded_fonts
 
         pdf = create_pdf(tmp_path / "input.pdf")
-        result = extract_embedded_fonts(
+        result = await extract_embedded_fonts(
             input_path=str(pdf),
             max_file_size=1,
         )
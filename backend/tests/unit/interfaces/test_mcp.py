@@ -32,26 +32,43 @@ class TestMCPServer:
 class TestMCPReadStructure:
     """Tests for read_pdf_structure tool."""
 
-    def test_returns_valid_json(self) -> None:
-        result = read_pdf_structure(str(SAMPLE_PDF))
+    async def test_returns_valid_json(self) -> None:
+        result = await read_pdf_structure(str(SAMPLE_PDF))
         parsed = json.loads(result)
         assert "total_pages" in parsed
         assert parsed["total_pages"] >= 1
 
-    def test_contains_pages_array(self) -> None:
-        result = read_pdf_structure(str(SAMPLE_PDF))
+    async def test_contains_pages_array(self) -> None:
+        result = await read_pdf_structure(str(SAMPLE_PDF))
         parsed = json.loads(result)
         assert "pages" in parsed
         assert len(parsed["pages"]) == parsed["total_pages"]
 
-    def test_error_on_invalid_file(self, tmp_path: Path) -> None:
-        result = read_pdf_structure(str(tmp_path / "missing.pdf"))
+    async def test_page_window(self, tmp_path: Path) -> None:
+        doc = fitz.open()
+        for _ in range(3):
+            doc.new_page().insert_text((100, 100), "Hello")
+        pdf = tmp_path / "three.pdf"
+        doc.save(str(pdf))
+        doc.close()
+
+        parsed = json.loads(await read_pdf_structure(str(pdf), start_page=1, page_limit=2))
+        assert parsed["total_pages"] == 3
+        assert len(parsed["pages"]) == 2
+        assert parsed["next_page"] == 3
+
+        parsed = json.loads(await read_pdf_structure(str(pdf), start_page=parsed["next_page"]))
+        assert [p["page"] for p in parsed["pages"]] == [3]
+        assert parsed["next_page"] is None
+
+    async def test_error_on_invalid_file(self, tmp_path: Path) -> None:
+        result = await read_pdf_structure(str(tmp_path / "missing.pdf"))
         parsed = json.loads(result)
         assert parsed["success"] is False
         assert "error" in parsed
 
-    def test_error_json_has_message(self, tmp_path: Path) -> None:
-        result = read_pdf_structure(str(tmp_path / "missing.pdf"))
+    async def test_error_json_has_message(self, tmp_path: Path) -> None:
+        result = await read_pdf_structure(str(tmp_path / "missing.pdf"))
         parsed = json.loads(result)
         assert "message" in parsed
         assert len(parsed["message"]) > 0
@@ -60,18 +77,18 @@ class TestMCPReadStructure:
 class TestMCPInspectFonts:
     """Tests for inspect_pdf_fonts tool."""
 
-    def test_returns_matches(self) -> None:
-        result = inspect_pdf_fonts(str(SAMPLE_PDF), ["Order", "$"])
+    async def test_returns_matches(self) -> None:
+        result = await inspect_pdf_fonts(str(SAMPLE_PDF), ["Order", "$"])
         parsed = json.loads(result)
         assert parsed["total_matches"] >= 1
 
-    def test_no_matches(self) -> None:
-        result = inspect_pdf_fonts(str(SAMPLE_PDF), ["XYZNONEXISTENT"])
+    async def test_no_matches(self) -> None:
+        result = await inspect_pdf_fonts(str(SAMPLE_PDF), ["XYZNONEXISTENT"])
         parsed = json.loads(result)
         assert parsed["total_matches"] == 0
 
-    def test_error_on_invalid_file(self, tmp_path: Path) -> None:
-        result = inspect_pdf_fonts(str(tmp_path / "missing.pdf"), ["anything"])
+    async def test_error_on_invalid_file(self, tmp_path: Path) -> None:
+        result = await inspect_pdf_fonts(str(tmp_path / "missing.pdf"), ["anything"])
         parsed = json.loads(result)
         assert parsed["success"] is False
 
@@ -79,16 +96,16 @@ class TestMCPInspectFonts:
 class TestMCPModifyContent:
     """Tests for modify_pdf_content tool."""
 
-    def test_simple_replacement(self, tmp_path: Path) -> None:
+    async def test_simple_replacement(self, tmp_path: Path) -> None:
         output_pdf = tmp_path / "output.pdf"
-        result = modify_pdf_content(str(SAMPLE_PDF), str(output_pdf), {"$27.99": "$99.99"})
+        result = await modify_pdf_content(str(SAMPLE_PDF), str(output_pdf), {"$27.99": "$99.99"})
         parsed = json.loads(result)
         assert parsed["success"] is True
         assert output_pdf.exists()
 
-    def test_regex_replacement(self, tmp_path: Path) -> None:
+    async def test_regex_replacement(self, tmp_path: Path) -> None:
         output_pdf = tmp_path / "output.pdf"
-        result = modify_pdf_content(
+        result = await modify_pdf_content(
             str(SAMPLE_PDF),
             str(output_pdf),
             {r"January \d{2}, \d{4}": "February 01, 2030"},
@@ -97,47 +114,82 @@ class TestMCPModifyContent:
         parsed = json.loads(result)
         assert parsed["success"] is True
 
-    def test_hyperlink_syntax(self, tmp_path: Path) -> None:
+    async def test_hyperlink_syntax(self, tmp_path: Path) -> None:
         output_pdf = tmp_path / "output.pdf"
-        result = modify_pdf_content(
+        result = await modify_pdf_content(
             str(SAMPLE_PDF), str(output_pdf), {"Order Summary": "Click|https://example.com"}
         )
         parsed = json.loads(result)
         assert parsed["success"] is True
 
-    def test_void_link_syntax(self, tmp_path: Path) -> None:
+    async def test_void_link_syntax(self, tmp_path: Path) -> None:
         output_pdf = tmp_path / "output.pdf"
-        result = modify_pdf_content(
+        result = await modify_pdf_content(
             str(SAMPLE_PDF), str(output_pdf), {"Order Summary": "Summary|void(0)"}
         )
         parsed = json.loads(result)
         assert parsed["success"] is True
 
-    def test_error_on_invalid_file(self, tmp_path: Path) -> None:
-        result = modify_pdf_content(
+    async def test_error_on_invalid_file(self, tmp_path: Path) -> None:
+        result = await modify_pdf_content(
             str(tmp_path / "missing.pdf"), str(tmp_path / "out.pdf"), {"a": "b"}
         )
         parsed = json.loads(result)
         assert parsed["success"] is False
 
-    def test_result_contains_stats(self, tmp_path: Path) -> None:
+    async def test_result_contains_stats(self, tmp_path: Path) -> None:
         output_pdf = tmp_path / "output.pdf"
-        result = modify_pdf_content(str(SAMPLE_PDF), str(output_pdf), {"$27.99": "$99.99"})
+        result = await modify_pdf_content(str(SAMPLE_PDF), str(output_pdf), {"$27.99": "$99.99"})
         parsed = json.loads(result)
         assert "replacements_made" in parsed
         assert "pages_modified" in parsed
+        assert "save_seconds" in parsed
+
+    async def test_timings_behind_flag(self, tmp_path: Path) -> None:
+        output_pdf = tmp_path / "output.pdf"
+        plain = json.loads(
+            await modify_pdf_content(str(SAMPLE_PDF), str(output_pdf), {"$27.99": "$99.99"})
+        )
+        assert plain["timings"] is None
+
+        parsed = json.loads(
+            await modify_pdf_content(
+                str(SAMPLE_PDF), str(tmp_path / "timed.pdf"), {"$27.99": "$89.99"}, timings=True
+            )
+        )
+        assert {"open", "save"} <= parsed["timings"]["stages"].keys()
+        assert parsed["timings"]["slowest_pages"][0]["page"] == 1
+
+    async def test_incremental_save(self, tmp_path: Path) -> None:
+        output_pdf = tmp_path / "output.pdf"
+        result = await modify_pdf_content(
+            str(SAMPLE_PDF), str(output_pdf), {"$27.99": "$99.99"}, incremental=True
+        )
+        parsed = json.loads(result)
+        assert parsed["success"] is True
+        assert parsed["save_mode"] == "incremental"
+        assert output_pdf.read_bytes().startswith(SAMPLE_PDF.read_bytes())
+
+    async def test_save_profile(self, tmp_path: Path) -> None:
+        output_pdf = tmp_path / "output.pdf"
+        result = await modify_pdf_content(
+            str(SAMPLE_PDF), str(output_pdf), {"$27.99": "$99.99"}, save_profile="balanced"
+        )
+        parsed = json.loads(result)
+        assert parsed["save_profile"] == "balanced"
+        assert parsed["output_size_bytes"] == output_pdf.stat().st_size
 
 
 class TestMCPListHyperlinks:
     """Tests for list_pdf_hyperlinks tool."""
 
-    def test_returns_valid_json(self) -> None:
-        result = list_pdf_hyperlinks(str(SAMPLE_PDF))
+    async def test_returns_valid_json(self) -> None:
+        result = await list_pdf_hyperlinks(str(SAMPLE_PDF))
         parsed = json.loads(result)
         assert "total_links" in parsed
         assert "links" in parsed
 
-    def test_pdf_with_links(self, tmp_path: Path) -> None:
+    async def test_pdf_with_links(self, tmp_path: Path) -> None:
         pdf_path = tmp_path / "with_links.pdf"
         doc = fitz.open()
         page = doc.new_page()
@@ -147,13 +199,13 @@ class TestMCPListHyperlinks:
         doc.save(str(pdf_path))
         doc.close()
 
-        result = list_pdf_hyperlinks(str(pdf_path))
+        result = await list_pdf_hyperlinks(str(pdf_path))
         parsed = json.loads(result)
         assert parsed["total_links"] == 1
         assert parsed["links"][0]["uri"] == "https://example.com"
 
-    def test_error_on_invalid_file(self, tmp_path: Path) -> None:
-        result = list_pdf_hyperlinks(str(tmp_path / "missing.pdf"))
+    async def test_error_on_invalid_file(self, tmp_path: Path) -> None:
+        result = await list_pdf_hyperlinks(str(tmp_path / "missing.pdf"))
         parsed = json.loads(result)
         assert parsed["success"] is False
 
@@ -161,12 +213,12 @@ class TestMCPListHyperlinks:
 class TestMCPBatchModify:
     """Tests for batch_modify_pdf_content tool."""
 
-    def test_batch_multiple_files(self, tmp_path: Path) -> None:
+    async def test_batch_multiple_files(self, tmp_path: Path) -> None:
         pdf1 = create_pdf(tmp_path / "a.pdf", text="Hello World")
         pdf2 = create_pdf(tmp_path / "b.pdf", text="Hello World")
         output_dir = tmp_path / "out"
 
-        result = batch_modify_pdf_content(
+        result = await batch_modify_pdf_content(
             [str(pdf1), str(pdf2)],
             str(output_dir),
             {"Hello": "Goodbye"},
@@ -176,11 +228,11 @@ class TestMCPBatchModify:
         assert parsed["successful"] == 2
         assert parsed["failed"] == 0
 
-    def test_batch_with_missing_file(self, tmp_path: Path) -> None:
+    async def test_batch_with_missing_file(self, tmp_path: Path) -> None:
         pdf_good = create_pdf(tmp_path / "good.pdf", text="Hello")
         output_dir = tmp_path / "out"
 
-        result = batch_modify_pdf_content(
+        result = await batch_modify_pdf_content(
             [str(pdf_good), str(tmp_path / "missing.pdf")],
             str(output_dir),
             {"Hello": "Goodbye"},
@@ -191,19 +243,19 @@ class TestMCPBatchModify:
         assert parsed["failed"] == 1
         assert len(parsed["errors"]) == 1
 
-    def test_batch_empty_list(self, tmp_path: Path) -> None:
+    async def test_batch_empty_list(self, tmp_path: Path) -> None:
         output_dir = tmp_path / "out"
-        result = batch_modify_pdf_content([], str(output_dir), {"a": "b"})
+        result = await batch_modify_pdf_content([], str(output_dir), {"a": "b"})
         parsed = json.loads(result)
         assert parsed["total_files"] == 0
         assert parsed["successful"] == 0
         assert parsed["failed"] == 0
 
-    def test_batch_regex(self, tmp_path: Path) -> None:
+    async def test_batch_regex(self, tmp_path: Path) -> None:
         pdf = create_pdf(tmp_path / "test.pdf", text="Date: 2024-01-01")
         output_dir = tmp_path / "out"
 
-        result = batch_modify_pdf_content(
+        result = await batch_modify_pdf_content(
             [str(pdf)],
             str(output_dir),
             {r"\d{4}-\d{2}-\d{2}": "REDACTED"},
@@ -212,20 +264,38 @@ class TestMCPBatchModify:
         parsed = json.loads(result)
         assert parsed["successful"] == 1
 
+    async def test_batch_with_workers(self, tmp_path: Path) -> None:
+        pdf1 = create_pdf(tmp_path / "a.pdf", text="Hello World")
+        pdf2 = create_pdf(tmp_path / "b.pdf", text="Hello World")
+        output_dir = tmp_path / "out"
+
+        result = await batch_modify_pdf_content(
+            [str(pdf1), str(pdf2)],
+            str(output_dir),
+            {"Hello": "Goodbye"},
+            workers=2,
+        )
+        parsed = json.loads(result)
+        assert parsed["successful"] == 2
+        assert [r["input_path"] for r in parsed["results"]] == [
+            str(pdf1.absolute()),
+            str(pdf2.absolute()),
+        ]
+
 
 class TestMCPErrorHandling:
     """Tests for error handling decorator behavior."""
 
-    def test_encrypted_pdf_returns_error_json(self, tmp_path: Path) -> None:
+    async def test_encrypted_pdf_returns_error_json(self, tmp_path: Path) -> None:
         pdf_path = create_encrypted_pdf(tmp_path / "encrypted.pdf")
-        result = read_pdf_structure(str(pdf_path))
+        result = await read_pdf_structure(str(pdf_path))
         parsed = json.loads(result)
         assert parsed["success"] is False
         assert parsed["error"] == "PASSWORD_ERROR"
 
-    def test_same_input_output_returns_error(self, tmp_path: Path) -> None:
+    async def test_same_input_output_returns_error(self, tmp_path: Path) -> None:
         pdf_path = create_pdf(tmp_path / "test.pdf")
-        result = modify_pdf_content(str(pdf_path), str(pdf_path), {"a": "b"})
+        result = await modify_pdf_content(str(pdf_path), str(pdf_path), {"a": "b"})
         parsed = json.loads(result)
         assert parsed["success"] is False
         assert parsed["error"] == "UNEXPECTED_ERROR"
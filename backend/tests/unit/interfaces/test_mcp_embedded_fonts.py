@@ -70,33 +70,33 @@ class TestExtractEmbeddedFonts:
 
         assert callable(extract_embedded_fonts)
 
-    def test_returns_json(self, tmp_path: Path) -> None:
+    async def test_returns_json(self, tmp_path: Path) -> None:
         """Tool returns valid JSON."""
         pdf_path = self._create_pdf_with_custom_font(tmp_path)
-        result = extract_embedded_fonts(str(pdf_path))
+        result = await extract_embedded_fonts(str(pdf_path))
         parsed = json.loads(result)
         assert isinstance(parsed, dict)
 
-    def test_returns_fonts(self, tmp_path: Path) -> None:
+    async def test_returns_fonts(self, tmp_path: Path) -> None:
         """Tool returns embedded fonts from a PDF with custom fonts."""
         pdf_path = self._create_pdf_with_custom_font(tmp_path)
-        result = extract_embedded_fonts(str(pdf_path))
+        result = await extract_embedded_fonts(str(pdf_path))
         parsed = json.loads(result)
         assert parsed.get("success") is True
         assert len(parsed.get("fonts", [])) >= 1
 
-    def test_returns_empty_for_base14(self, tmp_path: Path) -> None:
+    async def test_returns_empty_for_base14(self, tmp_path: Path) -> None:
         """Tool returns empty fonts list for Base 14 only PDF."""
         pdf_path = self._create_pdf_with_base14_only(tmp_path)
-        result = extract_embedded_fonts(str(pdf_path))
+        result = await extract_embedded_fonts(str(pdf_path))
         parsed = json.loads(result)
         assert parsed.get("success") is True
         assert len(parsed.get("fonts", [])) == 0
 
-    def test_font_fields_present(self, tmp_path: Path) -> None:
+    async def test_font_fields_present(self, tmp_path: Path) -> None:
         """Each font entry has required fields."""
         pdf_path = self._create_pdf_with_custom_font(tmp_path)
-        result = extract_embedded_fonts(str(pdf_path))
+        result = await extract_embedded_fonts(str(pdf_path))
         parsed = json.loads(result)
         fonts = parsed.get("fonts", [])
         assert len(fonts) >= 1
@@ -107,17 +107,17 @@ class TestExtractEmbeddedFonts:
             assert "buffer_size" in font
             assert "page_numbers" in font
 
-    def test_buffer_size_positive(self, tmp_path: Path) -> None:
+    async def test_buffer_size_positive(self, tmp_path: Path) -> None:
         """Buffer sizes are positive for embedded fonts."""
         pdf_path = self._create_pdf_with_custom_font(tmp_path)
-        result = extract_embedded_fonts(str(pdf_path))
+        result = await extract_embedded_fonts(str(pdf_path))
         parsed = json.loads(result)
         for font in parsed.get("fonts", []):
             assert font["buffer_size"] > 0
 
-    def test_tool_invalid_file(self, tmp_path: Path) -> None:
+    async def test_tool_invalid_file(self, tmp_path: Path) -> None:
         """Tool returns error for non-existent file."""
-        result = extract_embedded_fonts(str(tmp_path / "missing.pdf"))
+        result = await extract_embedded_fonts(str(tmp_path / "missing.pdf"))
         parsed = json.loads(result)
         assert parsed.get("success") is False
 
@@ -142,18 +142,18 @@ class TestInspectFontsEnhanced:
         doc.close()
         return pdf_path
 
-    def test_inspect_fonts_still_works(self, tmp_path: Path) -> None:
+    async def test_inspect_fonts_still_works(self, tmp_path: Path) -> None:
         """Existing inspect_fonts behavior is preserved."""
         pdf_path = self._create_pdf_with_custom_font(tmp_path)
-        result = inspect_pdf_fonts(str(pdf_path), ["Custom"])
+        result = await inspect_pdf_fonts(str(pdf_path), ["Custom"])
         parsed = json.loads(result)
         assert parsed.get("success") is True
         assert parsed.get("total_matches", 0) >= 1
 
-    def test_inspect_fonts_no_match(self, tmp_path: Path) -> None:
+    async def test_inspect_fonts_no_match(self, tmp_path: Path) -> None:
         """inspect_fonts returns no matches for non-existent term."""
         pdf_path = self._create_pdf_with_custom_font(tmp_path)
-        result = inspect_pdf_fonts(str(pdf_path), ["NonExistentTerm123"])
+        result = await inspect_pdf_fonts(str(pdf_path), ["NonExistentTerm123"])
         parsed = json.loads(result)
         assert parsed.get("success") is True
         assert parsed.get("total_matches", 0) == 0
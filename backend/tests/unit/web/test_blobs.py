@@ -0,0 +1,91 @@
+"""Tests for the content-addressed blob store."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING
+
+from pdf_modifier.web.blobs import BlobStore
+from pdf_modifier.web.storage import PDFStorage
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+PDF_BYTES = b"%PDF-1.4\n" + b"x" * 100
+DIGEST = hashlib.sha256(PDF_BYTES).hexdigest()
+
+
+def _write(path: Path, content: bytes = PDF_BYTES) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+class TestBlobStore:
+    """Blob adoption, reference counting and collection."""
+
+    def test_first_upload_becomes_blob(self, tmp_path: Path) -> None:
+        blobs = BlobStore(tmp_path / "blobs")
+        upload = _write(tmp_path / "s1" / "doc.pdf")
+
+        assert blobs.adopt(upload, DIGEST) is False
+        assert blobs.path_for(DIGEST).read_bytes() == PDF_BYTES
+        assert blobs.ref_count(DIGEST) == 1
+
+    def test_duplicate_shares_blob(self, tmp_path: Path) -> None:
+        blobs = BlobStore(tmp_path / "blobs")
+        first = _write(tmp_path / "s1" / "doc.pdf")
+        second = _write(tmp_path / "s2" / "copy.pdf")
+        blobs.adopt(first, DIGEST)
+
+        assert blobs.adopt(second, DIGEST) is True
+        assert second.read_bytes() == PDF_BYTES
+        assert second.stat().st_ino == first.stat().st_ino
+        assert blobs.ref_count(DIGEST) == 2
+        assert sorted(p.name for p in second.parent.iterdir()) == ["copy.pdf"]
+
+    def test_collects_unreferenced_blobs(self, tmp_path: Path) -> None:
+        blobs = BlobStore(tmp_path / "blobs")
+        upload = _write(tmp_path / "s1" / "doc.pdf")
+        blobs.adopt(upload, DIGEST)
+        blobs.put_structure(DIGEST, b"{}")
+
+        assert blobs.collect_garbage() == 0
+        upload.unlink()
+        assert blobs.collect_garbage() == len(PDF_BYTES) + 2
+        assert blobs.ref_count(DIGEST) == 0
+        assert blobs.get_structure(DIGEST) is None
+
+    def test_structure_cache(self, tmp_path: Path) -> None:
+        blobs = BlobStore(tmp_path / "blobs")
+        assert blobs.get_structure(DIGEST) is None
+        blobs.put_structure(DIGEST, b"{}")
+        # Not cached for content that is not stored
+        assert blobs.get_structure(DIGEST) is None
+
+        blobs.adopt(_write(tmp_path / "s1" / "doc.pdf"), DIGEST)
+        blobs.put_structure(DIGEST, b'{"total_pages": 1}')
+        assert blobs.get_structure(DIGEST) == b'{"total_pages": 1}'
+
+    def test_collect_without_blobs(self, tmp_path: Path) -> None:
+        assert BlobStore(tmp_path / "blobs").collect_garbage() == 0
+
+
+class TestDeduplicatedStorage:
+    """PDFStorage storing identical uploads once."""
+
+    def test_identical_uploads_stored_once(self, tmp_path: Path) -> None:
+        storage = PDFStorage(tmp_path / "storage")
+        first = storage.save_pdf("s1", PDF_BYTES, "a.pdf")
+        second = storage.save_pdf("s2", PDF_BYTES, "b.pdf")
+
+        assert second.stat().st_ino == first.stat().st_ino
+        assert storage.total_bytes() == len(PDF_BYTES)
+        # Shared, so deleting either session alone frees nothing
+        assert storage.session_bytes("s1") == 0
+
+        storage.delete_session("s1")
+        assert storage.session_bytes("s2") == len(PDF_BYTES)
+        storage.delete_session("s2")
+        assert storage.collect_garbage() == len(PDF_BYTES)
+        assert storage.total_bytes() == 0
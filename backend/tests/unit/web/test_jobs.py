@@ -0,0 +1,353 @@
+"""Tests for the persistent job queue, its workers and the job endpoints."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import fitz
+import pytest
+from fastapi.testclient import TestClient
+
+from pdf_modifier.core.exceptions import ExecutorBusyError
+from pdf_modifier.web.app import create_app
+from pdf_modifier.web.config import WebSettings
+from pdf_modifier.web.deps import reset_deps
+from pdf_modifier.web.jobs import JobRunner, JobStore
+from pdf_modifier.web.session import SessionManager
+from tests.conftest import create_pdf
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from fastapi import FastAPI
+
+PARAMS: dict[str, Any] = {
+    "replacements": {"Hello": "Goodbye"},
+    "use_regex": False,
+    "pages": None,
+    "incremental": False,
+    "save_profile": "fast",
+}
+
+
+def _wait_for(store: JobStore, job_id: str, *statuses: str) -> str:
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        job = store.get(job_id)
+        assert job is not None
+        if job.status in statuses:
+            return job.status
+        time.sleep(0.02)
+    raise AssertionError(f"Job {job_id} never reached {statuses}")
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> Iterator[JobStore]:
+    job_store = JobStore(tmp_path / "jobs.sqlite3")
+    yield job_store
+    job_store.close()
+
+
+class TestJobStore:
+    """SQLite job queue tests."""
+
+    def test_submit_and_get(self, store: JobStore, tmp_path: Path) -> None:
+        job = store.submit("sid", tmp_path / "in.pdf", tmp_path / "out", PARAMS)
+        assert job.status == "queued"
+        assert job.output_path == tmp_path / "out" / f"{job.job_id}.pdf"
+        fetched = store.get(job.job_id)
+        assert fetched is not None
+        assert fetched.params == PARAMS
+        assert store.get("missing") is None
+
+    def test_claim_oldest_first(self, store: JobStore, tmp_path: Path) -> None:
+        first = store.submit("a", tmp_path / "a.pdf", tmp_path, PARAMS)
+        second = store.submit("b", tmp_path / "b.pdf", tmp_path, PARAMS)
+
+        claimed = store.claim()
+        assert claimed is not None
+        assert claimed.job_id == first.job_id
+        assert claimed.status == "running"
+        claimed = store.claim()
+        assert claimed is not None
+        assert claimed.job_id == second.job_id
+        assert store.claim() is None
+
+    def test_jobs_survive_reopen(self, tmp_path: Path) -> None:
+        db = tmp_path / "jobs.sqlite3"
+        store = JobStore(db)
+        queued = store.submit("a", tmp_path / "a.pdf", tmp_path, PARAMS)
+        running = store.submit("b", tmp_path / "b.pdf", tmp_path, PARAMS)
+        store.claim()
+        store.claim()
+        store.close()
+
+        reopened = JobStore(db, lease_seconds=0.05)
+        try:
+            # The previous process's leases are still fresh
+            assert reopened.requeue_expired() == 0
+            time.sleep(0.1)
+            assert reopened.requeue_expired() == 2
+            assert reopened.count("queued") == 2
+            assert {queued.job_id, running.job_id} == {
+                job.job_id for job in (reopened.claim(), reopened.claim()) if job
+            }
+        finally:
+            reopened.close()
+
+    def test_heartbeat_keeps_lease(self, tmp_path: Path) -> None:
+        db = tmp_path / "jobs.sqlite3"
+        owner, other = JobStore(db, lease_seconds=0.2), JobStore(db, lease_seconds=0.2)
+        try:
+            job = owner.submit("a", tmp_path / "a.pdf", tmp_path, PARAMS)
+            claimed = owner.claim()
+            assert claimed is not None
+            assert claimed.owner == owner.owner
+            for _ in range(4):
+                time.sleep(0.1)
+                assert owner.heartbeat() == 1
+                assert other.requeue_expired() == 0
+            # The owner stops renewing, as if its process died
+            time.sleep(0.3)
+            assert other.requeue_expired() == 1
+            requeued = other.get(job.job_id)
+            assert requeued is not None
+            assert (requeued.status, requeued.owner) == ("queued", None)
+        finally:
+            owner.close()
+            other.close()
+
+    def test_requeue_only_own_job(self, tmp_path: Path) -> None:
+        db = tmp_path / "jobs.sqlite3"
+        owner, other = JobStore(db), JobStore(db)
+        try:
+            job = owner.submit("a", tmp_path / "a.pdf", tmp_path, PARAMS)
+            owner.claim()
+            other.requeue(job.job_id)
+            assert owner.count("running") == 1
+            owner.requeue(job.job_id)
+            assert owner.count("queued") == 1
+        finally:
+            owner.close()
+            other.close()
+
+    def test_stale_owner_cannot_write(self, tmp_path: Path) -> None:
+        db = tmp_path / "jobs.sqlite3"
+        stale, other = JobStore(db, lease_seconds=0.05), JobStore(db, lease_seconds=0.05)
+        try:
+            job = stale.submit("a", tmp_path / "a.pdf", tmp_path, PARAMS)
+            stale.claim()
+            time.sleep(0.1)
+            assert other.requeue_expired() == 1
+            assert other.claim() is not None
+
+            # The first worker wakes up after losing its lease
+            assert stale.update_progress(job.job_id, 5, 5) is False
+            assert stale.finish(job.job_id, {"replacements_made": 1}) is False
+            assert stale.fail(job.job_id, "late") is False
+            current = other.get(job.job_id)
+            assert current is not None
+            assert (current.status, current.owner, current.error) == ("running", other.owner, None)
+            assert current.result is None
+
+            assert other.finish(job.job_id, {"replacements_made": 2}) is True
+            done = other.get(job.job_id)
+            assert done is not None
+            assert (done.status, done.result) == ("succeeded", {"replacements_made": 2})
+        finally:
+            stale.close()
+            other.close()
+
+    def test_invalid_lease(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="lease_seconds"):
+            JobStore(tmp_path / "jobs.sqlite3", lease_seconds=0)
+
+    def test_cancel_queued_job(self, store: JobStore, tmp_path: Path) -> None:
+        job = store.submit("a", tmp_path / "a.pdf", tmp_path, PARAMS)
+        cancelled = store.request_cancel(job.job_id)
+        assert cancelled is not None
+        assert cancelled.status == "cancelled"
+        assert store.claim() is None
+
+    def test_cancel_running_job_sets_flag(self, store: JobStore, tmp_path: Path) -> None:
+        job = store.submit("a", tmp_path / "a.pdf", tmp_path, PARAMS)
+        store.claim()
+        running = store.request_cancel(job.job_id)
+        assert running is not None
+        assert running.status == "running"
+        assert store.is_cancel_requested(job.job_id)
+
+
+class TestJobRunner:
+    """Background worker tests."""
+
+    def test_runs_job_to_success(self, store: JobStore, tmp_path: Path) -> None:
+        pdf = create_pdf(tmp_path / "in.pdf", text="Hello World")
+        session_mgr = SessionManager()
+        sid = session_mgr.create(pdf)
+        runner = JobRunner(store, workers=1, session_mgr=session_mgr, poll_seconds=0.05)
+        runner.start()
+        try:
+            job = runner.submit(sid, pdf, tmp_path / "jobs", PARAMS)
+            assert _wait_for(store, job.job_id, "succeeded", "failed") == "succeeded"
+        finally:
+            runner.stop()
+
+        done = store.get(job.job_id)
+        assert done is not None
+        assert done.result is not None
+        assert done.result["replacements_made"] == 1
+        assert (done.pages_done, done.pages_total) == (1, 1)
+        with fitz.open(done.output_path) as doc:
+            assert "Goodbye World" in doc[0].get_text()
+        session = session_mgr.get(sid)
+        assert session is not None
+        assert session.modified_path == done.output_path
+
+    def test_failed_job_records_error(self, store: JobStore, tmp_path: Path) -> None:
+        runner = JobRunner(store, workers=1, poll_seconds=0.05)
+        runner.start()
+        try:
+            job = runner.submit("sid", tmp_path / "missing.pdf", tmp_path / "jobs", PARAMS)
+            assert _wait_for(store, job.job_id, "succeeded", "failed") == "failed"
+        finally:
+            runner.stop()
+        failed = store.get(job.job_id)
+        assert failed is not None
+        assert failed.error
+
+    def test_cancel_running_job(self, store: JobStore, tmp_path: Path) -> None:
+        pdf = create_pdf(tmp_path / "in.pdf", text="Hello World")
+        job = store.submit("sid", pdf, tmp_path / "jobs", PARAMS)
+        claimed = store.claim()
+        assert claimed is not None
+        runner = JobRunner(store)
+        runner.cancel(job.job_id)
+
+        runner.run_job(claimed)
+
+        cancelled = store.get(job.job_id)
+        assert cancelled is not None
+        assert cancelled.status == "cancelled"
+        assert not cancelled.output_path.exists()
+
+    def test_second_runner_leaves_live_jobs_alone(self, tmp_path: Path) -> None:
+        db = tmp_path / "jobs.sqlite3"
+        pdf = create_pdf(tmp_path / "in.pdf", text="Hello World")
+        first, second = JobStore(db, lease_seconds=0.3), JobStore(db, lease_seconds=0.3)
+        # A job being processed by the first runner's process
+        job = first.submit("sid", pdf, tmp_path / "jobs", PARAMS)
+        first.claim()
+        first_runner = JobRunner(first, workers=1, poll_seconds=0.05)
+        second_runner = JobRunner(second, workers=1, poll_seconds=0.05)
+        first_runner.start()
+        second_runner.start()
+        try:
+            for _ in range(8):
+                time.sleep(0.1)
+                running = second.get(job.job_id)
+                assert running is not None
+                assert (running.status, running.owner) == ("running", first.owner)
+            # The first process dies without finishing the job
+            first_runner.stop()
+            assert _wait_for(second, job.job_id, "succeeded", "failed") == "succeeded"
+        finally:
+            first_runner.stop()
+            second_runner.stop()
+            first.close()
+            second.close()
+
+    def test_queue_limit(self, store: JobStore, tmp_path: Path) -> None:
+        runner = JobRunner(store, max_queued=1)
+        runner.submit("a", tmp_path / "a.pdf", tmp_path, PARAMS)
+        with pytest.raises(ExecutorBusyError):
+            runner.submit("b", tmp_path / "b.pdf", tmp_path, PARAMS)
+
+    def test_invalid_workers(self, store: JobStore) -> None:
+        with pytest.raises(ValueError, match="workers"):
+            JobRunner(store, workers=0)
+
+
+class TestJobEndpoints:
+    """Job API tests."""
+
+    @pytest.fixture
+    def app(self, tmp_path: Path) -> Iterator[FastAPI]:
+        import pdf_modifier.web.deps as deps
+
+        reset_deps()
+        deps._settings = WebSettings(storage_dir=str(tmp_path / "storage"))
+        yield create_app()
+        reset_deps()
+
+    def _upload(self, client: TestClient, tmp_path: Path) -> str:
+        pdf = create_pdf(tmp_path / "upload.pdf", text="Hello World")
+        with open(pdf, "rb") as f:
+            response = client.post(
+                "/api/pdf/upload", files={"file": ("upload.pdf", f, "application/pdf")}
+            )
+        return str(response.json()["session_id"])
+
+    def _poll(self, client: TestClient, job_id: str) -> dict[str, Any]:
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            data: dict[str, Any] = client.get(f"/api/jobs/{job_id}").json()
+            if data["status"] not in ("queued", "running"):
+                return data
+            time.sleep(0.05)
+        raise AssertionError("Job did not finish")
+
+    def test_submit_poll_download(self, app: FastAPI, tmp_path: Path) -> None:
+        client = TestClient(app)
+        session_id = self._upload(client, tmp_path)
+
+        response = client.post(
+            "/api/jobs", json={"session_id": session_id, "replacements": {"Hello": "Goodbye"}}
+        )
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+
+        data = self._poll(client, job_id)
+        assert data["status"] == "succeeded"
+        assert data["result"]["replacements_made"] == 1
+
+        download = client.get(f"/api/jobs/{job_id}/download")
+        assert download.status_code == 200
+        assert download.content.startswith(b"%PDF")
+        # The session download serves the job output too
+        assert client.get(f"/api/pdf/{session_id}/download").content == download.content
+
+    def test_submit_unknown_session_returns_404(self, app: FastAPI) -> None:
+        client = TestClient(app)
+        response = client.post("/api/jobs", json={"session_id": "nope", "replacements": {}})
+        assert response.status_code == 404
+
+    def test_submit_invalid_pages_returns_400(self, app: FastAPI, tmp_path: Path) -> None:
+        client = TestClient(app)
+        session_id = self._upload(client, tmp_path)
+        response = client.post(
+            "/api/jobs",
+            json={"session_id": session_id, "replacements": {"a": "b"}, "pages": "x"},
+        )
+        assert response.status_code == 400
+
+    def test_unknown_job_returns_404(self, app: FastAPI) -> None:
+        client = TestClient(app)
+        assert client.get("/api/jobs/nope").status_code == 404
+        assert client.get("/api/jobs/nope/download").status_code == 404
+        assert client.delete("/api/jobs/nope").status_code == 404
+
+    def test_download_unfinished_job_returns_409(self, app: FastAPI, tmp_path: Path) -> None:
+        client = TestClient(app)
+        session_id = self._upload(client, tmp_path)
+        job_id = client.post(
+            "/api/jobs", json={"session_id": session_id, "replacements": {"Hello": "Bye"}}
+        ).json()["job_id"]
+        # Cancel right away; whether it was still queued or already done, a
+        # download only succeeds for a succeeded job
+        client.delete(f"/api/jobs/{job_id}")
+        data = self._poll(client, job_id)
+        expected = 200 if data["status"] == "succeeded" else 409
+        assert client.get(f"/api/jobs/{job_id}/download").status_code == expected
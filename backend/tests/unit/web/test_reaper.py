@@ -0,0 +1,135 @@
+"""Tests for the expired-session reaper."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pdf_modifier.web.reaper import SessionReaper
+from pdf_modifier.web.session import SessionManager
+from pdf_modifier.web.storage import PDFStorage
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+PDF_BYTES = b"%PDF-1.4\n" + b"x" * 991
+
+
+@pytest.fixture
+def storage_dir(tmp_path: Path) -> Path:
+    return tmp_path / "storage"
+
+
+@pytest.fixture
+def storage(storage_dir: Path) -> PDFStorage:
+    return PDFStorage(storage_dir)
+
+
+def _upload(
+    mgr: SessionManager, storage: PDFStorage, storage_dir: Path, content: bytes | None = None
+) -> str:
+    sid = mgr.create(storage_dir / "pending.pdf")
+    # Distinct bytes per session unless given, so nothing is deduplicated
+    storage.save_pdf(sid, content or PDF_BYTES[:-12] + sid.encode(), "doc.pdf")
+    return sid
+
+
+class TestSessionReaper:
+    """Reaping expired sessions, orphans and over-quota storage."""
+
+    async def test_expires_sessions_in_batches(
+        self, storage: PDFStorage, storage_dir: Path
+    ) -> None:
+        mgr = SessionManager(ttl_seconds=1)
+        sids = [_upload(mgr, storage, storage_dir) for _ in range(5)]
+        time.sleep(1.1)
+        reaper = SessionReaper(mgr, storage, batch_size=2)
+
+        metrics = await reaper.run_once()
+
+        assert metrics.sessions_expired == 5
+        assert metrics.bytes_reclaimed == 5 * len(PDF_BYTES)
+        assert metrics.storage_bytes == 0
+        assert metrics.runs == 1
+        assert metrics.last_run_at is not None
+        assert metrics.last_run_seconds >= 0
+        assert not any((storage_dir / sid).exists() for sid in sids)
+
+    async def test_keeps_live_sessions(self, storage: PDFStorage, storage_dir: Path) -> None:
+        mgr = SessionManager(ttl_seconds=3600)
+        sid = _upload(mgr, storage, storage_dir)
+        reaper = SessionReaper(mgr, storage)
+
+        metrics = await reaper.run_once()
+
+        assert metrics.bytes_reclaimed == 0
+        assert metrics.storage_bytes == len(PDF_BYTES)
+        assert mgr.get(sid) is not None
+        assert (storage_dir / sid).exists()
+
+    async def test_removes_old_orphaned_directories(
+        self, storage: PDFStorage, storage_dir: Path
+    ) -> None:
+        storage.save_pdf("orphan", PDF_BYTES, "doc.pdf")
+        storage.save_pdf("fresh", PDF_BYTES + b"\n", "doc.pdf")
+        old = time.time() - 7200
+        os.utime(storage_dir / "orphan", (old, old))
+        reaper = SessionReaper(SessionManager(), storage, orphan_grace_seconds=3600)
+
+        metrics = await reaper.run_once()
+
+        assert metrics.orphans_removed == 1
+        assert metrics.bytes_reclaimed == len(PDF_BYTES)
+        assert not (storage_dir / "orphan").exists()
+        # Too recent to tell apart from an upload whose session is being created
+        assert (storage_dir / "fresh").exists()
+
+    async def test_evicts_oldest_over_quota(self, storage: PDFStorage, storage_dir: Path) -> None:
+        mgr = SessionManager(ttl_seconds=3600)
+        sids = [_upload(mgr, storage, storage_dir) for _ in range(3)]
+        reaper = SessionReaper(mgr, storage, quota_bytes=2 * len(PDF_BYTES))
+
+        metrics = await reaper.run_once()
+
+        assert metrics.sessions_evicted == 1
+        assert metrics.bytes_reclaimed == len(PDF_BYTES)
+        assert metrics.storage_bytes == 2 * len(PDF_BYTES)
+        assert not (storage_dir / sids[0]).exists()
+        assert mgr.list_active() == sids[1:]
+
+    async def test_shared_uploads_reclaimed_with_last_session(
+        self, storage: PDFStorage, storage_dir: Path
+    ) -> None:
+        mgr = SessionManager(ttl_seconds=3600)
+        sids = [_upload(mgr, storage, storage_dir, PDF_BYTES) for _ in range(3)]
+        reaper = SessionReaper(mgr, storage, quota_bytes=len(PDF_BYTES) - 1)
+
+        metrics = await reaper.run_once()
+
+        # Stored once, so only evicting the last session frees anything
+        assert metrics.sessions_evicted == 3
+        assert metrics.bytes_reclaimed == len(PDF_BYTES)
+        assert metrics.storage_bytes == 0
+        assert storage.total_bytes() == 0
+        assert not any((storage_dir / sid).exists() for sid in sids)
+
+    async def test_runs_periodically_until_stopped(self, storage: PDFStorage) -> None:
+        reaper = SessionReaper(SessionManager(), storage, interval_seconds=0.01)
+        reaper.start()
+        for _ in range(200):
+            if reaper.metrics.runs >= 2:
+                break
+            await asyncio.sleep(0.01)
+        await reaper.stop()
+        runs = reaper.metrics.runs
+        await asyncio.sleep(0.05)
+        assert runs >= 2
+        assert reaper.metrics.runs == runs
+
+    def test_rejects_bad_batch_size(self, storage: PDFStorage) -> None:
+        with pytest.raises(ValueError, match="batch_size"):
+            SessionReaper(SessionManager(), storage, batch_size=0)
@@ -40,6 +40,18 @@ class TestHealthEndpoint:
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
 
+    def test_reaper_metrics(self, tmp_path: Path) -> None:
+        import pdf_modifier.web.deps as deps
+
+        deps._settings = WebSettings(storage_dir=str(tmp_path / "storage"))
+
+        with TestClient(create_app()) as client:
+            response = client.get("/health/reaper")
+        assert response.status_code == 200
+        body = response.json()
+        for key in ("sessions_expired", "sessions_evicted", "bytes_reclaimed", "last_run_seconds"):
+            assert key in body
+
 
 class TestPDFUpload:
     """PDF upload endpoint tests."""
@@ -73,11 +85,13 @@ class TestPDFUpload:
             files={"file": ("test.txt", b"not a pdf", "text/plain")},
         )
         assert response.status_code == 400
+        # The session created for the upload is removed again
+        assert list((tmp_path / "storage").iterdir()) == []
 
     def test_upload_oversized_returns_413(self, app: object, tmp_path: Path) -> None:
         client = TestClient(app)
-        # 200 MB of null bytes
-        large_content = b"\x00" * (200 * 1024 * 1024)
+        # 200 MB PDF header followed by null bytes
+        large_content = b"%PDF" + b"\x00" * (200 * 1024 * 1024)
         response = client.post(
             "/api/pdf/upload",
             files={"file": ("big.pdf", large_content, "application/pdf")},
@@ -119,6 +133,158 @@ class TestPDFStructure:
         response = client.get("/api/pdf/nonexistent/structure")
         assert response.status_code == 404
 
+    def _upload_multi_page(self, client: TestClient, tmp_path: Path, pages: int) -> str:
+        import fitz
+
+        doc = fitz.open()
+        for i in range(pages):
+            doc.new_page().insert_text((100, 100), f"Page {i + 1}")
+        pdf = tmp_path / "multi.pdf"
+        doc.save(str(pdf))
+        doc.close()
+        with open(pdf, "rb") as f:
+            upload_resp = client.post(
+                "/api/pdf/upload",
+                files={"file": ("multi.pdf", f, "application/pdf")},
+            )
+        return upload_resp.json()["session_id"]
+
+    def test_get_structure_window(self, app: object, tmp_path: Path) -> None:
+        client = TestClient(app)
+        session_id = self._upload_multi_page(client, tmp_path, 3)
+
+        response = client.get(f"/api/pdf/{session_id}/structure?start_page=2&page_limit=1")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_pages"] == 3
+        assert [p["page"] for p in data["pages"]] == [2]
+        assert data["next_page"] == 3
+
+    def test_get_structure_invalid_window_returns_400(self, app: object, tmp_path: Path) -> None:
+        client = TestClient(app)
+        session_id = self._upload_multi_page(client, tmp_path, 2)
+
+        response = client.get(f"/api/pdf/{session_id}/structure?start_page=5")
+        assert response.status_code == 400
+
+    def test_structure_precomputed_after_upload(
+        self, app: object, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from pdf_modifier.core.async_api import AsyncPDFAnalyzer
+
+        client = TestClient(app)
+        session_id = self._upload_multi_page(client, tmp_path, 2)
+
+        async def fail(*args: object) -> None:
+            raise AssertionError("structure should come from the cache")
+
+        monkeypatch.setattr(AsyncPDFAnalyzer, "get_structure", fail)
+        response = client.get(f"/api/pdf/{session_id}/structure")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["total_pages"] == 2
+
+    def test_repeat_upload_reuses_blob_and_analysis(
+        self, app: object, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from pdf_modifier.core.async_api import AsyncPDFAnalyzer
+
+        client = TestClient(app)
+        pdf = create_pdf(tmp_path / "template.pdf", text="Template")
+
+        def upload() -> str:
+            with open(pdf, "rb") as f:
+                response = client.post(
+                    "/api/pdf/upload", files={"file": ("template.pdf", f, "application/pdf")}
+                )
+            return str(response.json()["session_id"])
+
+        first = upload()
+        assert client.get(f"/api/pdf/{first}/structure").status_code == 200
+
+        async def fail(*args: object) -> None:
+            raise AssertionError("a repeat upload should not be analyzed again")
+
+        monkeypatch.setattr(AsyncPDFAnalyzer, "get_structure", fail)
+        second = upload()
+        response = client.get(f"/api/pdf/{second}/structure")
+        assert response.status_code == 200
+        assert response.json()["total_pages"] == 1
+        # The shared analysis must not reveal the first session's directory
+        assert first not in response.text
+        assert second in response.json()["file_path"]
+
+        storage = tmp_path / "storage"
+        first_pdf = next((storage / first).glob("*.pdf"))
+        second_pdf = next((storage / second).glob("*.pdf"))
+        assert first_pdf.stat().st_ino == second_pdf.stat().st_ino
+
+    def test_structure_recomputed_when_pdf_changes(self, app: object, tmp_path: Path) -> None:
+        import fitz
+
+        client = TestClient(app)
+        session_id = self._upload_multi_page(client, tmp_path, 2)
+        assert client.get(f"/api/pdf/{session_id}/structure").json()["total_pages"] == 2
+
+        # Replace the stored PDF behind the session's back
+        stored = next((tmp_path / "storage" / session_id).glob("*.pdf"))
+        doc = fitz.open()
+        for _ in range(3):
+            doc.new_page()
+        doc.save(str(stored))
+        doc.close()
+
+        assert client.get(f"/api/pdf/{session_id}/structure").json()["total_pages"] == 3
+
+    def test_get_structure_busy_returns_503(self, app: object, tmp_path: Path) -> None:
+        from pdf_modifier.core.async_api import PDFExecutor
+        from pdf_modifier.web.deps import get_executor
+
+        client = TestClient(app)
+        session_id = self._upload_multi_page(client, tmp_path, 1)
+        saturated = PDFExecutor(max_workers=1, max_queue=0)
+        saturated._in_flight = 1
+        app.dependency_overrides[get_executor] = lambda: saturated  # type: ignore[attr-defined]
+
+        # Page windows are never cached, so this needs a worker
+        response = client.get(f"/api/pdf/{session_id}/structure?page_limit=1")
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "5"
+
+    def test_stream_structure_ndjson(self, app: object, tmp_path: Path) -> None:
+        import json
+
+        client = TestClient(app)
+        session_id = self._upload_multi_page(client, tmp_path, 3)
+
+        response = client.get(f"/api/pdf/{session_id}/structure/stream")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert response.headers["x-total-pages"] == "3"
+        pages = [json.loads(line) for line in response.text.splitlines()]
+        assert [p["page"] for p in pages] == [1, 2, 3]
+        assert pages[1]["elements"][0]["text"] == "Page 2"
+
+    def test_stream_structure_window(self, app: object, tmp_path: Path) -> None:
+        client = TestClient(app)
+        session_id = self._upload_multi_page(client, tmp_path, 3)
+
+        response = client.get(f"/api/pdf/{session_id}/structure/stream?start_page=2&page_limit=5")
+        assert response.status_code == 200
+        assert len(response.text.splitlines()) == 2
+
+    def test_stream_structure_invalid_window_returns_400(self, app: object, tmp_path: Path) -> None:
+        client = TestClient(app)
+        session_id = self._upload_multi_page(client, tmp_path, 2)
+
+        response = client.get(f"/api/pdf/{session_id}/structure/stream?start_page=9")
+        assert response.status_code == 400
+
+    def test_stream_structure_nonexistent_session(self, app: object) -> None:
+        client = TestClient(app)
+        response = client.get("/api/pdf/nonexistent/structure/stream")
+        assert response.status_code == 404
+
 
 class TestPDFReplace:
     """PDF replace endpoint tests."""
@@ -151,6 +317,65 @@ class TestPDFReplace:
         assert "success" in data
         assert "replacements_made" in data
 
+    def test_replace_incremental(self, app: object, tmp_path: Path) -> None:
+        pdf = create_pdf(tmp_path / "replace.pdf", text="Hello World")
+        client = TestClient(app)
+        with open(pdf, "rb") as f:
+            upload_resp = client.post(
+                "/api/pdf/upload",
+                files={"file": ("replace.pdf", f, "application/pdf")},
+            )
+        session_id = upload_resp.json()["session_id"]
+
+        response = client.post(
+            f"/api/pdf/{session_id}/replace",
+            json={"replacements": {"Hello": "Goodbye"}, "incremental": True},
+        )
+        assert response.status_code == 200
+        assert response.json()["save_mode"] == "incremental"
+
+        download = client.get(f"/api/pdf/{session_id}/download")
+        assert download.content.startswith(pdf.read_bytes())
+
+    def test_replace_unknown_save_profile(self, app: object, tmp_path: Path) -> None:
+        pdf = create_pdf(tmp_path / "replace.pdf", text="Hello World")
+        client = TestClient(app)
+        with open(pdf, "rb") as f:
+            upload_resp = client.post(
+                "/api/pdf/upload",
+                files={"file": ("replace.pdf", f, "application/pdf")},
+            )
+        session_id = upload_resp.json()["session_id"]
+
+        response = client.post(
+            f"/api/pdf/{session_id}/replace",
+            json={"replacements": {"Hello": "Goodbye"}, "save_profile": "tiny"},
+        )
+        assert response.status_code == 400
+        assert "Unknown save profile" in response.json()["detail"]
+
+    def test_repeat_replace_served_from_result_cache(self, app: object, tmp_path: Path) -> None:
+        pdf = create_pdf(tmp_path / "replace.pdf", text="Hello World")
+        client = TestClient(app)
+        session_ids = []
+        for _ in range(2):
+            with open(pdf, "rb") as f:
+                upload_resp = client.post(
+                    "/api/pdf/upload",
+                    files={"file": ("replace.pdf", f, "application/pdf")},
+                )
+            session_ids.append(upload_resp.json()["session_id"])
+
+        body = {"replacements": {"Hello": "Goodbye"}}
+        first = client.post(f"/api/pdf/{session_ids[0]}/replace", json=body)
+        second = client.post(f"/api/pdf/{session_ids[1]}/replace", json=body)
+
+        assert first.json()["cache_hit"] is False
+        assert second.json()["cache_hit"] is True
+        assert second.json()["replacements_made"] == first.json()["replacements_made"]
+        first_pdf = client.get(f"/api/pdf/{session_ids[0]}/download").content
+        assert client.get(f"/api/pdf/{session_ids[1]}/download").content == first_pdf
+
 
 class TestPDFDownload:
     """PDF download endpoint tests."""
@@ -193,6 +418,73 @@ class TestPDFDownload:
         assert response.headers["content-type"] == "application/pdf"
         # Should return a valid PDF (modified doesn't exist, returns original)
 
+    def _upload(self, client: TestClient, tmp_path: Path) -> str:
+        pdf = create_pdf(tmp_path / "cached.pdf", text="Hello World")
+        with open(pdf, "rb") as f:
+            upload_resp = client.post(
+                "/api/pdf/upload",
+                files={"file": ("cached.pdf", f, "application/pdf")},
+            )
+        return str(upload_resp.json()["session_id"])
+
+    def test_download_sends_validators(self, app: object, tmp_path: Path) -> None:
+        client = TestClient(app)
+        session_id = self._upload(client, tmp_path)
+
+        response = client.get(f"/api/pdf/{session_id}/download")
+        assert response.headers["etag"].startswith('"')
+        assert "last-modified" in response.headers
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["cache-control"] == "private, no-cache"
+
+    def test_conditional_get_returns_304(self, app: object, tmp_path: Path) -> None:
+        client = TestClient(app)
+        session_id = self._upload(client, tmp_path)
+        first = client.get(f"/api/pdf/{session_id}/download")
+
+        by_etag = client.get(
+            f"/api/pdf/{session_id}/download",
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+        assert by_etag.status_code == 304
+        assert by_etag.content == b""
+        assert by_etag.headers["etag"] == first.headers["etag"]
+
+        by_date = client.get(
+            f"/api/pdf/{session_id}/download",
+            headers={"If-Modified-Since": first.headers["last-modified"]},
+        )
+        assert by_date.status_code == 304
+
+        stale = client.get(f"/api/pdf/{session_id}/download", headers={"If-None-Match": '"stale"'})
+        assert stale.status_code == 200
+        assert stale.content == first.content
+
+    def test_range_request_returns_partial_content(self, app: object, tmp_path: Path) -> None:
+        client = TestClient(app)
+        session_id = self._upload(client, tmp_path)
+        full = client.get(f"/api/pdf/{session_id}/download").content
+
+        response = client.get(f"/api/pdf/{session_id}/download", headers={"Range": "bytes=0-9"})
+        assert response.status_code == 206
+        assert response.content == full[:10]
+        assert response.headers["content-range"] == f"bytes 0-9/{len(full)}"
+
+    def test_accel_redirect(self, tmp_path: Path) -> None:
+        import pdf_modifier.web.deps as deps
+
+        deps._settings = WebSettings(
+            storage_dir=str(tmp_path / "storage"), accel_redirect_prefix="/_storage/"
+        )
+        client = TestClient(create_app())
+        session_id = self._upload(client, tmp_path)
+
+        response = client.get(f"/api/pdf/{session_id}/download")
+        assert response.status_code == 200
+        assert response.content == b""
+        assert response.headers["x-accel-redirect"] == f"/_storage/{session_id}/cached.pdf"
+        assert "cached.pdf" in response.headers["content-disposition"]
+
 
 class TestPDFDelete:
     """PDF delete endpoint tests."""
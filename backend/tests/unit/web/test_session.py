@@ -43,18 +43,25 @@ class TestSessionManager:
     def test_update_structure(self) -> None:
         mgr = SessionManager()
         sid = mgr.create(Path("/tmp/test.pdf"))
-        result = mgr.update_structure(sid, {"pages": 1})
+        result = mgr.update_structure(sid, b'{"pages": 1}', "v1")
         assert result is True
-        session = mgr.get(sid)
-        assert session is not None
-        assert session.structure == {"pages": 1}
+        assert mgr.get_structure(sid, "v1") == b'{"pages": 1}'
 
     def test_update_structure_wrong_session(self) -> None:
         mgr = SessionManager()
         mgr.create(Path("/tmp/test.pdf"))
-        result = mgr.update_structure("wrong_id", {"pages": 1})
+        result = mgr.update_structure("wrong_id", b'{"pages": 1}', "v1")
         assert result is False
 
+    def test_get_structure_checks_version(self) -> None:
+        mgr = SessionManager()
+        sid = mgr.create(Path("/tmp/test.pdf"))
+        assert mgr.get_structure(sid, "v1") is None
+        mgr.update_structure(sid, b"{}", "v1")
+        assert mgr.get_structure(sid, "v1") == b"{}"
+        assert mgr.get_structure(sid, "v2") is None
+        assert mgr.get_structure("wrong_id", "v1") is None
+
     def test_set_modified_path(self) -> None:
         mgr = SessionManager()
         sid = mgr.create(Path("/tmp/test.pdf"))
@@ -84,6 +91,21 @@ class TestSessionManager:
         count = mgr.cleanup_expired()
         assert count == 2
 
+    def test_expire_in_batches_oldest_first(self) -> None:
+        mgr = SessionManager(ttl_seconds=1)
+        sids = [mgr.create(Path(f"/tmp/test{i}.pdf")) for i in range(3)]
+        time.sleep(1.1)
+        assert mgr.expire(limit=2) == sids[:2]
+        assert mgr.expire(limit=2) == sids[2:]
+        assert mgr.expire(limit=2) == []
+
+    def test_evict_oldest_ignores_ttl(self) -> None:
+        mgr = SessionManager(ttl_seconds=3600)
+        sid1 = mgr.create(Path("/tmp/test1.pdf"))
+        sid2 = mgr.create(Path("/tmp/test2.pdf"))
+        assert mgr.evict_oldest() == [sid1]
+        assert mgr.list_active() == [sid2]
+
     def test_list_active(self) -> None:
         mgr = SessionManager(ttl_seconds=3600)
         sid1 = mgr.create(Path("/tmp/test1.pdf"))
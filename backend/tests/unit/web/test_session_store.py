@@ -0,0 +1,133 @@
+"""Tests for the in-memory and SQLite session stores."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pdf_modifier.web.session import SessionManager
+from pdf_modifier.web.session_store import (
+    InMemorySessionStore,
+    SessionData,
+    SessionStore,
+    SQLiteSessionStore,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request: pytest.FixtureRequest, tmp_path: Path) -> Iterator[SessionStore]:
+    if request.param == "memory":
+        yield InMemorySessionStore()
+        return
+    sqlite_store = SQLiteSessionStore(tmp_path / "sessions.sqlite3")
+    yield sqlite_store
+    sqlite_store.close()
+
+
+def _session(session_id: str, created_at: float) -> SessionData:
+    return SessionData(session_id, Path(f"/tmp/{session_id}.pdf"), created_at=created_at)
+
+
+class TestSessionStore:
+    """Behavior shared by all session stores."""
+
+    def test_add_get_delete(self, store: SessionStore) -> None:
+        store.add(_session("a", 100.0))
+        session = store.get("a")
+        assert session is not None
+        assert session.original_path == Path("/tmp/a.pdf")
+        assert session.modified_path is None
+        assert store.delete("a") is True
+        assert store.get("a") is None
+        assert store.delete("a") is False
+
+    def test_update(self, store: SessionStore) -> None:
+        store.add(_session("a", 100.0))
+        assert store.update(
+            "a", modified_path=Path("/tmp/out.pdf"), structure=b"{}", structure_version="v1"
+        )
+        session = store.get("a")
+        assert session is not None
+        assert session.modified_path == Path("/tmp/out.pdf")
+        assert session.structure_version == "v1"
+        assert store.update("missing", structure=b"{}") is False
+
+    def test_get_leaves_structure_out(self, store: SessionStore) -> None:
+        store.add(_session("a", 100.0))
+        store.update("a", structure=b'{"pages": []}', structure_version="v1")
+        session = store.get("a")
+        assert session is not None
+        assert session.structure is None
+        assert store.get_structure("a", "v1") == b'{"pages": []}'
+        assert store.get_structure("a", "v2") is None
+        assert store.get_structure("missing", "v1") is None
+
+    def test_update_rejects_unknown_fields(self, store: SessionStore) -> None:
+        store.add(_session("a", 100.0))
+        with pytest.raises(ValueError, match="created_at"):
+            store.update("a", created_at=0.0)
+
+    def test_delete_created_before_oldest_first(self, store: SessionStore) -> None:
+        for i, created in enumerate([100.0, 200.0, 300.0, 400.0]):
+            store.add(_session(f"s{i}", created))
+
+        assert store.delete_created_before(300.0, limit=2) == ["s0", "s1"]
+        assert store.delete_created_before(300.0) == ["s2"]
+        assert store.delete_created_before(300.0) == []
+        assert store.list_created_since() == ["s3"]
+
+    def test_list_created_since(self, store: SessionStore) -> None:
+        store.add(_session("old", 100.0))
+        store.add(_session("new", 200.0))
+        assert store.list_created_since(150.0) == ["new"]
+        assert store.list_created_since() == ["old", "new"]
+
+
+class TestSharedSQLiteSessions:
+    """Sessions shared between processes through one SQLite file."""
+
+    def test_managers_share_sessions(self, tmp_path: Path) -> None:
+        db = tmp_path / "sessions.sqlite3"
+        worker_a = SessionManager(store=SQLiteSessionStore(db))
+        worker_b = SessionManager(store=SQLiteSessionStore(db))
+
+        sid = worker_a.create(Path("/tmp/test.pdf"))
+        worker_a.update_structure(sid, b'{"pages": []}', "v1")
+        worker_b.set_modified_path(sid, Path("/tmp/modified.pdf"))
+
+        session = worker_b.get(sid)
+        assert session is not None
+        assert session.modified_path == Path("/tmp/modified.pdf")
+        assert worker_b.get_structure(sid, "v1") == b'{"pages": []}'
+        assert worker_b.delete(sid) is True
+        assert worker_a.get(sid) is None
+
+    def test_expiry(self, tmp_path: Path) -> None:
+        store = SQLiteSessionStore(tmp_path / "sessions.sqlite3")
+        store.add(_session("expired", time.time() - 10))
+        mgr = SessionManager(ttl_seconds=5, store=store)
+        fresh = mgr.create(Path("/tmp/fresh.pdf"))
+
+        assert mgr.list_active() == [fresh]
+        assert mgr.cleanup_expired() == 1
+        assert store.get("expired") is None
+        assert mgr.get(fresh) is not None
+
+    def test_selected_by_settings(self, tmp_path: Path) -> None:
+        import pdf_modifier.web.deps as deps
+        from pdf_modifier.web.config import WebSettings
+
+        deps.reset_deps()
+        deps._settings = WebSettings(storage_dir=tmp_path / "storage", session_backend="sqlite")
+        try:
+            store = deps.get_session_manager().store
+            assert isinstance(store, SQLiteSessionStore)
+            assert store.db_path == tmp_path / "storage" / "sessions.sqlite3"
+        finally:
+            deps.reset_deps()
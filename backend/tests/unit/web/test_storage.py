@@ -6,6 +6,7 @@ from pathlib import Path
 
 import pytest
 
+from pdf_modifier.core.exceptions import FileSizeExceededError
 from pdf_modifier.web.storage import PDFStorage, StorageError
 
 
@@ -14,6 +15,19 @@ def _make_pdf_bytes() -> bytes:
     return b"%PDF-1.4\n1 0 obj\n<< /Type /Catalog >>\nendobj\nxref\n0 1\ntrailer\n<< /Size 1 >>\nstartxref\n0\n%%EOF\n"
 
 
+class _ChunkedSource:
+    """Async byte source that records the read sizes it was asked for."""
+
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+        self.reads: list[int] = []
+
+    async def read(self, size: int = -1) -> bytes:
+        self.reads.append(size)
+        chunk, self._data = self._data[:size], self._data[size:]
+        return chunk
+
+
 class TestPDFStorage:
     """PDF storage tests."""
 
@@ -64,7 +78,70 @@ class TestPDFStorage:
         storage.delete_session("session1")
         assert not (tmp_path / "storage" / "session1").exists()
 
+    def test_session_usage(self, tmp_path: Path) -> None:
+        storage = PDFStorage(tmp_path / "storage")
+        content = _make_pdf_bytes()
+        storage.save_pdf("session1", content, "test.pdf")
+        storage.save_pdf("session2", content + b"\n", "test.pdf")
+        assert sorted(storage.session_ids()) == ["session1", "session2"]
+        assert storage.session_bytes("session1") == len(content)
+        assert storage.session_mtime("session1") is not None
+        assert storage.session_bytes("missing") == 0
+        assert storage.session_mtime("missing") is None
+
     def test_validate_pdf_header(self) -> None:
         assert PDFStorage._validate_pdf_header(b"%PDF-1.4...") is True
         assert PDFStorage._validate_pdf_header(b"%pdf-1.4...") is False
         assert PDFStorage._validate_pdf_header(b"not a pdf") is False
+
+
+class TestSaveUpload:
+    """Streaming upload tests."""
+
+    async def test_streams_in_chunks(self, tmp_path: Path) -> None:
+        storage = PDFStorage(tmp_path / "storage")
+        content = _make_pdf_bytes()
+        source = _ChunkedSource(content)
+
+        upload = await storage.save_upload("s1", source, "up.pdf", max_size=1024, chunk_size=16)
+        path = upload.path
+
+        assert path == tmp_path / "storage" / "s1" / "up.pdf"
+        assert path.read_bytes() == content
+        assert set(source.reads) == {16}
+        assert [p.name for p in path.parent.iterdir()] == ["up.pdf"]
+
+    async def test_magic_split_across_chunks(self, tmp_path: Path) -> None:
+        storage = PDFStorage(tmp_path / "storage")
+        upload = await storage.save_upload(
+            "s1", _ChunkedSource(_make_pdf_bytes()), "up.pdf", max_size=1024, chunk_size=3
+        )
+        assert upload.path.read_bytes() == _make_pdf_bytes()
+
+    async def test_rejects_non_pdf_without_reading_everything(self, tmp_path: Path) -> None:
+        storage = PDFStorage(tmp_path / "storage")
+        source = _ChunkedSource(b"not a pdf" * 100)
+        with pytest.raises(StorageError, match="not a valid PDF"):
+            await storage.save_upload("s1", source, "up.pdf", max_size=10_000, chunk_size=8)
+        assert len(source.reads) == 1
+        assert list((tmp_path / "storage" / "s1").iterdir()) == []
+
+    async def test_rejects_short_upload(self, tmp_path: Path) -> None:
+        storage = PDFStorage(tmp_path / "storage")
+        with pytest.raises(StorageError):
+            await storage.save_upload("s1", _ChunkedSource(b"%P"), "up.pdf", max_size=1024)
+
+    async def test_oversized_upload_leaves_nothing(self, tmp_path: Path) -> None:
+        storage = PDFStorage(tmp_path / "storage")
+        with pytest.raises(FileSizeExceededError):
+            await storage.save_upload(
+                "s1", _ChunkedSource(_make_pdf_bytes()), "up.pdf", max_size=32, chunk_size=16
+            )
+        assert list((tmp_path / "storage" / "s1").iterdir()) == []
+
+    async def test_rejects_path_traversal(self, tmp_path: Path) -> None:
+        storage = PDFStorage(tmp_path / "storage")
+        with pytest.raises(StorageError):
+            await storage.save_upload(
+                "../evil", _ChunkedSource(_make_pdf_bytes()), "up.pdf", max_size=1024
+            )